@@ -1,6 +1,13 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class CommonConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'apps.common'
\ No newline at end of file
+    name = 'apps.common'
+
+    def ready(self):
+        if getattr(settings, 'REQUIRE_SHARED_CACHE', False):
+            from apps.common.utils.cache import require_shared_cache
+            require_shared_cache('The permission matrix')
+        import apps.common.signals  # noqa F401
@@ -0,0 +1,3 @@
+from apps.common.benchmarks.runner import BenchmarkRunner, Scenario, compare, load_results, save_results
+
+__all__ = ['BenchmarkRunner', 'Scenario', 'compare', 'load_results', 'save_results']
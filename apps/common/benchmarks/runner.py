@@ -0,0 +1,146 @@
+import gc
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from abc import ABC, abstractmethod
+
+import django
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+class Scenario(ABC):
+    """
+    A benchmarked operation.
+
+    ``setup(scale)`` creates the data the operation needs and returns a
+    context object; ``run(context, iteration)`` performs one measured call.
+    Both run inside a transaction that is rolled back after the scenario.
+    """
+    name = None
+    description = ''
+    iterations = 20
+
+    def setup(self, scale):
+        return None
+
+    @abstractmethod
+    def run(self, context, iteration):
+        """Perform one measured call"""
+
+
+def percentile(samples, value):
+    """Nearest-rank percentile of a sorted list"""
+    if not samples:
+        return None
+    rank = max(int(round(value / 100 * len(samples) + 0.5)) - 1, 0)
+    return samples[min(rank, len(samples) - 1)]
+
+
+class BenchmarkRunner:
+    """
+    Runs scenarios and collects latency, query and memory statistics.
+
+    Latency is measured over ``iterations`` calls after one warm-up call.
+    Query counts and peak memory come from one extra call under
+    CaptureQueriesContext and tracemalloc, so the tracing does not distort
+    the timings.
+    """
+
+    def __init__(self, scale=1, iterations=None):
+        self.scale = scale
+        self.iterations = iterations
+
+    def meta(self):
+        return {
+            'created_at': timezone.now().isoformat(),
+            'scale': self.scale,
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': connection.vendor,
+        }
+
+    def run_scenario(self, scenario):
+        iterations = self.iterations or scenario.iterations
+        with transaction.atomic():
+            start = time.perf_counter()
+            context = scenario.setup(self.scale)
+            setup_seconds = time.perf_counter() - start
+
+            # Warm-up call (caches, lazy graphs, prepared statements)
+            scenario.run(context, 0)
+
+            gc.collect()
+            samples = []
+            for iteration in range(1, iterations + 1):
+                start = time.perf_counter()
+                scenario.run(context, iteration)
+                samples.append((time.perf_counter() - start) * 1000)
+
+            tracemalloc.start()
+            try:
+                with CaptureQueriesContext(connection) as queries:
+                    scenario.run(context, iterations + 1)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+            transaction.set_rollback(True)
+
+        samples.sort()
+        result = {
+            'description': scenario.description,
+            'iterations': iterations,
+            'setup_seconds': round(setup_seconds, 3),
+            'mean_ms': round(statistics.fmean(samples), 3),
+            'min_ms': round(samples[0], 3),
+            'max_ms': round(samples[-1], 3),
+            'queries': len(queries.captured_queries),
+            'peak_memory_kb': round(peak / 1024, 1),
+        }
+        for value in PERCENTILES:
+            result[f'p{value}_ms'] = round(percentile(samples, value), 3)
+        return result
+
+
+def compare(results, baseline, threshold=1.2):
+    """
+    Compare results with a baseline run
+
+    A scenario regresses when its median latency grows by more than
+    ``threshold`` times or it runs more queries than in the baseline.
+
+    Returns:
+        list: One dict per scenario present in both runs
+    """
+    rows = []
+    for name, current in results['scenarios'].items():
+        previous = baseline.get('scenarios', {}).get(name)
+        if previous is None:
+            continue
+        ratio = current['p50_ms'] / previous['p50_ms'] if previous['p50_ms'] else None
+        rows.append({
+            'scenario': name,
+            'p50_ms': current['p50_ms'],
+            'baseline_p50_ms': previous['p50_ms'],
+            'ratio': round(ratio, 3) if ratio is not None else None,
+            'queries': current['queries'],
+            'baseline_queries': previous['queries'],
+            'regressed': (ratio is not None and ratio > threshold) or current['queries'] > previous['queries'],
+        })
+    return rows
+
+
+def load_results(path):
+    with open(path) as file:
+        return json.load(file)
+
+
+def save_results(results, path):
+    with open(path, 'w') as file:
+        json.dump(results, file, indent=2, sort_keys=True)
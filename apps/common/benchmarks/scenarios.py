@@ -0,0 +1,230 @@
+import io
+from decimal import Decimal
+
+import pandas as pd
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from rest_framework.test import APIClient
+
+from apps.common.benchmarks.runner import Scenario
+from apps.common.repositories.resource_version_repository import ResourceVersionRepository
+from apps.dealers.models import Dealer
+from apps.inventory.models import Item, Recipe, RecipeItem
+from apps.inventory.models.excel_import import ExcelImport
+from apps.inventory.repositories.bom_graph_repository import BOMGraphRepository
+from apps.inventory.services.customizable_product_service import CustomizableProductService
+from apps.inventory.services.excel_import_service import ExcelImportService
+from apps.inventory.services.production_service import ProductionService
+from apps.sales.models import Order
+from apps.sales.repositories.order_repository import OrderRepository
+
+User = get_user_model()
+
+
+def create_user(prefix):
+    return User.objects.create_user(username=f'{prefix}-benchmark', password='benchmark')
+
+
+def create_items(prefix, count, item_type='RAW', quantity=1_000_000, **fields):
+    return Item.objects.bulk_create([
+        Item(
+            name=f'{prefix} {item_type.title()} {index:06d}',
+            sku=f'{prefix}-{item_type}-{index}',
+            item_type=item_type,
+            unit_of_measure='pcs',
+            quantity=quantity,
+            **fields
+        )
+        for index in range(count)
+    ], batch_size=1000)
+
+
+def create_recipe_tree(prefix, depth, width):
+    """
+    Create a product whose recipe is ``depth`` levels deep with ``width``
+    inputs per level; every level also has one optional raw material.
+
+    Returns:
+        Item: The final product
+    """
+    raw_materials = create_items(prefix, width * depth + depth)
+    raw_index = 0
+    output = None
+    recipe_items = []
+    for level in range(depth):
+        item_type = 'FINAL' if level == depth - 1 else 'INTERMEDIATE'
+        product = Item.objects.create(
+            name=f'{prefix} Level {level}', sku=f'{prefix}-LEVEL-{level}',
+            item_type=item_type, unit_of_measure='pcs', quantity=1_000_000
+        )
+        recipe = Recipe.objects.create(
+            name=f'{prefix} Recipe {level}', output_item=product, output_quantity=1, unit_of_measure='pcs'
+        )
+        inputs = raw_materials[raw_index:raw_index + width]
+        optional = raw_materials[raw_index + width]
+        raw_index += width + 1
+        if output is not None:
+            inputs = [output] + inputs[1:]
+        for sequence, input_item in enumerate(inputs):
+            recipe_items.append(RecipeItem(
+                recipe=recipe, input_item=input_item, quantity_required=1 + sequence % 3,
+                unit_of_measure='pcs', sequence=sequence * 10
+            ))
+        recipe_items.append(RecipeItem(
+            recipe=recipe, input_item=optional, quantity_required=1,
+            unit_of_measure='pcs', sequence=width * 10, is_optional=True
+        ))
+        output = product
+    RecipeItem.objects.bulk_create(recipe_items)
+    # Scenarios run in a transaction that is rolled back, so bump the graph
+    # version now instead of on commit
+    ResourceVersionRepository.bump([BOMGraphRepository.VERSION_KEY])
+    BOMGraphRepository.expire()
+    return output
+
+
+class CreateProductionScenario(Scenario):
+    name = 'production.create_production'
+    description = 'ProductionService.create_production for a recipe with 10 x scale inputs'
+
+    def setup(self, scale):
+        user = create_user('PROD')
+        product = create_items('PROD-OUT', 1, item_type='FINAL')[0]
+        inputs = create_items('PROD', 10 * scale)
+        recipe = Recipe.objects.create(
+            name='Benchmark Production Recipe', output_item=product, output_quantity=1, unit_of_measure='pcs'
+        )
+        RecipeItem.objects.bulk_create([
+            RecipeItem(recipe=recipe, input_item=item, quantity_required=1, unit_of_measure='pcs', sequence=index)
+            for index, item in enumerate(inputs)
+        ])
+        return {'service': ProductionService(), 'recipe': recipe, 'user': user}
+
+    def run(self, context, iteration):
+        response = context['service'].create_production(
+            {'recipe': context['recipe'].id, 'output_quantity': 1}, context['user']
+        )
+        if response.status_code != 201:
+            raise RuntimeError(f'create_production failed: {response.data}')
+
+
+class BOMImportScenario(Scenario):
+    name = 'excel_import.process_bom_import'
+    description = 'ExcelImportService.process_bom_import of a 500 x scale row recipe sheet'
+    iterations = 5
+
+    def setup(self, scale):
+        rows = 500 * scale
+        recipes = max(rows // 10, 1)
+        create_items('BOM-OUT', recipes, item_type='FINAL')
+        create_items('BOM-IN', 100)
+        df = pd.DataFrame({
+            'output_sku': [f'BOM-OUT-FINAL-{index % recipes}' for index in range(rows)],
+            'output_quantity': 1,
+            'input_sku': [f'BOM-IN-RAW-{(index // recipes) % 100}' for index in range(rows)],
+            'quantity_required': [1 + index % 5 for index in range(rows)],
+            'unit_of_measure': 'pcs',
+            'sequence': [10 * (index // recipes) for index in range(rows)],
+            'is_optional': ['Y' if index % 7 == 0 else 'N' for index in range(rows)],
+        })
+        buffer = io.BytesIO()
+        df.to_excel(buffer, index=False)
+        path = default_storage.save('imports/inventory/benchmark-bom.xlsx', ContentFile(buffer.getvalue()))
+        return {'path': path}
+
+    def run(self, context, iteration):
+        excel_import = ExcelImport.objects.create(import_type='BOM', file=context['path'])
+        success, error = ExcelImportService.process_bom_import(excel_import.id)
+        if not success:
+            raise RuntimeError(f'BOM import failed: {error}')
+
+
+class CreateOrderScenario(Scenario):
+    name = 'sales.create_order_with_items'
+    description = 'OrderRepository.create_order_with_items with 20 x scale lines'
+
+    def setup(self, scale):
+        dealer = Dealer.objects.create(name='Benchmark Dealer', code='BENCH-DEALER')
+        items = create_items('ORDER', 20 * scale, item_type='FINAL', dealer_price=Decimal('125.50'))
+        lines = [
+            {'item': item, 'quantity': 1 + index % 4, 'unit_price': item.dealer_price,
+             'discount_percentage': Decimal(index % 3 * 5)}
+            for index, item in enumerate(items)
+        ]
+        return {'repository': OrderRepository(), 'dealer': dealer, 'lines': lines}
+
+    def run(self, context, iteration):
+        context['repository'].create_order_with_items(
+            {'order_number': f'BENCH-{iteration}', 'dealer': context['dealer']},
+            [dict(line) for line in context['lines']]
+        )
+
+
+class MaterialRequirementsScenario(Scenario):
+    name = 'inventory.calculate_material_requirements'
+    description = 'CustomizableProductService.calculate_material_requirements over a 5-level recipe tree'
+    iterations = 200
+
+    def setup(self, scale):
+        return {'product': create_recipe_tree('MRP', depth=5, width=4 * scale)}
+
+    def run(self, context, iteration):
+        requirements, error = CustomizableProductService.calculate_material_requirements(
+            context['product'].id, quantity=1 + iteration % 10, include_stock=True
+        )
+        if error:
+            raise RuntimeError(error)
+
+
+class EndpointScenario(Scenario):
+    """GET an API endpoint as an authenticated user"""
+    url = None
+
+    def create_data(self, scale):
+        pass
+
+    def setup(self, scale):
+        self.create_data(scale)
+        client = APIClient()
+        client.force_authenticate(create_user(self.name))
+        return {'client': client}
+
+    def run(self, context, iteration):
+        response = context['client'].get(self.url)
+        if response.status_code != 200:
+            raise RuntimeError(f'GET {self.url} returned {response.status_code}')
+
+
+class ItemListEndpointScenario(EndpointScenario):
+    name = 'api.inventory_items_list'
+    description = 'GET /api/v1/inventory/items/ (50 per page) over 1000 x scale items'
+    url = '/api/v1/inventory/items/?page_size=50'
+
+    def create_data(self, scale):
+        create_items('LIST', 1000 * scale)
+
+
+class OrderListEndpointScenario(EndpointScenario):
+    name = 'api.sales_orders_list'
+    description = 'GET /api/v1/sales/orders/ (50 per page) over 200 x scale orders'
+    url = '/api/v1/sales/orders/?page_size=50'
+
+    def create_data(self, scale):
+        dealer = Dealer.objects.create(name='Benchmark List Dealer', code='BENCH-LIST-DEALER')
+        Order.objects.bulk_create([
+            Order(order_number=f'BENCH-LIST-{index}', dealer=dealer) for index in range(200 * scale)
+        ], batch_size=1000)
+
+
+SCENARIOS = {
+    scenario.name: scenario
+    for scenario in (
+        CreateProductionScenario,
+        BOMImportScenario,
+        CreateOrderScenario,
+        MaterialRequirementsScenario,
+        ItemListEndpointScenario,
+        OrderListEndpointScenario,
+    )
+}
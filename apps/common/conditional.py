@@ -0,0 +1,90 @@
+import hashlib
+
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+from rest_framework import status
+from rest_framework.response import Response
+
+from apps.common.repositories.resource_version_repository import ResourceVersionRepository
+
+
+class NotModified(Exception):
+    """Raised before a handler runs when the client's copy is still current"""
+
+
+def _weak(etag):
+    return etag[2:] if etag.startswith('W/') else etag
+
+
+class ConditionalGetMixin:
+    """
+    Conditional GET for viewsets, from resource version counters.
+
+    Views declare the models their responses are built from:
+
+        etag_resources = ('inventory.Item', 'inventory.Category')
+
+    and may narrow them per request by overriding get_etag_keys(), e.g. to
+    a project's scope. For the actions in etag_actions the counters are read
+    (one query) after authentication and permission checks; a matching
+    If-None-Match (or, without one, a current If-Modified-Since) answers 304
+    before the handler runs, so no queryset or serializer is evaluated.
+    Other responses of those actions get a weak ETag and Last-Modified.
+    """
+    etag_resources = ()
+    etag_actions = ('list', 'retrieve')
+
+    def get_etag_keys(self, request):
+        """Version counter keys the response of the current request depends on"""
+        return [ResourceVersionRepository.key(resource) for resource in self.etag_resources]
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.resource_etag = None
+        self.resource_last_modified = None
+        if request.method not in ('GET', 'HEAD') or getattr(self, 'action', None) not in self.etag_actions:
+            return
+
+        keys = sorted(self.get_etag_keys(request))
+        versions = ResourceVersionRepository.get_versions(keys)
+        renderer = getattr(request, 'accepted_renderer', None)
+        signature = '|'.join([
+            request.get_full_path(),
+            getattr(renderer, 'format', ''),
+            *(f'{key}={versions.get(key, (0, None))[0]}' for key in keys),
+        ])
+        self.resource_etag = f'W/"{hashlib.blake2b(signature.encode(), digest_size=12).hexdigest()}"'
+        modified = [updated_at for _, updated_at in versions.values()]
+        if modified:
+            self.resource_last_modified = int(max(modified).timestamp())
+
+        if self.is_not_modified(request):
+            raise NotModified
+
+    def is_not_modified(self, request):
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+        if if_none_match:
+            etags = parse_etags(if_none_match)
+            return '*' in etags or _weak(self.resource_etag) in {_weak(etag) for etag in etags}
+        if_modified_since = parse_http_date_safe(request.META.get('HTTP_IF_MODIFIED_SINCE', ''))
+        return (
+            if_modified_since is not None
+            and self.resource_last_modified is not None
+            and self.resource_last_modified <= if_modified_since
+        )
+
+    def handle_exception(self, exc):
+        if isinstance(exc, NotModified):
+            return Response(status=status.HTTP_304_NOT_MODIFIED)
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if getattr(self, 'resource_etag', None) and response.status_code in (
+            status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED
+        ):
+            response['ETag'] = self.resource_etag
+            if self.resource_last_modified is not None:
+                response['Last-Modified'] = http_date(self.resource_last_modified)
+            # Cached copies must be revalidated, which is what the ETag makes cheap
+            response['Cache-Control'] = 'private, no-cache'
+        return response
@@ -0,0 +1,108 @@
+import json
+import logging
+import os
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.test.utils import override_settings
+
+from core.middleware.request_logging import RequestLogPipeline, RequestLoggingMiddleware, logger
+
+# Per-request budget of the logging middleware
+BUDGET_US = 50
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures the per-request overhead of RequestLoggingMiddleware against a bare '
+        'view, with records written to os.devnull on the background thread. The budget '
+        'applies to the CPU time of the request thread; wall time also includes the GIL '
+        'time taken by the writer thread.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=50000,
+                            help='Number of requests per scenario')
+        parser.add_argument('--queries', type=int, default=0,
+                            help='Number of SELECT 1 queries the view runs per request')
+
+    def handle(self, *args, **options):
+        self.queries = options['queries']
+        count = options['requests']
+
+        # Send the records to os.devnull so the benchmark measures the request thread only
+        RequestLogPipeline.stop()
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+        devnull = open(os.devnull, 'w')
+        logger.addHandler(logging.StreamHandler(devnull))
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+        factory = RequestFactory()
+        get_request = factory.get('/api/v1/inventory/items/', {'ordering': 'name', 'page_size': 50})
+        post_request = factory.post(
+            '/api/v1/sales/orders/', data=json.dumps({'customer': 'x' * 200, 'password': 'secret'}),
+            content_type='application/json'
+        )
+
+        scenarios = [
+            ('GET, every request logged', get_request, {}),
+            ('GET, 10% sampled', get_request, {'SAMPLE_RATE': 0.1}),
+            ('POST, body captured', post_request, {'LOG_BODIES': True}),
+        ]
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Benchmarking request logging over {count} requests '
+            f'({self.queries} queries per request)...'
+        ))
+        base_wall, base_cpu = self.run(self.view, get_request, count)
+        self.stdout.write(
+            f'{"bare view":>28}: {base_wall * 1e6 / count:8.2f} µs/request wall, '
+            f'{base_cpu * 1e6 / count:8.2f} µs/request CPU'
+        )
+
+        try:
+            for label, request, request_logging in scenarios:
+                with override_settings(REQUEST_LOGGING=request_logging):
+                    middleware = RequestLoggingMiddleware(self.view)
+                wall, cpu = self.run(middleware, request, count)
+                drain = self.drain()
+                overhead = (cpu - base_cpu) * 1e6 / count
+                style = self.style.SUCCESS if overhead < BUDGET_US else self.style.WARNING
+                self.stdout.write(style(
+                    f'{label:>28}: {(wall - base_wall) * 1e6 / count:8.2f} µs/request wall, '
+                    f'{overhead:8.2f} µs/request CPU overhead (budget {BUDGET_US} µs), '
+                    f'writer drained {drain * 1e3:.0f} ms after the last request'
+                ))
+        finally:
+            RequestLogPipeline.stop()
+            devnull.close()
+
+    def view(self, request):
+        if self.queries:
+            with connection.cursor() as cursor:
+                for _ in range(self.queries):
+                    cursor.execute('SELECT 1')
+        return HttpResponse(b'{"success": true}', content_type='application/json')
+
+    def run(self, handler, request, count):
+        """Get the wall time and the CPU time of this thread for count requests"""
+        for _ in range(min(count, 1000)):
+            handler(request)
+        self.drain()
+        start, start_cpu = time.perf_counter(), time.thread_time()
+        for _ in range(count):
+            handler(request)
+        return time.perf_counter() - start, time.thread_time() - start_cpu
+
+    @staticmethod
+    def drain():
+        """Wait for the writer thread to empty the queue"""
+        start = time.perf_counter()
+        while RequestLogPipeline.queue is not None and not RequestLogPipeline.queue.empty():
+            time.sleep(0.001)
+        return time.perf_counter() - start
@@ -0,0 +1,25 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.common.repositories.search_repository import SEARCH_TYPES, SearchIndexRepository
+
+
+class Command(BaseCommand):
+    help = (
+        'Rebuilds the search index from the searchable records '
+        '(needed after bulk writes, which send no signals)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--types', nargs='+', choices=list(SEARCH_TYPES),
+                            help='Entity types to rebuild (default: all)')
+        parser.add_argument('--batch-size', type=int, default=2000, help='Entries written per INSERT')
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        counts = SearchIndexRepository().rebuild(options['types'], batch_size=options['batch_size'])
+        summary = ', '.join(f'{count} {entity_type}' for entity_type, count in counts.items())
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt search entries ({summary}) in {time.perf_counter() - start:.1f} s'
+        ))
@@ -0,0 +1,91 @@
+import shutil
+import sys
+import tempfile
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+
+from apps.common.benchmarks import BenchmarkRunner, compare, load_results, save_results
+from apps.common.benchmarks.scenarios import SCENARIOS
+
+SCALES = {'small': 1, 'medium': 10, 'large': 50}
+
+
+class Command(BaseCommand):
+    help = (
+        'Runs the performance benchmark scenarios (services and API endpoints) and reports '
+        'latency percentiles, query counts and peak memory. All data is rolled back. '
+        'Intended for the SQLite benchmark settings: '
+        'DJANGO_SETTINGS_MODULE=config.settings.benchmark'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', default='small',
+                            help=f'Data scale: {", ".join(SCALES)} or a positive integer multiplier')
+        parser.add_argument('--iterations', type=int,
+                            help='Measured calls per scenario (default: per scenario)')
+        parser.add_argument('--scenarios', nargs='+', choices=sorted(SCENARIOS), default=sorted(SCENARIOS),
+                            metavar='SCENARIO', help='Scenarios to run')
+        parser.add_argument('--output', metavar='FILE', help='Save the results as JSON')
+        parser.add_argument('--baseline', metavar='FILE', help='Compare against a saved result file')
+        parser.add_argument('--threshold', type=float, default=1.2,
+                            help='Median latency ratio above which a scenario counts as regressed')
+        parser.add_argument('--fail-on-regression', action='store_true',
+                            help='Exit with status 1 when a scenario regressed against the baseline')
+
+    def handle(self, *args, **options):
+        scale = self.get_scale(options['scale'])
+        baseline = load_results(options['baseline']) if options['baseline'] else None
+
+        self.stdout.write(self.style.SUCCESS(f'Running {len(options["scenarios"])} benchmarks at scale {scale}...'))
+        media_root = tempfile.mkdtemp(prefix='smarteq-benchmark-')
+        runner = BenchmarkRunner(scale=scale, iterations=options['iterations'])
+        results = {'meta': runner.meta(), 'scenarios': {}}
+        try:
+            with override_settings(MEDIA_ROOT=media_root):
+                for name in options['scenarios']:
+                    result = runner.run_scenario(SCENARIOS[name]())
+                    results['scenarios'][name] = result
+                    self.stdout.write(
+                        f'{name:>42}: p50 {result["p50_ms"]:9.2f} ms  p95 {result["p95_ms"]:9.2f} ms  '
+                        f'p99 {result["p99_ms"]:9.2f} ms  {result["queries"]:5d} queries  '
+                        f'{result["peak_memory_kb"]:9.1f} KiB peak'
+                    )
+        finally:
+            shutil.rmtree(media_root, ignore_errors=True)
+
+        if options['output']:
+            save_results(results, options['output'])
+            self.stdout.write(f'Saved results to {options["output"]}')
+
+        if baseline is None:
+            return
+
+        if baseline.get('meta', {}).get('scale') != scale:
+            self.stdout.write(self.style.WARNING(
+                f'Baseline was recorded at scale {baseline.get("meta", {}).get("scale")}, not {scale}'
+            ))
+        rows = compare(results, baseline, options['threshold'])
+        regressed = [row for row in rows if row['regressed']]
+        for row in rows:
+            style = self.style.ERROR if row['regressed'] else self.style.SUCCESS
+            ratio = f'{row["ratio"]:.2f}x' if row['ratio'] is not None else 'n/a'
+            self.stdout.write(style(
+                f'{row["scenario"]:>42}: p50 {row["baseline_p50_ms"]:.2f} -> {row["p50_ms"]:.2f} ms ({ratio}), '
+                f'queries {row["baseline_queries"]} -> {row["queries"]}'
+            ))
+        if regressed and options['fail_on_regression']:
+            self.stderr.write(self.style.ERROR(f'{len(regressed)} scenario(s) regressed'))
+            sys.exit(1)
+
+    @staticmethod
+    def get_scale(value):
+        if value in SCALES:
+            return SCALES[value]
+        try:
+            scale = int(value)
+        except ValueError:
+            raise CommandError(f'Invalid scale: {value}')
+        if scale < 1:
+            raise CommandError('Scale must be a positive integer')
+        return scale
@@ -0,0 +1,101 @@
+import os
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from apps.common.seeding import SyntheticDataGenerator, SyntheticDataPlan
+from apps.dealers.models import Dealer
+
+
+class Command(BaseCommand):
+    help = (
+        'Generates a large, deterministic synthetic data set across all apps for load testing '
+        '(the seed_*_data commands create a small hand-written sample instead)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seed', type=int, default=1,
+                            help='Seed of the data set; the same seed and options always give the same rows')
+        parser.add_argument('--items', type=int, default=1000, help='Number of inventory items')
+        parser.add_argument('--orders', type=int, default=500, help='Number of orders (with 1-6 lines each)')
+        parser.add_argument('--quotations', type=int, help='Number of quotations (default: orders / 2)')
+        parser.add_argument('--dealers', type=int, default=50, help='Number of dealers')
+        parser.add_argument('--customers', type=int, help='Number of customers (default: 20 per dealer)')
+        parser.add_argument('--devices', type=int, help='Number of devices (default: 2 per order)')
+        parser.add_argument('--repairs', type=int, help='Number of repair requests (default: devices / 10)')
+        parser.add_argument('--bom-depth', type=int, default=4,
+                            help='Recipe levels from raw materials up to the final products')
+        parser.add_argument('--recipe-inputs', type=int, default=5, help='Input items per recipe')
+        parser.add_argument('--transactions-per-item', type=int, default=5,
+                            help='Average length of the inventory ledger of an item')
+        parser.add_argument('--projects', type=int, default=10, help='Number of projects')
+        parser.add_argument('--project-items', type=int, default=50, help='Inventory items per project')
+        parser.add_argument('--production-processes', type=int,
+                            help='Number of production processes (default: items / 100)')
+        parser.add_argument('--users', type=int, default=20, help='Number of users')
+        parser.add_argument('--categories', type=int, default=30, help='Number of item categories')
+        parser.add_argument('--days', type=int, default=365, help='Length of the generated history in days')
+        parser.add_argument('--end-date', type=date.fromisoformat,
+                            help='Last day of the history (YYYY-MM-DD, default: today)')
+        parser.add_argument('--workers', type=int,
+                            help='Worker processes (default: CPU count, or 1 on SQLite)')
+        parser.add_argument('--chunk-size', type=int, default=5000, help='Rows generated per worker task')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows per INSERT statement')
+
+    def handle(self, *args, **options):
+        self.verbosity = options['verbosity']
+        plan = SyntheticDataPlan(
+            seed=options['seed'],
+            items=options['items'],
+            orders=options['orders'],
+            quotations=options['quotations'],
+            customers=options['customers'],
+            dealers=options['dealers'],
+            devices=options['devices'],
+            repairs=options['repairs'],
+            bom_depth=options['bom_depth'],
+            recipe_inputs=options['recipe_inputs'],
+            transactions_per_item=options['transactions_per_item'],
+            projects=options['projects'],
+            project_items=options['project_items'],
+            production_processes=options['production_processes'],
+            users=options['users'],
+            categories=options['categories'],
+            days=options['days'],
+            end_date=options['end_date'],
+            chunk_size=options['chunk_size'],
+            batch_size=options['batch_size'],
+        )
+
+        if Dealer.objects.filter(code__startswith=f'{plan.prefix}-').exists():
+            raise CommandError(
+                f'Synthetic data for seed {plan.seed} already exists; use a different --seed'
+            )
+
+        workers = options['workers']
+        if workers is None:
+            # SQLite allows a single writer, so parallel workers would only wait on each other
+            workers = 1 if connection.vendor == 'sqlite' else os.cpu_count() or 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Generating synthetic data (seed {plan.seed}, {plan.items} items, {plan.orders} orders, '
+            f'BOM depth {plan.bom_depth}, {workers} worker(s))...'
+        ))
+
+        start = time.perf_counter()
+        counts = SyntheticDataGenerator(plan, workers=workers, progress=self.report).run()
+        elapsed = time.perf_counter() - start
+
+        total = sum(counts.values())
+        for table, rows in counts.items():
+            self.stdout.write(f'{table:>22}: {rows}')
+        self.stdout.write(self.style.SUCCESS(
+            f'Generated {total} root rows in {elapsed:.1f} s '
+            f'(ledgers, purchase records and document lines are written with their parents)'
+        ))
+
+    def report(self, table, rows, seconds):
+        if self.verbosity > 1:
+            self.stdout.write(f'  {table}: {rows} rows ({seconds:.2f} s)')
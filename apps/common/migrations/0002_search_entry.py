@@ -0,0 +1,111 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:47
+
+from django.db import migrations, models
+
+# Kept in sync with the search table by triggers (external content table)
+SQLITE_FULLTEXT = [
+    """
+    CREATE VIRTUAL TABLE common_searchentry_fts USING fts5(
+        keywords, content, content='common_searchentry', content_rowid='id'
+    )
+    """,
+    """
+    CREATE TRIGGER common_searchentry_fts_insert AFTER INSERT ON common_searchentry BEGIN
+        INSERT INTO common_searchentry_fts(rowid, keywords, content) VALUES (new.id, new.keywords, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER common_searchentry_fts_delete AFTER DELETE ON common_searchentry BEGIN
+        INSERT INTO common_searchentry_fts(common_searchentry_fts, rowid, keywords, content)
+        VALUES ('delete', old.id, old.keywords, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER common_searchentry_fts_update AFTER UPDATE ON common_searchentry BEGIN
+        INSERT INTO common_searchentry_fts(common_searchentry_fts, rowid, keywords, content)
+        VALUES ('delete', old.id, old.keywords, old.content);
+        INSERT INTO common_searchentry_fts(rowid, keywords, content) VALUES (new.id, new.keywords, new.content);
+    END
+    """,
+]
+SQLITE_FULLTEXT_REVERSE = [
+    "DROP TRIGGER IF EXISTS common_searchentry_fts_update",
+    "DROP TRIGGER IF EXISTS common_searchentry_fts_delete",
+    "DROP TRIGGER IF EXISTS common_searchentry_fts_insert",
+    "DROP TABLE IF EXISTS common_searchentry_fts",
+]
+
+MYSQL_FULLTEXT = [
+    "ALTER TABLE common_searchentry ADD FULLTEXT INDEX search_entry_keywords_ft (keywords)",
+    "ALTER TABLE common_searchentry ADD FULLTEXT INDEX search_entry_content_ft (content)",
+]
+MYSQL_FULLTEXT_REVERSE = [
+    "ALTER TABLE common_searchentry DROP INDEX search_entry_content_ft",
+    "ALTER TABLE common_searchentry DROP INDEX search_entry_keywords_ft",
+]
+
+
+def _execute(schema_editor, statements):
+    statements = statements.get(schema_editor.connection.vendor, [])
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def create_fulltext_index(apps, schema_editor):
+    """Full-text index of the database in use; other databases search with LIKE"""
+    _execute(schema_editor, {"sqlite": SQLITE_FULLTEXT, "mysql": MYSQL_FULLTEXT})
+
+
+def drop_fulltext_index(apps, schema_editor):
+    _execute(schema_editor, {"sqlite": SQLITE_FULLTEXT_REVERSE, "mysql": MYSQL_FULLTEXT_REVERSE})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchEntry",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "entity_type",
+                    models.CharField(max_length=20, verbose_name="Entity Type"),
+                ),
+                ("object_id", models.UUIDField(verbose_name="Object ID")),
+                ("title", models.CharField(max_length=255, verbose_name="Title")),
+                (
+                    "subtitle",
+                    models.CharField(
+                        blank=True, default="", max_length=255, verbose_name="Subtitle"
+                    ),
+                ),
+                (
+                    "keywords",
+                    models.TextField(blank=True, default="", verbose_name="Keywords"),
+                ),
+                (
+                    "content",
+                    models.TextField(blank=True, default="", verbose_name="Content"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="Updated At"),
+                ),
+            ],
+            options={
+                "verbose_name": "Search Entry",
+                "verbose_name_plural": "Search Entries",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("entity_type", "object_id"),
+                        name="search_entry_object_unique",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(create_fulltext_index, drop_fulltext_index),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0002_search_entry"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ResourceVersion",
+            fields=[
+                (
+                    "key",
+                    models.CharField(
+                        max_length=150,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="Key",
+                    ),
+                ),
+                (
+                    "version",
+                    models.PositiveBigIntegerField(default=0, verbose_name="Version"),
+                ),
+                ("updated_at", models.DateTimeField(verbose_name="Updated At")),
+            ],
+            options={
+                "verbose_name": "Resource Version",
+                "verbose_name_plural": "Resource Versions",
+            },
+        ),
+    ]
@@ -1,3 +1,6 @@
 from apps.common.models.base_model import BaseModel
+from apps.common.models.permission import Permission
+from apps.common.models.resource_version import ResourceVersion
+from apps.common.models.search_entry import SearchEntry
 
-__all__ = ["BaseModel"]
\ No newline at end of file
+__all__ = ["BaseModel", "Permission", "ResourceVersion", "SearchEntry"]
@@ -0,0 +1,29 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class ResourceVersion(models.Model):
+    """
+    Version counter of an API resource, for conditional GET.
+
+    One row per model label ("inventory.Item") and per scope of a model
+    ("projects.ProjectInventory:project=<id>"). Counters are bumped after
+    every committed write of the resource (see
+    apps.common.repositories.resource_version_repository) and turned into
+    the ETag of the responses built from it.
+
+    Fields:
+        key: Model label, optionally followed by a scope
+        version: Number of committed writes since the row was created
+        updated_at: Time of the last bump, sent as Last-Modified
+    """
+    key = models.CharField(_("Key"), max_length=150, primary_key=True)
+    version = models.PositiveBigIntegerField(_("Version"), default=0)
+    updated_at = models.DateTimeField(_("Updated At"))
+
+    class Meta:
+        verbose_name = _("Resource Version")
+        verbose_name_plural = _("Resource Versions")
+
+    def __str__(self):
+        return f"{self.key} v{self.version}"
@@ -0,0 +1,41 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class SearchEntry(models.Model):
+    """
+    Normalized search text of one searchable record (see
+    apps.common.repositories.search_repository.SEARCH_TYPES).
+
+    Rows are derived data kept in sync by apps.common.signals and rebuilt
+    with the rebuild_search_index command. Unlike the other models it has an
+    integer primary key: the SQLite FTS5 table indexes it by rowid. The
+    full-text indexes themselves are created by the migration for the
+    database in use (MariaDB FULLTEXT, SQLite FTS5).
+
+    Fields:
+        entity_type: Type of the record (item, customer, dealer, device)
+        object_id: Primary key of the record
+        title: Display title of the result
+        subtitle: Display subtitle of the result
+        keywords: Folded title and code tokens, ranked above content
+        content: Folded tokens of all searchable fields
+    """
+    id = models.BigAutoField(primary_key=True)
+    entity_type = models.CharField(_("Entity Type"), max_length=20)
+    object_id = models.UUIDField(_("Object ID"))
+    title = models.CharField(_("Title"), max_length=255)
+    subtitle = models.CharField(_("Subtitle"), max_length=255, blank=True, default='')
+    keywords = models.TextField(_("Keywords"), blank=True, default='')
+    content = models.TextField(_("Content"), blank=True, default='')
+    updated_at = models.DateTimeField(_("Updated At"), auto_now=True)
+
+    class Meta:
+        verbose_name = _("Search Entry")
+        verbose_name_plural = _("Search Entries")
+        constraints = [
+            models.UniqueConstraint(fields=['entity_type', 'object_id'], name='search_entry_object_unique'),
+        ]
+
+    def __str__(self):
+        return f"{self.entity_type}: {self.title}"
@@ -0,0 +1,291 @@
+import base64
+import json
+
+from django.conf import settings
+from django.db.models import Q
+from django_filters.filterset import filterset_factory
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from apps.common.responses import success_response, error_response
+from apps.common.utils.exports import EXPORT_FORMATS, streaming_export_response
+
+# Rows fetched per query when a whole list is read in keyset batches
+KEYSET_BATCH_SIZE = 2000
+
+
+class KeysetPagination:
+    """
+    Cursor (keyset) pagination over a fixed set of indexed orderings.
+
+    Every ordering is a tuple of non-null columns ending in the primary key,
+    so it is total and each page is fetched with a range condition on the
+    ordering's index instead of an OFFSET. No COUNT is run, so response time
+    stays flat however large the table grows.
+
+    The cursor is an opaque, URL-safe token holding the ordering name, the
+    ordering values of the row the page starts after and the direction.
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    ordering_query_param = 'ordering'
+    max_page_size = 500
+
+    def __init__(self, orderings, default_ordering, page_size=None):
+        self.orderings = orderings
+        self.default_ordering = default_ordering
+        self.page_size = page_size or settings.REST_FRAMEWORK.get('PAGE_SIZE') or 25
+        self.request = None
+        self.next_position = None
+        self.previous_position = None
+
+    def paginate_queryset(self, queryset, request):
+        """
+        Get one page of the queryset
+
+        Raises:
+            ValueError: When the cursor, ordering or page size is invalid
+        """
+        self.request = request
+        self.ordering_name = request.query_params.get(self.ordering_query_param) or self.default_ordering
+        if self.ordering_name not in self.orderings:
+            raise ValueError(
+                f"Invalid ordering. Must be one of {', '.join(sorted(self.orderings))}"
+            )
+        ordering = self.orderings[self.ordering_name]
+        self.page_size = self.get_page_size(request)
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        position, reverse = self.decode_cursor(cursor, queryset.model, ordering) if cursor else (None, False)
+
+        if reverse:
+            ordering = tuple(self._flip(field) for field in ordering)
+        if position is not None:
+            queryset = queryset.filter(self._after(ordering, position))
+
+        rows = list(queryset.order_by(*ordering)[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+
+        if rows:
+            first = self._position(rows[0], ordering)
+            last = self._position(rows[-1], ordering)
+            # Coming back from a later page there is always a next page, and
+            # moving forward from a cursor there is always a previous one
+            self.next_position = last if (has_more or reverse) else None
+            self.previous_position = first if (has_more if reverse else position is not None) else None
+        return rows
+
+    def get_page_size(self, request):
+        page_size = request.query_params.get(self.page_size_query_param)
+        if page_size is None:
+            return self.page_size
+        try:
+            page_size = int(page_size)
+        except ValueError:
+            raise ValueError("page_size must be an integer")
+        if page_size < 1:
+            raise ValueError("page_size must be a positive integer")
+        return min(page_size, self.max_page_size)
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+        return self._link(self.next_position, reverse=False)
+
+    def get_previous_link(self):
+        if self.previous_position is None:
+            return None
+        return self._link(self.previous_position, reverse=True)
+
+    def encode_cursor(self, position, reverse):
+        payload = json.dumps({'o': self.ordering_name, 'v': position, 'r': int(reverse)}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor, model, ordering):
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+            if payload['o'] != self.ordering_name or len(payload['v']) != len(ordering):
+                raise ValueError
+            position = [
+                model._meta.get_field(field.lstrip('-')).to_python(value)
+                for field, value in zip(ordering, payload['v'])
+            ]
+            return position, bool(payload['r'])
+        except Exception:
+            raise ValueError("Invalid cursor")
+
+    def _link(self, position, reverse):
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(position, reverse))
+
+    @staticmethod
+    def _position(row, ordering):
+        values = []
+        for field in ordering:
+            value = getattr(row, row._meta.get_field(field.lstrip('-')).attname)
+            values.append(value if isinstance(value, (int, bool, str)) else str(value))
+        return values
+
+    @staticmethod
+    def _flip(field):
+        return field[1:] if field.startswith('-') else f'-{field}'
+
+    @staticmethod
+    def _after(ordering, position):
+        """Build (a > x) OR (a = x AND b > y) OR ... for the given ordering"""
+        condition = Q()
+        equal = {}
+        for field, value in zip(ordering, position):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            condition |= Q(**equal, **{f'{name}__{lookup}': value})
+            equal[name] = value
+        return condition
+
+
+def keyset_rows(queryset, ordering, fields, batch_size=KEYSET_BATCH_SIZE):
+    """
+    Values of every row of a queryset, read in keyset batches.
+
+    Each batch is a range query on the ordering's index that starts after
+    the last row of the previous one, so memory stays flat and no batch
+    slows down with its position (unlike OFFSET, or iterator() on MySQL,
+    whose driver loads the whole result).
+
+    Args:
+        queryset: Filtered queryset
+        ordering: Total ordering of non-null columns ending in the primary key
+        fields: values_list lookups of each yielded row
+        batch_size: Rows per query
+
+    Yields:
+        tuple of the fields' values per row
+    """
+    names = [field.lstrip('-') for field in ordering]
+    queryset = queryset.order_by(*ordering)
+    position = None
+    while True:
+        batch = queryset.filter(KeysetPagination._after(ordering, position)) if position else queryset
+        rows = list(batch.values_list(*fields, *names)[:batch_size])
+        for row in rows:
+            yield row[:len(fields)]
+        if len(rows) < batch_size:
+            return
+        position = rows[-1][len(fields):]
+
+
+class KeysetListMixin:
+    """
+    Paginated, filterable list responses for ViewSets.
+
+    Subclasses declare the orderings clients may choose from and the fields
+    they may filter on; both should be backed by database indexes.
+
+        list_orderings = {'name': ('name', 'id'), '-created_at': ('-created_at', '-id')}
+        list_default_ordering = 'name'
+        list_filterset_fields = ['item_type', 'category']
+
+    By default the page is returned in the ApiResponse envelope, with the
+    rows in ``data`` and the cursor links in ``pagination``. Clients that want
+    the plain DRF cursor body ({next, previous, results}) pass
+    ``?envelope=false``; the project default is the API_LIST_ENVELOPE setting.
+
+    keyset_export_response() streams the whole filtered list as a CSV or
+    XLSX file instead, with the same filters and orderings.
+    """
+    list_orderings = {}
+    list_default_ordering = None
+    list_filterset_fields = ()
+    envelope_query_param = 'envelope'
+    export_format_query_param = 'file_type'
+
+    def filter_list_queryset(self, request, queryset, filterset_fields=None):
+        """
+        Apply the list filters of the request to a queryset
+
+        Returns:
+            tuple: (filtered queryset, None) or (None, filter errors)
+        """
+        filterset_fields = self.list_filterset_fields if filterset_fields is None else filterset_fields
+        if filterset_fields:
+            filterset_class = filterset_factory(queryset.model, fields=filterset_fields)
+            filterset = filterset_class(request.query_params, queryset=queryset, request=request)
+            if not filterset.is_valid():
+                return None, filterset.errors
+            queryset = filterset.qs
+        return queryset, None
+
+    def keyset_list_response(self, request, queryset, serializer_class, orderings=None,
+                             default_ordering=None, filterset_fields=None):
+        """
+        Filter, paginate and serialize a queryset into a list response
+
+        The orderings and filter fields default to the list_* attributes; pass
+        them explicitly for actions that list a different model.
+        """
+        queryset, errors = self.filter_list_queryset(request, queryset, filterset_fields)
+        if errors:
+            return error_response(error_message=errors)
+
+        paginator = KeysetPagination(
+            orderings or self.list_orderings, default_ordering or self.list_default_ordering
+        )
+        try:
+            page = paginator.paginate_queryset(queryset, request)
+        except ValueError as e:
+            return error_response(error_message=str(e))
+
+        data = serializer_class(page, many=True, context={'request': request}).data
+        if not self.use_envelope(request):
+            return Response({
+                'next': paginator.get_next_link(),
+                'previous': paginator.get_previous_link(),
+                'results': data
+            })
+        return success_response(data=data, pagination={
+            'next': paginator.get_next_link(),
+            'previous': paginator.get_previous_link(),
+            'page_size': paginator.page_size,
+            'ordering': paginator.ordering_name
+        })
+
+    def keyset_export_response(self, request, queryset, columns, filename, sheet_name='Sheet1',
+                               orderings=None, default_ordering=None, filterset_fields=None):
+        """
+        Filter a queryset like the list and stream all its rows as a file
+
+        Args:
+            columns: (title, values_list lookup) pairs of the file's columns
+            filename: File name without extension
+
+        The format comes from the file_type parameter (csv or xlsx, default
+        xlsx) and the row order from the list's ordering parameter.
+        """
+        queryset, errors = self.filter_list_queryset(request, queryset, filterset_fields)
+        if errors:
+            return error_response(error_message=errors)
+
+        orderings = orderings or self.list_orderings
+        ordering_name = request.query_params.get('ordering') or default_ordering or self.list_default_ordering
+        if ordering_name not in orderings:
+            return error_response(
+                error_message=f"Invalid ordering. Must be one of {', '.join(sorted(orderings))}"
+            )
+        file_format = request.query_params.get(self.export_format_query_param, 'xlsx')
+        if file_format not in EXPORT_FORMATS:
+            return error_response(
+                error_message=f"Invalid {self.export_format_query_param}. Must be one of {', '.join(EXPORT_FORMATS)}"
+            )
+
+        header = [title for title, _ in columns]
+        rows = keyset_rows(queryset, orderings[ordering_name], [lookup for _, lookup in columns])
+        return streaming_export_response(file_format, filename, header, rows, sheet_name=sheet_name)
+
+    def use_envelope(self, request):
+        value = request.query_params.get(self.envelope_query_param)
+        if value is None:
+            return getattr(settings, 'API_LIST_ENVELOPE', True)
+        return value.lower() not in ('0', 'false', 'no', 'off')
@@ -2,8 +2,10 @@ from apps.common.permissions.role_permissions import (
     IsSuperUser, IsSystemAdmin, IsSoftwareDeveloper, 
     IsHardwareExpert, IsTechnicalSupport, IsDealerNetwork,
     IsInstitutionManager, IsAdvancedInstitutionManager,
-    IsOwnerOrAdmin, ReadOnly, IsAdminOrRoles, IsSystemAdminOrSoftwareDeveloper
+    IsOwnerOrAdmin, ReadOnly, IsAdminOrRoles, IsSystemAdminOrSoftwareDeveloper,
+    HasRoles, HasPermissions
 )
+from apps.common.permissions.permission_matrix import PermissionMatrixRepository
 
 # Gelecekte eklenecek diğer permission modülleri için import satırları
 # from core.permissions.action_permissions import ...
@@ -23,5 +25,8 @@ __all__ = [
     'ReadOnly',
     'IsAdminOrRoles',
     'IsSystemAdminOrSoftwareDeveloper',
+    'HasRoles',
+    'HasPermissions',
+    'PermissionMatrixRepository',
     # Gelecekte eklenecek diğer permission sınıfları
 ]
\ No newline at end of file
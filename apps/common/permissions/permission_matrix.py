@@ -0,0 +1,140 @@
+import threading
+
+from django.core.cache import cache
+from django.db import transaction
+
+# Whether the current transaction changed roles or permissions
+_pending = threading.local()
+
+
+class PermissionMatrix:
+    """
+    Compiled role → permission lookup tables.
+
+    Every active permission code is given a bit, and every role is reduced to
+    its name and the bitmask of its active permissions. Checks are dictionary
+    lookups and integer ANDs, keyed by ``user.role_id``, so they never touch
+    the database or the user's ``role`` relation.
+    """
+
+    def __init__(self, role_names, role_masks, bits):
+        self.role_names = role_names
+        self.role_masks = role_masks
+        self.bits = bits
+        self._masks = {}
+
+    @classmethod
+    def build(cls):
+        """Build the matrix from roles, permissions and their links in three queries"""
+        from apps.common.models import Permission
+        from apps.users.models import Role
+
+        role_names = dict(Role.objects.filter(is_active=True).values_list('id', 'name'))
+        bits = {
+            code: 1 << position
+            for position, code in enumerate(
+                Permission.objects.filter(is_active=True).order_by('code').values_list('code', flat=True)
+            )
+        }
+
+        role_masks = dict.fromkeys(role_names, 0)
+        links = Role.permissions.through.objects.values_list('role_id', 'permission__code')
+        for role_id, code in links:
+            if role_id in role_masks and code in bits:
+                role_masks[role_id] |= bits[code]
+
+        return cls(role_names, role_masks, bits)
+
+    def role_name(self, role_id):
+        """Get the name of an active role, or None"""
+        return self.role_names.get(role_id)
+
+    def mask_for(self, codes):
+        """
+        Get the bitmask for a set of permission codes
+
+        Returns None when a code is unknown, so that a check against it fails.
+        """
+        codes = frozenset(codes)
+        if codes not in self._masks:
+            mask = 0
+            for code in codes:
+                bit = self.bits.get(code)
+                if bit is None:
+                    mask = None
+                    break
+                mask |= bit
+            self._masks[codes] = mask
+        return self._masks[codes]
+
+    def has_permissions(self, role_id, codes):
+        """Whether the role holds every one of the given permission codes"""
+        mask = self.mask_for(codes)
+        return mask is not None and self.role_masks.get(role_id, 0) & mask == mask
+
+    def has_any_permission(self, role_id, codes):
+        """Whether the role holds at least one of the given permission codes"""
+        mask = 0
+        for code in codes:
+            mask |= self.bits.get(code, 0)
+        return bool(self.role_masks.get(role_id, 0) & mask)
+
+    def permissions_for(self, role_id):
+        """Get the permission codes held by a role"""
+        mask = self.role_masks.get(role_id, 0)
+        return frozenset(code for code, bit in self.bits.items() if mask & bit)
+
+
+class PermissionMatrixRepository:
+    """
+    Process-wide access to the compiled permission matrix.
+
+    The matrix is built lazily on first use and rebuilt after invalidation.
+    A version number is kept in the Django cache so that a role or permission
+    change in one worker invalidates the matrix in all of them; the cache must
+    therefore be shared by every worker (REQUIRE_SHARED_CACHE). The version is
+    bumped once the change commits, so no worker can rebuild the matrix from
+    data older than the version it caches it under.
+    """
+    VERSION_CACHE_KEY = 'common:permission_matrix:version'
+
+    _matrix = None
+    _version = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_matrix(cls):
+        """Get the current permission matrix, building it if needed"""
+        version = cache.get(cls.VERSION_CACHE_KEY, 0)
+        matrix = cls._matrix
+        if matrix is not None and cls._version == version:
+            return matrix
+
+        with cls._lock:
+            if cls._matrix is None or cls._version != version:
+                cls._matrix = PermissionMatrix.build()
+                cls._version = version
+            return cls._matrix
+
+    @classmethod
+    def invalidate(cls):
+        """Rebuild the matrix in every worker once the current transaction commits"""
+        _pending.invalidate = True
+        # Every write registers a callback; the first one to run bumps the version
+        transaction.on_commit(cls._invalidate_pending)
+
+    @classmethod
+    def _invalidate_pending(cls):
+        if getattr(_pending, 'invalidate', False):
+            _pending.invalidate = False
+            cls.bump()
+
+    @classmethod
+    def bump(cls):
+        """Drop the compiled matrix in this process and bump the shared version"""
+        with cls._lock:
+            cls._matrix = None
+        try:
+            cache.incr(cls.VERSION_CACHE_KEY)
+        except ValueError:
+            cache.set(cls.VERSION_CACHE_KEY, 1, timeout=None)
@@ -1,17 +1,73 @@
 from rest_framework import permissions
 
-class IsAdminOrRoles(permissions.BasePermission):
+from apps.common.permissions.permission_matrix import PermissionMatrixRepository
+
+
+def get_role_id(user):
+    """Get the role id of an authenticated user without loading the role"""
+    if not (user and user.is_authenticated):
+        return None
+    return getattr(user, 'role_id', None)
+
+
+class HasRoles(permissions.BasePermission):
     """
-    Sadece superuser veya belirtilen role sahip kullanıcılar erişebilir.
+    Sadece belirtilen role sahip kullanıcılar erişebilir.
     allowed_roles: List[str]
+
+    Rol adı, derlenmiş izin matrisinden ``user.role_id`` ile okunur;
+    kontrol sırasında veritabanına gidilmez.
     """
     allowed_roles = []
+    allowed_role_set = frozenset()
+    allow_superuser = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.allowed_role_set = frozenset(cls.allowed_roles)
+
+    def has_permission(self, request, view):
+        user = request.user
+        if self.allow_superuser and user and user.is_superuser:
+            return True
+        role_id = get_role_id(user)
+        if role_id is None:
+            return False
+        return PermissionMatrixRepository.get_matrix().role_name(role_id) in self.allowed_role_set
+
+
+class IsAdminOrRoles(HasRoles):
+    """
+    Sadece superuser veya belirtilen role sahip kullanıcılar erişebilir.
+    allowed_roles: List[str]
+    """
+    allow_superuser = True
+
+
+class HasPermissions(permissions.BasePermission):
+    """
+    Sadece superuser veya view'ın istediği tüm izin kodlarına sahip rol erişebilir.
+
+    View üzerinde tanımlanır:
+        required_permissions = ['inventory.view_item']
+    ya da action bazında:
+        required_permissions = {'list': ['inventory.view_item'], 'create': ['inventory.add_item']}
+    """
+
+    def get_required_permissions(self, view):
+        required = getattr(view, 'required_permissions', ())
+        if isinstance(required, dict):
+            required = required.get(getattr(view, 'action', None), ())
+        return required
 
     def has_permission(self, request, view):
         user = request.user
-        return bool(
-            user and user.is_authenticated and (
-                user.is_superuser or
-                (hasattr(user, 'role') and user.role and user.role.name in self.allowed_roles)
-            )
-        )
+        if not (user and user.is_authenticated):
+            return False
+        if user.is_superuser:
+            return True
+        required = self.get_required_permissions(view)
+        if not required:
+            return True
+        role_id = get_role_id(user)
+        return role_id is not None and PermissionMatrixRepository.get_matrix().has_permissions(role_id, required)
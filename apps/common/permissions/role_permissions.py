@@ -1,5 +1,8 @@
 from rest_framework import permissions
 
+from apps.common.permissions.role_mixins import HasRoles, IsAdminOrRoles, HasPermissions, get_role_id
+from apps.common.permissions.permission_matrix import PermissionMatrixRepository
+
 class IsSuperUser(permissions.BasePermission):
     """
     Permission to only allow superusers.
@@ -7,105 +10,63 @@ class IsSuperUser(permissions.BasePermission):
     def has_permission(self, request, view):
         return bool(request.user and request.user.is_superuser)
 
-class IsAdminOrRoles(permissions.BasePermission):
-    """
-    Sadece superuser veya belirtilen role sahip kullanıcılar erişebilir.
-    allowed_roles: List[str]
-    """
-    allowed_roles = []
-
-    def has_permission(self, request, view):
-        user = request.user
-        return bool(
-            user and user.is_authenticated and (
-                user.is_superuser or
-                (hasattr(user, 'role') and user.role and user.role.name in self.allowed_roles)
-            )
-        )
-
 class IsSystemAdmin(IsAdminOrRoles):
     allowed_roles = ['Sistem Yöneticisi']
 
 class IsSystemAdminOrSoftwareDeveloper(IsAdminOrRoles):
     allowed_roles = ['Sistem Yöneticisi', 'Yazılım Uzmanı']
 
-class IsSoftwareDeveloper(permissions.BasePermission):
+class IsSoftwareDeveloper(HasRoles):
     """
     Permission to only allow software developers.
     """
-    def has_permission(self, request, view):
-        return bool(
-            request.user and 
-            request.user.role and 
-            request.user.role.name == 'Yazılım Uzmanı'
-        )
+    allowed_roles = ['Yazılım Uzmanı']
 
-class IsHardwareExpert(permissions.BasePermission):
+class IsHardwareExpert(HasRoles):
     """
     Permission to only allow hardware experts.
     """
-    def has_permission(self, request, view):
-        return bool(
-            request.user and 
-            request.user.role and 
-            request.user.role.name == 'Donanım Uzmanı'
-        )
+    allowed_roles = ['Donanım Uzmanı']
 
-class IsTechnicalSupport(permissions.BasePermission):
+class IsTechnicalSupport(HasRoles):
     """
     Permission to only allow technical support staff.
     """
-    def has_permission(self, request, view):
-        return bool(
-            request.user and 
-            request.user.role and 
-            request.user.role.name in ['Teknik Destek Uzmanı', 'Kıdemli Teknik Uzman']
-        )
+    allowed_roles = ['Teknik Destek Uzmanı', 'Kıdemli Teknik Uzman']
 
-class IsDealerNetwork(permissions.BasePermission):
+class IsDealerNetwork(HasRoles):
     """
     Permission to only allow dealer network staff.
     """
-    def has_permission(self, request, view):
-        return bool(
-            request.user and 
-            request.user.role and 
-            request.user.role.name in [
-                'Bayi Temsilcisi', 'Filo Yöneticisi', 
-                'Kıdemli Filo Yöneticisi', 'Filo Yetkilisi'
-            ]
-        )
+    allowed_roles = [
+        'Bayi Temsilcisi', 'Filo Yöneticisi',
+        'Kıdemli Filo Yöneticisi', 'Filo Yetkilisi'
+    ]
 
-class IsInstitutionManager(permissions.BasePermission):
+class IsInstitutionManager(HasRoles):
     """
     Permission to only allow institution managers.
     """
-    def has_permission(self, request, view):
-        return bool(
-            request.user and 
-            request.user.role and 
-            request.user.role.name in ['Kurum Yöneticisi', 'Kıdemli Kurum Yöneticisi']
-        )
+    allowed_roles = ['Kurum Yöneticisi', 'Kıdemli Kurum Yöneticisi']
 
-class IsAdvancedInstitutionManager(permissions.BasePermission):
+class IsAdvancedInstitutionManager(HasRoles):
     """
     Permission to only allow senior institution managers.
     """
-    def has_permission(self, request, view):
-        return bool(
-            request.user and 
-            request.user.role and 
-            request.user.role.name == 'Kıdemli Kurum Yöneticisi'
-        )
+    allowed_roles = ['Kıdemli Kurum Yöneticisi']
+
 class IsOwnerOrAdmin(permissions.BasePermission):
     """
     Permission to allow only owners of objects or admins to perform actions on them.
     """
+    admin_roles = frozenset(['Sistem Yöneticisi', 'Yazılım Uzmanı'])
+
     def has_object_permission(self, request, view, obj):
         # Admin level roles have full access
+        role_id = get_role_id(request.user)
         if request.user.is_superuser or (
-            request.user.role and 
-            request.user.role.name in ['Sistem Yöneticisi', 'Yazılım Uzmanı']
+            role_id is not None and
+            PermissionMatrixRepository.get_matrix().role_name(role_id) in self.admin_roles
         ):
             return True
         
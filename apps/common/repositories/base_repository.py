@@ -1,5 +1,34 @@
+from django.db import connections
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from apps.common.repositories.resource_version_repository import ResourceVersionRepository
+
+
+def related_count(model, field, **filters):
+    """
+    Number of ``model`` rows whose ``field`` points at the outer row.
+
+    A correlated subquery instead of Count() over a join, so the outer
+    query keeps its plan (no GROUP BY over every selected column) and can
+    still be paginated on an index.
+
+    Usage:
+        Order.objects.annotate(item_count=related_count(OrderItem, 'order'))
+    """
+    rows = model.objects.filter(**{field: OuterRef('pk')}, **filters).order_by().values(field)
+    return Coalesce(
+        Subquery(rows.annotate(count=Count('*')).values('count'), output_field=IntegerField()),
+        0
+    )
+
+
 class BaseRepository:
     model = None
+    # What the list serializer of the model reads besides its own columns;
+    # applied by for_list() so a page costs a fixed number of queries
+    list_select_related = ()
+    list_prefetch_related = ()
 
     def __init__(self, model_class=None):
         if model_class:
@@ -11,6 +40,29 @@ class BaseRepository:
     def list(self):
         return self.model.objects.all()
 
+    def get_list_annotations(self):
+        """Annotations (name -> expression) read by the list serializer"""
+        return {}
+
+    def for_list(self, queryset=None):
+        """
+        Apply the list plan to a queryset (all rows by default).
+
+        Related names come from joined rows, related collections from one
+        prefetch query each and counts from annotations, whatever the number
+        of rows serialized.
+        """
+        if queryset is None:
+            queryset = self.model.objects.all()
+        if self.list_select_related:
+            queryset = queryset.select_related(*self.list_select_related)
+        if self.list_prefetch_related:
+            queryset = queryset.prefetch_related(*self.list_prefetch_related)
+        annotations = self.get_list_annotations()
+        if annotations:
+            queryset = queryset.annotate(**annotations)
+        return queryset
+
     def get(self, **kwargs):
         return self.model.objects.get(**kwargs)
 
@@ -28,3 +80,25 @@ class BaseRepository:
 
     def filter(self, **kwargs):
         return self.model.objects.filter(**kwargs)
+
+    def bulk_upsert(self, objs, update_fields, batch_size=None):
+        """
+        Insert new and update existing instances with one statement per batch.
+
+        Rows whose primary key already exists get the given fields overwritten
+        (INSERT ... ON CONFLICT / ON DUPLICATE KEY UPDATE), which avoids the
+        per-object CASE expressions of bulk_update.
+        """
+        unique_fields = None
+        if connections[self.model.objects.db].features.supports_update_conflicts_with_target:
+            unique_fields = [self.model._meta.pk.name]
+        saved = self.model.objects.bulk_create(
+            objs,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=unique_fields,
+            update_fields=update_fields
+        )
+        # Bulk writes send no signals
+        ResourceVersionRepository.mark_changed(self.model, saved)
+        return saved
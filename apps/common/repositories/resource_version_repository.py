@@ -0,0 +1,128 @@
+import threading
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.common.models import ResourceVersion
+
+# Models whose writes are counted, with the foreign keys that also get a counter per value
+VERSIONED_MODELS = {
+    'inventory.Item': (),
+    'inventory.Category': (),
+    'inventory.Recipe': (),
+    'inventory.RecipeItem': (),
+    'dealers.Dealer': (),
+    'projects.Project': (),
+    'projects.ProjectInventory': ('project',),
+}
+
+# Keys and key prefixes waiting for a bump when the current transaction commits
+_pending = threading.local()
+
+
+def _label(model):
+    return model if isinstance(model, str) else model._meta.label
+
+
+class ResourceVersionRepository:
+    """
+    Version counters of API resources.
+
+    Writes mark a resource changed; its counters are bumped once the
+    transaction commits, so a response whose version was read before its
+    data can never carry a newer version than the data it holds. Counters
+    live in the database, which every worker shares.
+    """
+
+    @staticmethod
+    def key(model, **scope):
+        """Counter key of a model, or of one scope of it (e.g. project=<id>)"""
+        key = _label(model)
+        if scope:
+            key += ':' + ','.join(f'{name}={value}' for name, value in sorted(scope.items()))
+        return key
+
+    @staticmethod
+    def get_versions(keys):
+        """
+        Current counters of the given keys in one query.
+
+        Returns:
+            dict: key -> (version, updated_at); never written keys are missing
+        """
+        return {
+            row.key: (row.version, row.updated_at)
+            for row in ResourceVersion.objects.filter(key__in=list(keys))
+        }
+
+    @staticmethod
+    def bump(keys=(), prefixes=()):
+        """Increment the counters of the given keys and of every key starting with a prefix"""
+        now = timezone.now()
+        keys = set(keys)
+        if keys:
+            updated = ResourceVersion.objects.filter(key__in=keys).update(version=F('version') + 1, updated_at=now)
+            if updated < len(keys):
+                ResourceVersion.objects.bulk_create(
+                    [ResourceVersion(key=key, version=1, updated_at=now) for key in keys],
+                    ignore_conflicts=True
+                )
+        for prefix in prefixes:
+            ResourceVersion.objects.filter(key__startswith=prefix).update(version=F('version') + 1, updated_at=now)
+
+    @staticmethod
+    @transaction.atomic
+    def increment(key):
+        """Increment one counter under a row lock and get its new value"""
+        row, _ = ResourceVersion.objects.select_for_update().get_or_create(
+            key=key, defaults={'updated_at': timezone.now()}
+        )
+        row.version += 1
+        row.updated_at = timezone.now()
+        row.save(update_fields=['version', 'updated_at'])
+        return row.version
+
+    @classmethod
+    def mark_changed(cls, model, objs=None):
+        """
+        Bump the counters of a model when the current transaction commits.
+
+        Args:
+            model: Model class or label; models outside VERSIONED_MODELS are ignored
+            objs: Written instances, whose scopes are bumped too; without them
+                (e.g. after a queryset update) every scope of the model is bumped
+        """
+        label = _label(model)
+        scope_fields = VERSIONED_MODELS.get(label)
+        if scope_fields is None:
+            return
+        keys, prefixes = {label}, set()
+        if scope_fields:
+            if objs is None:
+                prefixes.add(f'{label}:')
+            else:
+                for obj in objs:
+                    keys.update(
+                        cls.key(label, **{field: getattr(obj, obj._meta.get_field(field).attname)})
+                        for field in scope_fields
+                    )
+        cls.bump_on_commit(keys, prefixes)
+
+    @classmethod
+    def bump_on_commit(cls, keys=(), prefixes=()):
+        """Bump the given counters (see bump) when the current transaction commits"""
+        if not hasattr(_pending, 'keys'):
+            _pending.keys, _pending.prefixes = set(), set()
+        _pending.keys.update(keys)
+        _pending.prefixes.update(prefixes)
+        # Every write registers a callback; the first one to run bumps all pending keys
+        transaction.on_commit(cls._bump_pending)
+
+    @classmethod
+    def _bump_pending(cls):
+        keys = getattr(_pending, 'keys', None)
+        prefixes = getattr(_pending, 'prefixes', None)
+        if keys or prefixes:
+            _pending.keys, _pending.prefixes = set(), set()
+            cls.bump(keys, prefixes)
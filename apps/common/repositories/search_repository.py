@@ -0,0 +1,402 @@
+import uuid
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from itertools import islice
+
+from django.apps import apps
+from django.db import connection, transaction
+from django.db.models import Case, IntegerField, Value, When
+from django.db.models.expressions import RawSQL
+
+from apps.common.models import SearchEntry
+from apps.common.repositories.base_repository import BaseRepository
+from apps.common.utils.search_text import compact, tokenize
+
+# Query tokens beyond this are ignored
+MAX_QUERY_TOKENS = 8
+# Shortest token MariaDB indexes (innodb_ft_min_token_size); shorter ones fall back to LIKE
+FULLTEXT_MIN_TOKEN_SIZE = 3
+# Relative weight of a keyword (title / code) match against a content match
+KEYWORD_WEIGHT = 4.0
+# Records per IN list when refreshing entries
+REFRESH_CHUNK_SIZE = 500
+
+FTS_TABLE = 'common_searchentry_fts'
+
+
+class SearchType:
+    """
+    How the records of one model are written to the search index.
+
+    Args:
+        model: Model label
+        title: Fields joined into the result title
+        subtitle: Fields joined into the result subtitle
+        keys: Code-like fields, also indexed with their separators removed
+        text: Other searchable fields
+        follows: Model label -> lookup of the records whose entry also
+            changes when a record of that model does (e.g. a device shows
+            its item's name)
+        select_related: Relations read by the fields
+        filters: Records that are indexed at all
+        public: Whether the /search endpoint returns this type
+    """
+
+    def __init__(self, model, title, subtitle=(), keys=(), text=(), follows=None, select_related=(),
+                 filters=None, public=True):
+        self.model_label = model
+        self.title = title
+        self.subtitle = subtitle
+        self.keys = keys
+        self.text = text
+        self.follows = follows or {}
+        self.select_related = select_related
+        self.filters = filters or {}
+        self.public = public
+        # Columns whose change requires a new entry (for update_fields saves): own ones and,
+        # per followed model, the ones read through the relation
+        paths = [field.split('__') for field in (*title, *subtitle, *keys, *text, *self.filters)]
+        self.fields = frozenset(path[0] for path in paths)
+        self.followed_fields = {
+            label: frozenset(path[1] for path in paths if len(path) > 1 and path[0] == lookup.removesuffix('_id'))
+            for label, lookup in self.follows.items()
+        }
+
+    @property
+    def model(self):
+        return apps.get_model(self.model_label)
+
+    def queryset(self):
+        # Only the columns the entry is built from
+        return self.model.objects.filter(**self.filters).select_related(*self.select_related).only(
+            *self.title, *self.subtitle, *self.keys, *self.text
+        ).order_by()
+
+    @staticmethod
+    def _value(obj, field):
+        for name in field.split('__'):
+            obj = getattr(obj, name, None)
+            if obj is None:
+                return ''
+        return str(obj)
+
+    def _join(self, obj, fields):
+        return ' '.join(filter(None, (self._value(obj, field) for field in fields)))
+
+    def entry(self, entity_type, obj):
+        keys = [self._value(obj, field) for field in self.keys]
+        title = self._join(obj, self.title) or next(filter(None, keys), '') or str(obj.pk)
+        compacts = [value for value in map(compact, keys) if value and value not in keys]
+        keywords = tokenize(title) + [token for key in keys for token in tokenize(key)] + compacts
+        content = keywords + [token for field in self.text for token in tokenize(self._value(obj, field))]
+        return SearchEntry(
+            entity_type=entity_type,
+            object_id=obj.pk,
+            title=title[:255],
+            subtitle=self._join(obj, self.subtitle)[:255],
+            keywords=' '.join(dict.fromkeys(keywords)),
+            content=' '.join(dict.fromkeys(content)),
+        )
+
+
+ACTIVE = {'deleted_at__isnull': True}
+
+SEARCH_TYPES = {
+    'item': SearchType(
+        'inventory.Item', title=('name',), subtitle=('sku',),
+        keys=('sku', 'reference'), text=('description',), filters=ACTIVE,
+    ),
+    'customer': SearchType(
+        'customers.Customer', title=('name',), subtitle=('contact_person',),
+        keys=('phone', 'tax_id'), text=('contact_person', 'email', 'tax_office'), filters=ACTIVE,
+    ),
+    'dealer': SearchType(
+        'dealers.Dealer', title=('name',), subtitle=('code',),
+        keys=('code', 'phone', 'tax_id'), text=('contact_person', 'email', 'tax_office'), filters=ACTIVE,
+    ),
+    'device': SearchType(
+        'sales.Device', title=('serial_number',), subtitle=('item__name',),
+        keys=('serial_number', 'item__sku'), text=('item__name',),
+        follows={'inventory.Item': 'item_id'}, select_related=('item',), filters=ACTIVE,
+    ),
+    # Used by the user list search, not returned by /search
+    'user': SearchType(
+        'users.User', title=('first_name', 'last_name'), subtitle=('username',),
+        keys=('username',), text=('email',), public=False,
+    ),
+}
+
+PUBLIC_SEARCH_TYPES = tuple(name for name, search_type in SEARCH_TYPES.items() if search_type.public)
+
+
+def _chunks(values, size=REFRESH_CHUNK_SIZE):
+    values = iter(values)
+    while chunk := list(islice(values, size)):
+        yield chunk
+
+
+class LikeSearchBackend:
+    """
+    Portable backend: substring matches on the folded content column.
+
+    Scans the (narrow) search table; used on databases without a full-text
+    backend and for MariaDB queries made only of tokens too short for its
+    FULLTEXT index.
+    """
+
+    def matching(self, entity_type, tokens):
+        queryset = SearchEntry.objects.filter(entity_type=entity_type)
+        for token in tokens:
+            queryset = queryset.filter(content__contains=token)
+        return queryset
+
+    def search(self, entity_types, tokens, limit):
+        rows = []
+        # One point per query token found among the keywords (title and codes)
+        score = sum(
+            (Case(When(keywords__contains=token, then=Value(1)), default=Value(0), output_field=IntegerField())
+             for token in tokens),
+            Value(0)
+        )
+        for entity_type in entity_types:
+            queryset = self.matching(entity_type, tokens)
+            total = queryset.count()
+            if not total:
+                continue
+            for entry in queryset.annotate(score=score).order_by('-score', 'title')[:limit]:
+                rows.append((entity_type, entry.object_id, entry.title, entry.subtitle, float(entry.score), total))
+        return rows
+
+
+class RawSearchBackend(ABC):
+    """
+    Backend running the full-text query as raw SQL with per-type caps in a window function.
+
+    Subclasses give the SQL fragments of their database and build its match query.
+    """
+    from_sql = None
+    match_sql = None
+    score_sql = None
+
+    @abstractmethod
+    def match_query(self, tokens):
+        """Full-text query string matching every token as a prefix"""
+
+    def matching(self, entity_type, tokens):
+        query = self.match_query(tokens)
+        return RawSQL(
+            f"SELECT e.object_id FROM {self.from_sql} WHERE {self.match_sql} AND e.entity_type = %s",
+            [*self.match_params(query), entity_type]
+        )
+
+    def match_params(self, query):
+        return [query]
+
+    def search(self, entity_types, tokens, limit):
+        query = self.match_query(tokens)
+        placeholders = ', '.join(['%s'] * len(entity_types))
+        sql = f"""
+            SELECT entity_type, object_id, title, subtitle, score, total FROM (
+                SELECT m.*,
+                       ROW_NUMBER() OVER (PARTITION BY entity_type ORDER BY score DESC, title) AS position,
+                       COUNT(*) OVER (PARTITION BY entity_type) AS total
+                FROM (
+                    SELECT e.entity_type, e.object_id, e.title, e.subtitle, {self.score_sql} AS score
+                    FROM {self.from_sql}
+                    WHERE {self.match_sql} AND e.entity_type IN ({placeholders})
+                ) m
+            ) ranked
+            WHERE position <= %s
+            ORDER BY score DESC, title
+        """
+        params = [*self.score_params(query), *self.match_params(query), *entity_types, limit]
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return [
+                (entity_type, uuid.UUID(str(object_id)), title, subtitle, float(score), total)
+                for entity_type, object_id, title, subtitle, score, total in cursor.fetchall()
+            ]
+
+    def score_params(self, query):
+        return []
+
+
+class FTS5SearchBackend(RawSearchBackend):
+    """SQLite backend: FTS5 table over keywords and content, ranked by bm25"""
+    from_sql = f'common_searchentry e JOIN {FTS_TABLE} f ON f.rowid = e.id'
+    match_sql = f'{FTS_TABLE} MATCH %s'
+    score_sql = f'-bm25({FTS_TABLE}, {KEYWORD_WEIGHT}, 1.0)'
+
+    def match_query(self, tokens):
+        # Quoted prefix queries, implicitly ANDed
+        return ' '.join(f'"{token}"*' for token in tokens)
+
+
+class FullTextSearchBackend(RawSearchBackend):
+    """MariaDB / MySQL backend: FULLTEXT indexes on keywords and content in boolean mode"""
+    from_sql = 'common_searchentry e'
+    match_sql = 'MATCH (e.content) AGAINST (%s IN BOOLEAN MODE)'
+    score_sql = (
+        f'{KEYWORD_WEIGHT} * MATCH (e.keywords) AGAINST (%s IN BOOLEAN MODE)'
+        ' + MATCH (e.content) AGAINST (%s IN BOOLEAN MODE)'
+    )
+
+    def match_query(self, tokens):
+        return ' '.join(f'+{token}*' for token in tokens)
+
+    def score_params(self, query):
+        return [query, query]
+
+
+class SearchIndexRepository(BaseRepository):
+    """
+    Repository for the search index.
+    Writes SearchEntry rows for the SEARCH_TYPES records and answers ranked
+    queries with the full-text backend of the database in use.
+    """
+
+    def __init__(self):
+        super().__init__(SearchEntry)
+
+    @staticmethod
+    def get_backend(tokens=()):
+        vendor = connection.vendor
+        if vendor == 'sqlite':
+            return FTS5SearchBackend()
+        if vendor == 'mysql' and all(len(token) >= FULLTEXT_MIN_TOKEN_SIZE for token in tokens):
+            return FullTextSearchBackend()
+        return LikeSearchBackend()
+
+    @staticmethod
+    def query_tokens(query):
+        return list(dict.fromkeys(tokenize(query)))[:MAX_QUERY_TOKENS]
+
+    @staticmethod
+    def watched_models():
+        """Model labels whose writes change search entries"""
+        labels = {search_type.model_label for search_type in SEARCH_TYPES.values()}
+        return labels | {label for search_type in SEARCH_TYPES.values() for label in search_type.follows}
+
+    @staticmethod
+    def affects_index(model_label, update_fields):
+        """Whether a save with the given update_fields can change any entry"""
+        if not update_fields:
+            return True
+        fields = set(update_fields)
+        for search_type in SEARCH_TYPES.values():
+            if search_type.model_label == model_label and search_type.fields & fields:
+                return True
+            if search_type.followed_fields.get(model_label, frozenset()) & fields:
+                return True
+        return False
+
+    def search(self, query, entity_types=PUBLIC_SEARCH_TYPES, limit=10):
+        """
+        Ranked search across entity types.
+
+        Args:
+            query: Search text
+            entity_types: Types to search
+            limit: Maximum number of results per type
+
+        Returns:
+            List of (entity_type, object_id, title, subtitle, score, total)
+            tuples, best first; total is the number of matches of the type
+        """
+        tokens = self.query_tokens(query)
+        if not tokens or not entity_types:
+            return []
+        return self.get_backend(tokens).search(list(entity_types), tokens, limit)
+
+    def matching(self, entity_type, query):
+        """
+        Subquery of the primary keys of the records of a type matching a query,
+        for use as ``Model.objects.filter(pk__in=...)``; None without tokens.
+        """
+        tokens = self.query_tokens(query)
+        if not tokens:
+            return None
+        return self.get_backend(tokens).matching(entity_type, tokens)
+
+    def refresh(self, entity_type, values, lookup='pk'):
+        """
+        Rewrite the entries of the records of a type selected by a lookup.
+
+        With the default primary key lookup, entries of records that no
+        longer exist (or are no longer indexed) are removed. Entries whose
+        text did not change are left alone, so re-saving records without
+        touching their searchable fields writes nothing.
+
+        Returns:
+            Number of entries written
+        """
+        search_type = SEARCH_TYPES[entity_type]
+        written = 0
+        for chunk in _chunks(values):
+            entries = {
+                obj.pk: search_type.entry(entity_type, obj)
+                for obj in search_type.queryset().filter(**{f'{lookup}__in': chunk})
+            }
+            stale = set(chunk) if lookup == 'pk' else set()
+            stale.update(entries)
+            current = defaultdict(list)
+            for object_id, *text in self.model.objects.filter(
+                entity_type=entity_type, object_id__in=stale
+            ).values_list('object_id', 'title', 'subtitle', 'keywords', 'content'):
+                current[object_id].append(tuple(text))
+            unchanged = {
+                pk for pk, entry in entries.items()
+                if current.get(pk) == [(entry.title, entry.subtitle, entry.keywords, entry.content)]
+            }
+            outdated = set(current) - unchanged
+            changed = [entry for pk, entry in entries.items() if pk not in unchanged]
+            with transaction.atomic():
+                if outdated:
+                    self.model.objects.filter(entity_type=entity_type, object_id__in=outdated).delete()
+                self.model.objects.bulk_create(changed)
+            written += len(changed)
+        return written
+
+    def add(self, entity_type, objects, batch_size=2000):
+        """
+        Write the entries of records just created with bulk_create (which
+        sends no signals); relations read by the type must be loaded.
+        """
+        search_type = SEARCH_TYPES[entity_type]
+        self.model.objects.bulk_create(
+            [search_type.entry(entity_type, obj) for obj in objects], batch_size=batch_size
+        )
+
+    def add_for(self, model_label, objects):
+        """Write the entries of records of a model just inserted in bulk (nothing follows them yet)"""
+        for entity_type, search_type in SEARCH_TYPES.items():
+            if search_type.model_label == model_label:
+                self.add(entity_type, objects)
+
+    def refresh_for(self, model_label, pks):
+        """Rewrite the entries of the given records of a model and of the records that follow them"""
+        pks = list(pks)
+        for entity_type, search_type in SEARCH_TYPES.items():
+            if search_type.model_label == model_label:
+                self.refresh(entity_type, pks)
+            if model_label in search_type.follows:
+                self.refresh(entity_type, pks, lookup=search_type.follows[model_label])
+
+    def rebuild(self, entity_types=None, batch_size=2000):
+        """
+        Rebuild the entries of the given types (all by default).
+
+        Returns:
+            dict: entity type -> number of entries
+        """
+        counts = {}
+        for entity_type in entity_types or SEARCH_TYPES:
+            search_type = SEARCH_TYPES[entity_type]
+            with transaction.atomic():
+                self.model.objects.filter(entity_type=entity_type).delete()
+                objects = search_type.queryset().iterator(chunk_size=batch_size)
+                counts[entity_type] = 0
+                for chunk in _chunks(objects, batch_size):
+                    self.model.objects.bulk_create([search_type.entry(entity_type, obj) for obj in chunk])
+                    counts[entity_type] += len(chunk)
+        return counts
@@ -10,19 +10,22 @@ class ApiResponse(Response):
         "error": string | null,
         "status": number
     }
+    Sayfalanmış listelerde ayrıca "pagination" anahtarı eklenir.
     """
-    def __init__(self, data=None, error=None, status_code=status.HTTP_200_OK, **kwargs):
+    def __init__(self, data=None, error=None, status_code=status.HTTP_200_OK, pagination=None, **kwargs):
         content = {
             'data': data,
             'error': error,
             'status': status_code
         }
+        if pagination is not None:
+            content['pagination'] = pagination
         super().__init__(data=content, status=status_code, **kwargs)
 
 
-def success_response(data=None, status_code=status.HTTP_200_OK, **kwargs):
+def success_response(data=None, status_code=status.HTTP_200_OK, pagination=None, **kwargs):
     """Başarılı API yanıtı oluşturmak için yardımcı fonksiyon"""
-    return ApiResponse(data=data, error=None, status_code=status_code, **kwargs)
+    return ApiResponse(data=data, error=None, status_code=status_code, pagination=pagination, **kwargs)
 
 
 def error_response(error_message, status_code=status.HTTP_400_BAD_REQUEST, **kwargs):
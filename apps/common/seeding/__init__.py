@@ -0,0 +1,3 @@
+from apps.common.seeding.synthetic import SyntheticDataGenerator, SyntheticDataPlan
+
+__all__ = ['SyntheticDataGenerator', 'SyntheticDataPlan']
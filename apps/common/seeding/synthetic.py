@@ -0,0 +1,807 @@
+"""
+Deterministic, high-volume synthetic data for load testing.
+
+Every row is derived from (seed, table, index): primary keys are hashed from
+it and each row draws its values from its own random generator. Any chunk of
+any table can therefore be generated in any process, in any order, and
+children can reference their parents (and read their attributes) without
+querying the database.
+
+Tables are written in phases; the tables of one phase only reference the
+phases before it and are generated in parallel, in chunks, with bulk_create.
+"""
+
+import hashlib
+import multiprocessing
+import random
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, time as day_time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+
+import django
+from django.contrib.auth.hashers import make_password
+from django.db import connections, transaction
+from django.utils import timezone
+
+from apps.customers.models import Customer, CustomerType
+from apps.dealers.models import Dealer
+from apps.inventory.models import Category, InventoryTransaction, Item, ProductionProcess, Recipe, RecipeItem
+from apps.inventory.models.purchase_history import PurchaseHistory
+from apps.projects.models import Project, ProjectInventory
+from apps.sales.models import (
+    CurrencyType, Device, Order, OrderItem, OrderStatus, Quotation, QuotationItem, QuotationStatus
+)
+from apps.sales.models.device import warranty_end
+from apps.service.models import RepairPart, RepairRequest, RepairStatus
+from apps.users.models import User
+
+CENT = Decimal('0.01')
+
+RAW_PARTS = (
+    'Resistor', 'Capacitor', 'Diode', 'Transistor', 'PCB', 'Screw', 'Cable', 'Connector',
+    'Sensor', 'Relay', 'Fuse', 'LED', 'Battery', 'Enclosure', 'Gasket', 'Antenna',
+)
+INTERMEDIATE_PARTS = (
+    'Control Board', 'Power Module', 'Sensor Assembly', 'Display Unit',
+    'Cable Harness', 'Main Board', 'Front Panel', 'Relay Module',
+)
+FINAL_PRODUCTS = (
+    'Smart Meter', 'Gateway', 'Controller', 'Thermostat', 'Alarm Panel', 'Tracker', 'Data Logger', 'Smart Plug',
+)
+FIRST_NAMES = ('Ahmet', 'Mehmet', 'Ayşe', 'Fatma', 'Mustafa', 'Zeynep', 'Emre', 'Elif', 'Can', 'Deniz', 'Burak', 'Selin')
+LAST_NAMES = ('Yılmaz', 'Kaya', 'Demir', 'Şahin', 'Çelik', 'Yıldız', 'Öztürk', 'Aydın', 'Arslan', 'Doğan')
+CITIES = ('İstanbul', 'Ankara', 'İzmir', 'Bursa', 'Antalya', 'Konya', 'Adana', 'Kocaeli')
+SUPPLIERS = ('Elektronik A.Ş.', 'Komponent Ltd.', 'Mikro Tedarik', 'Anadolu Elektrik', 'Global Parts')
+ISSUES = (
+    'Device not powering on', 'Screen display malfunction', 'Connectivity issues',
+    'Battery not charging', 'Sensor readings incorrect', 'Physical damage to casing',
+    'Firmware update failed', 'Overheating during operation',
+)
+
+# Share of the item catalogue per item type; the rest are final products
+RAW_SHARE = 0.6
+INTERMEDIATE_SHARE = 0.25
+
+
+def get_multiprocessing_context():
+    # Spawned workers start from a clean interpreter instead of inheriting open connections
+    return multiprocessing.get_context('spawn')
+
+
+@contextmanager
+def explicit_timestamps(*models):
+    """
+    Let bulk_create keep the values assigned to auto_now/auto_now_add fields.
+
+    Synthetic history is spread over past dates, which those fields would
+    otherwise overwrite with the current time.
+    """
+    fields = [
+        field for model in models for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False)
+    ]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class SyntheticDataPlan:
+    """
+    Row counts and options of one generation run.
+
+    Counts left as None are derived from the item and order counts.
+    All names, codes and numbers contain the seed, so plans with different
+    seeds can be loaded into the same database.
+    """
+
+    def __init__(self, seed=1, items=1000, orders=500, quotations=None, customers=None, dealers=50,
+                 devices=None, repairs=None, bom_depth=4, recipe_inputs=5, transactions_per_item=5,
+                 projects=10, project_items=50, production_processes=None, users=20, categories=30,
+                 days=365, end_date=None, chunk_size=5000, batch_size=1000):
+        self.seed = seed
+        self.items = items
+        self.orders = orders
+        self.quotations = orders // 2 if quotations is None else quotations
+        self.dealers = max(dealers, 1)
+        self.customers = self.dealers * 20 if customers is None else customers
+        self.devices = orders * 2 if devices is None else devices
+        self.repairs = self.devices // 10 if repairs is None else repairs
+        self.bom_depth = max(bom_depth, 1)
+        self.recipe_inputs = max(recipe_inputs, 1)
+        self.transactions_per_item = transactions_per_item
+        self.projects = max(projects, 1)
+        self.project_items = project_items
+        self.production_processes = max(items // 100, 1) if production_processes is None else production_processes
+        self.users = max(users, 1)
+        self.categories = max(categories, 1)
+        self.days = max(days, 1)
+        self.end_date = end_date or timezone.localdate()
+        self.chunk_size = chunk_size
+        self.batch_size = batch_size
+
+        self.prefix = f'SYN{seed}'
+        self.raw_items = max(int(items * RAW_SHARE), 1)
+        # One level of intermediate products per recipe level below the final product
+        self.intermediate_items = int(items * INTERMEDIATE_SHARE) if self.bom_depth > 1 else 0
+        self.final_items = max(items - self.raw_items - self.intermediate_items, 1)
+        self.items = self.raw_items + self.intermediate_items + self.final_items
+
+    def row_id(self, table, index):
+        digest = hashlib.blake2b(f'{self.seed}:{table}:{index}'.encode(), digest_size=16).digest()
+        return uuid.UUID(bytes=digest, version=4)
+
+    def rng(self, table, index):
+        return random.Random(f'{self.seed}:{table}:{index}')
+
+    def day(self, days_ago):
+        return self.end_date - timedelta(days=days_ago)
+
+    def moment(self, day, rng):
+        """A timestamp on the given day during working hours"""
+        seconds = rng.randint(8 * 3600, 18 * 3600)
+        return datetime.combine(day, day_time(), tzinfo=dt_timezone.utc) + timedelta(seconds=seconds)
+
+    # Item catalogue layout: raw materials, then intermediate products, then final products
+
+    def item_type(self, index):
+        if index < self.raw_items:
+            return 'RAW'
+        if index < self.raw_items + self.intermediate_items:
+            return 'INTERMEDIATE'
+        return 'FINAL'
+
+    def item_level(self, index):
+        """Recipe level of an item: 0 for raw materials, bom_depth for final products"""
+        item_type = self.item_type(index)
+        if item_type == 'RAW':
+            return 0
+        if item_type == 'FINAL':
+            return self.bom_depth
+        return 1 + (index - self.raw_items) % (self.bom_depth - 1)
+
+    def random_raw_item(self, rng):
+        return rng.randrange(self.raw_items)
+
+    def random_final_item(self, rng):
+        return self.raw_items + self.intermediate_items + rng.randrange(self.final_items)
+
+    def random_item_at_level(self, rng, level):
+        """A random intermediate product of the given recipe level"""
+        levels = self.bom_depth - 1
+        count = (self.intermediate_items - (level - 1) + levels - 1) // levels
+        if count <= 0:
+            return None
+        return self.raw_items + (level - 1) + levels * rng.randrange(count)
+
+    def item_spec(self, index):
+        """Catalogue attributes of an item, shared by every table that references it"""
+        rng = self.rng('item', index)
+        item_type = self.item_type(index)
+        if item_type == 'RAW':
+            name = rng.choice(RAW_PARTS)
+            purchase_price = Decimal(rng.randint(5, 5000)) / 100
+        elif item_type == 'INTERMEDIATE':
+            name = rng.choice(INTERMEDIATE_PARTS)
+            purchase_price = Decimal(rng.randint(2000, 50000)) / 100
+        else:
+            name = rng.choice(FINAL_PRODUCTS)
+            purchase_price = Decimal(rng.randint(20000, 500000)) / 100
+        selling_price = (purchase_price * Decimal(rng.uniform(1.3, 2.5))).quantize(CENT)
+        return {
+            'name': f'{name} {self.prefix}-{index:07d}',
+            'item_type': item_type,
+            'purchase_price': purchase_price,
+            'selling_price': selling_price,
+            'dealer_price': (selling_price * Decimal('0.85')).quantize(CENT),
+            'minimum_stock_level': rng.choice((0, 0, 5, 10, 25, 50)),
+            'category': rng.randrange(self.categories),
+        }
+
+    def customer_dealer(self, index):
+        return index % self.dealers
+
+    def device_spec(self, index):
+        rng = self.rng('device', index)
+        purchase_date = self.day(rng.randrange(self.days * 2)) if rng.random() < 0.7 else None
+        return {
+            'item': self.random_final_item(rng),
+            'purchase_date': purchase_date,
+            'warranty_period_months': rng.choice((12, 24, 24, 36)),
+        }
+
+
+def bulk_create(model, objects, plan):
+    model.objects.bulk_create(objects, batch_size=plan.batch_size)
+    return len(objects)
+
+
+def stamp(obj, moment):
+    obj.created_at = obj.updated_at = moment
+    return obj
+
+
+# Phase 1: small reference tables, generated in the main process
+
+def generate_users(plan, start, stop):
+    # A fixed salt keeps the rows identical between runs
+    password = make_password(f'{plan.prefix}-password', salt=f'{plan.prefix.lower()}synthetic')
+    users = []
+    for index in range(start, stop):
+        rng = plan.rng('user', index)
+        first_name, last_name = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        users.append(User(
+            id=plan.row_id('user', index),
+            username=f'{plan.prefix.lower()}_user{index:05d}',
+            password=password,
+            first_name=first_name,
+            last_name=last_name,
+            email=f'{plan.prefix.lower()}.user{index}@example.com',
+            date_joined=plan.moment(plan.day(plan.days + rng.randrange(365)), rng),
+        ))
+    return bulk_create(User, users, plan)
+
+
+def generate_dealers(plan, start, stop):
+    dealers = []
+    for index in range(start, stop):
+        rng = plan.rng('dealer', index)
+        city = rng.choice(CITIES)
+        dealers.append(stamp(Dealer(
+            id=plan.row_id('dealer', index),
+            name=f'{city} {rng.choice(LAST_NAMES)} Elektronik {index}',
+            code=f'{plan.prefix}-D{index:05d}',
+            contact_person=f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+            email=f'dealer{index}@{plan.prefix.lower()}.example.com',
+            phone=f'+90 5{rng.randint(10, 59)} {rng.randint(100, 999)} {rng.randint(1000, 9999)}',
+            address=f'{rng.randint(1, 200)}. Sokak No: {rng.randint(1, 99)}, {city}',
+            tax_id=f'{rng.randint(10 ** 9, 10 ** 10 - 1)}',
+            tax_office=city,
+        ), plan.moment(plan.day(plan.days + rng.randrange(365)), rng)))
+    return bulk_create(Dealer, dealers, plan)
+
+
+def generate_categories(plan, start, stop):
+    """Two-level category tree; the first fifth of the categories are the roots"""
+    roots = max(plan.categories // 5, 1)
+    categories = {}
+    for index in range(start, stop):
+        rng = plan.rng('category', index)
+        parent = None if index < roots else categories.get(index % roots)
+        category = stamp(Category(
+            id=plan.row_id('category', index),
+            name=f'{rng.choice(RAW_PARTS + INTERMEDIATE_PARTS + FINAL_PRODUCTS)} {plan.prefix}-{index}',
+            parent_category=parent,
+        ), plan.moment(plan.day(plan.days), rng))
+        category.assign_path()
+        categories[index] = category
+    return bulk_create(Category, list(categories.values()), plan)
+
+
+def generate_projects(plan, start, stop):
+    projects = []
+    for index in range(start, stop):
+        rng = plan.rng('project', index)
+        projects.append(stamp(Project(
+            id=plan.row_id('project', index),
+            name=f'{rng.choice(CITIES)} {rng.choice(FINAL_PRODUCTS)} Project {plan.prefix}-{index}',
+            description='Synthetic load test project',
+        ), plan.moment(plan.day(plan.days), rng)))
+    return bulk_create(Project, projects, plan)
+
+
+# Phase 2: items with their stock ledger, customers
+
+def generate_items(plan, start, stop):
+    """
+    Items with their inventory transaction history and purchase records.
+
+    The ledger of each item is generated with it, so the stored quantity is
+    the running balance of its transactions and the purchase price is the
+    price of its last purchase.
+    """
+    items, transactions, purchases = [], [], []
+    for index in range(start, stop):
+        spec = plan.item_spec(index)
+        rng = plan.rng('ledger', index)
+        item_id = plan.row_id('item', index)
+        item_type = spec['item_type']
+        created = plan.moment(plan.day(plan.days), rng)
+        item = stamp(Item(
+            id=item_id,
+            name=spec['name'],
+            sku=f'{plan.prefix}-{item_type[0]}-{index:07d}',
+            item_type=item_type,
+            category_id=plan.row_id('category', spec['category']),
+            unit_of_measure='pcs',
+            minimum_stock_level=spec['minimum_stock_level'],
+            purchase_price=spec['purchase_price'],
+            selling_price=spec['selling_price'],
+            dealer_price=spec['dealer_price'],
+            sales_list_status=rng.choice(('CUSTOMER_LIST', 'DEALER_LIST', 'BOTH_LISTS'))
+            if item_type == 'FINAL' else 'NOT_LISTED',
+        ), created)
+
+        average = plan.transactions_per_item
+        count = rng.randint(1, 2 * average - 1) if average > 0 else 0
+        days_ago = sorted((rng.randrange(plan.days) for _ in range(count)), reverse=True)
+        balance = 0
+        for sequence, transaction_days_ago in enumerate(days_ago):
+            if sequence == 0 or balance == 0 or rng.random() < 0.4:
+                transaction_type = 'PURCHASE' if item_type == 'RAW' else 'PRODUCTION_OUT'
+                quantity = rng.randint(10, 500)
+            elif rng.random() < 0.1:
+                transaction_type = 'ADJUSTMENT'
+                quantity = max(rng.randint(-5, 5), -balance)
+            else:
+                transaction_type = 'SALE' if item_type == 'FINAL' else 'PRODUCTION_IN'
+                quantity = -rng.randint(1, balance)
+            if not quantity:
+                continue
+            balance += quantity
+            day = plan.day(transaction_days_ago)
+            moment = plan.moment(day, rng)
+            transactions.append(stamp(InventoryTransaction(
+                id=plan.row_id('inventory_transaction', f'{index}:{sequence}'),
+                item_id=item_id,
+                transaction_type=transaction_type,
+                quantity=quantity,
+                transaction_date=moment,
+                notes='Synthetic ledger entry',
+            ), moment))
+            if transaction_type == 'PURCHASE':
+                unit_price = (spec['purchase_price'] * Decimal(rng.uniform(0.9, 1.1))).quantize(CENT)
+                purchases.append(stamp(PurchaseHistory(
+                    id=plan.row_id('purchase_history', f'{index}:{sequence}'),
+                    item_id=item_id,
+                    purchase_date=day,
+                    quantity=quantity,
+                    unit_price=unit_price,
+                    total_price=unit_price * quantity,
+                    supplier=rng.choice(SUPPLIERS),
+                    invoice_reference=f'{plan.prefix}-INV-{index}-{sequence}',
+                ), moment))
+                item.purchase_price = unit_price
+                item.last_purchase_date = day
+
+        item.quantity = balance
+        item.is_low_stock = 0 < item.minimum_stock_level and balance <= item.minimum_stock_level
+        items.append(item)
+
+    bulk_create(Item, items, plan)
+    bulk_create(InventoryTransaction, transactions, plan)
+    bulk_create(PurchaseHistory, purchases, plan)
+    return len(items)
+
+
+def generate_customers(plan, start, stop):
+    customers = []
+    for index in range(start, stop):
+        rng = plan.rng('customer', index)
+        city = rng.choice(CITIES)
+        person = f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}'
+        corporate = rng.random() < 0.3
+        customers.append(stamp(Customer(
+            id=plan.row_id('customer', index),
+            name=f'{rng.choice(LAST_NAMES)} {rng.choice(FINAL_PRODUCTS)} Ltd. Şti.' if corporate else person,
+            customer_type=CustomerType.CORPORATE if corporate else CustomerType.INDIVIDUAL,
+            contact_person=person if corporate else None,
+            email=f'customer{index}@{plan.prefix.lower()}.example.com',
+            phone=f'+90 5{rng.randint(10, 59)} {rng.randint(100, 999)} {rng.randint(1000, 9999)}',
+            address=f'{rng.randint(1, 200)}. Sokak No: {rng.randint(1, 99)}, {city}',
+            tax_id=f'{rng.randint(10 ** 9, 10 ** 10 - 1)}' if corporate else None,
+            tax_office=city if corporate else None,
+            dealer_id=plan.row_id('dealer', plan.customer_dealer(index)),
+        ), plan.moment(plan.day(rng.randrange(plan.days)), rng)))
+    return bulk_create(Customer, customers, plan)
+
+
+# Phase 3: recipes, documents, devices and production, all referencing items
+
+def generate_recipes(plan, start, stop):
+    """
+    One recipe per intermediate and final product, indexed from the first
+    intermediate product.
+
+    Products of level N use one or two products of level N - 1 and raw
+    materials, which gives every final product a bom_depth-level tree.
+    """
+    recipes, recipe_items = [], []
+    for offset in range(start, stop):
+        index = plan.raw_items + offset
+        rng = plan.rng('recipe', index)
+        spec = plan.item_spec(index)
+        recipe_id = plan.row_id('recipe', index)
+        created = plan.moment(plan.day(plan.days), rng)
+        recipes.append(stamp(Recipe(
+            id=recipe_id,
+            name=f'{spec["name"]} Recipe',
+            output_item_id=plan.row_id('item', index),
+            output_quantity=1,
+            unit_of_measure='pcs',
+        ), created))
+
+        inputs = []
+        level = plan.item_level(index)
+        if level > 1:
+            for _ in range(rng.randint(1, 2)):
+                child = plan.random_item_at_level(rng, level - 1)
+                if child is not None and child not in inputs:
+                    inputs.append(child)
+        while len(inputs) < plan.recipe_inputs and len(inputs) < plan.raw_items:
+            raw = plan.random_raw_item(rng)
+            if raw not in inputs:
+                inputs.append(raw)
+
+        for sequence, input_index in enumerate(inputs):
+            recipe_items.append(stamp(RecipeItem(
+                id=plan.row_id('recipe_item', f'{index}:{input_index}'),
+                recipe_id=recipe_id,
+                input_item_id=plan.row_id('item', input_index),
+                quantity_required=1 if plan.item_type(input_index) != 'RAW' else rng.randint(1, 8),
+                unit_of_measure='pcs',
+                sequence=(sequence + 1) * 10,
+                is_optional=plan.item_type(input_index) == 'RAW' and rng.random() < 0.05,
+            ), created))
+
+    bulk_create(Recipe, recipes, plan)
+    bulk_create(RecipeItem, recipe_items, plan)
+    return len(recipes)
+
+
+def order_status(rng, days_ago):
+    if days_ago < 7:
+        return rng.choice((OrderStatus.PENDING, OrderStatus.CONFIRMED, OrderStatus.PROCESSING))
+    if days_ago < 30:
+        return rng.choice((OrderStatus.PROCESSING, OrderStatus.SHIPPED, OrderStatus.DELIVERED))
+    return OrderStatus.CANCELLED if rng.random() < 0.05 else OrderStatus.DELIVERED
+
+
+def generate_orders(plan, start, stop):
+    orders, lines = [], []
+    specs = {}
+    for index in range(start, stop):
+        rng = plan.rng('order', index)
+        days_ago = rng.randrange(plan.days)
+        order_date = plan.day(days_ago)
+        moment = plan.moment(order_date, rng)
+        status = order_status(rng, days_ago)
+        order = stamp(Order(
+            id=plan.row_id('order', index),
+            order_number=f'{plan.prefix}-ORD-{index:08d}',
+            dealer_id=plan.row_id('dealer', rng.randrange(plan.dealers)),
+            order_date=order_date,
+            status=status,
+            is_paid=status in (OrderStatus.SHIPPED, OrderStatus.DELIVERED),
+            currency=rng.choice((CurrencyType.TRY, CurrencyType.TRY, CurrencyType.USD, CurrencyType.EUR)),
+            device_set_count=rng.randint(1, 5),
+        ), moment)
+        if status in (OrderStatus.SHIPPED, OrderStatus.DELIVERED):
+            order.shipping_date = order_date + timedelta(days=3)
+        if status == OrderStatus.DELIVERED:
+            order.delivery_date = order_date + timedelta(days=7)
+            order.completion_date = order_date + timedelta(days=8)
+
+        total = vat = Decimal('0')
+        items = {plan.random_final_item(rng) for _ in range(rng.randint(1, 6))}
+        for item_index in sorted(items):
+            spec = specs.get(item_index) or specs.setdefault(item_index, plan.item_spec(item_index))
+            line = stamp(OrderItem(
+                id=plan.row_id('order_item', f'{index}:{item_index}'),
+                order_id=order.id,
+                item_id=plan.row_id('item', item_index),
+                quantity=rng.randint(1, 20),
+                unit_price=spec['dealer_price'],
+                discount_percentage=Decimal(rng.choice((0, 0, 5, 10))),
+                dealer_discount_percentage=Decimal(rng.choice((0, 0, 0, 5))),
+                vat_percentage=Decimal('20.00'),
+            ), moment)
+            line.calculate_prices()
+            line.discounted_price = line.discounted_price.quantize(CENT)
+            line.total_price = line.total_price.quantize(CENT)
+            line.vat_amount = line.vat_amount.quantize(CENT)
+            total += line.total_price
+            vat += line.vat_amount
+            lines.append(line)
+
+        order.total_price, order.vat_amount, order.grand_total = total, vat, total + vat
+        orders.append(order)
+
+    bulk_create(Order, orders, plan)
+    bulk_create(OrderItem, lines, plan)
+    return len(orders)
+
+
+def generate_quotations(plan, start, stop):
+    quotations, lines = [], []
+    specs = {}
+    for index in range(start, stop):
+        rng = plan.rng('quotation', index)
+        days_ago = rng.randrange(plan.days)
+        issue_date = plan.day(days_ago)
+        moment = plan.moment(issue_date, rng)
+        if days_ago > 30:
+            status = rng.choice((QuotationStatus.ACCEPTED, QuotationStatus.REJECTED, QuotationStatus.EXPIRED))
+        else:
+            status = rng.choice((QuotationStatus.DRAFT, QuotationStatus.SENT, QuotationStatus.ACCEPTED))
+        quotation = stamp(Quotation(
+            id=plan.row_id('quotation', index),
+            quotation_number=f'{plan.prefix}-QUO-{index:08d}',
+            dealer_id=plan.row_id('dealer', rng.randrange(plan.dealers)),
+            issue_date=issue_date,
+            valid_until=issue_date + timedelta(days=30),
+            status=status,
+        ), moment)
+
+        total = Decimal('0')
+        items = {plan.random_final_item(rng) for _ in range(rng.randint(1, 6))}
+        for item_index in sorted(items):
+            spec = specs.get(item_index) or specs.setdefault(item_index, plan.item_spec(item_index))
+            line = stamp(QuotationItem(
+                id=plan.row_id('quotation_item', f'{index}:{item_index}'),
+                quotation_id=quotation.id,
+                item_id=plan.row_id('item', item_index),
+                quantity=rng.randint(1, 50),
+                unit_price=spec['dealer_price'],
+                discount_percent=Decimal(rng.choice((0, 0, 5, 10, 15))),
+            ), moment)
+            line.total_price = line.calculate_total_price().quantize(CENT)
+            total += line.total_price
+            lines.append(line)
+
+        quotation.total_price = total
+        quotations.append(quotation)
+
+    bulk_create(Quotation, quotations, plan)
+    bulk_create(QuotationItem, lines, plan)
+    return len(quotations)
+
+
+def generate_devices(plan, start, stop):
+    devices = []
+    for index in range(start, stop):
+        spec = plan.device_spec(index)
+        rng = plan.rng('device_row', index)
+        day = spec['purchase_date'] or plan.day(rng.randrange(plan.days))
+        devices.append(stamp(Device(
+            id=plan.row_id('device', index),
+            item_id=plan.row_id('item', spec['item']),
+            serial_number=f'{plan.prefix}-SN-{index:09d}',
+            purchase_date=spec['purchase_date'],
+            warranty_period_months=spec['warranty_period_months'],
+            # bulk_create skips Device.save, which keeps the end date in sync
+            warranty_end_date=warranty_end(spec['purchase_date'], spec['warranty_period_months']),
+        ), plan.moment(day, rng)))
+    return bulk_create(Device, devices, plan)
+
+
+def generate_production_processes(plan, start, stop):
+    processes = []
+    for index in range(start, stop):
+        rng = plan.rng('production_process', index)
+        target = plan.raw_items + rng.randrange(plan.intermediate_items + plan.final_items)
+        status = rng.choices(('PLANNED', 'IN_PROGRESS', 'COMPLETED', 'CANCELLED'), weights=(30, 20, 45, 5))[0]
+        days_ago = rng.randrange(plan.days)
+        created = plan.moment(plan.day(days_ago), rng)
+        process = stamp(ProductionProcess(
+            id=plan.row_id('production_process', index),
+            project_id=plan.row_id('project', rng.randrange(plan.projects)),
+            name=f'{plan.prefix}-BATCH-{index:07d}',
+            performed_by_id=plan.row_id('user', rng.randrange(plan.users)),
+            status=status,
+            target_output_item_id=plan.row_id('item', target),
+            target_output_quantity=rng.randint(1, 100) * 10,
+        ), created)
+        if status != 'PLANNED':
+            process.process_start_date = created + timedelta(days=rng.randint(0, 3))
+        if status == 'COMPLETED':
+            process.process_end_date = process.process_start_date + timedelta(days=rng.randint(1, 14))
+        processes.append(process)
+    return bulk_create(ProductionProcess, processes, plan)
+
+
+def generate_project_inventory(plan, start, stop):
+    rows = []
+    for project in range(start, stop):
+        rng = plan.rng('project_inventory', project)
+        items = rng.sample(range(plan.items), min(plan.project_items, plan.items))
+        for item_index in items:
+            rows.append(stamp(ProjectInventory(
+                id=plan.row_id('project_inventory', f'{project}:{item_index}'),
+                project_id=plan.row_id('project', project),
+                item_id=plan.row_id('item', item_index),
+                quantity=rng.randint(0, 500),
+                minimum_stock_level=rng.choice((0, 10, 50)),
+            ), plan.moment(plan.day(rng.randrange(plan.days)), rng)))
+    return bulk_create(ProjectInventory, rows, plan)
+
+
+# Phase 4: repairs of sold devices
+
+def repair_status(rng, days_ago):
+    if days_ago > 30:
+        return RepairStatus.DELIVERED_TO_DEALER
+    return rng.choice(RepairStatus.values)
+
+
+def generate_repairs(plan, start, stop):
+    repairs, parts = [], []
+    for index in range(start, stop):
+        rng = plan.rng('repair', index)
+        # Only sold devices come back for repair; probe forward from a random device
+        device_index = rng.randrange(plan.devices)
+        device = plan.device_spec(device_index)
+        for _ in range(plan.devices):
+            if device['purchase_date'] is not None:
+                break
+            device_index = (device_index + 1) % plan.devices
+            device = plan.device_spec(device_index)
+        if device['purchase_date'] is None:
+            break
+
+        since_purchase = (plan.end_date - device['purchase_date']).days
+        request_date = plan.day(rng.randint(0, max(min(since_purchase, plan.days) - 1, 0)))
+        is_warranty = request_date <= warranty_end(device['purchase_date'], device['warranty_period_months'])
+        days_ago = (plan.end_date - request_date).days
+        status = repair_status(rng, days_ago)
+        customer = rng.randrange(plan.customers) if plan.customers else None
+
+        repair = stamp(RepairRequest(
+            id=plan.row_id('repair', index),
+            device_id=plan.row_id('device', device_index),
+            dealer_id=plan.row_id(
+                'dealer', plan.customer_dealer(customer) if customer is not None else rng.randrange(plan.dealers)
+            ),
+            customer_id=plan.row_id('customer', customer) if customer is not None else None,
+            request_date=request_date,
+            issue_description=rng.choice(ISSUES),
+            status=status,
+            is_warranty=is_warranty,
+            completion_date=request_date + timedelta(days=rng.randint(2, 20))
+            if status == RepairStatus.DELIVERED_TO_DEALER else None,
+        ), plan.moment(request_date, rng))
+
+        cost = Decimal('0')
+        part_items = {plan.random_raw_item(rng) for _ in range(rng.randint(0, 3))}
+        for item_index in sorted(part_items):
+            quantity = rng.randint(1, 4)
+            unit_price = plan.item_spec(item_index)['selling_price']
+            part = stamp(RepairPart(
+                id=plan.row_id('repair_part', f'{index}:{item_index}'),
+                repair_request_id=repair.id,
+                item_id=plan.row_id('item', item_index),
+                quantity=quantity,
+                unit_price=unit_price,
+                total_price=unit_price * quantity,
+                is_warranty_covered=is_warranty,
+            ), repair.created_at)
+            if not is_warranty:
+                cost += part.total_price
+            parts.append(part)
+
+        repair.repair_cost = cost
+        repairs.append(repair)
+
+    bulk_create(RepairRequest, repairs, plan)
+    bulk_create(RepairPart, parts, plan)
+    return len(repairs)
+
+
+# Models written by each generator, whose automatic timestamps are replaced
+GENERATORS = {
+    'users': (generate_users, (User,)),
+    'dealers': (generate_dealers, (Dealer,)),
+    'categories': (generate_categories, (Category,)),
+    'projects': (generate_projects, (Project,)),
+    'items': (generate_items, (Item, InventoryTransaction, PurchaseHistory)),
+    'customers': (generate_customers, (Customer,)),
+    'recipes': (generate_recipes, (Recipe, RecipeItem)),
+    'orders': (generate_orders, (Order, OrderItem)),
+    'quotations': (generate_quotations, (Quotation, QuotationItem)),
+    'devices': (generate_devices, (Device,)),
+    'production_processes': (generate_production_processes, (ProductionProcess,)),
+    'project_inventory': (generate_project_inventory, (ProjectInventory,)),
+    'repairs': (generate_repairs, (RepairRequest, RepairPart)),
+}
+
+
+def run_task(plan, table, start, stop):
+    """Generate rows [start, stop) of a table in one transaction"""
+    generator, models = GENERATORS[table]
+    with explicit_timestamps(*models), transaction.atomic():
+        return table, generator(plan, start, stop)
+
+
+class SyntheticDataGenerator:
+    """
+    Writes a SyntheticDataPlan to the database.
+
+    Usage:
+        plan = SyntheticDataPlan(seed=7, items=200000, orders=50000, bom_depth=5)
+        SyntheticDataGenerator(plan, workers=4).run()
+    """
+
+    def __init__(self, plan, workers=1, progress=None):
+        self.plan = plan
+        self.workers = max(workers, 1)
+        self.progress = progress or (lambda table, rows, seconds: None)
+
+    def phases(self):
+        """Tables of each phase with their row counts"""
+        plan = self.plan
+        return [
+            {'users': plan.users, 'dealers': plan.dealers, 'categories': plan.categories, 'projects': plan.projects},
+            {'items': plan.items, 'customers': plan.customers},
+            {
+                'recipes': plan.intermediate_items + plan.final_items,
+                'orders': plan.orders,
+                'quotations': plan.quotations,
+                'devices': plan.devices,
+                'production_processes': plan.production_processes,
+                'project_inventory': plan.projects if plan.project_items else 0,
+            },
+            {'repairs': plan.repairs if plan.devices else 0},
+        ]
+
+    def chunks(self, table, rows):
+        # The category tree is built in memory from its roots, so it is never split
+        size = rows if table == 'categories' else max(self.plan.chunk_size, 1)
+        for start in range(0, rows, size):
+            yield table, start, min(start + size, rows)
+
+    def run(self):
+        """
+        Returns:
+            dict: Number of rows generated per table
+        """
+        counts = {}
+        for number, phase in enumerate(self.phases()):
+            tasks = [task for table, rows in phase.items() for task in self.chunks(table, rows)]
+            # Reference tables are tiny; spawning workers for them is not worth it
+            if self.workers == 1 or number == 0 or len(tasks) == 1:
+                results = self.run_serial(tasks)
+            else:
+                results = self.run_parallel(tasks)
+            for table, rows, seconds in results:
+                counts[table] = counts.get(table, 0) + rows
+                self.progress(table, rows, seconds)
+
+        from apps.inventory.repositories.bom_graph_repository import BOMGraphRepository
+        from apps.inventory.repositories.price_list_repository import PriceListRepository
+        from apps.service.repositories.repair_daily_stat_repository import RepairDailyStatRepository
+        from apps.common.repositories.search_repository import SearchIndexRepository
+        from apps.common.repositories.resource_version_repository import VERSIONED_MODELS, ResourceVersionRepository
+        BOMGraphRepository.invalidate()
+        # Repairs are bulk created without signals, so their rollup days are rebuilt here
+        if counts.get('repairs'):
+            RepairDailyStatRepository().rebuild(self.plan.day(self.plan.days), self.plan.end_date)
+        SearchIndexRepository().rebuild()
+        ResourceVersionRepository.bump(VERSIONED_MODELS, [f'{label}:' for label in VERSIONED_MODELS])
+        PriceListRepository.invalidate()
+        return counts
+
+    def run_serial(self, tasks):
+        for table, start, stop in tasks:
+            started = time.perf_counter()
+            _, rows = run_task(self.plan, table, start, stop)
+            yield table, rows, time.perf_counter() - started
+
+    def run_parallel(self, tasks):
+        # Workers open their own connections; none may be shared with the parent
+        connections.close_all()
+        with ProcessPoolExecutor(
+            # The initializer must not import models, it runs before the app registry is ready
+            max_workers=self.workers, mp_context=get_multiprocessing_context(), initializer=django.setup
+        ) as executor:
+            started = time.perf_counter()
+            futures = [executor.submit(run_task, self.plan, *task) for task in tasks]
+            for future in futures:
+                table, rows = future.result()
+                yield table, rows, time.perf_counter() - started
@@ -0,0 +1,3 @@
+from apps.common.services.search_service import SearchService
+
+__all__ = ['SearchService']
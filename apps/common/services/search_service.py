@@ -0,0 +1,60 @@
+from apps.common.repositories.search_repository import PUBLIC_SEARCH_TYPES, SearchIndexRepository
+
+# Results per entity type
+DEFAULT_SEARCH_LIMIT = 5
+MAX_SEARCH_LIMIT = 50
+
+
+class SearchService:
+    """
+    Service class for the unified search across items, customers, dealers and devices.
+    Uses SearchIndexRepository for data access.
+    """
+    
+    def __init__(self, search_repository: SearchIndexRepository = None):
+        self.repository = search_repository or SearchIndexRepository()
+    
+    def search(self, query, entity_types=None, limit=DEFAULT_SEARCH_LIMIT):
+        """
+        Ranked search across entity types with a cap per type
+        
+        Args:
+            query: Search text
+            entity_types: Types to search (default: all public types)
+            limit: Maximum number of results per type
+            
+        Returns:
+            dict with the results (best first) and the number of matches per type
+            
+        Raises:
+            ValueError: For an empty query, an unknown type or an invalid limit
+        """
+        if not self.repository.query_tokens(query or ''):
+            raise ValueError("Search query must contain at least one letter or digit")
+        entity_types = list(dict.fromkeys(entity_types or PUBLIC_SEARCH_TYPES))
+        invalid = [entity_type for entity_type in entity_types if entity_type not in PUBLIC_SEARCH_TYPES]
+        if invalid:
+            raise ValueError(
+                f"Invalid type: {', '.join(invalid)}. Must be one of {', '.join(PUBLIC_SEARCH_TYPES)}"
+            )
+        if not 1 <= limit <= MAX_SEARCH_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_SEARCH_LIMIT}")
+        
+        rows = self.repository.search(query, entity_types, limit)
+        totals = dict.fromkeys(entity_types, 0)
+        for entity_type, _, _, _, _, total in rows:
+            totals[entity_type] = total
+        return {
+            'query': query,
+            'results': [
+                {
+                    'type': entity_type,
+                    'id': object_id,
+                    'title': title,
+                    'subtitle': subtitle,
+                    'score': round(score, 4),
+                }
+                for entity_type, object_id, title, subtitle, score, _ in rows
+            ],
+            'totals': totals,
+        }
@@ -0,0 +1,55 @@
+import threading
+
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.common.repositories.resource_version_repository import VERSIONED_MODELS, ResourceVersionRepository
+from apps.common.repositories.search_repository import SearchIndexRepository
+from apps.common.utils.metrics import install_query_counter
+
+# Records waiting for a search index refresh when the current transaction commits
+_pending = threading.local()
+
+
+@receiver(connection_created)
+def count_traced_queries(sender, connection, **kwargs):
+    """Count the queries of every new database connection for traced methods"""
+    install_query_counter(connection)
+
+
+def _refresh_pending_search_entries():
+    pending = getattr(_pending, 'records', None)
+    if pending:
+        _pending.records = {}
+        repository = SearchIndexRepository()
+        for model_label, pks in pending.items():
+            repository.refresh_for(model_label, pks)
+
+
+def refresh_search_entries(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Rewrite the search entries of a written record once the write commits"""
+    label = sender._meta.label
+    if raw or not SearchIndexRepository.affects_index(label, update_fields):
+        return
+    if not hasattr(_pending, 'records'):
+        _pending.records = {}
+    _pending.records.setdefault(label, set()).add(instance.pk)
+    # Every write registers a callback; the first one to run refreshes all pending records
+    transaction.on_commit(_refresh_pending_search_entries)
+
+
+for model_label in SearchIndexRepository.watched_models():
+    post_save.connect(refresh_search_entries, sender=model_label, dispatch_uid=f'search_index_save_{model_label}')
+    post_delete.connect(refresh_search_entries, sender=model_label, dispatch_uid=f'search_index_delete_{model_label}')
+
+
+def mark_resource_changed(sender, instance, **kwargs):
+    """Bump the version counters of a written resource once the write commits"""
+    ResourceVersionRepository.mark_changed(sender, [instance])
+
+
+for model_label in VERSIONED_MODELS:
+    post_save.connect(mark_resource_changed, sender=model_label, dispatch_uid=f'resource_version_save_{model_label}')
+    post_delete.connect(mark_resource_changed, sender=model_label, dispatch_uid=f'resource_version_delete_{model_label}')
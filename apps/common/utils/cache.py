@@ -0,0 +1,53 @@
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS
+from django.core.exceptions import ImproperlyConfigured
+
+# Cache backends whose entries are only seen by the process that wrote them
+PROCESS_LOCAL_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+# Cache backends served from memory by a Redis server
+REDIS_CACHE_BACKENDS = (
+    'django.core.cache.backends.redis.RedisCache',
+    'django_redis.cache.RedisCache',
+)
+
+
+def is_shared_cache(alias=DEFAULT_CACHE_ALIAS):
+    """Whether every worker process reads and writes the same entries of a cache"""
+    backend = settings.CACHES.get(alias, {}).get('BACKEND')
+    return backend is not None and backend not in PROCESS_LOCAL_CACHE_BACKENDS
+
+
+def require_shared_cache(feature, alias=DEFAULT_CACHE_ALIAS):
+    """
+    Refuse to start a feature whose invalidations must reach every worker
+
+    Raises:
+        ImproperlyConfigured: When the cache is process-local
+    """
+    if not is_shared_cache(alias):
+        backend = settings.CACHES.get(alias, {}).get('BACKEND')
+        raise ImproperlyConfigured(
+            f"{feature} needs a cache shared by all worker processes, but the '{alias}' cache uses "
+            f"{backend}. Configure CACHES with a shared backend (database, Redis or Memcached)."
+        )
+
+
+def require_redis_cache(feature, alias=DEFAULT_CACHE_ALIAS):
+    """
+    Refuse to start a feature that reads the cache on every request unless it is Redis
+
+    A database cache would spend the query the feature exists to save.
+
+    Raises:
+        ImproperlyConfigured: When the cache is not a Redis cache
+    """
+    backend = settings.CACHES.get(alias, {}).get('BACKEND')
+    if backend not in REDIS_CACHE_BACKENDS:
+        raise ImproperlyConfigured(
+            f"{feature} needs a Redis cache, but the '{alias}' cache uses {backend}. "
+            f"Set REDIS_URL (production settings) or configure CACHES with RedisCache."
+        )
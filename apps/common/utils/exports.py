@@ -0,0 +1,191 @@
+"""
+Streamed CSV and XLSX exports.
+
+Rows are written as they are produced, so an export holds one chunk of
+rows in memory whatever its size and the first bytes reach the client
+before the last rows are read. XLSX files are written directly as a zip
+stream (inline strings, no shared string table or styles), which every
+spreadsheet application opens. CSV text cells that a spreadsheet would
+evaluate as a formula are quoted with a leading apostrophe.
+"""
+
+import csv
+import io
+import re
+import zipfile
+from datetime import date, datetime
+from decimal import Decimal
+from xml.sax.saxutils import escape
+
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+CSV_CONTENT_TYPE = 'text/csv; charset=utf-8'
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+EXPORT_FORMATS = ('csv', 'xlsx')
+
+# Rows written between two chunks sent to the client
+ROWS_PER_CHUNK = 500
+
+# Leading characters that make a spreadsheet evaluate a CSV cell as a formula
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+# Characters XML 1.0 does not allow
+_ILLEGAL_XML_RE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+_XLSX_PARTS = {
+    '[Content_Types].xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    '_rels/.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    'xl/_rels/workbook.xml.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '</Relationships>'
+    ),
+}
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+_XLSX_SHEET_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_XLSX_SHEET_END = '</sheetData></worksheet>'
+
+
+class _ChunkBuffer(io.RawIOBase):
+    """Write-only, unseekable file collecting what is written until it is taken"""
+
+    def __init__(self):
+        self.chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def take(self):
+        data = b''.join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def _date_text(value):
+    """ISO text of a date, or of a datetime in local time"""
+    if isinstance(value, datetime) and timezone.is_aware(value):
+        value = timezone.make_naive(value)
+    return value.isoformat(sep=' ', timespec='seconds') if isinstance(value, datetime) else value.isoformat()
+
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, (datetime, date)):
+        return _date_text(value)
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        # User text such as "=HYPERLINK(...)" stays text (numbers are written as they are)
+        return "'" + value
+    return value
+
+
+def iter_csv(header, rows):
+    """CSV text of a header and rows, in chunks (with a BOM so Excel reads UTF-8)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write('\ufeff')
+    writer.writerow(header)
+    for number, row in enumerate(rows, 1):
+        writer.writerow([_csv_value(value) for value in row])
+        if number % ROWS_PER_CHUNK == 0:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
+
+
+def _xlsx_cell(value):
+    if value is None:
+        return '<c/>'
+    if isinstance(value, bool):
+        return f'<c t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float, Decimal)):
+        return f'<c><v>{value}</v></c>'
+    if isinstance(value, (datetime, date)):
+        value = _date_text(value)
+    text = escape(_ILLEGAL_XML_RE.sub('', str(value)))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def _xlsx_row(row):
+    return '<row>' + ''.join(_xlsx_cell(value) for value in row) + '</row>'
+
+
+def iter_xlsx(header, rows, sheet_name='Sheet1'):
+    """XLSX file of a header and rows, as a zip stream in chunks"""
+    buffer = _ChunkBuffer()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in _XLSX_PARTS.items():
+            archive.writestr(name, content)
+        sheet_name = escape(_ILLEGAL_XML_RE.sub('', sheet_name))[:31]
+        archive.writestr('xl/workbook.xml', _XLSX_WORKBOOK.format(name=sheet_name))
+        with archive.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as sheet:
+            sheet.write((_XLSX_SHEET_START + _xlsx_row(header)).encode())
+            lines = []
+            for number, row in enumerate(rows, 1):
+                lines.append(_xlsx_row(row))
+                if number % ROWS_PER_CHUNK == 0:
+                    sheet.write(''.join(lines).encode())
+                    lines.clear()
+                    yield buffer.take()
+            sheet.write((''.join(lines) + _XLSX_SHEET_END).encode())
+    yield buffer.take()
+
+
+def streaming_export_response(file_format, filename, header, rows, sheet_name='Sheet1'):
+    """
+    Streaming download of a header and rows.
+
+    Args:
+        file_format: 'csv' or 'xlsx'
+        filename: File name without extension
+        header: Column titles
+        rows: Iterable of row sequences, consumed while the response is sent
+        sheet_name: Worksheet name of XLSX files
+
+    Raises:
+        ValueError: For an unknown format
+    """
+    if file_format == 'csv':
+        content, content_type = iter_csv(header, rows), CSV_CONTENT_TYPE
+    elif file_format == 'xlsx':
+        content, content_type = iter_xlsx(header, rows, sheet_name), XLSX_CONTENT_TYPE
+    else:
+        raise ValueError(f"Invalid format. Must be one of {', '.join(EXPORT_FORMATS)}")
+    response = StreamingHttpResponse(content, content_type=content_type)
+    response['Content-Disposition'] = f'attachment; filename="{filename}.{file_format}"'
+    return response
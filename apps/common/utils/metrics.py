@@ -0,0 +1,171 @@
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class MethodStats:
+    """Latency histogram, call, error and query counters of one traced method"""
+    __slots__ = ('buckets', 'count', 'errors', 'queries', 'seconds', 'lock')
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.queries = 0
+        self.seconds = 0.0
+        self.lock = threading.Lock()
+
+    def observe(self, seconds, queries, failed):
+        index = bisect_left(LATENCY_BUCKETS, seconds)
+        with self.lock:
+            self.buckets[index] += 1
+            self.count += 1
+            self.seconds += seconds
+            self.queries += queries
+            if failed:
+                self.errors += 1
+
+
+class MetricsRegistry:
+    """
+    Process-wide store of traced method metrics.
+
+    Each worker process keeps its own counters, so a Prometheus scrape sees
+    the process that served it; scrape every worker (or run a single one)
+    for complete numbers.
+    """
+    _stats = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_stats(cls, service, method):
+        key = (service, method)
+        stats = cls._stats.get(key)
+        if stats is None:
+            with cls._lock:
+                stats = cls._stats.setdefault(key, MethodStats())
+        return stats
+
+    @classmethod
+    def reset(cls):
+        """Zero every counter; traced functions keep their stats objects"""
+        with cls._lock:
+            for stats in cls._stats.values():
+                with stats.lock:
+                    stats.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+                    stats.count = stats.errors = stats.queries = 0
+                    stats.seconds = 0.0
+
+    @classmethod
+    def render_prometheus(cls):
+        """Render all metrics in the Prometheus text exposition format"""
+        lines = [
+            '# HELP service_method_duration_seconds Latency of traced service methods',
+            '# TYPE service_method_duration_seconds histogram',
+        ]
+        # Methods that were never called are left out
+        series = sorted(item for item in cls._stats.items() if item[1].count)
+        for (service, method), stats in series:
+            labels = f'service="{_escape(service)}",method="{_escape(method)}"'
+            with stats.lock:
+                buckets, count, seconds = list(stats.buckets), stats.count, stats.seconds
+            cumulative = 0
+            for bound, bucket in zip(LATENCY_BUCKETS, buckets):
+                cumulative += bucket
+                lines.append(f'service_method_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'service_method_duration_seconds_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f'service_method_duration_seconds_sum{{{labels}}} {seconds}')
+            lines.append(f'service_method_duration_seconds_count{{{labels}}} {count}')
+
+        for name, attribute, description in (
+            ('service_method_calls_total', 'count', 'Calls of traced service methods'),
+            ('service_method_errors_total', 'errors', 'Traced service method calls that raised'),
+            ('service_method_queries_total', 'queries', 'Database queries run by traced service methods'),
+        ):
+            lines.append(f'# HELP {name} {description}')
+            lines.append(f'# TYPE {name} counter')
+            for (service, method), stats in series:
+                labels = f'service="{_escape(service)}",method="{_escape(method)}"'
+                lines.append(f'{name}{{{labels}}} {getattr(stats, attribute)}')
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class QueryCount(threading.local):
+    """Number of database queries run by the current thread"""
+    count = 0
+
+
+query_count = QueryCount()
+
+
+def count_query(execute, sql, params, many, context):
+    """Execute wrapper that counts queries for traced methods"""
+    query_count.count += 1
+    return execute(sql, params, many, context)
+
+
+def install_query_counter(connection):
+    """
+    Add count_query to a database connection.
+
+    Installed once per connection (see apps.common.signals), so a traced call
+    only reads a thread-local counter instead of looking up the connection.
+    """
+    if count_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(count_query)
+
+
+def traced(func=None, *, service=None, name=None):
+    """
+    Decorator that records the latency, errors and database queries of a
+    function or method in the MetricsRegistry.
+
+    The service label defaults to the class of the first argument (self or
+    cls), the method label to the function name.
+
+    Usage:
+        @traced
+        def create_item(self, item_data): ...
+
+        @traced(service='excel_import', name='run')
+        def run_import(...): ...
+    """
+    if func is None:
+        return lambda inner: traced(inner, service=service, name=name)
+
+    method = name or func.__name__
+    fixed_stats = MetricsRegistry.get_stats(service, method) if service is not None else None
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        stats = fixed_stats
+        if stats is None:
+            owner = args[0] if args else None
+            if owner is None:
+                label = func.__module__
+            else:
+                label = owner.__name__ if isinstance(owner, type) else owner.__class__.__name__
+            stats = MetricsRegistry.get_stats(label, method)
+
+        queries = query_count.count
+        failed = False
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            stats.observe(elapsed, query_count.count - queries, failed)
+
+    wrapper.__traced__ = True
+    return wrapper
@@ -0,0 +1,187 @@
+"""
+Query inspection for development and tests.
+
+A QueryInspector records the queries run on a connection, groups them by
+fingerprint (the statement with its literals and IN lists collapsed) and
+remembers where in the project each group came from. Groups repeated many
+times in one request are reported as likely N+1 patterns.
+
+Views declare how many queries a request may run:
+
+    query_budget = 5
+    query_budget = {'list': 3, 'retrieve': 4}
+"""
+
+import re
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# Repeats of one statement from which it is reported as a likely N+1 pattern
+N_PLUS_ONE_THRESHOLD = 5
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r'\b\d+(?:\.\d+)?\b')
+_IN_LIST_RE = re.compile(r'\bIN\s*\((?:\s*(?:%s|\?|\.\.\.)\s*,?)+\)', re.IGNORECASE)
+_SPACE_RE = re.compile(r'\s+')
+
+# Frames in these files (execute wrappers and middleware) are never reported as the origin of a query
+_SKIPPED_PATHS = (
+    str(Path(__file__).resolve()),
+    str(Path(__file__).resolve().with_name('metrics.py')),
+    str(Path(__file__).resolve().parents[3] / 'core' / 'middleware'),
+)
+# DRF frames that read a serializer field, e.g. source='dealer.name'
+_FIELD_FRAMES = frozenset(('get_attribute', 'to_representation'))
+
+
+class QueryBudgetExceeded(AssertionError):
+    """A request or block ran more queries than its budget, or repeated one statement"""
+
+
+def fingerprint(sql):
+    """Normalize a statement so that its repetitions with other values compare equal"""
+    sql = _STRING_RE.sub('?', sql)
+    sql = _NUMBER_RE.sub('?', sql)
+    sql = _IN_LIST_RE.sub('IN (...)', sql)
+    return _SPACE_RE.sub(' ', sql).strip()
+
+
+def get_query_budget(view):
+    """Query budget of a view instance for its current action, or None"""
+    budget = getattr(view, 'query_budget', None)
+    if isinstance(budget, dict):
+        action = getattr(view, 'action', None) or getattr(getattr(view, 'request', None), 'method', '').lower()
+        budget = budget.get(action)
+    return budget
+
+
+def _project_root():
+    return str(Path(settings.BASE_DIR).resolve())
+
+
+def find_origin(frame, root):
+    """
+    Describe the code that caused a query.
+
+    Returns the innermost project frame ("apps/.../file.py:42 in method"), or
+    the serializer field being read when DRF resolves a dotted source or a
+    related field before any project code is reached.
+    """
+    while frame is not None:
+        code = frame.f_code
+        filename = code.co_filename
+        if filename.startswith(root) and not filename.startswith(_SKIPPED_PATHS) and 'site-packages' not in filename:
+            return f'{filename[len(root) + 1:]}:{frame.f_lineno} in {code.co_name}'
+        if code.co_name in _FIELD_FRAMES and 'rest_framework' in filename:
+            field = frame.f_locals.get('self')
+            parent = getattr(field, 'parent', None)
+            if parent is not None and getattr(field, 'field_name', None):
+                return f'{type(parent).__name__}.{field.field_name}'
+        frame = frame.f_back
+    return None
+
+
+class QueryGroup:
+    """Queries that share a fingerprint"""
+    __slots__ = ('sql', 'count', 'duration', 'origins')
+
+    def __init__(self, sql):
+        self.sql = sql
+        self.count = 0
+        self.duration = 0.0
+        self.origins = Counter()
+
+    def as_dict(self):
+        return {
+            'sql': self.sql,
+            'count': self.count,
+            'duration_ms': round(self.duration * 1000, 3),
+            'origins': [origin for origin, _ in self.origins.most_common(3)],
+        }
+
+
+class QueryInspector:
+    """
+    Execute wrapper that records the queries of a block.
+
+    Usage:
+        with QueryInspector() as inspector:
+            client.get('/api/v1/sales/orders/')
+        inspector.n_plus_one()
+    """
+
+    def __init__(self, using=DEFAULT_DB_ALIAS, capture_origin=True):
+        self.connection = connections[using]
+        self.capture_origin = capture_origin
+        self.root = _project_root()
+        self.count = 0
+        self.groups = {}
+
+    def __enter__(self):
+        self.connection.execute_wrappers.append(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.connection.execute_wrappers.remove(self)
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            key = fingerprint(sql)
+            group = self.groups.get(key)
+            if group is None:
+                group = self.groups[key] = QueryGroup(sql)
+            group.count += 1
+            group.duration += duration
+            self.count += 1
+            if self.capture_origin:
+                origin = find_origin(sys._getframe(1), self.root)
+                if origin:
+                    group.origins[origin] += 1
+
+    def n_plus_one(self, threshold=N_PLUS_ONE_THRESHOLD):
+        """Query groups repeated at least ``threshold`` times, most repeated first"""
+        groups = [group for group in self.groups.values() if group.count >= threshold]
+        return sorted(groups, key=lambda group: group.count, reverse=True)
+
+    def report(self, budget=None, threshold=N_PLUS_ONE_THRESHOLD):
+        return {
+            'queries': self.count,
+            'budget': budget,
+            'n_plus_one': [group.as_dict() for group in self.n_plus_one(threshold)],
+        }
+
+    def describe(self, budget=None, threshold=N_PLUS_ONE_THRESHOLD):
+        """Human readable summary for logs and assertion messages"""
+        lines = [f'{self.count} queries' + (f' (budget {budget})' if budget is not None else '')]
+        for group in self.n_plus_one(threshold):
+            origins = ', '.join(origin for origin, _ in group.origins.most_common(3)) or 'unknown origin'
+            lines.append(f'  {group.count}x from {origins}: {group.sql[:200]}')
+        return '\n'.join(lines)
+
+
+@contextmanager
+def max_queries(budget, threshold=None, using=DEFAULT_DB_ALIAS):
+    """
+    Fail a test block that runs more than ``budget`` queries.
+
+    With ``threshold`` the block also fails when any statement is repeated
+    that many times, even within the budget.
+
+    Usage:
+        with max_queries(3, threshold=N_PLUS_ONE_THRESHOLD):
+            response = client.get('/api/v1/sales/orders/')
+    """
+    with QueryInspector(using) as inspector:
+        yield inspector
+    if inspector.count > budget or (threshold and inspector.n_plus_one(threshold)):
+        raise QueryBudgetExceeded(inspector.describe(budget, threshold or N_PLUS_ONE_THRESHOLD))
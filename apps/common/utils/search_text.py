@@ -0,0 +1,43 @@
+"""
+Text normalization for the search index.
+
+Index content and queries go through the same folding, so "İSTANBUL",
+"istanbul" and "Istanbul" match each other, as do "Çağrı" and "cagri":
+
+1. Turkish capitals are lowered by Turkish rules (İ -> i, I -> ı) before
+   the usual case folding, which would otherwise turn İ into "i̇".
+2. Accents are stripped (NFKD, combining marks dropped) and the dotless
+   ı is folded to i, so the result is independent of keyboard layout.
+3. Anything that is not a letter or digit separates tokens.
+"""
+
+import re
+import unicodedata
+
+_TURKISH_UPPER = str.maketrans({'İ': 'i', 'I': 'ı'})
+_TOKEN_RE = re.compile(r'[^\W_]+')
+
+
+def fold(text):
+    """Case fold and strip accents from a text, Turkish-aware"""
+    if not text:
+        return ''
+    text = str(text).translate(_TURKISH_UPPER).casefold()
+    if text.isascii():
+        # Nothing to strip
+        return text
+    text = ''.join(char for char in unicodedata.normalize('NFKD', text) if not unicodedata.combining(char))
+    return text.replace('ı', 'i')
+
+
+def tokenize(text):
+    """Folded tokens of a text"""
+    return _TOKEN_RE.findall(fold(text))
+
+
+def compact(text):
+    """
+    Folded text with separators removed, for codes written in many ways
+    (serial numbers, SKUs, phone and tax numbers): "SN-0012 A" -> "sn0012a"
+    """
+    return ''.join(tokenize(text))
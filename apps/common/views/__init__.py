@@ -0,0 +1,4 @@
+from apps.common.views.metrics_views import metrics_view
+from apps.common.views.search_views import SearchView
+
+__all__ = ['metrics_view', 'SearchView']
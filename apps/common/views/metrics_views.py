@@ -0,0 +1,45 @@
+import hmac
+
+from django.conf import settings
+from django.http import Http404, HttpResponse, HttpResponseForbidden
+from django.views.decorators.http import require_GET
+
+from apps.common.utils.metrics import MetricsRegistry
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Headers set by reverse proxies; REMOTE_ADDR is then the proxy, not the client
+PROXY_HEADERS = ('HTTP_X_FORWARDED_FOR', 'HTTP_FORWARDED', 'HTTP_X_REAL_IP')
+
+
+def _has_token(request):
+    scheme, _, token = request.META.get('HTTP_AUTHORIZATION', '').partition(' ')
+    return scheme.lower() == 'bearer' and hmac.compare_digest(token.encode(), settings.METRICS_TOKEN.encode())
+
+
+def _is_allowed_address(request):
+    if any(header in request.META for header in PROXY_HEADERS):
+        return False
+    return request.META.get('REMOTE_ADDR') in settings.METRICS_ALLOWED_IPS
+
+
+@require_GET
+def metrics_view(request):
+    """
+    Internal Prometheus endpoint with the traced service method metrics.
+
+    It is not part of the authenticated API and is disabled (404) until the
+    deployment opts in with METRICS_TOKEN or METRICS_ALLOWED_IPS:
+
+    - With METRICS_TOKEN the scraper must send "Authorization: Bearer
+      <token>". This is the only safe choice behind a reverse proxy, where
+      every request arrives from the proxy's (usually loopback) address.
+    - METRICS_ALLOWED_IPS admits scrapers by REMOTE_ADDR, for deployments
+      where they reach gunicorn directly. Proxied requests (X-Forwarded-For,
+      Forwarded or X-Real-IP set) are never admitted by address.
+    """
+    if not settings.METRICS_TOKEN and not settings.METRICS_ALLOWED_IPS:
+        raise Http404
+    if not (settings.METRICS_TOKEN and _has_token(request)) and not _is_allowed_address(request):
+        return HttpResponseForbidden()
+    return HttpResponse(MetricsRegistry.render_prometheus(), content_type=PROMETHEUS_CONTENT_TYPE)
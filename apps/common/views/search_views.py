@@ -0,0 +1,40 @@
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.views import APIView
+
+from apps.common.responses import error_response, success_response
+from apps.common.services import SearchService
+from apps.common.services.search_service import DEFAULT_SEARCH_LIMIT
+
+
+class SearchView(APIView):
+    """
+    Unified ranked search across items, customers, dealers and devices.
+    
+    Query parameters:
+        q: Search text (case, Turkish characters and accents are ignored)
+        types: Comma separated types to search (default: all)
+        limit: Results per type (default 5, at most 50)
+    """
+    permission_classes = [IsAuthenticated]
+    query_budget = 2
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.service = SearchService()
+    
+    def get(self, request):
+        params = request.query_params
+        types = [entity_type.strip() for entity_type in params.get('types', '').split(',') if entity_type.strip()]
+        try:
+            result = self.service.search(
+                params.get('q', ''),
+                entity_types=types or None,
+                limit=int(params.get('limit', DEFAULT_SEARCH_LIMIT))
+            )
+        except ValueError as e:
+            return error_response(
+                error_message=str(e),
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+        return success_response(data=result)
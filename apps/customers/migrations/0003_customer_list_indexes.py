@@ -0,0 +1,24 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("customers", "0002_alter_customer_table"),
+        ("dealers", "0003_dealer_list_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="customer",
+            index=models.Index(fields=["name", "id"], name="customer_name_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="customer",
+            index=models.Index(
+                fields=["created_at", "id"], name="customer_created_idx"
+            ),
+        ),
+    ]
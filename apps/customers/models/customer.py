@@ -49,6 +49,10 @@ class Customer(BaseModel):
     class Meta:
         verbose_name = _("Customer")
         verbose_name_plural = _("Customers")
+        indexes = [
+            models.Index(fields=['name', 'id'], name='customer_name_idx'),
+            models.Index(fields=['created_at', 'id'], name='customer_created_idx'),
+        ]
     
     def __str__(self):
         return self.name
@@ -1,6 +1,6 @@
-from django.db import models
 from apps.customers.models import Customer, CustomerType
 from apps.common.repositories.base_repository import BaseRepository
+from apps.common.repositories.search_repository import SearchIndexRepository
 
 
 class CustomerRepository(BaseRepository):
@@ -8,6 +8,7 @@ class CustomerRepository(BaseRepository):
     Repository for Customer model operations.
     Follows the repository pattern for data access abstraction.
     """
+    list_select_related = ('dealer',)
     
     def __init__(self):
         super().__init__(Customer)
@@ -56,7 +57,8 @@ class CustomerRepository(BaseRepository):
     
     def search_customers(self, query):
         """
-        Search customers by name, contact person, email or phone
+        Search customers by name, contact person, email, phone or tax ID
+        through the search index (every query word must match a word prefix)
         
         Args:
             query: Search query string
@@ -64,9 +66,7 @@ class CustomerRepository(BaseRepository):
         Returns:
             QuerySet of matching customers
         """
-        return self.model.objects.filter(
-            models.Q(name__icontains=query) |
-            models.Q(contact_person__icontains=query) |
-            models.Q(email__icontains=query) |
-            models.Q(phone__icontains=query)
-        ).distinct()
\ No newline at end of file
+        matching = SearchIndexRepository().matching('customer', query)
+        if matching is None:
+            return self.model.objects.none()
+        return self.model.objects.filter(pk__in=matching)
\ No newline at end of file
@@ -37,6 +37,6 @@ class CustomerListSerializer(serializers.ModelSerializer):
         model = Customer
         fields = [
             'id', 'name', 'customer_type', 'contact_person', 'email',
-            'phone', 'city', 'dealer_name'
+            'phone', 'dealer_name'
         ]
         read_only_fields = ['id', 'dealer_name']
\ No newline at end of file
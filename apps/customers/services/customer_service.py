@@ -23,7 +23,7 @@ class CustomerService:
         Returns:
             QuerySet of all customers
         """
-        return self.repository.list()
+        return self.repository.for_list()
     
     def get_customer(self, customer_id):
         """
@@ -52,7 +52,7 @@ class CustomerService:
         if not dealer:
             return None
             
-        return self.repository.get_by_dealer(dealer_id)
+        return self.repository.for_list(self.repository.get_by_dealer(dealer_id))
     
     def get_customers_by_type(self, customer_type):
         """
@@ -80,7 +80,7 @@ class CustomerService:
         Returns:
             QuerySet of corporate customers
         """
-        return self.repository.get_corporate_customers()
+        return self.repository.for_list(self.repository.get_corporate_customers())
     
     def get_individual_customers(self):
         """
@@ -89,7 +89,7 @@ class CustomerService:
         Returns:
             QuerySet of individual customers
         """
-        return self.repository.get_individual_customers()
+        return self.repository.for_list(self.repository.get_individual_customers())
     
     def search_customers(self, query):
         """
@@ -101,7 +101,7 @@ class CustomerService:
         Returns:
             QuerySet of matching customers
         """
-        return self.repository.search_customers(query)
+        return self.repository.for_list(self.repository.search_customers(query))
     
     def create_customer(self, customer_data):
         """
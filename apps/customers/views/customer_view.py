@@ -7,14 +7,23 @@ from django.db import transaction
 from apps.customers.models.customer import Customer
 from apps.customers.serializers import CustomerSerializer, CustomerListSerializer
 from apps.customers.services import CustomerService
+from apps.common.pagination import KeysetListMixin
 from apps.common.responses import success_response, error_response
 
 
-class CustomerViewSet(viewsets.ViewSet):
+class CustomerViewSet(KeysetListMixin, viewsets.ViewSet):
     """
     ViewSet for customer operations.
     """
     permission_classes = [IsAuthenticated]
+    list_orderings = {
+        'name': ('name', 'id'),
+        '-name': ('-name', '-id'),
+        '-created_at': ('-created_at', '-id'),
+    }
+    list_default_ordering = 'name'
+    list_filterset_fields = ['customer_type', 'dealer']
+    query_budget = {'list': 3}
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -22,14 +31,10 @@ class CustomerViewSet(viewsets.ViewSet):
     
     def list(self, request):
         """
-        Get all customers.
+        Get a page of customers, filtered by customer_type or dealer.
         """
         customers = self.service.get_all_customers()
-        serializer = CustomerListSerializer(customers, many=True)
-        return success_response(
-            data=serializer.data,
-            status_code=status.HTTP_200_OK
-        )
+        return self.keyset_list_response(request, customers, CustomerListSerializer)
     
     def retrieve(self, request, pk=None):
         """
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dealers", "0002_alter_dealer_table"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="dealer",
+            index=models.Index(fields=["name", "id"], name="dealer_name_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="dealer",
+            index=models.Index(fields=["created_at", "id"], name="dealer_created_idx"),
+        ),
+    ]
@@ -31,6 +31,10 @@ class Dealer(BaseModel):
     class Meta:
         verbose_name = _("Dealer")
         verbose_name_plural = _("Dealers")
+        indexes = [
+            models.Index(fields=['name', 'id'], name='dealer_name_idx'),
+            models.Index(fields=['created_at', 'id'], name='dealer_created_idx'),
+        ]
     
     def __str__(self):
         return self.name
\ No newline at end of file
@@ -1,6 +1,6 @@
-from django.db import models
 from apps.dealers.models import Dealer
 from apps.common.repositories.base_repository import BaseRepository
+from apps.common.repositories.search_repository import SearchIndexRepository
 
 
 class DealerRepository(BaseRepository):
@@ -38,7 +38,8 @@ class DealerRepository(BaseRepository):
     
     def search_dealers(self, query):
         """
-        Search dealers by name, code, contact person or email
+        Search dealers by name, code, contact person, email, phone or tax ID
+        through the search index (every query word must match a word prefix)
         
         Args:
             query: Search query string
@@ -46,9 +47,7 @@ class DealerRepository(BaseRepository):
         Returns:
             QuerySet of matching dealers
         """
-        return self.model.objects.filter(
-            models.Q(name__icontains=query) |
-            models.Q(code__icontains=query) |
-            models.Q(contact_person__icontains=query) |
-            models.Q(email__icontains=query)
-        ).distinct()
\ No newline at end of file
+        matching = SearchIndexRepository().matching('dealer', query)
+        if matching is None:
+            return self.model.objects.none()
+        return self.model.objects.filter(pk__in=matching)
\ No newline at end of file
@@ -27,6 +27,6 @@ class DealerListSerializer(serializers.ModelSerializer):
         model = Dealer
         fields = [
             'id', 'name', 'code', 'contact_person', 'email',
-            'phone', 'city', 'is_active'
+            'phone', 'is_active'
         ]
         read_only_fields = ['id']
\ No newline at end of file
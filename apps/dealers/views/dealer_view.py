@@ -7,14 +7,27 @@ from django.db import transaction
 from apps.dealers.models.dealer import Dealer
 from apps.dealers.serializers import DealerSerializer, DealerListSerializer
 from apps.dealers.services import DealerService
+from apps.common.conditional import ConditionalGetMixin
+from apps.common.pagination import KeysetListMixin
 from apps.common.responses import success_response, error_response
 
 
-class DealerViewSet(viewsets.ViewSet):
+class DealerViewSet(ConditionalGetMixin, KeysetListMixin, viewsets.ViewSet):
     """
     ViewSet for dealer operations.
     """
     permission_classes = [IsAuthenticated]
+    etag_resources = ('dealers.Dealer',)
+    etag_actions = ('list', 'retrieve', 'active')
+    list_orderings = {
+        'name': ('name', 'id'),
+        '-name': ('-name', '-id'),
+        'code': ('code', 'id'),
+        '-created_at': ('-created_at', '-id'),
+    }
+    list_default_ordering = 'name'
+    list_filterset_fields = ['is_active']
+    query_budget = {'list': 3}
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -22,14 +35,10 @@ class DealerViewSet(viewsets.ViewSet):
     
     def list(self, request):
         """
-        Get all dealers.
+        Get a page of dealers, filtered by is_active.
         """
         dealers = self.service.get_all_dealers()
-        serializer = DealerListSerializer(dealers, many=True)
-        return success_response(
-            data=serializer.data,
-            status_code=status.HTTP_200_OK
-        )
+        return self.keyset_list_response(request, dealers, DealerListSerializer)
     
     def retrieve(self, request, pk=None):
         """
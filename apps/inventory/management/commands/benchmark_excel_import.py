@@ -0,0 +1,122 @@
+import os
+import time
+
+import pandas as pd
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from apps.inventory.models import Item
+from apps.inventory.models.excel_import import ExcelImport
+from apps.inventory.services.excel_import_pipeline import PIPELINES
+from apps.projects.models import Project
+
+
+class Command(BaseCommand):
+    help = 'Benchmarks the Excel import pipelines on synthetic sheets (data is rolled back)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=20000,
+                            help='Number of rows per synthetic sheet')
+        parser.add_argument('--types', nargs='+', choices=sorted(PIPELINES), default=sorted(PIPELINES),
+                            help='Import types to benchmark')
+        parser.add_argument('--fixtures', metavar='DIR',
+                            help='Also write each synthetic sheet as an .xlsx fixture into DIR')
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.SUCCESS('Starting Excel import benchmark...'))
+
+        for import_type in options['types']:
+            df = getattr(self, f'build_{import_type.lower()}')(options['rows'])
+            if options['fixtures']:
+                os.makedirs(options['fixtures'], exist_ok=True)
+                path = os.path.join(options['fixtures'], f'{import_type.lower()}.xlsx')
+                df.to_excel(path, index=False)
+                self.stdout.write(f'Wrote {path}')
+
+            with transaction.atomic():
+                project = Project.objects.create(name=f'Excel Import Benchmark {import_type}')
+                self.create_items(import_type, options['rows'])
+
+                # First pass creates everything, second pass re-imports the same sheet as updates
+                for label in ('create', 'update'):
+                    excel_import = ExcelImport.objects.create(
+                        import_type=import_type,
+                        file=f'imports/inventory/benchmark-{import_type.lower()}.xlsx'
+                    )
+                    pipeline = PIPELINES[import_type](excel_import, project_id=project.id)
+
+                    with CaptureQueriesContext(connection) as context:
+                        start = time.perf_counter()
+                        result = pipeline.run(df)
+                        elapsed = time.perf_counter() - start
+
+                    rate = len(df) / elapsed if elapsed else 0
+                    style = self.style.SUCCESS if rate >= 5000 else self.style.WARNING
+                    self.stdout.write(style(
+                        f'{import_type:>22} {label:>6}: {len(df)} rows in {elapsed:.2f} s '
+                        f'({rate:,.0f} rows/s), {len(context.captured_queries)} queries, '
+                        f'{result.processed_count} processed, {result.failed_count} failed'
+                    ))
+
+                transaction.set_rollback(True)
+
+    def create_items(self, import_type, rows):
+        """Create the items a BOM sheet refers to"""
+        if import_type != 'BOM':
+            return
+        recipes = max(rows // 10, 1)
+        Item.objects.bulk_create(
+            [Item(name=f'Benchmark Output {index}', sku=f'BENCH-OUT-{index}', item_type='FINAL',
+                  unit_of_measure='pcs') for index in range(recipes)]
+            + [Item(name=f'Benchmark Input {index}', sku=f'BENCH-IN-{index}', item_type='RAW',
+                    unit_of_measure='pcs') for index in range(100)],
+            batch_size=1000
+        )
+
+    def build_raw_materials(self, rows):
+        return pd.DataFrame({
+            'sku': [f'BENCH-RM-{index}' for index in range(rows)],
+            'name': [f'Benchmark Raw Material {index}' for index in range(rows)],
+            'description': 'Synthetic raw material',
+            'category': [f'Benchmark > Group {index % 20}' for index in range(rows)],
+            'unit_of_measure': 'kg',
+            'quantity': [index % 500 for index in range(rows)],
+            'purchase_price': [round(1 + (index % 1000) / 10, 2) for index in range(rows)],
+            'purchase_date': '2024-01-15',
+            'supplier': 'Benchmark Supplier',
+            'invoice_reference': [f'INV-{index // 50}' for index in range(rows)],
+        })
+
+    def build_products(self, rows):
+        return pd.DataFrame({
+            'Name': [f'Benchmark Product {index}' for index in range(rows)],
+            'SKU': [f'BENCH-FP-{index}' for index in range(rows)],
+            'Qty': [index % 50 for index in range(rows)],
+            'Category': [f'Benchmark Products > Line {index % 10}' for index in range(rows)],
+            'Unit': 'pcs',
+            'Price': [round(10 + (index % 100), 2) for index in range(rows)],
+            'Cost': [round(5 + (index % 100) / 2, 2) for index in range(rows)],
+            'Description': 'Synthetic product',
+        })
+
+    def build_electronic_components(self, rows):
+        return pd.DataFrame({
+            'Reference': [f'R{index},R{index + 1}' for index in range(rows)],
+            'Qty': [2 + index % 8 for index in range(rows)],
+            'Value': [f'{index}pF' for index in range(rows)],
+            'MPN': [f'MPN-{index:06d}' for index in range(rows)],
+            'Footprint': 'Capacitor_SMD:C_0402_1005Metric',
+        })
+
+    def build_bom(self, rows):
+        recipes = max(rows // 10, 1)
+        return pd.DataFrame({
+            'output_sku': [f'BENCH-OUT-{index % recipes}' for index in range(rows)],
+            'output_quantity': 1,
+            'input_sku': [f'BENCH-IN-{(index // recipes) % 100}' for index in range(rows)],
+            'quantity_required': [1 + index % 5 for index in range(rows)],
+            'unit_of_measure': 'pcs',
+            'sequence': [10 * (index // recipes) for index in range(rows)],
+            'is_optional': ['Y' if index % 7 == 0 else 'N' for index in range(rows)],
+        })
@@ -0,0 +1,66 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from apps.inventory.models import Item
+from apps.inventory.repositories.inventory_repository import InventoryRepository, StockMovement
+
+
+class Command(BaseCommand):
+    help = 'Benchmarks the low stock lookup at increasing catalogue sizes (data is rolled back)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', nargs='+', type=int, default=[100, 1000, 10000],
+                            help='Catalogue sizes to benchmark')
+        parser.add_argument('--page-size', type=int, default=25,
+                            help='Number of low stock items fetched per lookup')
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.SUCCESS('Starting low stock benchmark...'))
+
+        query_counts = set()
+        for size in options['sizes']:
+            with transaction.atomic():
+                self.create_items(size)
+
+                with CaptureQueriesContext(connection) as context:
+                    start = time.perf_counter()
+                    items = InventoryRepository.get_low_stock_items()
+                    total = items.count()
+                    page = list(items[:options['page_size']])
+                    elapsed = (time.perf_counter() - start) * 1000
+
+                query_counts.add(len(context.captured_queries))
+                self.stdout.write(
+                    f'{size:>8} items: {total:>6} low stock, {len(page)} fetched, '
+                    f'{len(context.captured_queries)} queries, {elapsed:.2f} ms'
+                )
+
+                transaction.set_rollback(True)
+
+        if len(query_counts) == 1:
+            self.stdout.write(self.style.SUCCESS('Query count is constant across catalogue sizes'))
+        else:
+            self.stdout.write(self.style.ERROR(f'Query count varies with catalogue size: {sorted(query_counts)}'))
+
+    def create_items(self, size):
+        """Create a synthetic catalogue where every tenth item drops below its minimum"""
+        items = Item.objects.bulk_create([
+            Item(
+                name=f'Benchmark Item {index:07d}',
+                sku=f'BENCH-LOW-{size}-{index}',
+                item_type='RAW',
+                unit_of_measure='pcs',
+                quantity=10,
+                minimum_stock_level=5
+            )
+            for index in range(size)
+        ], batch_size=1000)
+
+        # Push every tenth item below its minimum through the regular movement path
+        InventoryRepository.apply_movements([
+            StockMovement(item.id, -8, 'ADJUSTMENT', 'Low stock benchmark')
+            for item in items[::10]
+        ])
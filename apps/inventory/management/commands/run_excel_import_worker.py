@@ -0,0 +1,60 @@
+import os
+import socket
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+from django.utils import timezone
+
+from apps.inventory.repositories.excel_import_repository import ExcelImportRepository
+from apps.inventory.services.excel_import_service import HEARTBEAT_INTERVAL, ExcelImportService
+
+
+class Command(BaseCommand):
+    help = (
+        'Processes queued Excel imports in the background. Imports are claimed from the '
+        'database, so several workers can run side by side; an import whose worker stops '
+        'sending heartbeats is resumed after its last committed chunk.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true',
+                            help='Process the imports that are currently queued, then exit')
+        parser.add_argument('--poll-interval', type=float, default=5,
+                            help='Seconds to wait between polls when the queue is empty')
+        parser.add_argument('--stale-after', type=int, default=120,
+                            help='Seconds without a heartbeat after which a processing import is resumed')
+
+    def handle(self, *args, **options):
+        if options['stale_after'] < 2 * HEARTBEAT_INTERVAL:
+            raise CommandError(f'--stale-after must be at least {2 * HEARTBEAT_INTERVAL} seconds '
+                               f'(twice the {HEARTBEAT_INTERVAL} s heartbeat interval)')
+        worker_id = f'{socket.gethostname()}:{os.getpid()}'
+        self.stdout.write(self.style.SUCCESS(f'Excel import worker {worker_id} started'))
+
+        try:
+            while True:
+                close_old_connections()
+                stale_before = timezone.now() - timedelta(seconds=options['stale_after'])
+                excel_import = ExcelImportRepository.claim_next(worker_id, stale_before)
+
+                if excel_import is None:
+                    if options['once']:
+                        break
+                    time.sleep(options['poll_interval'])
+                    continue
+
+                resumed = f' (resuming after chunk {excel_import.chunks_completed})' if excel_import.chunks_completed else ''
+                self.stdout.write(f'Processing {excel_import.import_type} import {excel_import.id}{resumed}')
+
+                start = time.perf_counter()
+                success, error = ExcelImportService.run_queued_import(excel_import)
+                elapsed = time.perf_counter() - start
+
+                if success:
+                    self.stdout.write(self.style.SUCCESS(f'Finished import {excel_import.id} in {elapsed:.1f} s'))
+                else:
+                    self.stdout.write(self.style.ERROR(f'Import {excel_import.id} failed: {error}'))
+        except KeyboardInterrupt:
+            self.stdout.write('Worker stopped')
@@ -0,0 +1,34 @@
+# Generated by Django 5.1.7 on 2026-10-16 22:40
+
+from django.db import migrations, models
+
+
+def populate_is_low_stock(apps, schema_editor):
+    Item = apps.get_model("inventory", "Item")
+    Item.objects.filter(
+        minimum_stock_level__gt=0, quantity__lte=models.F("minimum_stock_level")
+    ).update(is_low_stock=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0009_alter_inventorytransaction_quantity_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="item",
+            name="is_low_stock",
+            field=models.BooleanField(
+                default=False, editable=False, verbose_name="Is Low Stock"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="item",
+            index=models.Index(
+                fields=["is_low_stock", "name", "id"], name="item_low_stock_idx"
+            ),
+        ),
+        migrations.RunPython(populate_is_low_stock, migrations.RunPython.noop),
+    ]
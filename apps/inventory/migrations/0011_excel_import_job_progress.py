@@ -0,0 +1,82 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0010_item_is_low_stock"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="excelimport",
+            name="chunks_completed",
+            field=models.IntegerField(default=0, verbose_name="Chunks Completed"),
+        ),
+        migrations.AddField(
+            model_name="excelimport",
+            name="finished_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="Finished At"
+            ),
+        ),
+        migrations.AddField(
+            model_name="excelimport",
+            name="heartbeat_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="Heartbeat At"
+            ),
+        ),
+        migrations.AddField(
+            model_name="excelimport",
+            name="started_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="Started At"
+            ),
+        ),
+        migrations.AddField(
+            model_name="excelimport",
+            name="total_chunks",
+            field=models.IntegerField(
+                blank=True, null=True, verbose_name="Total Chunks"
+            ),
+        ),
+        migrations.AddField(
+            model_name="excelimport",
+            name="total_rows",
+            field=models.IntegerField(blank=True, null=True, verbose_name="Total Rows"),
+        ),
+        migrations.AddField(
+            model_name="excelimport",
+            name="worker_id",
+            field=models.CharField(
+                blank=True, max_length=100, null=True, verbose_name="Worker ID"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="excelimport",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("PENDING", "Pending"),
+                    ("QUEUED", "Queued"),
+                    ("PROCESSING", "Processing"),
+                    ("COMPLETED", "Completed"),
+                    ("FAILED", "Failed"),
+                ],
+                default="PENDING",
+                max_length=20,
+                verbose_name="Status",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="excelimport",
+            index=models.Index(
+                fields=["status", "created_at"], name="excel_import_queue_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0011_excel_import_job_progress"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="item",
+            index=models.Index(fields=["name", "id"], name="item_name_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="item",
+            index=models.Index(fields=["created_at", "id"], name="item_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="item",
+            index=models.Index(
+                fields=["item_type", "name", "id"], name="item_type_name_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:10
+
+from django.db import migrations, models
+
+
+def populate_category_paths(apps, schema_editor):
+    Category = apps.get_model("inventory", "Category")
+    categories = {category.id: category for category in Category.objects.all()}
+
+    def assign(category, seen=()):
+        if category.path:
+            return
+        parent = categories.get(category.parent_category_id)
+        if parent is None or parent.id in seen or category.id in seen:
+            category.path = f"{category.id.hex}/"
+            category.name_path = category.name
+            category.depth = 0
+            return
+        assign(parent, seen + (category.id,))
+        category.path = f"{parent.path}{category.id.hex}/"
+        category.name_path = f"{parent.name_path} > {category.name}"
+        category.depth = parent.depth + 1
+
+    for category in categories.values():
+        assign(category)
+    Category.objects.bulk_update(
+        categories.values(), ["path", "name_path", "depth"], batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0012_item_list_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="category",
+            name="depth",
+            field=models.PositiveSmallIntegerField(
+                default=0, editable=False, verbose_name="Depth"
+            ),
+        ),
+        migrations.AddField(
+            model_name="category",
+            name="name_path",
+            field=models.TextField(
+                default="", editable=False, verbose_name="Name Path"
+            ),
+        ),
+        migrations.AddField(
+            model_name="category",
+            name="path",
+            field=models.CharField(
+                db_index=True,
+                default="",
+                editable=False,
+                max_length=255,
+                verbose_name="Path",
+            ),
+        ),
+        migrations.RunPython(populate_category_paths, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0013_category_materialized_path"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="inventorytransaction",
+            index=models.Index(
+                fields=["transaction_date", "id"], name="inv_tx_date_idx"
+            ),
+        ),
+    ]
@@ -1,7 +1,12 @@
 from django.db import models
+from django.db.models import F, Q, Value
+from django.db.models.functions import Concat, Substr
 from django.utils.translation import gettext_lazy as _
 from apps.common.models.base_model import BaseModel
 
+# Separator between the names in Category.name_path
+PATH_NAME_SEPARATOR = ' > '
+
 
 class Category(BaseModel):
     """
@@ -17,6 +22,11 @@ class Category(BaseModel):
         related_name='subcategories',
         verbose_name=_('Parent Category')
     )
+    # Materialized path: the hex IDs of all ancestors and the category itself,
+    # each followed by "/". Maintained on save, so subtrees are prefix ranges.
+    path = models.CharField(_('Path'), max_length=255, db_index=True, editable=False, default='')
+    name_path = models.TextField(_('Name Path'), editable=False, default='')
+    depth = models.PositiveSmallIntegerField(_('Depth'), editable=False, default=0)
 
     class Meta(BaseModel.Meta):
         verbose_name = _('Category')
@@ -29,6 +39,84 @@ class Category(BaseModel):
     @property
     def full_path(self):
         """Returns the full hierarchical path of this category"""
+        if self.name_path:
+            return self.name_path
         if self.parent_category:
-            return f"{self.parent_category.full_path} > {self.name}"
+            return f"{self.parent_category.full_path}{PATH_NAME_SEPARATOR}{self.name}"
         return self.name
+    
+    def assign_path(self):
+        """Compute path, name_path and depth from the parent in memory"""
+        parent = self.parent_category
+        if parent is not None:
+            if not parent.path:
+                raise ValueError(f"Parent category {parent.name} has no path")
+            if parent.path.startswith(f"{self.pk.hex}/") or f"/{self.pk.hex}/" in parent.path:
+                raise ValueError('Cannot move a category to its own descendant')
+            self.path = f"{parent.path}{self.pk.hex}/"
+            self.name_path = f"{parent.name_path}{PATH_NAME_SEPARATOR}{self.name}"
+            self.depth = parent.depth + 1
+        else:
+            self.path = f"{self.pk.hex}/"
+            self.name_path = self.name
+            self.depth = 0
+    
+    def subtree_filter(self, prefix=''):
+        """
+        Q object matching this category and all of its descendants.
+        
+        The path is compared as a half-open range instead of LIKE, so the
+        lookup is an index range scan on every database backend.
+        
+        Args:
+            prefix: Lookup prefix when filtering a related model, e.g. 'category__'
+        """
+        return Q(**{
+            f'{prefix}path__gte': self.path,
+            f'{prefix}path__lt': self.path[:-1] + chr(ord('/') + 1),
+        })
+    
+    def save(self, *args, **kwargs):
+        previous = None
+        if not self._state.adding:
+            previous = type(self).objects.filter(pk=self.pk).values('path', 'name_path', 'depth').first()
+        
+        self.assign_path()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = set(update_fields) | {'path', 'name_path', 'depth'}
+        super().save(*args, **kwargs)
+        
+        # Re-root the descendants in one statement when the path or a name above them changed
+        if previous and previous['path'] and (
+            previous['path'] != self.path or previous['name_path'] != self.name_path
+        ):
+            type(self).rebase_descendants(previous, self.path, self.name_path, self.depth)
+    
+    @classmethod
+    def rebase_descendants(cls, previous, path='', name_path='', depth=-1):
+        """
+        Move the descendants of a category from its previous path to a new one.
+        
+        With the default arguments the descendants are promoted in place of a
+        deleted category.
+        
+        Args:
+            previous: Dict with the old 'path', 'name_path' and 'depth'
+            path: New path of the category ('' when it was deleted)
+            name_path: New name path of the category ('' when it was deleted)
+            depth: New depth of the category (-1 when it was deleted)
+        """
+        old_path = previous['path']
+        # Descendant name paths continue after "<old name path> > "
+        name_offset = len(previous['name_path']) + len(PATH_NAME_SEPARATOR) + 1
+        name_prefix = f"{name_path}{PATH_NAME_SEPARATOR}" if name_path else ''
+        
+        descendants = cls.objects.filter(
+            path__gt=old_path, path__lt=old_path[:-1] + chr(ord('/') + 1)
+        )
+        return descendants.update(
+            path=Concat(Value(path), Substr('path', len(old_path) + 1)),
+            name_path=Concat(Value(name_prefix), Substr('name_path', name_offset)),
+            depth=F('depth') + (depth - previous['depth']),
+        )
@@ -25,6 +25,7 @@ class ExcelImport(BaseModel):
     
     IMPORT_STATUS = (
         ('PENDING', _('Pending')),
+        ('QUEUED', _('Queued')),
         ('PROCESSING', _('Processing')),
         ('COMPLETED', _('Completed')),
         ('FAILED', _('Failed')),
@@ -37,6 +38,15 @@ class ExcelImport(BaseModel):
     failed_count = models.IntegerField(_('Failed Count'), default=0)
     error_details = models.TextField(_('Error Details'), blank=True, null=True)
     notes = models.TextField(_('Notes'), blank=True, null=True)
+    # Background job progress; chunks are committed one at a time so a
+    # crashed import resumes after the last committed chunk
+    total_rows = models.IntegerField(_('Total Rows'), null=True, blank=True)
+    total_chunks = models.IntegerField(_('Total Chunks'), null=True, blank=True)
+    chunks_completed = models.IntegerField(_('Chunks Completed'), default=0)
+    worker_id = models.CharField(_('Worker ID'), max_length=100, blank=True, null=True)
+    heartbeat_at = models.DateTimeField(_('Heartbeat At'), null=True, blank=True)
+    started_at = models.DateTimeField(_('Started At'), null=True, blank=True)
+    finished_at = models.DateTimeField(_('Finished At'), null=True, blank=True)
     processed_by = models.ForeignKey(
         'users.User',
         on_delete=models.SET_NULL,
@@ -50,6 +60,18 @@ class ExcelImport(BaseModel):
         verbose_name = _('Excel Import')
         verbose_name_plural = _('Excel Imports')
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='excel_import_queue_idx'),
+        ]
 
     def __str__(self):
         return f"{self.get_import_type_display()} - {self.created_at} ({self.get_status_display()})"
+    
+    @property
+    def progress(self):
+        """Completed share of the import in percent, or None before it has started"""
+        if self.status == 'COMPLETED':
+            return 100
+        if not self.total_chunks:
+            return None
+        return round(100 * self.chunks_completed / self.total_chunks)
@@ -41,6 +41,9 @@ class InventoryTransaction(BaseModel):
         verbose_name = _('Inventory Transaction')
         verbose_name_plural = _('Inventory Transactions')
         ordering = ['-transaction_date']
+        indexes = [
+            models.Index(fields=['transaction_date', 'id'], name='inv_tx_date_idx'),
+        ]
         
     def __str__(self):
         return f"{self.transaction_type} - {self.item.name} ({self.quantity})"
@@ -1,8 +1,16 @@
 from django.db import models
+from django.db.models import F, Q
 from django.utils.translation import gettext_lazy as _
 from apps.common.models.base_model import BaseModel
 
 
+# Items with a minimum stock level whose quantity is at or below it
+LOW_STOCK_CONDITION = Q(minimum_stock_level__gt=0, quantity__lte=F('minimum_stock_level'))
+
+# Item fields that are copied into BOM graph nodes
+BOM_ITEM_FIELDS = {'name', 'sku', 'item_type', 'unit_of_measure'}
+
+
 class Item(BaseModel):
     """
     Central model representing all physical or virtual items in the system 
@@ -36,6 +44,8 @@ class Item(BaseModel):
     unit_of_measure = models.CharField(_('Unit of Measure'), max_length=50)
     quantity = models.IntegerField(_('Quantity'), default=0)
     minimum_stock_level = models.IntegerField(_('Minimum Stock Level'), default=0)
+    # Maintained on every stock movement so low stock lookups can use an index
+    is_low_stock = models.BooleanField(_('Is Low Stock'), default=False, editable=False)
     purchase_price = models.DecimalField(_('Purchase Price'), max_digits=10, decimal_places=2, default=0)
     selling_price = models.DecimalField(_('Selling Price'), max_digits=10, decimal_places=2, default=0)
     dealer_price = models.DecimalField(_('Dealer Price'), max_digits=10, decimal_places=2, default=0)
@@ -56,10 +66,40 @@ class Item(BaseModel):
         verbose_name = _('Item')
         verbose_name_plural = _('Items')
         ordering = ['name']
+        indexes = [
+            models.Index(fields=['is_low_stock', 'name', 'id'], name='item_low_stock_idx'),
+            models.Index(fields=['name', 'id'], name='item_name_idx'),
+            models.Index(fields=['created_at', 'id'], name='item_created_idx'),
+            models.Index(fields=['item_type', 'name', 'id'], name='item_type_name_idx'),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.sku})"
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        item = super().from_db(db, field_names, values)
+        item._loaded_bom_values = {
+            field: value for field, value in zip(field_names, values) if field in BOM_ITEM_FIELDS
+        }
+        return item
+    
+    def save(self, *args, **kwargs):
+        self.is_low_stock = 0 < self.minimum_stock_level and self.quantity <= self.minimum_stock_level
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'quantity', 'minimum_stock_level'} & set(update_fields):
+            kwargs['update_fields'] = set(update_fields) | {'is_low_stock'}
+        super().save(*args, **kwargs)
+        # What was just written is what later saves are compared against
+        self._loaded_bom_values = {field: self.__dict__[field] for field in BOM_ITEM_FIELDS if field in self.__dict__}
+    
+    def bom_fields_changed(self):
+        """Whether the BOM node data differs from what was loaded (True when unknown)"""
+        loaded = getattr(self, '_loaded_bom_values', None)
+        if loaded is None:
+            return True
+        return any(field not in loaded or loaded[field] != getattr(self, field) for field in BOM_ITEM_FIELDS)
+    
     @property
     def is_raw_material(self):
         return self.item_type == 'RAW'
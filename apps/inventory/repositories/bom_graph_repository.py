@@ -0,0 +1,279 @@
+import threading
+import time
+import uuid
+from array import array
+
+from django.db import transaction
+
+from apps.common.repositories.resource_version_repository import ResourceVersionRepository
+from apps.inventory.models.recipe import Recipe
+from apps.inventory.models.recipe_item import RecipeItem
+
+
+class BOMNode:
+    """
+    A single item in the BOM graph.
+
+    Outgoing edges are stored in the graph's flat arrays between
+    edge_start (inclusive) and edge_end (exclusive).
+    """
+    __slots__ = ('id', 'name', 'sku', 'item_type', 'unit_of_measure', 'edge_start', 'edge_end')
+
+    def __init__(self, item_id, name, sku, item_type, unit_of_measure):
+        self.id = item_id
+        self.name = name
+        self.sku = sku
+        self.item_type = item_type
+        self.unit_of_measure = unit_of_measure
+        self.edge_start = 0
+        self.edge_end = 0
+
+    @property
+    def is_raw_material(self):
+        return self.item_type == 'RAW'
+
+    @property
+    def is_final_product(self):
+        return self.item_type == 'FINAL'
+
+    @property
+    def is_intermediate_product(self):
+        return self.item_type == 'INTERMEDIATE'
+
+    @property
+    def has_recipe(self):
+        return self.edge_end > self.edge_start
+
+
+class BOMGraph:
+    """
+    Compact multi-level bill of materials built from active recipes.
+
+    Items are integer-indexed nodes; recipe lines are stored as parallel
+    arrays (compressed adjacency) holding the input node, the quantity needed
+    per single unit of output and the optional flag. Explosions are memoized
+    per (node, selected optional components), so shared sub-assemblies are
+    only expanded once.
+    """
+
+    def __init__(self, nodes, index, edge_targets, edge_quantities, edge_optional, edge_units):
+        self.nodes = nodes
+        self.index = index
+        self.edge_targets = edge_targets
+        self.edge_quantities = edge_quantities
+        self.edge_optional = edge_optional
+        self.edge_units = edge_units
+        self._explosions = {}
+        self._optional_components = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def build(cls):
+        """Build the graph from active recipes and their items in two queries"""
+        nodes = []
+        index = {}
+
+        def node_for(item_id, name, sku, item_type, unit_of_measure):
+            position = index.get(item_id)
+            if position is None:
+                position = index[item_id] = len(nodes)
+                nodes.append(BOMNode(item_id, name, sku, item_type, unit_of_measure))
+            return position
+
+        # One recipe per output item; the first active recipe by name wins
+        recipes = {}
+        outputs = set()
+        for recipe in Recipe.objects.filter(active=True).order_by('name', 'id').values(
+            'id', 'output_quantity', 'output_item_id', 'output_item__name', 'output_item__sku',
+            'output_item__item_type', 'output_item__unit_of_measure'
+        ):
+            output = node_for(
+                recipe['output_item_id'], recipe['output_item__name'], recipe['output_item__sku'],
+                recipe['output_item__item_type'], recipe['output_item__unit_of_measure']
+            )
+            if output not in outputs:
+                outputs.add(output)
+                recipes[recipe['id']] = output
+
+        lines = {}
+        for line in RecipeItem.objects.filter(recipe_id__in=list(recipes)).order_by('sequence', 'id').values(
+            'recipe_id', 'recipe__output_quantity', 'quantity_required', 'unit_of_measure', 'is_optional',
+            'input_item_id', 'input_item__name', 'input_item__sku', 'input_item__item_type',
+            'input_item__unit_of_measure'
+        ):
+            target = node_for(
+                line['input_item_id'], line['input_item__name'], line['input_item__sku'],
+                line['input_item__item_type'], line['input_item__unit_of_measure']
+            )
+            output_quantity = line['recipe__output_quantity'] or 1
+            lines.setdefault(recipes[line['recipe_id']], []).append((
+                target,
+                line['quantity_required'] / output_quantity,
+                line['is_optional'],
+                line['unit_of_measure']
+            ))
+
+        # Lay the edges out contiguously per node
+        edge_targets = array('l')
+        edge_quantities = array('d')
+        edge_optional = array('b')
+        edge_units = []
+        for position, node in enumerate(nodes):
+            node.edge_start = len(edge_targets)
+            for target, quantity, is_optional, unit in lines.get(position, ()):
+                edge_targets.append(target)
+                edge_quantities.append(quantity)
+                edge_optional.append(1 if is_optional else 0)
+                edge_units.append(unit)
+            node.edge_end = len(edge_targets)
+
+        return cls(nodes, index, edge_targets, edge_quantities, edge_optional, edge_units)
+
+    def get_node(self, item_id):
+        """Get the node for an item ID, or None if the item is not part of any recipe"""
+        position = self.index.get(self._normalize(item_id))
+        return self.nodes[position] if position is not None else None
+
+    def explode(self, item_id, selections=frozenset()):
+        """
+        Get the leaf material requirements for one unit of an item.
+
+        Args:
+            item_id: ID of the item to explode
+            selections: Item IDs of optional components to include
+
+        Returns:
+            dict: Leaf node index -> (quantity per unit, unit of measure)
+        """
+        position = self.index.get(self._normalize(item_id))
+        if position is None:
+            return {}
+        selections = frozenset(self.index[s] for s in map(self._normalize, selections) if s in self.index)
+        return self._explode(position, selections, ())
+
+    def optional_components(self, item_id):
+        """Get the IDs of all optional components anywhere below an item"""
+        position = self.index.get(self._normalize(item_id))
+        if position is None:
+            return frozenset()
+        return frozenset(self.nodes[i].id for i in self._collect_optional(position, ()))
+
+    def _explode(self, position, selections, path):
+        key = (position, selections)
+        cached = self._explosions.get(key)
+        if cached is not None:
+            return cached
+        if position in path:
+            raise ValueError(f"Recipe cycle detected at {self.nodes[position].name}")
+
+        requirements = {}
+        node = self.nodes[position]
+        path = path + (position,)
+        for edge in range(node.edge_start, node.edge_end):
+            target = self.edge_targets[edge]
+            if self.edge_optional[edge] and target not in selections:
+                continue
+            quantity = self.edge_quantities[edge]
+            target_node = self.nodes[target]
+
+            if target_node.is_raw_material or not target_node.has_recipe:
+                # Leaf material - add directly to requirements
+                current, unit = requirements.get(target, (0, self.edge_units[edge]))
+                requirements[target] = (current + quantity, unit)
+            else:
+                # Sub-assembly - merge its (memoized) requirements scaled by quantity
+                for leaf, (leaf_quantity, unit) in self._explode(target, selections, path).items():
+                    current, _ = requirements.get(leaf, (0, unit))
+                    requirements[leaf] = (current + leaf_quantity * quantity, unit)
+
+        with self._lock:
+            self._explosions[key] = requirements
+        return requirements
+
+    def _collect_optional(self, position, path):
+        cached = self._optional_components.get(position)
+        if cached is not None:
+            return cached
+        if position in path:
+            raise ValueError(f"Recipe cycle detected at {self.nodes[position].name}")
+
+        found = set()
+        node = self.nodes[position]
+        for edge in range(node.edge_start, node.edge_end):
+            target = self.edge_targets[edge]
+            if self.edge_optional[edge]:
+                found.add(target)
+            found |= self._collect_optional(target, path + (position,))
+
+        found = frozenset(found)
+        with self._lock:
+            self._optional_components[position] = found
+        return found
+
+    @staticmethod
+    def _normalize(item_id):
+        if isinstance(item_id, uuid.UUID):
+            return item_id
+        return uuid.UUID(str(item_id))
+
+
+class BOMGraphRepository:
+    """
+    Process-wide access to the BOM graph.
+
+    The graph is built lazily on first use and rebuilt after invalidation.
+    Its version is a ResourceVersion counter, which lives in the database
+    shared by every worker and is bumped once the invalidating write commits.
+    Each worker reads the counter at most every VERSION_CHECK_INTERVAL
+    seconds, so warm calls run no query and a change committed by another
+    worker is picked up within that interval; the worker that made the change
+    sees it right after its commit. The counter is read before the recipes,
+    so a graph is never older than the version it is held under.
+    """
+    VERSION_KEY = ResourceVersionRepository.key('inventory.BOMGraph')
+    # Seconds a worker uses its graph before reading the version again
+    VERSION_CHECK_INTERVAL = 5
+
+    _graph = None
+    _version = None
+    _checked_at = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_graph(cls):
+        """Get the current BOM graph, building it if needed"""
+        now = time.monotonic()
+        graph = cls._graph
+        checked_at = cls._checked_at
+        if graph is not None and checked_at is not None and now - checked_at < cls.VERSION_CHECK_INTERVAL:
+            return graph
+
+        version = ResourceVersionRepository.get_versions([cls.VERSION_KEY]).get(cls.VERSION_KEY, (0, None))[0]
+        with cls._lock:
+            if cls._graph is None or cls._version != version:
+                cls._graph = BOMGraph.build()
+                cls._version = version
+            cls._checked_at = now
+            return cls._graph
+
+    @classmethod
+    def is_loaded(cls):
+        """Whether this process currently holds a built graph"""
+        return cls._graph is not None
+
+    @classmethod
+    def contains(cls, item_id):
+        """Whether the graph held by this process includes the given item"""
+        graph = cls._graph
+        return graph is not None and graph.get_node(item_id) is not None
+
+    @classmethod
+    def invalidate(cls):
+        """Rebuild the graph in every worker once the current transaction commits"""
+        ResourceVersionRepository.bump_on_commit([cls.VERSION_KEY])
+        transaction.on_commit(cls.expire)
+
+    @classmethod
+    def expire(cls):
+        """Make the next get_graph call in this process read the version"""
+        cls._checked_at = None
@@ -1,12 +1,21 @@
+from django.core.cache import cache
 from django.shortcuts import get_object_or_404
 from apps.inventory.models import Category
+from apps.common.repositories.resource_version_repository import ResourceVersionRepository
 
 
 class CategoryRepository:
     """
     Repository class for Category data access operations.
     Abstracts all database operations related to Category model.
+    
+    The nested category tree is built from one query and kept in the Django
+    cache with the 'inventory.Category' ResourceVersion counter it was built
+    at. The counter lives in the database and is bumped once a category write
+    commits, so every worker rebuilds its tree after any change, whatever the
+    cache backend.
     """
+    TREE_CACHE_KEY = 'inventory:category_tree'
     
     def __init__(self):
         self.model = Category
@@ -27,6 +36,62 @@ class CategoryRepository:
         """Get all subcategories for a given parent category"""
         return self.model.objects.filter(parent_category_id=parent_id)
     
+    def get_descendants(self, category, include_self=False):
+        """Get all categories below a category with a single path range lookup"""
+        descendants = self.model.objects.filter(category.subtree_filter())
+        if not include_self:
+            descendants = descendants.exclude(pk=category.pk)
+        return descendants
+    
+    def get_tree(self):
+        """
+        Get the whole category tree as nested dicts, siblings ordered by name
+        
+        Returns:
+            list: Root nodes with 'id', 'name', 'description', 'full_path' and 'children'
+        """
+        version_key = ResourceVersionRepository.key(self.model)
+        # The version is read before the categories, so a tree is never older than it claims
+        version = ResourceVersionRepository.get_versions([version_key]).get(version_key, (0, None))[0]
+        cached = cache.get(self.TREE_CACHE_KEY)
+        if cached is not None and cached['version'] == version:
+            return cached['tree']
+        
+        nodes = {}
+        tree = []
+        # Parents always come before their children when ordered by depth
+        for category in self.model.objects.order_by('depth', 'name', 'id').values(
+            'id', 'name', 'description', 'name_path', 'parent_category_id'
+        ):
+            node = nodes[category['id']] = {
+                'id': category['id'],
+                'name': category['name'],
+                'description': category['description'],
+                'full_path': category['name_path'],
+                'children': []
+            }
+            parent = nodes.get(category['parent_category_id'])
+            (parent['children'] if parent else tree).append(node)
+        
+        cache.set(self.TREE_CACHE_KEY, {'version': version, 'tree': tree}, timeout=None)
+        return tree
+    
+    def get_category_map(self):
+        """Get all categories keyed by (parent category ID, name)"""
+        return {
+            (category.parent_category_id, category.name): category
+            for category in self.model.objects.order_by('created_at')
+        }
+    
+    def bulk_create_categories(self, categories):
+        """Insert unsaved category instances; parents must already be saved or come first"""
+        for category in categories:
+            category.assign_path()
+        created = self.model.objects.bulk_create(categories)
+        # Bulk inserts send no signals; this also makes every worker rebuild its category tree
+        ResourceVersionRepository.mark_changed(self.model)
+        return created
+    
     def create_category(self, category_data):
         """Create a new category"""
         return self.model.objects.create(**category_data)
@@ -46,3 +111,9 @@ class CategoryRepository:
         category = self.get_category_by_id(category_id)
         category.delete()
         return True
+    
+    def delete_category_tree(self, category_id):
+        """Delete a category together with all of its descendants"""
+        category = self.get_category_by_id(category_id)
+        self.get_descendants(category, include_self=True).delete()
+        return True
@@ -1,6 +1,17 @@
+from django.db.models import Q
+from django.utils import timezone
 from apps.inventory.models.excel_import import ExcelImport
 
 
+class ImportClaimLost(Exception):
+    """The import was reclaimed by another worker after its heartbeat went stale"""
+
+    def __init__(self, import_id, worker_id):
+        self.import_id = import_id
+        self.worker_id = worker_id
+        super().__init__(f"Excel import {import_id} is no longer held by worker {worker_id}")
+
+
 class ExcelImportRepository:
     """
     Repository class for ExcelImport model
@@ -65,6 +76,121 @@ class ExcelImportRepository:
         except ExcelImport.DoesNotExist:
             return None
     
+    @staticmethod
+    def queue(import_id):
+        """
+        Mark a pending import as queued for the background worker
+        
+        Returns:
+            bool: Whether the import was pending and is now queued
+        """
+        return ExcelImport.objects.filter(id=import_id, status='PENDING').update(
+            status='QUEUED',
+            updated_at=timezone.now()
+        ) == 1
+    
+    @staticmethod
+    def claim_next(worker_id, stale_before):
+        """
+        Claim the oldest queued import, or a processing one whose worker
+        stopped sending heartbeats before stale_before
+        
+        The claim is a conditional update, so two workers never get the same
+        import even on databases without row locking.
+        """
+        candidates = ExcelImport.objects.filter(
+            Q(status='QUEUED') | Q(status='PROCESSING', heartbeat_at__lt=stale_before)
+        ).order_by('created_at').values('id', 'status', 'heartbeat_at')[:10]
+        
+        for candidate in candidates:
+            claimed = ExcelImport.objects.filter(
+                id=candidate['id'],
+                status=candidate['status'],
+                heartbeat_at=candidate['heartbeat_at']
+            ).update(
+                status='PROCESSING',
+                worker_id=worker_id,
+                heartbeat_at=timezone.now(),
+                updated_at=timezone.now()
+            )
+            if claimed:
+                return ExcelImport.objects.get(id=candidate['id'])
+        return None
+    
+    @staticmethod
+    def start(import_id, worker_id, total_rows, total_chunks):
+        """
+        Record the size of an import when a worker starts (or resumes) it
+        
+        Raises:
+            ImportClaimLost: When the import is no longer held by the worker
+        """
+        now = timezone.now()
+        updated = ExcelImport.objects.filter(id=import_id, worker_id=worker_id).update(
+            status='PROCESSING',
+            total_rows=total_rows,
+            total_chunks=total_chunks,
+            heartbeat_at=now,
+            updated_at=now
+        )
+        if not updated:
+            raise ImportClaimLost(import_id, worker_id)
+        ExcelImport.objects.filter(id=import_id, started_at__isnull=True).update(started_at=now)
+    
+    @staticmethod
+    def heartbeat(import_id, worker_id):
+        """
+        Show that the worker is still processing an import
+        
+        Returns:
+            bool: Whether the import is still held by the worker
+        """
+        now = timezone.now()
+        return ExcelImport.objects.filter(id=import_id, worker_id=worker_id, status='PROCESSING').update(
+            heartbeat_at=now,
+            updated_at=now
+        ) == 1
+    
+    @staticmethod
+    def save_checkpoint(import_id, worker_id, chunks_completed, processed_count, failed_count, error_details):
+        """
+        Record progress after a chunk, inside its transaction; also serves as
+        the worker heartbeat
+        
+        Raises:
+            ImportClaimLost: When another worker reclaimed the import, so that
+                the chunk is rolled back instead of being written twice
+        """
+        now = timezone.now()
+        updated = ExcelImport.objects.filter(id=import_id, worker_id=worker_id).update(
+            chunks_completed=chunks_completed,
+            processed_count=processed_count,
+            failed_count=failed_count,
+            error_details=error_details,
+            heartbeat_at=now,
+            updated_at=now
+        )
+        if not updated:
+            raise ImportClaimLost(import_id, worker_id)
+    
+    @staticmethod
+    def finish(import_id, worker_id, status, processed_count=None, failed_count=None, error_details=None):
+        """
+        Set the final status of an import and release it from its worker
+        
+        Returns:
+            bool: Whether the import was still held by the worker
+        """
+        fields = {'status': status, 'finished_at': timezone.now(), 'worker_id': None}
+        if processed_count is not None:
+            fields['processed_count'] = processed_count
+        if failed_count is not None:
+            fields['failed_count'] = failed_count
+        if error_details is not None:
+            fields['error_details'] = error_details
+        fields['updated_at'] = fields['finished_at']
+        return ExcelImport.objects.filter(id=import_id, worker_id=worker_id).update(**fields) == 1
+    
     @staticmethod
     def delete(import_id):
         """
@@ -1,11 +1,48 @@
-from django.db.models import F, Sum
+from collections import namedtuple
+from decimal import Decimal, InvalidOperation
+
+from django.db import transaction
+from django.db.models import BooleanField, Case, F, IntegerField, Q, Value, When
+from django.utils import timezone
 from apps.inventory.models.inventory_transaction import InventoryTransaction
-from apps.inventory.models.item import Item
+from apps.inventory.models.item import Item, LOW_STOCK_CONDITION
+from apps.common.repositories.resource_version_repository import ResourceVersionRepository
+
+
+# A single stock movement: positive quantity adds stock, negative consumes it.
+StockMovement = namedtuple(
+    'StockMovement',
+    ['item_id', 'quantity', 'transaction_type', 'notes', 'reference_model', 'reference_id'],
+    defaults=('', None, None)
+)
+
+
+class InsufficientStockError(ValueError):
+    """Raised when a stock movement would drive an item's quantity below zero"""
+
+    def __init__(self, shortages):
+        self.shortages = shortages
+        details = ', '.join(
+            f"{s['item_name'] or s['item_id']} (Required: {s['required']}, Available: {s['available']})"
+            for s in shortages
+        )
+        super().__init__(f"Insufficient inventory for {details}")
+
+
+class UnknownItemError(Item.DoesNotExist):
+    """Raised when a stock movement refers to an item that does not exist"""
+
+    def __init__(self, item_ids):
+        self.item_ids = [str(item_id) for item_id in item_ids]
+        super().__init__(f"Item not found: {', '.join(self.item_ids)}")
 
 
 class InventoryRepository:
     """Repository for inventory management and tracking operations"""
     
+    # Maximum number of items changed by a single UPDATE statement
+    UPDATE_BATCH_SIZE = 250
+    
     @staticmethod
     def get_item_quantity(item_id):
         """Get the current available quantity of an item"""
@@ -37,54 +74,181 @@ class InventoryRepository:
                 transaction_type = 'PRODUCTION_IN'  # Consumed in production
             else:
                 transaction_type = 'PRODUCTION_OUT'  # Produced in production
-                
-        # Handle reference_id (store in notes since the field requires an integer)
-        ref_id_str = ""
-        if reference_id:
-            # Store complete reference ID in notes
-            ref_id_str = f" (Ref: {reference_id})"
-            
-        # Add performer info to notes if available
-        performer_info = ""
-        if performed_by:
-            performer_info = f" - by {performed_by.username}"
-            
-        # Create inventory transaction with numerical reference_id or None
-        transaction = InventoryTransaction.objects.create(
-            item_id=item_id,
-            quantity=quantity,  # Can be positive (addition) or negative (reduction)
-            transaction_type=transaction_type,
-            # Don't pass reference_id if it's not an integer
-            notes=f"{reason}{ref_id_str}{performer_info}"
+        
+        transactions = InventoryRepository.apply_movements(
+            [StockMovement(item_id, quantity, transaction_type, reason)],
+            reference_id=reference_id,
+            performed_by=performed_by
         )
+        return transactions[0]
+    
+    @staticmethod
+    @transaction.atomic
+    def apply_movements(movements, reference_id=None, performed_by=None):
+        """
+        Apply a batch of stock movements as one set-based operation.
+        
+        The ledger rows are written with a single bulk insert and every item's
+        quantity is changed by one guarded UPDATE, so a movement list costs a
+        constant number of queries regardless of its length. Item rows are
+        locked in primary key order to keep concurrent batches deadlock free,
+        and the UPDATE only matches rows whose stock stays non-negative.
+        
+        Args:
+            movements: Iterable of StockMovement (or equivalent tuples)
+            reference_id: Optional reference appended to every ledger note
+            performed_by: Optional user appended to every ledger note
+        
+        Returns:
+            List of created InventoryTransaction instances
+        
+        Raises:
+            ValueError: If a movement quantity is not a whole number
+            UnknownItemError: If a movement refers to an item that does not exist
+            InsufficientStockError: If any item would end up with negative stock
+        """
+        movements = [
+            movement._replace(quantity=InventoryRepository.whole_quantity(movement.quantity))
+            for movement in map(StockMovement._make, movements)
+        ]
+        if not movements:
+            return []
+        
+        # Net quantity change per item; several movements may touch the same item
+        deltas = {}
+        for movement in movements:
+            item_id = Item._meta.pk.to_python(movement.item_id)
+            deltas[item_id] = deltas.get(item_id, 0) + movement.quantity
+        item_ids = sorted(deltas)
+        
+        # Lock the affected rows in a deterministic order before changing them
+        locked = {
+            row['id']: row
+            for row in Item.objects.select_for_update()
+            .filter(id__in=item_ids)
+            .order_by('id')
+            .values('id', 'name', 'quantity')
+        }
+        missing = [item_id for item_id in item_ids if item_id not in locked]
+        if missing:
+            raise UnknownItemError(missing)
         
-        # Directly update the item quantity in the Item table
-        InventoryRepository.update_item_quantity(item_id, int(quantity))
+        # Decrements only match rows that still hold enough stock. Large batches are
+        # split so the CASE expression stays within database expression limits.
+        updated = 0
+        now = timezone.now()
+        for offset in range(0, len(item_ids), InventoryRepository.UPDATE_BATCH_SIZE):
+            chunk = item_ids[offset:offset + InventoryRepository.UPDATE_BATCH_SIZE]
+            guard = Q()
+            for item_id in chunk:
+                if deltas[item_id] < 0:
+                    guard |= Q(id=item_id, quantity__gte=-deltas[item_id])
+                else:
+                    guard |= Q(id=item_id)
+            
+            updated += Item.objects.filter(guard).update(
+                quantity=Case(
+                    *[When(id=item_id, then=F('quantity') + Value(deltas[item_id])) for item_id in chunk],
+                    default=F('quantity'),
+                    output_field=IntegerField()
+                ),
+                updated_at=now
+            )
+        
+        if updated != len(deltas):
+            shortages = []
+            for item_id in item_ids:
+                available = locked[item_id]['quantity']
+                if available + deltas[item_id] < 0:
+                    shortages.append({
+                        'item_id': str(item_id),
+                        'item_name': locked[item_id]['name'],
+                        'required': -deltas[item_id],
+                        'available': available
+                    })
+            raise InsufficientStockError(shortages)
+        
+        InventoryRepository.refresh_low_stock_flags(item_ids)
+        
+        # Handle reference_id (store in notes since the field requires an integer)
+        ref_id_str = f" (Ref: {reference_id})" if reference_id else ""
+        performer_info = f" - by {performed_by.username}" if performed_by else ""
+        
+        return InventoryTransaction.objects.bulk_create([
+            InventoryTransaction(
+                item_id=movement.item_id,
+                quantity=movement.quantity,  # Can be positive (addition) or negative (reduction)
+                transaction_type=movement.transaction_type,
+                reference_model=movement.reference_model,
+                reference_id=movement.reference_id,
+                notes=f"{movement.notes}{ref_id_str}{performer_info}"
+            )
+            for movement in movements
+        ])
+    
+    @staticmethod
+    def whole_quantity(quantity):
+        """
+        Get a stock quantity as an int, refusing fractions instead of truncating them
         
-        return transaction
+        Raises:
+            ValueError: If the quantity is not a whole number
+        """
+        try:
+            value = Decimal(str(quantity))
+        except (InvalidOperation, ValueError):
+            raise ValueError(f"Invalid stock quantity: {quantity!r}")
+        if not value.is_finite() or value != value.to_integral_value():
+            raise ValueError(f"Stock quantities must be whole numbers, got {quantity}")
+        return int(value)
     
     @staticmethod
-    def update_item_quantity(item_id, quantity_change):
+    def update_item_quantity(item_id, quantity_change, notes='Manual quantity update', performed_by=None):
         """
-        Directly update the item quantity in the Item table.
+        Change the quantity of an item through the guarded movement engine.
         
         Args:
             item_id: UUID of the item to update
             quantity_change: Integer change in quantity (can be positive or negative)
+            notes: Ledger note of the adjustment
+            performed_by: Optional user appended to the ledger note
         
         Returns:
             Updated Item instance
-        """
-        # Get the item
-        item = Item.objects.get(id=item_id)
         
-        # Update quantity
-        item.quantity = item.quantity + quantity_change
+        Raises:
+            UnknownItemError: If the item does not exist
+            InsufficientStockError: If the change would drive stock negative
+        """
+        InventoryRepository.apply_movements(
+            [StockMovement(item_id, quantity_change, 'ADJUSTMENT', notes)],
+            performed_by=performed_by
+        )
+        return Item.objects.get(id=item_id)
+    
+    @staticmethod
+    def refresh_low_stock_flags(item_ids=None):
+        """
+        Recompute the maintained is_low_stock flag in a single UPDATE.
         
-        # Save the item
-        item.save(update_fields=['quantity'])
+        Args:
+            item_ids: Optional list of item IDs to refresh; all items when omitted
         
-        return item
+        Returns:
+            Number of rows updated
+        """
+        # Every stock write ends here; queryset updates send no signals
+        ResourceVersionRepository.mark_changed(Item)
+        queryset = Item.objects.all()
+        if item_ids is not None:
+            queryset = queryset.filter(id__in=list(item_ids))
+        return queryset.update(
+            is_low_stock=Case(
+                When(LOW_STOCK_CONDITION, then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField()
+            )
+        )
     
     @staticmethod
     def get_inventory_transactions(item_id=None, date_from=None, date_to=None):
@@ -103,28 +267,14 @@ class InventoryRepository:
         return queryset.order_by('-created_at')
     
     @staticmethod
-    def get_low_stock_items(threshold_percentage=20):
-        """Get items that are low in stock"""
-        low_stock_items = []
-        
-        # Get all items
-        items = Item.objects.all()
-        
-        for item in items:
-            if item.minimum_stock:
-                # Calculate current quantity
-                transactions = InventoryTransaction.objects.filter(item=item)
-                current_quantity = transactions.aggregate(total=Sum('quantity')).get('total', 0) or 0
-                
-                # Check if below threshold
-                if current_quantity <= (item.minimum_stock * (threshold_percentage / 100)):
-                    low_stock_items.append({
-                        'item_id': str(item.id),
-                        'item_name': item.name,
-                        'current_quantity': current_quantity,
-                        'minimum_stock': item.minimum_stock,
-                        'unit_of_measure': item.unit_of_measure,
-                        'is_critical': current_quantity <= 0
-                    })
+    def get_low_stock_items():
+        """
+        Get items whose quantity is at or below their minimum stock level.
         
-        return low_stock_items
+        Answered from the maintained is_low_stock flag, so this is a single
+        indexed query regardless of catalogue size.
+        
+        Returns:
+            QuerySet: Low stock items ordered by name
+        """
+        return Item.objects.filter(is_low_stock=True).select_related('category').order_by('name', 'id')
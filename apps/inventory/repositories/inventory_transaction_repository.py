@@ -23,6 +23,19 @@ class InventoryTransactionRepository(BaseRepository):
         """
         return self.model.objects.create(**transaction_data)
     
+    def bulk_create_transactions(self, transactions, batch_size=None):
+        """
+        Insert unsaved inventory transactions in batches.
+        
+        Args:
+            transactions (list): InventoryTransaction instances
+            batch_size (int, optional): Rows per INSERT statement
+            
+        Returns:
+            list: Created transaction instances
+        """
+        return self.model.objects.bulk_create(transactions, batch_size=batch_size)
+    
     def get_transactions_by_item(self, item_id):
         """
         Get all transactions for a specific item.
@@ -8,6 +8,7 @@ class ItemRepository(BaseRepository):
     Repository class for Item data access operations.
     Abstracts all database operations related to Item model.
     """
+    list_select_related = ('category',)
     
     def __init__(self):
         super().__init__(Item)
@@ -20,10 +21,31 @@ class ItemRepository(BaseRepository):
         """Get a specific item by its ID"""
         return get_object_or_404(self.model, id=item_id)
     
+    def get_items_by_ids(self, item_ids):
+        """Get a dict of items keyed by ID for the given IDs in a single query"""
+        return self.model.objects.in_bulk(list(item_ids))
+    
+    def get_items_by_skus(self, skus):
+        """Get a dict of items keyed by SKU for the given SKUs"""
+        return self.model.objects.in_bulk(list(skus), field_name='sku')
+    
+    def get_planning_data(self, item_ids):
+        """Get the fields MRP reads (identity, type, unit and quantity) keyed by item ID in a single query"""
+        return {
+            row['id']: row
+            for row in self.model.objects.filter(id__in=list(item_ids)).order_by().values(
+                'id', 'name', 'sku', 'item_type', 'unit_of_measure', 'quantity'
+            )
+        }
+    
     def get_item_by_sku(self, sku):
         """Get a specific item by its SKU"""
         return get_object_or_404(self.model, sku=sku)
     
+    def get_items_in_category_tree(self, category):
+        """Get all items in a category and its descendants with one indexed path range lookup"""
+        return self.model.objects.filter(category.subtree_filter(prefix='category__'))
+    
     def get_items_by_category(self, category_id):
         """Get all items in a specific category"""
         return self.model.objects.filter(category_id=category_id)
@@ -36,6 +58,10 @@ class ItemRepository(BaseRepository):
         """Create a new item"""
         return self.model.objects.create(**item_data)
     
+    def bulk_save_items(self, items, fields, batch_size=None):
+        """Insert new items and write the given fields of existing ones in batches"""
+        return self.bulk_upsert(items, fields, batch_size=batch_size)
+    
     def update_item(self, item_id, item_data):
         """Update an existing item"""
         item = self.get_item_by_id(item_id)
@@ -46,12 +72,17 @@ class ItemRepository(BaseRepository):
         item.save()
         return item
     
-    def update_item_quantity(self, item_id, quantity):
-        """Update the quantity of an item"""
-        item = self.get_item_by_id(item_id)
-        item.quantity = quantity
-        item.save()
-        return item
+    def get_item_quantities(self, item_ids, for_update=False):
+        """
+        Get a dict of current quantities keyed by item ID in a single query.
+        
+        With for_update the rows are locked in primary key order until the
+        surrounding transaction ends.
+        """
+        queryset = self.model.objects.filter(id__in=list(item_ids))
+        if for_update:
+            queryset = queryset.select_for_update().order_by('id')
+        return dict(queryset.values_list('id', 'quantity'))
     
     def get_item_quantity(self, item_id):
         """Get the current quantity of an item"""
@@ -0,0 +1,162 @@
+import threading
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from apps.common.repositories.resource_version_repository import ResourceVersionRepository
+from apps.inventory.models.item import Item
+
+# Sales list statuses and price field of each price list
+PRICE_LISTS = {
+    'customer': {'statuses': ('CUSTOMER_LIST', 'BOTH_LISTS'), 'price_field': 'selling_price'},
+    'dealer': {'statuses': ('DEALER_LIST', 'BOTH_LISTS'), 'price_field': 'dealer_price'},
+}
+
+# Snapshot row layout
+PRICE_LIST_COLUMNS = ('item_id', 'sku', 'name', 'category', 'unit_of_measure', 'price')
+
+# Item fields copied into snapshots (or deciding whether an item is listed)
+PRICE_LIST_ITEM_FIELDS = frozenset({
+    'sales_list_status', 'selling_price', 'dealer_price', 'name', 'sku', 'unit_of_measure', 'category',
+    'deleted_at',
+})
+
+# Items waiting for a snapshot update when the current transaction commits
+_pending = threading.local()
+
+
+class PriceListRepository:
+    """
+    Versioned snapshots of the customer and dealer price lists.
+
+    A snapshot is the compact row list of the listed items, built in one
+    query and kept in the Django cache with the version it was built at.
+    The version is a ResourceVersion counter bumped after every committed
+    change of a listed item (or of an item entering a list). The process
+    that made the change patches the cached snapshot to the new version by
+    re-reading only the changed items; any other holder of an older
+    snapshot rebuilds it on its next read.
+    """
+    CACHE_KEY = 'inventory:price_list:{kind}'
+
+    @staticmethod
+    def version_key(kind):
+        return ResourceVersionRepository.key('inventory.PriceList', list=kind)
+
+    @classmethod
+    def get_version(cls, kind):
+        key = cls.version_key(kind)
+        return ResourceVersionRepository.get_versions([key]).get(key, (0, None))[0]
+
+    @classmethod
+    def get_snapshot(cls, kind):
+        """
+        Get the current snapshot of a price list, building it if needed
+
+        Returns:
+            dict with list, version, built_at, columns and rows
+        """
+        version = cls.get_version(kind)
+        snapshot = cache.get(cls.CACHE_KEY.format(kind=kind))
+        if snapshot is None or snapshot['version'] != version:
+            # The version is read before the rows, so the snapshot is never older than it claims
+            snapshot = cls.build(kind, version)
+            cache.set(cls.CACHE_KEY.format(kind=kind), snapshot, timeout=None)
+        return snapshot
+
+    @staticmethod
+    def _rows(queryset, price_field):
+        return queryset.order_by('name', 'sku').values_list(
+            'id', 'sku', 'name', 'category__name', 'unit_of_measure', price_field
+        )
+
+    @classmethod
+    def build(cls, kind, version):
+        """Build a snapshot of a price list in one query"""
+        spec = PRICE_LISTS[kind]
+        queryset = Item.objects.filter(sales_list_status__in=spec['statuses'], deleted_at__isnull=True)
+        return {
+            'list': kind,
+            'version': version,
+            'built_at': timezone.now(),
+            'columns': PRICE_LIST_COLUMNS,
+            'rows': [
+                (str(item_id), sku, name, category, unit, str(price))
+                for item_id, sku, name, category, unit, price in cls._rows(queryset, spec['price_field'])
+            ],
+        }
+
+    @classmethod
+    def mark_changed(cls, item_ids):
+        """Update the price lists for the given items when the current transaction commits"""
+        if not hasattr(_pending, 'item_ids'):
+            _pending.item_ids = set()
+        _pending.item_ids.update(str(item_id) for item_id in item_ids)
+        # Every write registers a callback; the first one to run handles all pending items
+        transaction.on_commit(cls._refresh_pending)
+
+    @classmethod
+    def _refresh_pending(cls):
+        item_ids = getattr(_pending, 'item_ids', None)
+        if item_ids:
+            _pending.item_ids = set()
+            cls.refresh_items(item_ids)
+
+    @classmethod
+    def refresh_items(cls, item_ids):
+        """
+        Bring the price lists up to date after the given items changed.
+
+        Lists the items are not and were not part of keep their version.
+        A cached snapshot exactly one version behind is patched with the
+        changed items (one query for all lists); otherwise it is dropped and
+        rebuilt on the next read.
+        """
+        item_ids = {str(item_id) for item_id in item_ids}
+        current = {
+            str(row[0]): row
+            for row in Item.objects.filter(id__in=item_ids).order_by().values_list(
+                'id', 'sku', 'name', 'category__name', 'unit_of_measure', 'selling_price', 'dealer_price',
+                'sales_list_status', 'deleted_at'
+            )
+        }
+        versions = ResourceVersionRepository.get_versions([cls.version_key(kind) for kind in PRICE_LISTS])
+        for kind, spec in PRICE_LISTS.items():
+            listed = {
+                item_id: row for item_id, row in current.items()
+                if row[7] in spec['statuses'] and row[8] is None
+            }
+            cache_key = cls.CACHE_KEY.format(kind=kind)
+            snapshot = cache.get(cache_key)
+            # Only a current snapshot tells whether an unlisted item was listed before
+            if (
+                not listed
+                and snapshot is not None
+                and snapshot['version'] == versions.get(cls.version_key(kind), (0, None))[0]
+                and not any(row[0] in item_ids for row in snapshot['rows'])
+            ):
+                continue
+
+            version = ResourceVersionRepository.increment(cls.version_key(kind))
+            if snapshot is None:
+                continue
+            if snapshot['version'] != version - 1:
+                cache.delete(cache_key)
+                continue
+
+            price = 5 if spec['price_field'] == 'selling_price' else 6
+            rows = [row for row in snapshot['rows'] if row[0] not in item_ids]
+            rows.extend(
+                (item_id, row[1], row[2], row[3], row[4], str(row[price])) for item_id, row in listed.items()
+            )
+            rows.sort(key=lambda row: (row[2], row[1]))
+            cache.set(cache_key, {**snapshot, 'version': version, 'built_at': timezone.now(), 'rows': rows},
+                      timeout=None)
+
+    @classmethod
+    def invalidate(cls):
+        """Bump every price list and drop the cached snapshots (e.g. after a category rename)"""
+        for kind in PRICE_LISTS:
+            ResourceVersionRepository.increment(cls.version_key(kind))
+        cache.delete_many([cls.CACHE_KEY.format(kind=kind) for kind in PRICE_LISTS])
@@ -1,5 +1,7 @@
 from django.shortcuts import get_object_or_404
 from django.db import transaction
+from django.db.models import IntegerField, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
 from apps.inventory.models import ProductionProcess, ProcessItemInput, ProcessItemOutput
 
 
@@ -8,10 +10,18 @@ class ProductionProcessRepository:
     Repository class for ProductionProcess data access operations.
     Abstracts all database operations related to ProductionProcess model.
     """
+    # Relations read by ProductionProcessListSerializer
+    list_select_related = ('project', 'target_output_item')
+    
+    def for_list(self, queryset=None):
+        """Join the relations the list serializer reads into a process queryset"""
+        if queryset is None:
+            queryset = ProductionProcess.objects.all()
+        return queryset.select_related(*self.list_select_related)
     
     def get_all_processes(self):
         """Get all production processes"""
-        return ProductionProcess.objects.all()
+        return self.for_list()
     
     def get_process_by_id(self, process_id):
         """Get a specific production process by ID"""
@@ -19,19 +29,43 @@ class ProductionProcessRepository:
     
     def get_processes_by_project(self, project_id):
         """Get all production processes for a specific project"""
-        return ProductionProcess.objects.filter(project_id=project_id)
+        return self.for_list(ProductionProcess.objects.filter(project_id=project_id))
     
     def get_processes_by_status(self, status):
         """Get all production processes with a specific status"""
-        return ProductionProcess.objects.filter(status=status)
+        return self.for_list(ProductionProcess.objects.filter(status=status))
     
     def get_processes_by_output_item(self, item_id):
         """Get all production processes for a specific target output item"""
-        return ProductionProcess.objects.filter(target_output_item_id=item_id)
+        return self.for_list(ProductionProcess.objects.filter(target_output_item_id=item_id))
     
     def get_processes_by_performer(self, user_id):
         """Get all production processes performed by a specific user"""
-        return ProductionProcess.objects.filter(performed_by_id=user_id)
+        return self.for_list(ProductionProcess.objects.filter(performed_by_id=user_id))
+    
+    def get_open_demand(self, statuses, project_id=None):
+        """
+        Get the output still to be produced by the processes in the given statuses.
+        
+        Returns:
+            list: (project ID, target item ID, target quantity, quantity produced so far) tuples
+        """
+        produced = (
+            ProcessItemOutput.objects
+            .filter(process=OuterRef('pk'), item=OuterRef('target_output_item'))
+            .order_by()
+            .values('process')
+            .annotate(total=Sum('quantity_produced'))
+            .values('total')
+        )
+        queryset = ProductionProcess.objects.filter(status__in=list(statuses))
+        if project_id:
+            queryset = queryset.filter(project_id=project_id)
+        return list(
+            queryset.order_by()
+            .annotate(produced=Coalesce(Subquery(produced, output_field=IntegerField()), 0))
+            .values_list('project_id', 'target_output_item_id', 'target_output_quantity', 'produced')
+        )
     
     @transaction.atomic
     def create_process(self, process_data):
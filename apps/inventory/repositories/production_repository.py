@@ -2,6 +2,7 @@ from django.db.models import Prefetch, Q
 from apps.inventory.models.production import Production
 from apps.inventory.models.production_item import ProductionItem
 from apps.inventory.models.production_history import ProductionHistory
+from apps.inventory.models.recipe import Recipe
 
 
 class ProductionRepository:
@@ -48,11 +49,33 @@ class ProductionRepository:
         except Production.DoesNotExist:
             return None
     
+    @staticmethod
+    def lock_production(production_id):
+        """
+        Get a production record with its recipe output item, locking the
+        production row until the current transaction ends
+
+        Only the production row is locked; the recipe and its output item are
+        read by a second, unlocked query (FOR UPDATE OF is not supported by
+        MySQL/MariaDB).
+        """
+        try:
+            production = Production.objects.select_for_update().get(id=production_id)
+        except Production.DoesNotExist:
+            return None
+        production.recipe = Recipe.objects.select_related('output_item').get(id=production.recipe_id)
+        return production
+    
     @staticmethod
     def create_production(production_data):
         """Create a new production record"""
         return Production.objects.create(**production_data)
     
+    @staticmethod
+    def bulk_create_productions(productions):
+        """Insert many unsaved Production instances with a single query"""
+        return Production.objects.bulk_create(productions)
+    
     @staticmethod
     def update_production(production, production_data):
         """Update an existing production record"""
@@ -71,6 +94,11 @@ class ProductionRepository:
         """Add a consumed item to a production record"""
         return ProductionItem.objects.create(**production_item_data)
     
+    @staticmethod
+    def bulk_add_production_items(production_items):
+        """Insert many unsaved ProductionItem instances with a single query"""
+        return ProductionItem.objects.bulk_create(production_items)
+    
     @staticmethod
     def update_production_item(production_item, production_item_data):
         """Update a production item"""
@@ -102,6 +130,11 @@ class ProductionRepository:
         """Add a history record for a production event"""
         return ProductionHistory.objects.create(**history_data)
     
+    @staticmethod
+    def bulk_add_production_history(history_records):
+        """Insert many unsaved ProductionHistory instances with a single query"""
+        return ProductionHistory.objects.bulk_create(history_records)
+    
     @staticmethod
     def get_production_history(production_id):
         """Get all history records for a specific production"""
@@ -22,6 +22,18 @@ class PurchaseHistoryRepository:
             notes=notes
         )
     
+    @staticmethod
+    def bulk_create(purchases, batch_size=None):
+        """
+        Insert unsaved purchase history records in batches.
+        
+        Unlike save(), this does not touch the items: callers are expected to
+        update purchase_price and last_purchase_date themselves.
+        """
+        for purchase in purchases:
+            purchase.total_price = purchase.quantity * purchase.unit_price
+        return PurchaseHistory.objects.bulk_create(purchases, batch_size=batch_size)
+    
     @staticmethod
     def get_by_id(purchase_id):
         """
@@ -1,6 +1,7 @@
 from django.db.models import Prefetch, Q
 from apps.inventory.models.recipe import Recipe
 from apps.inventory.models.recipe_item import RecipeItem
+from apps.common.repositories.resource_version_repository import ResourceVersionRepository
 
 
 class RecipeRepository:
@@ -41,6 +42,21 @@ class RecipeRepository:
         except Recipe.DoesNotExist:
             return None
     
+    @staticmethod
+    def get_recipes_by_ids(recipe_ids):
+        """Get a dict of recipes keyed by ID, with output item and recipe items preloaded"""
+        return Recipe.objects.select_related('output_item').prefetch_related(
+            Prefetch(
+                'items',
+                queryset=RecipeItem.objects.select_related('input_item').order_by('sequence')
+            )
+        ).in_bulk(list(recipe_ids))
+    
+    @staticmethod
+    def get_recipes_by_output_items(output_item_ids):
+        """Get all recipes producing any of the given items"""
+        return Recipe.objects.filter(output_item_id__in=list(output_item_ids)).order_by('created_at')
+    
     @staticmethod
     def create_recipe(recipe_data):
         """Create a new recipe"""
@@ -54,6 +70,18 @@ class RecipeRepository:
         recipe.save()
         return recipe
     
+    @staticmethod
+    def bulk_create_recipes(recipes, batch_size=None):
+        """Insert unsaved recipe instances in batches"""
+        ResourceVersionRepository.mark_changed(Recipe)
+        return Recipe.objects.bulk_create(recipes, batch_size=batch_size)
+    
+    @staticmethod
+    def bulk_update_recipes(recipes, fields, batch_size=None):
+        """Write the given fields of existing recipe instances in batches"""
+        ResourceVersionRepository.mark_changed(Recipe)
+        return Recipe.objects.bulk_update(recipes, fields, batch_size=batch_size)
+    
     @staticmethod
     def delete_recipe(recipe):
         """Delete a recipe"""
@@ -64,6 +92,17 @@ class RecipeRepository:
         """Add an item to a recipe"""
         return RecipeItem.objects.create(**recipe_item_data)
     
+    @staticmethod
+    def bulk_create_recipe_items(recipe_items, batch_size=None):
+        """Insert unsaved recipe item instances in batches"""
+        ResourceVersionRepository.mark_changed(RecipeItem)
+        return RecipeItem.objects.bulk_create(recipe_items, batch_size=batch_size)
+    
+    @staticmethod
+    def delete_items_for_recipes(recipe_ids):
+        """Delete all items of the given recipes in a single query"""
+        return RecipeItem.objects.filter(recipe_id__in=list(recipe_ids)).delete()
+    
     @staticmethod
     def update_recipe_item(recipe_item, recipe_item_data):
         """Update a recipe item"""
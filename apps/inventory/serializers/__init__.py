@@ -2,7 +2,8 @@ from apps.inventory.serializers.category_serializer import (
     CategorySerializer, CategoryListSerializer, CategoryDetailSerializer, CategoryHierarchySerializer
 )
 from apps.inventory.serializers.item_serializer import (
-    ItemSerializer, ItemListSerializer, ItemDetailSerializer, ItemCreateUpdateSerializer
+    ItemSerializer, ItemListSerializer, ItemDetailSerializer, ItemCreateUpdateSerializer,
+    LowStockItemSerializer
 )
 # BillOfMaterials serializers removed - use Recipe and Production serializers instead
 from apps.inventory.serializers.recipe_serializers import (
@@ -28,6 +29,7 @@ from .inventory_transaction_serializer import InventoryTransactionSerializer
 __all__ = [
     'CategorySerializer', 'CategoryListSerializer', 'CategoryDetailSerializer', 'CategoryHierarchySerializer',
     'ItemSerializer', 'ItemListSerializer', 'ItemDetailSerializer', 'ItemCreateUpdateSerializer',
+    'LowStockItemSerializer',
     'ProductionProcessSerializer', 'ProductionProcessListSerializer',
     'ProductionProcessDetailSerializer', 'ProcessItemInputSerializer',
     'ProcessItemInputDetailSerializer', 'ProcessItemOutputSerializer',
@@ -34,14 +34,23 @@ class CategoryDetailSerializer(serializers.ModelSerializer):
 
 
 class CategoryHierarchySerializer(serializers.ModelSerializer):
-    """Serializer for nested category hierarchies"""
+    """
+    Serializer for nested category hierarchies.
+    
+    Pass all categories of the tree as context['categories'] to resolve the
+    children in memory instead of with a query per node.
+    """
     children = serializers.SerializerMethodField()
     
     class Meta:
         model = Category
-        fields = ['id', 'name', 'description', 'children']
+        fields = ['id', 'name', 'description', 'full_path', 'children']
     
     def get_children(self, obj):
-        children = Category.objects.filter(parent_category=obj)
-        serializer = CategoryHierarchySerializer(children, many=True)
+        categories = self.context.get('categories')
+        if categories is not None:
+            children = [category for category in categories if category.parent_category_id == obj.id]
+        else:
+            children = Category.objects.filter(parent_category=obj)
+        serializer = CategoryHierarchySerializer(children, many=True, context=self.context)
         return serializer.data
@@ -14,12 +14,28 @@ class ExcelImportSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'import_type', 'import_type_display', 'file', 'status', 'status_display',
             'processed_count', 'failed_count', 'error_details', 'notes',
+            'total_rows', 'total_chunks', 'chunks_completed', 'progress', 'started_at', 'finished_at',
             'processed_by', 'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'processed_count', 'failed_count', 'error_details', 
+                           'total_rows', 'total_chunks', 'chunks_completed', 'progress',
+                           'started_at', 'finished_at',
                            'processed_by', 'created_at', 'updated_at', 'status']
 
 
+class ExcelImportProgressSerializer(serializers.ModelSerializer):
+    """Lightweight serializer for polling the progress of a queued import"""
+    status_display = serializers.CharField(source='get_status_display', read_only=True)
+    
+    class Meta:
+        model = ExcelImport
+        fields = [
+            'id', 'status', 'status_display', 'total_rows', 'total_chunks', 'chunks_completed',
+            'progress', 'processed_count', 'failed_count', 'started_at', 'finished_at', 'heartbeat_at'
+        ]
+        read_only_fields = fields
+
+
 class ExcelImportCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating Excel import records"""
     project_id = serializers.CharField(required=False, write_only=True)
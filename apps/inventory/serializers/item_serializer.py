@@ -21,6 +21,21 @@ class ItemListSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'sku', 'item_type', 'category_name', 'unit_of_measure', 'quantity']
 
 
+class LowStockItemSerializer(serializers.ModelSerializer):
+    """Serializer for items at or below their minimum stock level"""
+    category_name = serializers.CharField(source='category.name', read_only=True, allow_null=True)
+    is_critical = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = Item
+        fields = ['id', 'name', 'sku', 'item_type', 'category_name', 'unit_of_measure',
+                  'quantity', 'minimum_stock_level', 'is_critical']
+    
+    def get_is_critical(self, obj):
+        """An item is critical when it is out of stock"""
+        return obj.quantity <= 0
+
+
 class ItemDetailSerializer(serializers.ModelSerializer):
     """Serializer for detailed item information including category details"""
     category_name = serializers.CharField(source='category.name', read_only=True, allow_null=True)
@@ -140,3 +140,32 @@ class ProductionUpdateSerializer(serializers.ModelSerializer):
         )
         
         return instance
+
+
+class ProductionBatchItemSerializer(serializers.Serializer):
+    """Serializer for a consumed item inside a batch production run"""
+    input_item = serializers.UUIDField()
+    quantity_consumed = serializers.IntegerField(min_value=0)
+    unit_of_measure = serializers.CharField(max_length=50)
+
+
+class ProductionBatchRunSerializer(serializers.Serializer):
+    """
+    Serializer for a single run inside a batch.
+    Recipes and items are given by ID and resolved in bulk by the service.
+    """
+    recipe = serializers.UUIDField()
+    output_quantity = serializers.IntegerField(min_value=1)
+    notes = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+    consumed_items = ProductionBatchItemSerializer(many=True, required=False)
+
+
+class ProductionBatchCreateSerializer(serializers.Serializer):
+    """Serializer for creating many Production records in one request"""
+    MODE_CHOICES = (
+        ('all_or_nothing', _('All or nothing')),
+        ('best_effort', _('Best effort')),
+    )
+    
+    mode = serializers.ChoiceField(choices=MODE_CHOICES, default='all_or_nothing')
+    productions = ProductionBatchRunSerializer(many=True, allow_empty=False, max_length=500)
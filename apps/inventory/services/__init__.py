@@ -4,8 +4,10 @@ from apps.inventory.services.item_service import ItemService
 from apps.inventory.services.recipe_service import RecipeService
 from apps.inventory.services.production_service import ProductionService
 from apps.inventory.services.production_process_service import ProductionProcessService
+from apps.inventory.services.mrp_service import MRPService
 from apps.inventory.services.purchase_order_line_service import PurchaseOrderLineService
 from .inventory_transaction_service import InventoryTransactionService
+from .price_list_service import PriceListService
 
 __all__ = [
     'CategoryService',
@@ -13,6 +15,8 @@ __all__ = [
     'RecipeService',
     'ProductionService',
     'ProductionProcessService',
+    'MRPService',
     'PurchaseOrderLineService',
     'InventoryTransactionService',
+    'PriceListService',
 ]
\ No newline at end of file
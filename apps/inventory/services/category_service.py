@@ -1,14 +1,20 @@
+import uuid
+
 from apps.inventory.repositories.category_repository import CategoryRepository
+from apps.inventory.repositories.item_repository import ItemRepository
+from apps.inventory.utils.logger import LoggerMixin
 
 
-class CategoryService:
+class CategoryService(LoggerMixin):
     """
     Service class to handle business logic for Category operations.
     Uses CategoryRepository for data access.
     """
+    trace_methods = True
     
     def __init__(self):
         self.repository = CategoryRepository()
+        self.item_repository = ItemRepository()
     
     def get_all_categories(self):
         """Get all categories"""
@@ -23,24 +29,24 @@ class CategoryService:
         return self.repository.get_root_categories()
     
     def get_category_hierarchy(self, category_id=None):
-        """Get a hierarchical structure of categories"""
+        """Get a hierarchical structure of categories from the cached category tree"""
+        tree = self.repository.get_tree()
         # If category_id is None, start from root categories
         if category_id is None:
-            categories = self.repository.get_root_categories()
-        else:
-            categories = self.repository.get_subcategories(category_id)
-            
-        result = []
-        for category in categories:
-            subcategories = self.get_category_hierarchy(category.id)
-            result.append({
-                'id': category.id,
-                'name': category.name,
-                'description': category.description,
-                'children': subcategories
-            })
+            return tree
         
-        return result
+        pending = list(tree)
+        while pending:
+            node = pending.pop()
+            if str(node['id']) == str(category_id):
+                return node['children']
+            pending.extend(node['children'])
+        return []
+    
+    def get_category_items(self, category_id):
+        """Get all items in a category and its descendants"""
+        category = self.repository.get_category_by_id(category_id)
+        return self.item_repository.for_list(self.item_repository.get_items_in_category_tree(category))
     
     def create_category(self, category_data):
         """Create a new category"""
@@ -48,7 +54,7 @@ class CategoryService:
         parent_id = category_data.get('parent_category_id')
         if parent_id:
             parent = self.repository.get_category_by_id(parent_id)
-            if parent.parent_category is not None:
+            if parent.parent_category_id is not None:
                 raise ValueError('Categories can only be nested one level deep. This parent already has a parent.')
                 
         return self.repository.create_category(category_data)
@@ -59,42 +65,29 @@ class CategoryService:
         parent_id = category_data.get('parent_category_id')
         if parent_id:
             parent = self.repository.get_category_by_id(parent_id)
-            if parent.parent_category is not None:
+            if parent.parent_category_id is not None:
                 raise ValueError('Categories can only be nested one level deep. This parent already has a parent.')
             
             # Also check that we're not creating a cycle
-            current = parent
-            while current.parent_category is not None:
-                if str(current.parent_category.id) == str(category_id):
-                    raise ValueError('Cannot move a category to its own descendant')
-                current = current.parent_category
+            self._check_not_descendant(category_id, parent)
                 
         return self.repository.update_category(category_id, category_data)
     
     def delete_category(self, category_id):
-        """Delete a category"""
-        # Fetch the subcategories
-        subcategories = self.repository.get_subcategories(category_id)
-        
-        # Recursive deletion of subcategories
-        for subcategory in subcategories:
-            # First recursively delete any deeper subcategories
-            self.delete_category(subcategory.id)
-        
-        # Now it's safe to delete the category itself
-        return self.repository.delete_category(category_id)
+        """Delete a category and, with it, all of its subcategories"""
+        return self.repository.delete_category_tree(category_id)
     
     def move_category(self, category_id, new_parent_id=None):
         """Move a category to a new parent"""
         # Prevent circular references
         if new_parent_id is not None:
             parent = self.repository.get_category_by_id(new_parent_id)
-            current = parent
-            # Check if the new parent is not a descendant of the category
-            while current.parent_category is not None:
-                if str(current.parent_category.id) == str(category_id):
-                    raise ValueError('Cannot move a category to its own descendant')
-                current = current.parent_category
+            self._check_not_descendant(category_id, parent)
         
         update_data = {'parent_category_id': new_parent_id}
         return self.repository.update_category(category_id, update_data)
+    
+    def _check_not_descendant(self, category_id, parent):
+        """Raise if the parent is the category itself or one of its descendants"""
+        if f"{uuid.UUID(str(category_id)).hex}/" in parent.path:
+            raise ValueError('Cannot move a category to its own descendant')
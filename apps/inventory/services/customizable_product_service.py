@@ -1,12 +1,22 @@
+import math
+import uuid
+
 from django.db import transaction
 from apps.inventory.repositories.item_repository import ItemRepository
+from apps.inventory.repositories.inventory_repository import (
+    InventoryRepository, InsufficientStockError, StockMovement
+)
 from apps.inventory.repositories.recipe_repository import RecipeRepository  # Replaces BillOfMaterialsRepository
+from apps.inventory.repositories.bom_graph_repository import BOMGraphRepository
+from apps.inventory.utils.logger import LoggerMixin
 
 
-class CustomizableProductService:
+class CustomizableProductService(LoggerMixin):
     """
     Service class for managing customizable products and their recipe configurations
     """
+    trace_methods = True
+
     @staticmethod
     def get_product_bom(item_id):
         """
@@ -135,55 +145,58 @@ class CustomizableProductService:
         return customized_structure, None
     
     @staticmethod
-    def calculate_material_requirements(item_id, quantity=1, component_selections=None):
+    def calculate_material_requirements(item_id, quantity=1, component_selections=None, include_stock=False):
         """
         Calculate the raw material requirements for producing a specified quantity of a product
+        
+        The multi-level explosion is served from the process-wide BOM graph, so once
+        the graph is built this runs no query (the graph's version is re-read every
+        few seconds). Pass include_stock to attach the current available quantities,
+        which costs one query.
+        
+        component_selections lists the optional components to include, anywhere
+        in the product's recipe tree; only their component_id is read:
+        [
+            {
+                'component_id': optional_component_item_id
+            },
+            ...
+        ]
         """
-        # Get the customized BOM structure
-        if component_selections:
-            bom_structure, error = CustomizableProductService.customize_product(item_id, component_selections)
-        else:
-            bom_structure, error = CustomizableProductService.get_product_bom(item_id)
-            # Flatten to just get the default components
-            bom_structure = [item['component'] for item in bom_structure] if bom_structure else []
+        graph = BOMGraphRepository.get_graph()
+        node = graph.get_node(item_id)
+        if not node or not node.has_recipe:
+            return None, "Product has no active recipe"
+        
+        try:
+            selections = frozenset(
+                uuid.UUID(str(selection.get('component_id'))) for selection in component_selections or []
+            )
+        except (ValueError, TypeError, AttributeError):
+            return None, "Invalid component selection format"
         
-        if error:
-            return None, error
+        invalid_selections = selections - graph.optional_components(node.id)
+        if invalid_selections:
+            return None, f"Invalid component selection: Component {next(iter(invalid_selections))} is not an optional component of this product"
+        
+        try:
+            explosion = graph.explode(node.id, selections)
+        except ValueError as e:
+            return None, str(e)
         
-        # Calculate raw material requirements
         material_requirements = {}
+        for leaf, (unit_quantity, unit_of_measure) in explosion.items():
+            leaf_node = graph.nodes[leaf]
+            material_requirements[leaf_node.id] = {
+                'item': leaf_node,
+                'quantity': unit_quantity * quantity,
+                'unit_of_measure': unit_of_measure,
+            }
         
-        for entry in bom_structure:
-            input_item = entry.input_item
-            required_quantity = entry.quantity_required * quantity
-            
-            if input_item.is_raw_material:
-                # Raw material - add directly to requirements
-                if input_item.id in material_requirements:
-                    material_requirements[input_item.id]['quantity'] += required_quantity
-                else:
-                    material_requirements[input_item.id] = {
-                        'item': input_item,
-                        'quantity': required_quantity,
-                        'unit_of_measure': entry.unit_of_measure,
-                        'available_quantity': input_item.quantity,
-                    }
-            else:
-                # Intermediate product - recursively calculate its requirements
-                sub_requirements, error = CustomizableProductService.calculate_material_requirements(
-                    input_item.id, 
-                    quantity=required_quantity
-                )
-                
-                if error:
-                    return None, f"Error calculating requirements for {input_item.name}: {error}"
-                
-                # Merge with main requirements
-                for item_id, req in sub_requirements.items():
-                    if item_id in material_requirements:
-                        material_requirements[item_id]['quantity'] += req['quantity']
-                    else:
-                        material_requirements[item_id] = req
+        if include_stock:
+            available = ItemRepository().get_item_quantities(material_requirements.keys())
+            for material_id, req in material_requirements.items():
+                req['available_quantity'] = available.get(material_id, 0)
         
         return material_requirements, None
     
@@ -193,7 +206,7 @@ class CustomizableProductService:
         """
         Produce a product by consuming its required raw materials
         """
-        item = ItemRepository.get_by_id(item_id)
+        item = ItemRepository().filter(id=item_id).first()
         if not item:
             return None, "Product not found"
             
@@ -210,39 +223,25 @@ class CustomizableProductService:
         if error:
             return None, error
         
-        # Check if we have enough inventory
-        missing_materials = []
-        for item_id, req in material_requirements.items():
-            if req['available_quantity'] < req['quantity']:
-                missing_materials.append({
-                    'item': req['item'],
-                    'required': req['quantity'],
-                    'available': req['available_quantity'],
-                    'shortage': req['quantity'] - req['available_quantity'],
-                })
+        # Consume materials and increase product quantity in one batch;
+        # the database rejects the batch if any material would go negative
+        movements = [
+            StockMovement(req['item'].id, -math.ceil(req['quantity']), 'PRODUCTION_IN', f"Consumed in production of {item.name}")
+            for req in material_requirements.values()
+        ]
+        movements.append(StockMovement(item.id, quantity, 'PRODUCTION_OUT', f"Produced {item.name}"))
         
-        if missing_materials:
+        try:
+            InventoryRepository.apply_movements(movements)
+        except InsufficientStockError as e:
             return None, {
                 'error': "Insufficient raw materials",
-                'missing_materials': missing_materials
+                'missing_materials': [
+                    {**shortage, 'shortage': shortage['required'] - shortage['available']}
+                    for shortage in e.shortages
+                ]
             }
         
-        # Consume materials
-        for item_id, req in material_requirements.items():
-            raw_item = req['item']
-            consumed_quantity = req['quantity']
-            
-            ItemRepository.update(
-                item_id=raw_item.id,
-                quantity=raw_item.quantity - consumed_quantity
-            )
-        
-        # Increase product quantity
-        ItemRepository.update(
-            item_id=item.id,
-            quantity=item.quantity + quantity
-        )
-        
         # Return production details
         return {
             'product': item,
@@ -0,0 +1,798 @@
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from datetime import date, datetime
+from itertools import groupby
+from operator import itemgetter
+
+import pandas as pd
+from django.db import transaction
+from django.utils import timezone
+
+from apps.inventory.models import Category, InventoryTransaction, Item, Recipe, RecipeItem
+from apps.inventory.models.purchase_history import PurchaseHistory
+from apps.inventory.repositories.bom_graph_repository import BOMGraphRepository
+from apps.inventory.repositories.excel_import_repository import ImportClaimLost
+from apps.inventory.repositories.category_repository import CategoryRepository
+from apps.inventory.repositories.inventory_repository import InventoryRepository
+from apps.inventory.repositories.inventory_transaction_repository import InventoryTransactionRepository
+from apps.inventory.repositories.item_repository import ItemRepository
+from apps.inventory.repositories.price_list_repository import PRICE_LIST_ITEM_FIELDS, PriceListRepository
+from apps.inventory.repositories.purchase_history_repository import PurchaseHistoryRepository
+from apps.inventory.repositories.recipe_repository import RecipeRepository
+from apps.projects.models import ProjectInventory
+from apps.projects.repositories.project_inventory_repository import ProjectInventoryRepository
+from apps.common.repositories.search_repository import SearchIndexRepository
+from apps.common.utils.logger import logger
+
+
+def text_column(df, column):
+    """Stripped string values of a column, with missing and blank cells as None"""
+    result = pd.Series(None, index=df.index, dtype=object)
+    if column not in df.columns:
+        return result
+    present = df[column].notna()
+    values = df.loc[present, column].astype(str).str.strip()
+    values = values[values != '']
+    result[values.index] = values.astype(object)
+    return result
+
+
+def number_column(df, column, default=0):
+    """
+    Numeric values of a column.
+
+    Returns:
+        tuple: (values with missing cells set to default, mask of unparseable cells)
+    """
+    if column not in df.columns:
+        return pd.Series(default, index=df.index, dtype=float), pd.Series(False, index=df.index)
+    values = pd.to_numeric(df[column], errors='coerce')
+    invalid = df[column].notna() & values.isna()
+    if default is not None:
+        values = values.fillna(default)
+    return values, invalid
+
+
+def date_column(df, column, date_format='%Y-%m-%d'):
+    """
+    Date values of a column; Excel dates and text in the given format are accepted.
+
+    Returns:
+        tuple: (dates with missing cells as None, mask of unparseable cells)
+    """
+    result = pd.Series(None, index=df.index, dtype=object)
+    invalid = pd.Series(False, index=df.index)
+    if column not in df.columns:
+        return result, invalid
+    if pd.api.types.is_datetime64_any_dtype(df[column]):
+        present = df[column].notna()
+        result[present] = df.loc[present, column].dt.date.astype(object)
+        return result, invalid
+
+    # Parse each distinct value once
+    parsed = {}
+    for value in df[column].dropna().unique():
+        if isinstance(value, datetime):
+            parsed[value] = value.date()
+        elif isinstance(value, date):
+            parsed[value] = value
+        else:
+            try:
+                parsed[value] = datetime.strptime(str(value).strip(), date_format).date()
+            except ValueError:
+                parsed[value] = None
+
+    present = df[column].notna()
+    values = df.loc[present, column].map(parsed)
+    result[values.index] = values.astype(object)
+    invalid[present] = values.isna()
+    return result.where(~invalid, None), invalid
+
+
+def flag_errors(errors, mask, message):
+    """Record an error message for rows matching mask that have no error yet"""
+    errors[mask & errors.isna()] = message
+
+
+def records(df, columns):
+    """Iterate the given columns of a frame as plain Python tuples, with missing values as None"""
+    return zip(*(df[column].astype(object).where(df[column].notna(), None).tolist() for column in columns))
+
+
+class ImportResult:
+    """Running counters and error messages of an import"""
+
+    def __init__(self, processed_count=0, failed_count=0, errors=None):
+        self.processed_count = processed_count
+        self.failed_count = failed_count
+        self.errors = errors or []
+
+    @classmethod
+    def from_import(cls, excel_import):
+        """Counters saved by earlier, committed chunks of an import"""
+        errors = excel_import.error_details.split('\n') if excel_import.error_details else []
+        return cls(excel_import.processed_count, excel_import.failed_count, errors)
+
+    def fail(self, message):
+        self.failed_count += 1
+        self.errors.append(message)
+
+    def merge(self, other):
+        self.processed_count += other.processed_count
+        self.failed_count += other.failed_count
+        self.errors.extend(other.errors)
+
+    def merged(self, other):
+        result = ImportResult(self.processed_count, self.failed_count, list(self.errors))
+        result.merge(other)
+        return result
+
+    @property
+    def error_details(self):
+        return '\n'.join(self.errors) if self.errors else None
+
+
+class ExcelImportPipeline(ABC):
+    """
+    Base class for bulk-writing Excel import pipelines.
+
+    The sheet is read once and every column is normalized and validated with
+    vectorized pandas operations. Existing items (by SKU) and categories are
+    preloaded, and rows are then written in chunks with bulk_create /
+    bulk_upsert, so the number of queries grows with the number of chunks
+    rather than the number of rows. Each chunk is written in its own
+    transaction; rows failing validation are reported and skipped.
+
+    Chunking is deterministic for a given sheet, so an interrupted import
+    can be resumed by skipping the chunks it already committed.
+    """
+    import_type = None
+    required_columns = ()
+    batch_size = 500
+    # Whether imported stock is added to the project given with the import
+    uses_project = False
+    requires_project = False
+
+    def __init__(self, excel_import, project_id=None):
+        self.excel_import = excel_import
+        self.project_id = project_id
+        self.item_repository = ItemRepository()
+        self.inventory_transaction_repository = InventoryTransactionRepository()
+        self.project_inventory_repository = ProjectInventoryRepository()
+        self.items_by_sku = {}
+        self.categories = {}
+
+    def read(self):
+        """Read the uploaded sheet"""
+        return pd.read_excel(self.excel_import.file.path)
+
+    def validate_columns(self, df):
+        for column in self.required_columns:
+            if column not in df.columns:
+                raise ValueError(f"Required column '{column}' not found in Excel file")
+
+    def run(self, df=None, resume_from=0, result=None, on_start=None, checkpoint=None):
+        """
+        Run the import.
+
+        Args:
+            df (DataFrame, optional): Sheet contents; read from the import file if omitted
+            resume_from (int): Number of chunks already committed by an earlier run
+            result (ImportResult, optional): Counters of those chunks
+            on_start (callable, optional): Called with (total rows, total chunks) before writing
+            checkpoint (callable, optional): Called with (chunks completed, ImportResult)
+                inside each chunk's transaction
+
+        Returns:
+            ImportResult: Processed/failed counts and error messages
+        """
+        if df is None:
+            df = self.read()
+        self.validate_columns(df)
+
+        rows = self.normalize(df)
+        chunks = list(self.chunks(rows))
+        if on_start:
+            on_start(len(rows), len(chunks))
+
+        self.preload(rows)
+
+        result = result or ImportResult()
+        for number, chunk in enumerate(chunks[resume_from:], resume_from + 1):
+            self.process_chunk(chunk, result, number, checkpoint)
+        return result
+
+    @abstractmethod
+    def normalize(self, df):
+        """Build a frame of typed values with 'row' (Excel row number) and 'error' columns"""
+
+    def preload(self, rows):
+        """Load everything the chunks are matched against"""
+        valid = rows[rows['error'].isna()]
+        self.items_by_sku = self.item_repository.get_items_by_skus(self.get_skus(valid))
+
+    def get_skus(self, rows):
+        return rows['sku'].unique()
+
+    def chunks(self, rows):
+        for start in range(0, len(rows), self.batch_size):
+            yield rows.iloc[start:start + self.batch_size]
+
+    def process_chunk(self, chunk, result, number=None, checkpoint=None):
+        rejected = ImportResult()
+        invalid = chunk['error'].notna()
+        for row, error in records(chunk[invalid], ['row', 'error']):
+            rejected.fail(f"Row {row}: {error}")
+
+        valid = chunk[~invalid]
+        try:
+            with transaction.atomic():
+                written = ImportResult()
+                if not valid.empty:
+                    self.write(valid, written)
+                chunk_result = rejected.merged(written)
+                if checkpoint:
+                    checkpoint(number, result.merged(chunk_result))
+        except ImportClaimLost:
+            # Another worker took the import over; stop without recording this chunk
+            raise
+        except Exception as e:
+            logger.error("Excel import %s chunk %s failed: %s", self.excel_import.id, number, e)
+            chunk_result = rejected.merged(ImportResult(
+                failed_count=len(valid),
+                errors=[f"Rows {valid['row'].min()}-{valid['row'].max()}: {str(e)}"]
+            ))
+            if checkpoint:
+                with transaction.atomic():
+                    checkpoint(number, result.merged(chunk_result))
+
+            # The chunk was rolled back; reload its items so later chunks match the database
+            skus = self.get_skus(valid)
+            for sku in skus:
+                self.items_by_sku.pop(sku, None)
+            self.items_by_sku.update(self.item_repository.get_items_by_skus(skus))
+
+        result.merge(chunk_result)
+
+    @abstractmethod
+    def write(self, rows, result):
+        """Write one chunk of valid rows"""
+
+    def resolve_categories(self, paths):
+        """
+        Map category paths ("Parent > Child") to categories, creating missing ones.
+
+        Like ExcelImportService.get_or_create_category_hierarchy, paths are
+        limited to two levels; deeper levels are combined into the child name.
+        """
+        levels = {}
+        for path in paths:
+            parts = [part.strip() for part in path.split('>')]
+            if len(parts) > 2:
+                parts = [parts[0], ' > '.join(parts[1:])]
+            levels[path] = [part for part in parts if part]
+        if not levels:
+            return {}
+
+        category_repository = CategoryRepository()
+        known = category_repository.get_category_map()
+
+        # Top-level categories first, then children under them
+        for depth in (0, 1):
+            missing = {}
+            for parts in levels.values():
+                if len(parts) <= depth:
+                    continue
+                parent = known[(None, parts[0])] if depth else None
+                key = (parent.id if parent else None, parts[depth])
+                if key not in known and key not in missing:
+                    missing[key] = Category(name=parts[depth], parent_category=parent)
+            if missing:
+                category_repository.bulk_create_categories(list(missing.values()))
+                known.update(missing)
+
+        categories = {}
+        for path, parts in levels.items():
+            category = None
+            for part in parts:
+                category = known[(category.id if category else None, part)]
+            categories[path] = category
+        return categories
+
+    def save_items(self, created, updated, fields):
+        """
+        Insert new items and write the given fields of changed ones.
+
+        Args:
+            created (dict): SKU -> unsaved Item
+            updated (dict): SKU -> existing Item
+            fields (list): Fields changed on existing items
+        """
+        items = list(created.values()) + list(updated.values())
+        if not items:
+            return
+        self.item_repository.bulk_save_items(items, list(fields) + ['updated_at'], batch_size=self.batch_size)
+
+        # Bulk writes send no signals, so drop the BOM graph here if it holds any of the items
+        if updated and (
+            not BOMGraphRepository.is_loaded()
+            or any(BOMGraphRepository.contains(item.id) for item in updated.values())
+        ):
+            BOMGraphRepository.invalidate()
+
+        InventoryRepository.refresh_low_stock_flags([item.id for item in items])
+        priced = list(created.values())
+        if PRICE_LIST_ITEM_FIELDS & set(fields):
+            priced += list(updated.values())
+        if priced:
+            PriceListRepository.mark_changed([item.id for item in priced])
+        # New items are indexed from memory; changed ones are re-read with whatever follows them
+        search_index = SearchIndexRepository()
+        if created:
+            search_index.add_for('inventory.Item', created.values())
+        if updated and SearchIndexRepository.affects_index('inventory.Item', fields):
+            search_index.refresh_for('inventory.Item', [item.id for item in updated.values()])
+
+    def record_adjustments(self, adjustments, notes):
+        """
+        Record stock changes made by the import.
+
+        Args:
+            adjustments (list): (item, quantity change, description) tuples
+            notes (str): Notes prefix for the transactions
+        """
+        transactions = [
+            InventoryTransaction(
+                item=item,
+                transaction_type='ADJUSTMENT',
+                quantity=change,
+                reference_model='ExcelImport',
+                notes=f"{notes} {description}. Import ID: {self.excel_import.id}"
+            )
+            for item, change, description in adjustments
+            if change
+        ]
+        if transactions:
+            self.inventory_transaction_repository.bulk_create_transactions(transactions, batch_size=self.batch_size)
+
+    def add_to_project_inventory(self, quantities):
+        """
+        Add imported quantities to the project inventory.
+
+        Args:
+            quantities (dict): Item ID -> quantity to add
+        """
+        if not self.project_id or not quantities:
+            return
+
+        existing = self.project_inventory_repository.get_inventory_by_items(self.project_id, quantities.keys())
+        entries = []
+        for item_id, quantity in quantities.items():
+            entry = existing.get(item_id)
+            if entry:
+                entry.quantity += quantity
+            else:
+                entry = ProjectInventory(
+                    project_id=self.project_id,
+                    item_id=item_id,
+                    quantity=quantity,
+                    minimum_stock_level=1
+                )
+            entries.append(entry)
+        self.project_inventory_repository.bulk_save_inventory(entries, batch_size=self.batch_size)
+
+
+class RawMaterialsImportPipeline(ExcelImportPipeline):
+    """Raw materials with optional purchase history"""
+    import_type = 'RAW_MATERIALS'
+    required_columns = ('sku', 'name', 'unit_of_measure')
+    item_fields = ['name', 'description', 'category', 'unit_of_measure', 'purchase_price', 'last_purchase_date']
+
+    def normalize(self, df):
+        rows = pd.DataFrame({
+            'row': df.index + 2,
+            'sku': text_column(df, 'sku'),
+            'name': text_column(df, 'name'),
+            'unit_of_measure': text_column(df, 'unit_of_measure'),
+            'description': text_column(df, 'description'),
+            'category': text_column(df, 'category'),
+            'supplier': text_column(df, 'supplier'),
+            'invoice_reference': text_column(df, 'invoice_reference'),
+        }, index=df.index)
+        quantity, invalid_quantity = number_column(df, 'quantity')
+        purchase_price, invalid_price = number_column(df, 'purchase_price')
+        purchase_date, invalid_date = date_column(df, 'purchase_date')
+        rows['quantity'] = quantity.astype('int64')
+        rows['purchase_price'] = purchase_price.round(2)
+        rows['purchase_date'] = purchase_date
+
+        errors = pd.Series(None, index=df.index, dtype=object)
+        flag_errors(errors, rows['sku'].isna(), "SKU is required")
+        flag_errors(errors, rows['name'].isna(), "Name is required")
+        flag_errors(errors, rows['unit_of_measure'].isna(), "Unit of measure is required")
+        flag_errors(errors, rows['sku'].str.len() > 100, "SKU is longer than 100 characters")
+        flag_errors(errors, invalid_quantity, "Invalid quantity")
+        flag_errors(errors, invalid_price, "Invalid purchase price")
+        flag_errors(errors, invalid_date, "Invalid purchase date, expected YYYY-MM-DD")
+        rows['error'] = errors
+        return rows
+
+    def preload(self, rows):
+        super().preload(rows)
+        valid = rows[rows['error'].isna()]
+        self.categories = self.resolve_categories(valid['category'].dropna().unique())
+
+    def write(self, rows, result):
+        created = {}
+        updated = {}
+        purchases = []
+        columns = ['sku', 'name', 'description', 'category', 'unit_of_measure', 'quantity',
+                   'purchase_price', 'purchase_date', 'supplier', 'invoice_reference']
+        for (sku, name, description, category_path, unit_of_measure, quantity,
+             purchase_price, purchase_date, supplier, invoice_reference) in records(rows, columns):
+            category = self.categories.get(category_path) if category_path else None
+            item = created.get(sku) or self.items_by_sku.get(sku)
+            if item is None:
+                item = created[sku] = Item(
+                    name=name,
+                    sku=sku,
+                    description=description,
+                    item_type='RAW',
+                    category=category,
+                    unit_of_measure=unit_of_measure,
+                    quantity=quantity,
+                    purchase_price=purchase_price,
+                    sales_list_status='NOT_LISTED'
+                )
+            else:
+                item.name = name
+                item.description = description
+                item.category = category
+                item.unit_of_measure = unit_of_measure
+                item.purchase_price = purchase_price
+                if sku not in created:
+                    updated[sku] = item
+
+            if purchase_date and purchase_price > 0:
+                purchases.append(PurchaseHistory(
+                    item=item,
+                    purchase_date=purchase_date,
+                    quantity=quantity,
+                    unit_price=purchase_price,
+                    supplier=supplier,
+                    invoice_reference=invoice_reference
+                ))
+                item.last_purchase_date = purchase_date
+
+        self.save_items(created, updated, self.item_fields)
+        self.items_by_sku.update(created)
+        PurchaseHistoryRepository.bulk_create(purchases, batch_size=self.batch_size)
+        result.processed_count += len(rows)
+
+
+class ProductsImportPipeline(ExcelImportPipeline):
+    """Final products, optionally added to a project inventory"""
+    import_type = 'PRODUCTS'
+    required_columns = ('Name', 'Unit')
+    uses_project = True
+    item_fields = ['name', 'description', 'item_type', 'unit_of_measure', 'quantity', 'selling_price',
+                   'purchase_price', 'minimum_stock_level', 'category']
+
+    def normalize(self, df):
+        rows = pd.DataFrame({
+            'row': df.index + 2,
+            'name': text_column(df, 'Name'),
+            'unit_of_measure': text_column(df, 'Unit'),
+            'description': text_column(df, 'Description'),
+            'category': text_column(df, 'Category'),
+            'sku': text_column(df, 'SKU'),
+        }, index=df.index)
+        quantity, invalid_quantity = number_column(df, 'Qty')
+        selling_price, invalid_price = number_column(df, 'Price')
+        purchase_price, invalid_cost = number_column(df, 'Cost')
+        rows['quantity'] = quantity.astype('int64')
+        rows['selling_price'] = selling_price.round(2)
+        rows['purchase_price'] = purchase_price.round(2)
+
+        # Generate missing SKUs from the name and row position (FP-<first three letters><row>)
+        missing_sku = rows['sku'].isna() & rows['name'].notna()
+        generated = (
+            'FP-' + rows.loc[missing_sku, 'name'].str.slice(0, 3).str.upper()
+            + pd.Series(df.index + 1, index=df.index)[missing_sku].astype(str).str.zfill(3)
+        )
+        rows.loc[missing_sku, 'sku'] = generated.astype(object)
+
+        errors = pd.Series(None, index=df.index, dtype=object)
+        flag_errors(errors, rows['name'].isna(), "Name is required")
+        flag_errors(errors, rows['unit_of_measure'].isna(), "Unit is required")
+        flag_errors(errors, rows['sku'].str.len() > 100, "SKU is longer than 100 characters")
+        flag_errors(errors, invalid_quantity, "Invalid quantity")
+        flag_errors(errors, invalid_price, "Invalid price")
+        flag_errors(errors, invalid_cost, "Invalid cost")
+        rows['error'] = errors
+        return rows
+
+    def preload(self, rows):
+        super().preload(rows)
+        valid = rows[rows['error'].isna()]
+        self.categories = self.resolve_categories(valid['category'].dropna().unique())
+
+    def write(self, rows, result):
+        created = {}
+        updated = {}
+        adjustments = []
+        project_quantities = defaultdict(int)
+        columns = ['sku', 'name', 'description', 'category', 'unit_of_measure', 'quantity',
+                   'selling_price', 'purchase_price']
+        for (sku, name, description, category_path, unit_of_measure, quantity,
+             selling_price, purchase_price) in records(rows, columns):
+            category = self.categories.get(category_path) if category_path else None
+            item = created.get(sku) or self.items_by_sku.get(sku)
+            if item is None:
+                item = created[sku] = Item(sku=sku, item_type='FINAL', category=category)
+                change = quantity
+            else:
+                change = quantity - item.quantity
+                if category:
+                    item.category = category
+                if sku not in created:
+                    updated[sku] = item
+
+            item.name = name
+            item.description = description
+            item.item_type = 'FINAL'
+            item.unit_of_measure = unit_of_measure
+            item.quantity = quantity
+            item.selling_price = selling_price
+            item.purchase_price = purchase_price
+            item.minimum_stock_level = 1
+            adjustments.append((item, change, name))
+            project_quantities[item.id] += quantity
+
+        self.save_items(created, updated, self.item_fields)
+        self.items_by_sku.update(created)
+        self.record_adjustments(adjustments, "Stock from Excel import for")
+        self.add_to_project_inventory(project_quantities)
+        result.processed_count += len(rows)
+
+
+class ElectronicComponentsImportPipeline(ExcelImportPipeline):
+    """PCB component lists (Reference/Qty/Value/MPN/Footprint), added to a project inventory"""
+    import_type = 'ELECTRONIC_COMPONENTS'
+    required_columns = ('Reference', 'Qty', 'Value', 'MPN', 'Footprint')
+    uses_project = True
+    requires_project = True
+    category_path = 'Elektronik Komponentler'
+    item_fields = ['name', 'description', 'reference', 'unit_of_measure', 'category', 'quantity']
+
+    def normalize(self, df):
+        rows = pd.DataFrame({
+            'row': df.index + 2,
+            'reference': text_column(df, 'Reference'),
+            'name': text_column(df, 'Value'),
+            'mpn': text_column(df, 'MPN'),
+            'footprint': text_column(df, 'Footprint'),
+        }, index=df.index)
+        quantity, invalid_quantity = number_column(df, 'Qty', default=None)
+
+        # Use Value as SKU - normalized for database use
+        value_normalized = (
+            rows['name'].str.replace(' ', '-', regex=False)
+            .str.replace('/', '-', regex=False)
+            .str.replace('.', '_', regex=False)
+            .str.slice(0, 20)
+        )
+        rows['sku'] = ('COMP-' + value_normalized).astype(object)
+        rows['description'] = (
+            'MPN: ' + rows['mpn'].fillna('').astype(str)
+            + '\nFootprint: ' + rows['footprint'].fillna('').astype(str)
+        ).astype(object)
+
+        errors = pd.Series(None, index=df.index, dtype=object)
+        flag_errors(errors, rows['name'].isna(), "Value is required")
+        flag_errors(errors, invalid_quantity | quantity.isna(), "Invalid quantity")
+        flag_errors(errors, rows['name'].str.len() > 255, "Value is longer than 255 characters")
+        flag_errors(errors, rows['reference'].str.len() > 255, "Reference is longer than 255 characters")
+        rows['quantity'] = quantity.fillna(0).astype('int64')
+        rows['error'] = errors
+        return rows
+
+    def preload(self, rows):
+        super().preload(rows)
+        self.categories = self.resolve_categories([self.category_path])
+
+    def write(self, rows, result):
+        category = self.categories[self.category_path]
+        created = {}
+        updated = {}
+        adjustments = []
+        project_quantities = defaultdict(int)
+        columns = ['sku', 'name', 'description', 'reference', 'mpn', 'quantity']
+        for sku, name, description, reference, mpn, quantity in records(rows, columns):
+            item = created.get(sku) or self.items_by_sku.get(sku)
+            if item is None:
+                item = created[sku] = Item(sku=sku, item_type='RAW')
+                change = quantity
+            else:
+                change = quantity - item.quantity
+                if sku not in created:
+                    updated[sku] = item
+
+            item.name = name
+            item.description = description
+            item.reference = reference
+            item.unit_of_measure = 'pcs'
+            item.category = category
+            item.quantity = quantity
+            adjustments.append((item, change, f"{name} ({mpn})"))
+            project_quantities[item.id] += quantity
+
+        self.save_items(created, updated, self.item_fields)
+        self.items_by_sku.update(created)
+        self.record_adjustments(adjustments, "Excel import adjustment for")
+        self.add_to_project_inventory(project_quantities)
+        result.processed_count += len(rows)
+
+
+class BOMImportPipeline(ExcelImportPipeline):
+    """
+    Manufacturing recipes, one per output SKU.
+
+    Chunks always hold whole recipes. processed_count counts recipes;
+    failed_count counts failed recipes and rejected recipe lines.
+    """
+    import_type = 'BOM'
+    required_columns = ('output_sku', 'input_sku', 'quantity_required', 'unit_of_measure')
+
+    def __init__(self, excel_import, project_id=None):
+        super().__init__(excel_import, project_id)
+        self.recipes = {}
+        self.recipes_written = False
+
+    def normalize(self, df):
+        rows = pd.DataFrame({
+            'row': df.index + 2,
+            'output_sku': text_column(df, 'output_sku'),
+            'input_sku': text_column(df, 'input_sku'),
+            'unit_of_measure': text_column(df, 'unit_of_measure'),
+            'recipe_name': text_column(df, 'recipe_name'),
+        }, index=df.index)
+        quantity_required, invalid_quantity = number_column(df, 'quantity_required', default=None)
+        output_quantity, invalid_output_quantity = number_column(df, 'output_quantity', default=1)
+        sequence, invalid_sequence = number_column(df, 'sequence', default=10)
+        rows['quantity_required'] = quantity_required.fillna(0).astype('int64')
+        rows['output_quantity'] = output_quantity.astype('int64')
+        rows['sequence'] = sequence.astype('int64')
+        rows['is_optional'] = text_column(df, 'is_optional').str.upper().eq('Y')
+
+        errors = pd.Series(None, index=df.index, dtype=object)
+        flag_errors(errors, rows['output_sku'].isna(), "Output SKU is required")
+        flag_errors(errors, rows['input_sku'].isna(), "Input SKU is required")
+        flag_errors(errors, rows['unit_of_measure'].isna(), "Unit of measure is required")
+        flag_errors(errors, invalid_quantity | quantity_required.isna(), "Invalid quantity required")
+        flag_errors(errors, invalid_output_quantity, "Invalid output quantity")
+        flag_errors(errors, invalid_sequence, "Invalid sequence")
+        rows['error'] = errors
+        return rows
+
+    def get_skus(self, rows):
+        return pd.concat([rows['output_sku'], rows['input_sku']]).unique()
+
+    def preload(self, rows):
+        super().preload(rows)
+        output_skus = set(rows['output_sku'].dropna())
+        output_ids = [item.id for sku, item in self.items_by_sku.items() if sku in output_skus]
+        for recipe in RecipeRepository.get_recipes_by_output_items(output_ids):
+            self.recipes.setdefault((recipe.name, recipe.output_item_id), recipe)
+
+    def chunks(self, rows):
+        chunk = []
+        size = 0
+        for _, group in rows.groupby('output_sku', sort=False, dropna=False):
+            chunk.append(group)
+            size += len(group)
+            if size >= self.batch_size:
+                yield pd.concat(chunk)
+                chunk, size = [], 0
+        if chunk:
+            yield pd.concat(chunk)
+
+    def run(self, df=None, **kwargs):
+        try:
+            return super().run(df, **kwargs)
+        finally:
+            # Recipe lines are bulk written without signals
+            if self.recipes_written:
+                BOMGraphRepository.invalidate()
+
+    def write(self, rows, result):
+        new_recipes = []
+        changed_recipes = []
+        recipe_items = []
+        processed = 0
+        errors = []
+        columns = ['output_sku', 'recipe_name', 'output_quantity', 'unit_of_measure', 'input_sku',
+                   'quantity_required', 'sequence', 'is_optional']
+
+        # Chunks hold whole recipes, so the rows of each output SKU are adjacent
+        for output_sku, lines in groupby(records(rows, columns), key=itemgetter(0)):
+            output_item = self.items_by_sku.get(output_sku)
+            if output_item is None:
+                errors.append(f"Recipe for output '{output_sku}': Output item with SKU '{output_sku}' not found")
+                continue
+
+            # Recipe attributes come from the first row
+            lines = list(lines)
+            recipe_name, output_quantity, unit_of_measure = lines[0][1:4]
+            recipe_name = recipe_name or f"Recipe for {output_item.name}"
+
+            recipe = self.recipes.get((recipe_name, output_item.id))
+            if recipe:
+                recipe.output_quantity = output_quantity
+                recipe.unit_of_measure = unit_of_measure
+                changed_recipes.append(recipe)
+            else:
+                recipe = Recipe(
+                    name=recipe_name,
+                    description=f"Manufacturing recipe for {output_item.name}",
+                    output_item=output_item,
+                    output_quantity=output_quantity,
+                    unit_of_measure=unit_of_measure
+                )
+                new_recipes.append(recipe)
+
+            seen = set()
+            for _, _, _, line_unit, input_sku, quantity_required, sequence, is_optional in lines:
+                input_item = self.items_by_sku.get(input_sku)
+                if input_item is None:
+                    errors.append(f"Row for '{input_sku}' in recipe '{recipe_name}': Input item with SKU '{input_sku}' not found")
+                    continue
+                if input_item.id in seen:
+                    errors.append(f"Row for '{input_sku}' in recipe '{recipe_name}': Duplicate input item")
+                    continue
+                seen.add(input_item.id)
+                recipe_items.append(RecipeItem(
+                    recipe=recipe,
+                    input_item=input_item,
+                    quantity_required=quantity_required,
+                    unit_of_measure=line_unit,
+                    sequence=sequence,
+                    is_optional=is_optional
+                ))
+            processed += 1
+
+        if changed_recipes:
+            now = timezone.now()
+            for recipe in changed_recipes:
+                recipe.updated_at = now
+            RecipeRepository.bulk_update_recipes(
+                changed_recipes, ['output_quantity', 'unit_of_measure', 'updated_at'], batch_size=self.batch_size
+            )
+            # Existing recipe lines are replaced by the imported ones
+            RecipeRepository.delete_items_for_recipes([recipe.id for recipe in changed_recipes])
+        if new_recipes:
+            RecipeRepository.bulk_create_recipes(new_recipes, batch_size=self.batch_size)
+        if recipe_items:
+            RecipeRepository.bulk_create_recipe_items(recipe_items, batch_size=self.batch_size)
+
+        self.recipes.update({(recipe.name, recipe.output_item_id): recipe for recipe in new_recipes})
+        self.recipes_written = True
+        result.processed_count += processed
+        for error in errors:
+            result.fail(error)
+
+
+PIPELINES = {
+    pipeline.import_type: pipeline
+    for pipeline in (
+        RawMaterialsImportPipeline,
+        ProductsImportPipeline,
+        ElectronicComponentsImportPipeline,
+        BOMImportPipeline,
+    )
+}
+
+
+def get_pipeline(excel_import, project_id=None):
+    """Get the import pipeline for an Excel import record"""
+    return PIPELINES[excel_import.import_type](excel_import, project_id)
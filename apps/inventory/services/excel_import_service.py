@@ -1,26 +1,61 @@
-import pandas as pd
-from datetime import datetime
-from django.db import transaction
-from apps.inventory.repositories.excel_import_repository import ExcelImportRepository
-from apps.inventory.repositories.item_repository import ItemRepository
-from apps.inventory.repositories.category_repository import CategoryRepository
-from apps.inventory.repositories.purchase_history_repository import PurchaseHistoryRepository
-from apps.inventory.repositories.recipe_repository import RecipeRepository  # Replaces BillOfMaterialsRepository
-from apps.inventory.repositories.inventory_transaction_repository import InventoryTransactionRepository
+import threading
+
+from django.db import connection
+
+from apps.inventory.repositories.excel_import_repository import ExcelImportRepository, ImportClaimLost
 from apps.inventory.models import Category
-from apps.inventory.models.excel_import import ExcelImport
-from apps.projects.repositories.project_inventory_repository import ProjectInventoryRepository
+from apps.inventory.services.excel_import_pipeline import PIPELINES, ImportResult, get_pipeline
 from apps.projects.repositories.project_repository import ProjectRepository
-from apps.projects.services.project_inventory_service import ProjectInventoryService
 from apps.common.utils.logger import logger
-import traceback
-import uuid
+from apps.inventory.utils.logger import LoggerMixin
+
+# Seconds between heartbeats of a running import; the worker's --stale-after
+# must stay well above it
+HEARTBEAT_INTERVAL = 30
+
+
+class ImportHeartbeat:
+    """
+    Keeps the heartbeat of an import fresh from a background thread while its
+    chunks are written, so a chunk that takes longer than the stale timeout
+    does not get the import reclaimed by another worker.
+    """
+
+    def __init__(self, import_id, worker_id, interval=HEARTBEAT_INTERVAL):
+        self.import_id = import_id
+        self.worker_id = worker_id
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, name=f'excel-import-heartbeat-{import_id}', daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stopped.set()
+        self.thread.join()
+
+    def run(self):
+        try:
+            while not self.stopped.wait(self.interval):
+                try:
+                    if not ExcelImportRepository.heartbeat(self.import_id, self.worker_id):
+                        # Reclaimed; the next checkpoint rolls the running chunk back
+                        return
+                except Exception as e:
+                    logger.warning("Excel import %s heartbeat failed: %s", self.import_id, e)
+        finally:
+            # The thread has its own database connection
+            connection.close()
 
 
-class ExcelImportService:
+class ExcelImportService(LoggerMixin):
     """
     Service class for managing Excel imports for inventory
     """
+    trace_methods = True
+
     @staticmethod
     def create_import(import_type, file, notes=None, processed_by=None, project_id=None):
         """
@@ -44,7 +79,7 @@ class ExcelImportService:
                 if not project.is_active:
                     return None, "Selected project is not active"
             except Exception as e:
-                logger.error(f"Project validation error in create_import: {str(e)}")
+                logger.error("Project validation error in create_import: %s", e)
                 return None, "Selected project does not exist"
         
         # Prepare full notes with project_id if provided
@@ -101,122 +136,7 @@ class ExcelImportService:
         - supplier: Supplier name
         - invoice_reference: Invoice reference
         """
-        excel_import = ExcelImportRepository.get_by_id(import_id)
-        if not excel_import:
-            return False, "Import record not found"
-            
-        if excel_import.import_type != 'RAW_MATERIALS':
-            return False, "Import type is not RAW_MATERIALS"
-            
-        if excel_import.status != 'PENDING':
-            return False, "Import already processed"
-        
-        try:
-            # Update status to processing
-            ExcelImportRepository.update_status(
-                import_id=import_id,
-                status='PROCESSING'
-            )
-            
-            # Read Excel file
-            df = pd.read_excel(excel_import.file.path)
-            
-            required_cols = ['sku', 'name', 'unit_of_measure']
-            for col in required_cols:
-                if col not in df.columns:
-                    raise ValueError(f"Required column '{col}' not found in Excel file")
-            
-            processed_count = 0
-            failed_count = 0
-            error_details = []
-            
-            # Process each row
-            with transaction.atomic():
-                for index, row in df.iterrows():
-                    try:
-                        sku = str(row['sku']).strip()
-                        name = str(row['name']).strip()
-                        unit_of_measure = str(row['unit_of_measure']).strip()
-                        
-                        # Optional fields
-                        description = str(row.get('description', '')).strip() if pd.notna(row.get('description', '')) else None
-                        category_name = str(row.get('category', '')).strip() if pd.notna(row.get('category', '')) else None
-                        quantity = int(row.get('quantity', 0)) if pd.notna(row.get('quantity', 0)) else 0
-                        purchase_price = float(row.get('purchase_price', 0)) if pd.notna(row.get('purchase_price', 0)) else 0
-                        purchase_date_str = str(row.get('purchase_date', '')).strip() if pd.notna(row.get('purchase_date', '')) else None
-                        supplier = str(row.get('supplier', '')).strip() if pd.notna(row.get('supplier', '')) else None
-                        invoice_reference = str(row.get('invoice_reference', '')).strip() if pd.notna(row.get('invoice_reference', '')) else None
-                        
-                        # Get or create category
-                        category = None
-                        if category_name:
-                            category = CategoryRepository.get_by_name(category_name)
-                            if not category:
-                                category = CategoryRepository.create(name=category_name)
-                        
-                        # Check if item already exists
-                        item = ItemRepository.get_by_sku(sku)
-                        
-                        if item:
-                            # Update existing item
-                            item = ItemRepository.update(
-                                item_id=item.id,
-                                name=name,
-                                description=description,
-                                category=category,
-                                unit_of_measure=unit_of_measure,
-                                purchase_price=purchase_price
-                            )
-                        else:
-                            # Create new item
-                            item = ItemRepository.create(
-                                name=name,
-                                sku=sku,
-                                description=description,
-                                item_type='RAW',
-                                category=category,
-                                unit_of_measure=unit_of_measure,
-                                quantity=quantity,
-                                purchase_price=purchase_price,
-                                sales_list_status='NOT_LISTED'
-                            )
-                        
-                        # Create purchase history if purchase_date and purchase_price are provided
-                        if purchase_date_str and purchase_price > 0:
-                            purchase_date = datetime.strptime(purchase_date_str, '%Y-%m-%d').date()
-                            PurchaseHistoryRepository.create(
-                                item=item,
-                                purchase_date=purchase_date,
-                                quantity=quantity,
-                                unit_price=purchase_price,
-                                supplier=supplier,
-                                invoice_reference=invoice_reference
-                            )
-                        
-                        processed_count += 1
-                    except Exception as e:
-                        failed_count += 1
-                        error_details.append(f"Recipe for output '{output_sku}': {str(e)}")
-            
-            # Update import status
-            ExcelImportRepository.update_status(
-                import_id=import_id,
-                status='COMPLETED' if failed_count == 0 else 'FAILED',
-                processed_count=processed_count,
-                failed_count=failed_count,
-                error_details='\n'.join(error_details) if error_details else None
-            )
-            
-            return True, None
-        except Exception as e:
-            # Update import status
-            ExcelImportRepository.update_status(
-                import_id=import_id,
-                status='FAILED',
-                error_details=str(e)
-            )
-            
-            return False, str(e)
+        return ExcelImportService._process_import(import_id, 'RAW_MATERIALS')
     
     @staticmethod
     def process_bom_import(import_id):
@@ -232,137 +152,7 @@ class ExcelImportService:
         - sequence: Assembly sequence
         - is_optional: Whether component is optional (Y/N)
         """
-        excel_import = ExcelImportRepository.get_by_id(import_id)
-        if not excel_import:
-            return False, "Import record not found"
-            
-        if excel_import.import_type != 'BOM':
-            return False, "Import type is not BOM"
-            
-        if excel_import.status != 'PENDING':
-            return False, "Import already processed"
-    
-        try:
-            # Update status to processing
-            ExcelImportRepository.update_status(
-                import_id=import_id,
-                status='PROCESSING'
-            )
-            
-            # Read Excel file
-            df = pd.read_excel(excel_import.file.path)
-            
-            required_cols = ['output_sku', 'input_sku', 'quantity_required', 'unit_of_measure']
-            for col in required_cols:
-                if col not in df.columns:
-                    raise ValueError(f"Required column '{col}' not found in Excel file")
-            
-            processed_count = 0
-            failed_count = 0
-            error_details = []
-            
-            # Group data by output_sku to create recipes
-            grouped_df = df.groupby('output_sku')
-            
-            # Process each recipe
-            with transaction.atomic():
-                for output_sku, group_data in grouped_df:
-                    try:
-                        # Get output item
-                        output_item = ItemRepository.get_by_sku(output_sku)
-                        if not output_item:
-                            raise ValueError(f"Output item with SKU '{output_sku}' not found")
-                            
-                        # Get recipe name from first row or generate default name
-                        recipe_name = None
-                        output_quantity = 1.0
-                        first_row = group_data.iloc[0]
-                        
-                        if 'recipe_name' in group_data.columns and pd.notna(first_row.get('recipe_name')):
-                            recipe_name = str(first_row['recipe_name']).strip()
-                        else:
-                            recipe_name = f"Recipe for {output_item.name}"
-                            
-                        if 'output_quantity' in group_data.columns and pd.notna(first_row.get('output_quantity')):
-                            output_quantity = float(first_row['output_quantity'])
-                            
-                        # Check if recipe already exists
-                        existing_recipe = RecipeRepository.get_by_name_and_output(recipe_name, output_item.id)
-                        
-                        if existing_recipe:
-                            # Update existing recipe
-                            recipe = RecipeRepository.update_recipe(
-                                recipe_id=existing_recipe.id,
-                                name=recipe_name,
-                                output_quantity=output_quantity,
-                                unit_of_measure=str(first_row['unit_of_measure']).strip()
-                            )
-                            # Clear existing recipe items to replace with new ones
-                            RecipeRepository.delete_recipe_items(recipe.id)
-                        else:
-                            # Create new recipe
-                            recipe = RecipeRepository.create_recipe(
-                                name=recipe_name,
-                                description=f"Manufacturing recipe for {output_item.name}",
-                                output_item=output_item,
-                                output_quantity=output_quantity,
-                                unit_of_measure=str(first_row['unit_of_measure']).strip()
-                            )
-                        
-                        # Process each input item for this recipe
-                        for idx, row in group_data.iterrows():
-                            try:
-                                input_sku = str(row['input_sku']).strip()
-                                quantity_required = float(row['quantity_required'])
-                                unit_of_measure = str(row['unit_of_measure']).strip()
-                                
-                                # Optional fields
-                                sequence = int(row.get('sequence', 10)) if pd.notna(row.get('sequence', 10)) else 10
-                                is_optional = True if pd.notna(row.get('is_optional', '')) and str(row.get('is_optional', '')).upper() == 'Y' else False
-                                
-                                # Get input item
-                                input_item = ItemRepository.get_by_sku(input_sku)
-                                if not input_item:
-                                    raise ValueError(f"Input item with SKU '{input_sku}' not found")
-                                
-                                # Create recipe item
-                                RecipeRepository.create_recipe_item(
-                                    recipe=recipe,
-                                    input_item=input_item,
-                                    quantity_required=quantity_required,
-                                    unit_of_measure=unit_of_measure,
-                                    sequence=sequence,
-                                    is_optional=is_optional
-                                )
-                            except Exception as e:
-                                # Handle individual input item errors
-                                failed_count += 1
-                                error_details.append(f"Row for '{input_sku}' in recipe '{recipe_name}': {str(e)}")
-                        
-                        processed_count += 1
-                    except Exception as e:
-                        failed_count += 1
-                        error_details.append(f"Recipe for output '{output_sku}': {str(e)}")
-            
-            # Update import status
-            ExcelImportRepository.update_status(
-                import_id=import_id,
-                status='COMPLETED' if failed_count == 0 else 'FAILED',
-                processed_count=processed_count,
-                failed_count=failed_count,
-                error_details='\n'.join(error_details) if error_details else None
-            )
-            
-            return True, None
-        except Exception as e:
-            # Update import status
-            ExcelImportRepository.update_status(
-                import_id=import_id,
-                status='FAILED',
-                error_details=str(e)
-            )
-            
-            return False, str(e)
+        return ExcelImportService._process_import(import_id, 'BOM')
 
     @staticmethod
     def process_products_import(import_id):
@@ -379,141 +169,7 @@ class ExcelImportService:
         - Cost: Production cost
         - Description: Product description
         """
-        excel_import = ExcelImportRepository.get_by_id(import_id)
-        if not excel_import:
-            return False, "Import record not found"
-            
-        if excel_import.import_type != 'PRODUCTS':
-            return False, "Import type is not PRODUCTS"
-            
-        if excel_import.status != 'PENDING':
-            return False, "Import already processed"
-        
-        try:
-            # Get project_id from notes if available
-            project_id = ExcelImportService._extract_project_id_from_import(excel_import)
-            
-            # Validate project exists
-            project, error_message = ExcelImportService._validate_project(project_id)
-            if error_message:
-                return False, error_message
-            
-            # Update status to processing
-            ExcelImportRepository.update_status(
-                import_id=import_id,
-                status='PROCESSING'
-            )
-            
-            # Read Excel file
-            df = pd.read_excel(excel_import.file.path)
-            
-            # Check required columns based on structure
-            required_cols = ['Name', 'Unit']
-            for col in required_cols:
-                if col not in df.columns:
-                    raise ValueError(f"Required column '{col}' not found in Excel file")
-            
-            processed_count = 0
-            failed_count = 0
-            error_details = []
-
-            # Repository instances
-            item_repo = ItemRepository()
-            inventory_transaction_repo = InventoryTransactionRepository()
-            
-            # Process each row
-            with transaction.atomic():
-                for index, row in df.iterrows():
-                    try:
-                        name = str(row['Name']).strip()
-                        unit = str(row['Unit']).strip()
-                        
-                        # Determine SKU - either use explicit SKU if present or generate from Name/Value
-                        if 'SKU' in df.columns and pd.notna(row.get('SKU')):
-                            sku = str(row['SKU']).strip()
-                        else:
-                            # Generate SKU from name and value
-                            prefix = 'FP-'  # Final Product prefix
-                            base = name[:3].upper()
-                            sku = f"{prefix}{base}{(index+1):03d}"
-                            
-                        item_data = {
-                            'sku': sku,
-                            'name': name,
-                            'description': str(row.get('Description', '')).strip() if pd.notna(row.get('Description', '')) else None,
-                            'item_type': 'FINAL',  # Ürünler daima final product
-                            'unit_of_measure': unit,
-                            'quantity': int(row.get('Qty', 0)) if pd.notna(row.get('Qty', 0)) else 0,
-                            'selling_price': float(row.get('Price', 0)) if pd.notna(row.get('Price', 0)) else 0,
-                            'purchase_price': float(row.get('Cost', 0)) if pd.notna(row.get('Cost', 0)) else 0,
-                            'minimum_stock_level': 1
-                        }
-                        
-                        if 'Category' in df.columns and pd.notna(row.get('Category')):
-                            category_path = str(row['Category']).strip()
-                            category = ExcelImportService.get_or_create_category_hierarchy(category_path)
-                            if category:
-                                item_data['category_id'] = category.id
-                        
-                        # Check if item already exists
-                        existing_item = None
-                        try:
-                            existing_item = ItemRepository.get_by_sku(sku)
-                        except Exception:
-                            pass
-                            
-                        if existing_item:
-                            # Update existing item
-                            item = ItemRepository.update(existing_item.id, item_data)
-                        else:
-                            # Create new item
-                            item = ItemRepository.create(**item_data)
-                            
-                        # Add item to project inventory if project_id is available
-                        if project_id and item:
-                            success, error_message = ExcelImportService._add_item_to_project_inventory(item.id, project_id, item_data['quantity'], row_index=index)
-                            if not success:
-                                error_details.append(error_message)
-                        
-                        # Create initial inventory transaction if quantity > 0
-                        if item_data['quantity'] > 0:
-                            try:
-                                InventoryTransactionRepository.create_transaction(**{
-                                    'item_id': item.id,
-                                    'transaction_type': 'INITIAL',
-                                    'quantity': item_data['quantity'],
-                                    'reference_model': 'ExcelImport',
-                                    'reference_id': excel_import.id,
-                                    'notes': f"Initial stock from Excel import. Import ID: {import_id}"
-                                })
-                            except Exception as tx_e:
-                                # Log transaction error but continue with next item
-                                error_details.append(f"Row {index+2} (Initial Transaction): {str(tx_e)}")
-                        
-                        processed_count += 1
-                    except Exception as e:
-                        failed_count += 1
-                        error_details.append(f"Recipe for output '{output_sku}': {str(e)}")
-            
-            # Update import status
-            ExcelImportRepository.update_status(
-                import_id=import_id,
-                status='COMPLETED' if failed_count == 0 else 'FAILED',
-                processed_count=processed_count,
-                failed_count=failed_count,
-                error_details='\n'.join(error_details) if error_details else None
-            )
-            
-            return True, None
-        except Exception as e:
-            # Update import status
-            ExcelImportRepository.update_status(
-                import_id=import_id,
-                status='FAILED',
-                error_details=str(e)
-            )
-            
-            return False, str(e)
+        return ExcelImportService._process_import(import_id, 'PRODUCTS')
 
     @staticmethod
     def process_electronic_components_import(import_id):
@@ -526,170 +182,169 @@ class ExcelImportService:
         - MPN: Manufacturer Part Number
         - Footprint: Component footprint (e.g., Resistor_SMD:R_0402_1005Metric)
         """
+        return ExcelImportService._process_import(import_id, 'ELECTRONIC_COMPONENTS')
+
+    @staticmethod
+    def queue_import(import_id):
+        """
+        Submit an Excel import to the background worker
+        (manage.py run_excel_import_worker)
+        
+        Returns:
+            tuple: (excel_import, error_message)
+        """
+        excel_import = ExcelImportRepository.get_by_id(import_id)
+        if not excel_import:
+            return None, "Import record not found"
+        
+        project_id, error_message = ExcelImportService._prepare_import(excel_import)
+        if error_message:
+            return None, error_message
+        
+        if not ExcelImportRepository.queue(import_id):
+            return None, "Import already processed"
+        
+        return ExcelImportRepository.get_by_id(import_id), None
+    
+    @staticmethod
+    def run_queued_import(excel_import):
+        """
+        Process an import claimed by the background worker, resuming after
+        its last committed chunk if an earlier run was interrupted
+        
+        Returns:
+            tuple: (success, error_message)
+        """
+        project_id = None
+        if PIPELINES[excel_import.import_type].uses_project:
+            project_id = ExcelImportService._extract_project_id_from_import(excel_import)
+        return ExcelImportService._run_pipeline(excel_import, project_id)
+    
+    @staticmethod
+    def _process_import(import_id, import_type):
+        """
+        Ortak metod: Excel importunu istek içinde, senkron olarak işler
+        
+        Args:
+            import_id (str): Excel import kaydının ID'si
+            import_type (str): Beklenen import tipi
+            
+        Returns:
+            tuple: (success, error_message)
+        """
         excel_import = ExcelImportRepository.get_by_id(import_id)
         if not excel_import:
             return False, "Import record not found"
             
-        if excel_import.import_type != 'ELECTRONIC_COMPONENTS':
-            return False, "Import type is not ELECTRONIC_COMPONENTS"
+        if excel_import.import_type != import_type:
+            return False, f"Import type is not {import_type}"
+        
+        project_id, error_message = ExcelImportService._prepare_import(excel_import)
+        if error_message:
+            return False, error_message
+        
+        return ExcelImportService._run_pipeline(excel_import, project_id)
+    
+    @staticmethod
+    def _prepare_import(excel_import):
+        """
+        Ortak metod: Import kaydının işlenebilir olduğunu doğrular
+        
+        Args:
+            excel_import (ExcelImport): Excel import kaydı
             
+        Returns:
+            tuple: (project_id, error_message)
+        """
         if excel_import.status != 'PENDING':
-            return False, "Import already processed"
+            return None, "Import already processed"
         
-        try:
-            # Get project_id from notes if available
-            project_id = ExcelImportService._extract_project_id_from_import(excel_import)
-            
-            # Proje ID eksikse hata ver
-            if not project_id:
-                return False, "Excel importu için proje seçimi zorunludur. Lütfen bir proje seçin."
-            
-            # Validate project exists
-            project, error_message = ExcelImportService._validate_project(project_id)
-            if error_message:
-                return False, error_message
+        pipeline_class = PIPELINES.get(excel_import.import_type)
+        if not pipeline_class:
+            return None, "Unsupported import type"
+        
+        if not pipeline_class.uses_project:
+            return None, None
+        
+        # Get project_id from notes if available
+        project_id = ExcelImportService._extract_project_id_from_import(excel_import)
+        
+        # Proje ID eksikse hata ver
+        if pipeline_class.requires_project and not project_id:
+            return None, "Excel importu için proje seçimi zorunludur. Lütfen bir proje seçin."
+        
+        # Validate project exists
+        project, error_message = ExcelImportService._validate_project(project_id)
+        if error_message:
+            return None, error_message
+        
+        return project_id, None
+    
+    @staticmethod
+    def _run_pipeline(excel_import, project_id):
+        """
+        Ortak metod: Excel importunu ilgili pipeline ile işler
+        
+        Satırlar toplu olarak doğrulanır ve parçalar halinde yazılır;
+        bkz. apps.inventory.services.excel_import_pipeline. Her parça
+        kendi transaction'ı içinde ilerleme kaydıyla birlikte commit edilir,
+        böylece yarıda kalan bir import son commit edilen parçadan devam eder.
+        
+        Args:
+            excel_import (ExcelImport): Excel import kaydı
+            project_id (str): Proje ID veya None
             
-            # Update status to processing
-            ExcelImportRepository.update_status(
-                import_id=import_id,
-                status='PROCESSING'
+        Returns:
+            tuple: (success, error_message)
+        """
+        import_id = excel_import.id
+        worker_id = excel_import.worker_id
+        
+        def on_start(total_rows, total_chunks):
+            ExcelImportRepository.start(import_id, worker_id, total_rows, total_chunks)
+        
+        def checkpoint(chunks_completed, result):
+            ExcelImportRepository.save_checkpoint(
+                import_id,
+                worker_id,
+                chunks_completed,
+                result.processed_count,
+                result.failed_count,
+                result.error_details
             )
-            
-            # Read Excel file
-            df = pd.read_excel(excel_import.file.path)
-            
-            # Check required columns
-            required_cols = ['Reference', 'Qty', 'Value', 'MPN', 'Footprint']
-            for col in required_cols:
-                if col not in df.columns:
-                    raise ValueError(f"Required column '{col}' not found in Excel file")
-            
-            processed_count = 0
-            failed_count = 0
-            error_details = []
-            
-            # Repository instances
-            item_repo = ItemRepository()
-            inventory_transaction_repo = InventoryTransactionRepository()
-            
-            # Ensure electronic components category exists
-            electronic_category = ExcelImportService.get_or_create_category_hierarchy('Elektronik Komponentler')
-            
-            # Process each row
-            with transaction.atomic():
-                for index, row in df.iterrows():
-                    try:
-                        reference = str(row['Reference']).strip()
-                        quantity = int(row['Qty'])
-                        value = str(row['Value']).strip()
-                        mpn = str(row['MPN']).strip()
-                        footprint = str(row['Footprint']).strip()
-                        
-                        # Use Value as SKU and name - normalized for database use
-                        value_normalized = value.replace(' ', '-').replace('/', '-').replace('.', '_')[:20]
-                        sku = f"COMP-{value_normalized}"
-                        
-                        # Build description with MPN and footprint
-                        description = f"MPN: {mpn}\nFootprint: {footprint}"
-                        
-                        # Check if item already exists - handle errors gracefully
-                        try:
-                            # Try to get the item - if not found, will raise exception
-                            item = item_repo.get_item_by_sku(sku)
-                            
-                            # Update existing item
-                            item_repo.update_item(
-                                item_id=item.id,
-                                item_data={
-                                    'name': value,  # Use component value as name
-                                    'description': description,
-                                    'reference': reference,
-                                    'unit_of_measure': 'pcs',
-                                    'category': electronic_category
-                                }
-                            )
-                            
-                            # Update quantity through inventory transaction
-                            try:
-                                previous_qty = item.quantity
-                                quantity_change = quantity - previous_qty
-                                
-                                if quantity_change != 0:
-                                    item_repo.update_item_quantity(
-                                        item_id=item.id,
-                                        quantity=quantity
-                                    )
-                                    
-                                    # Record transaction for the quantity change
-                                    inventory_transaction_repo.create_transaction({
-                                        'item': item,
-                                        'transaction_type': 'ADJUSTMENT',
-                                        'quantity': quantity_change,
-                                        'reference_model': 'ExcelImport',
-                                        'reference_id': 1,  
-                                        'notes': f"Excel import adjustment for {value} ({mpn}). Import ID: {import_id}"
-                                    })
-                            except Exception as tx_e:
-                                # Log transaction error but continue with next item
-                                error_details.append(f"Row {index+2} (Transaction): {str(tx_e)}")
-                        except:
-                            # Create new item
-                            try:
-                                # Create the new item
-                                item = item_repo.create_item({
-                                    'sku': sku,
-                                    'name': value,  # Use component value as name
-                                    'description': description,
-                                    'reference': reference,
-                                    'item_type': 'RAW',  # Components are raw materials
-                                    'category': electronic_category,
-                                    'unit_of_measure': 'pcs',
-                                    'quantity': quantity
-                                })
-                                
-                                # Record transaction for the initial quantity
-                                if quantity > 0:
-                                    try:
-                                        inventory_transaction_repo.create_transaction({
-                                            'item': item,
-                                            'transaction_type': 'ADJUSTMENT',
-                                            'quantity': quantity,
-                                            'reference_model': 'ExcelImport',
-                                            'reference_id': 1,  
-                                            'notes': f"Initial stock from Excel import for {value} ({mpn}). Import ID: {import_id}"
-                                        })
-                                    except Exception as tx_e:
-                                        # Log transaction error but continue with next item
-                                        error_details.append(f"Row {index+2} (Initial Transaction): {str(tx_e)}")
-                            except Exception as create_e:
-                                # Handle creation errors
-                                raise Exception(f"Failed to create component: {str(create_e)}")
-                        
-                        # Add item to project inventory if project_id is available
-                        if project_id:
-                            success, error_message = ExcelImportService._add_item_to_project_inventory(item.id, project_id, quantity, row_index=index)
-                            if not success:
-                                error_details.append(error_message)
-                        
-                        processed_count += 1
-                    except Exception as e:
-                        failed_count += 1
-                        error_details.append(f"Recipe for output '{output_sku}': {str(e)}")
+        
+        try:
+            resume_from = excel_import.chunks_completed
+            with ImportHeartbeat(import_id, worker_id):
+                result = get_pipeline(excel_import, project_id).run(
+                    resume_from=resume_from,
+                    result=ImportResult.from_import(excel_import) if resume_from else None,
+                    on_start=on_start,
+                    checkpoint=checkpoint
+                )
             
             # Update import status
-            ExcelImportRepository.update_status(
-                import_id=import_id,
-                status='COMPLETED' if failed_count == 0 else 'FAILED',
-                processed_count=processed_count,
-                failed_count=failed_count,
-                error_details='\n'.join(error_details) if error_details else None
+            ExcelImportRepository.finish(
+                import_id,
+                worker_id,
+                status='COMPLETED' if result.failed_count == 0 else 'FAILED',
+                processed_count=result.processed_count,
+                failed_count=result.failed_count,
+                error_details=result.error_details
             )
             
             return True, None
+        except ImportClaimLost as e:
+            # Another worker resumes the import; the chunk in progress was rolled back
+            logger.warning("%s", e)
+            return False, str(e)
         except Exception as e:
+            logger.error("Excel import %s failed: %s", import_id, e)
+            
             # Update import status
-            ExcelImportRepository.update_status(
-                import_id=import_id,
+            ExcelImportRepository.finish(
+                import_id,
+                worker_id,
                 status='FAILED',
                 error_details=str(e)
             )
@@ -783,63 +438,6 @@ class ExcelImportService:
         except Exception as e:
             return None, f"Selected project does not exist: {str(e)}"
             
-    @staticmethod
-    def _add_item_to_project_inventory(item_id, project_id, quantity, row_index=None):
-        """
-        Ortak metod: Ürünü proje envanterine ekler
-        
-        Args:
-            item_id (str): Ürün ID'si
-            project_id (str): Proje ID'si
-            quantity (float): Miktar
-            row_index (int, optional): Excel satır indeksi (hata mesajları için)
-            
-        Returns:
-            tuple: (success, error_message)
-        """
-        if not item_id or not project_id:
-            return False, "Missing item_id or project_id"
-            
-        try:
-            # Repository kullanarak proje envanterini güncelle
-            project_inventory_repo = ProjectInventoryRepository()
-            
-            # Proje envanterini kontrol et
-            inventory_item = None
-            try:
-                # Önce ürünü proje envanterinde olup olmadığını kontrol et
-                inventory_item = project_inventory_repo.get_project_inventory(project_id, item_id)
-            except Exception as e:
-                # Proje envanterinde yoksa oluştur
-                inventory_item = None
-                
-            # İlgili envanteri güncelle veya oluştur   
-            if inventory_item:
-                # Var olan envanter öğesini güncelle
-                result = project_inventory_repo.update(
-                    inventory_item.id,
-                    {
-                        'quantity': inventory_item.quantity + quantity
-                    }
-                )
-            else:
-                # Yeni envanter öğesi oluştur
-                try:
-                    result = project_inventory_repo.create(
-                        project_id=project_id,
-                        item_id=item_id,
-                        quantity=quantity,
-                        minimum_stock_level=1
-                    )
-                except Exception as create_err:
-                    return False, f"Failed to create inventory: {str(create_err)}"
-                
-            return True, None
-                
-        except Exception as e:
-            error_msg = f"ERROR adding item to project: {str(e)}"
-            return False, error_msg
-    
     @staticmethod
     def get_or_create_category_hierarchy(category_path):
         """
@@ -1,16 +1,20 @@
 from apps.inventory.repositories.inventory_transaction_repository import InventoryTransactionRepository
 from apps.inventory.repositories.item_repository import ItemRepository
+from apps.inventory.repositories.inventory_repository import InventoryRepository, StockMovement
+from apps.inventory.utils.logger import LoggerMixin
 
 
-class InventoryTransactionService:
+class InventoryTransactionService(LoggerMixin):
     """
     Service class to handle business logic for Inventory Transaction operations.
     Uses InventoryTransactionRepository for data access.
     """
+    trace_methods = True
     
     def __init__(self):
         self.repository = InventoryTransactionRepository()
         self.item_repository = ItemRepository()
+        self.inventory_repository = InventoryRepository()
     
     def get_all_transactions(self, **filters):
         """
@@ -70,18 +74,27 @@ class InventoryTransactionService:
             
         Returns:
             InventoryTransaction: The created transaction
+        
+        Raises:
+            UnknownItemError: If the item does not exist
+            InsufficientStockError: If the item does not hold enough stock
         """
         # Get the item and update its quantity
         item_id = transaction_data.get('item')
         if isinstance(item_id, dict) and 'id' in item_id:
             item_id = item_id['id']
-            
-        item = self.item_repository.get(id=item_id)
-        quantity = transaction_data.get('quantity', 0)
-        
-        # Update item quantity - positive values increase stock, negative values decrease
-        item.quantity += quantity
-        self.item_repository.update(item.id, {'quantity': item.quantity})
+        item_id = getattr(item_id, 'id', item_id)
         
-        # Create the transaction record
-        return self.repository.create_transaction(transaction_data)
+        # Positive values increase stock, negative values decrease; the ledger row
+        # and the quantity change are written together by the inventory repository
+        transactions = self.inventory_repository.apply_movements([
+            StockMovement(
+                item_id,
+                transaction_data.get('quantity', 0),
+                transaction_data.get('transaction_type', 'ADJUSTMENT'),
+                transaction_data.get('notes') or '',
+                transaction_data.get('reference_model'),
+                transaction_data.get('reference_id')
+            )
+        ])
+        return transactions[0]
@@ -1,21 +1,25 @@
 from apps.inventory.repositories.item_repository import ItemRepository
+from apps.inventory.repositories.inventory_repository import InventoryRepository
 from apps.projects.repositories.project_inventory_repository import ProjectInventoryRepository
 from apps.projects.services.project_inventory_service import ProjectInventoryService
 from django.db import transaction
+from apps.inventory.utils.logger import LoggerMixin
 
 
-class ItemService:
+class ItemService(LoggerMixin):
     """
     Service class to handle business logic for Item operations.
     Uses ItemRepository for data access.
     """
+    trace_methods = True
     
     def __init__(self):
         self.repository = ItemRepository()
+        self.inventory_repository = InventoryRepository()
     
     def get_all_items(self):
         """Get all items"""
-        return self.repository.get_all_items()
+        return self.repository.for_list(self.repository.get_all_items())
     
     def get_item(self, item_id):
         """Get an item by its ID"""
@@ -27,25 +31,25 @@ class ItemService:
     
     def get_items_by_category(self, category_id):
         """Get all items in a category"""
-        return self.repository.get_items_by_category(category_id)
+        return self.repository.for_list(self.repository.get_items_by_category(category_id))
     
     def get_items_by_type(self, item_type):
         """Get all items of a specific type"""
         if item_type not in ['RAW', 'INTERMEDIATE', 'FINAL']:
             raise ValueError(f"Invalid item type: {item_type}. Must be one of: RAW, INTERMEDIATE, FINAL")
-        return self.repository.get_items_by_type(item_type)
+        return self.repository.for_list(self.repository.get_items_by_type(item_type))
     
     def get_raw_materials(self):
         """Get all raw materials"""
-        return self.repository.get_items_by_type('RAW')
+        return self.repository.for_list(self.repository.get_items_by_type('RAW'))
     
     def get_intermediate_products(self):
         """Get all intermediate products"""
-        return self.repository.get_items_by_type('INTERMEDIATE')
+        return self.repository.for_list(self.repository.get_items_by_type('INTERMEDIATE'))
     
     def get_final_products(self):
         """Get all final products"""
-        return self.repository.get_items_by_type('FINAL')
+        return self.repository.for_list(self.repository.get_items_by_type('FINAL'))
     
     def create_item(self, item_data):
         """Create a new item"""
@@ -64,22 +68,52 @@ class ItemService:
         
         return self.repository.update_item(item_id, item_data)
     
-    def update_item_quantity(self, item_id, quantity):
-        """Update the quantity of an item"""
+    @transaction.atomic
+    def update_item_quantity(self, item_id, quantity, performed_by=None):
+        """
+        Set the quantity of an item
+        
+        The difference to the current stock is booked as an ADJUSTMENT through
+        the inventory repository, so the change gets a ledger row and the
+        same non-negative guard as every other stock movement.
+        """
         try:
-            quantity = int(quantity)
-        except (ValueError, TypeError):
+            quantity = self.inventory_repository.whole_quantity(quantity)
+        except ValueError:
             raise ValueError("Quantity must be a valid integer")
             
         if quantity < 0:
             raise ValueError("Quantity cannot be negative")
-            
-        return self.repository.update_item_quantity(item_id, quantity)
+        
+        # Lock the row so the difference is computed against the stock it is applied to
+        current = self.repository.get_item_quantities([item_id], for_update=True)
+        if not current:
+            raise ValueError(f"Item with ID {item_id} not found")
+        change = quantity - next(iter(current.values()))
+        if not change:
+            return self.repository.get_item_by_id(item_id)
+        return self.inventory_repository.update_item_quantity(
+            item_id, change, 'Quantity set manually', performed_by=performed_by
+        )
         
     def get_item_quantity(self, item_id):
         """Get the current quantity of an item"""
         return self.repository.get_item_quantity(item_id)
     
+    def get_low_stock_items(self, project_id=None):
+        """
+        Get items at or below their minimum stock level.
+        
+        Args:
+            project_id (uuid, optional): Restrict to a project's inventory levels
+            
+        Returns:
+            QuerySet: Low stock items, or low stock project inventory rows when project_id is given
+        """
+        if project_id:
+            return ProjectInventoryService().get_low_stock_items(project_id)
+        return self.inventory_repository.get_low_stock_items()
+    
     def delete_item(self, item_id):
         """Delete an item"""
         # Here we could check if the item is used in any BOMs, production processes etc.
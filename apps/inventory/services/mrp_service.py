@@ -0,0 +1,226 @@
+import math
+import time
+
+import numpy as np
+
+from apps.inventory.repositories.bom_graph_repository import BOMGraphRepository
+from apps.inventory.repositories.item_repository import ItemRepository
+from apps.inventory.repositories.production_process_repository import ProductionProcessRepository
+from apps.inventory.utils.logger import LoggerMixin
+from apps.projects.repositories.project_inventory_repository import ProjectInventoryRepository
+
+# Processes whose remaining output still needs material
+OPEN_STATUSES = ('PLANNED', 'IN_PROGRESS')
+
+# Quantities below this are treated as zero when rounding suggestions up
+EPSILON = 1e-9
+
+
+class MRPService(LoggerMixin):
+    """
+    Material requirements planning over the open production processes.
+
+    A run works on dense NumPy arrays over an item index (the BOM graph nodes
+    plus any process target outside it) with one column per project:
+
+    1. The remaining output of every open process is added to the gross
+       requirement of its target item in its project's column.
+    2. Items are processed by low-level code (deepest position in any recipe
+       tree), so an item's gross requirement is complete before it is netted.
+    3. Each level is netted first against the stock held by the project
+       (ProjectInventory), then against the on-hand Item.quantity, which is
+       shared between projects in proportion to what they still need.
+    4. The net requirement of manufactured items is exploded into their
+       recipe inputs through the BOM edges with one scatter-add per level.
+
+    Net requirements of items without a recipe are what has to be bought;
+    those of manufactured items are what has to be produced. Both are
+    rounded up to whole units in the result.
+    """
+    trace_methods = True
+
+    def __init__(self):
+        self.process_repository = ProductionProcessRepository()
+        self.item_repository = ItemRepository()
+        self.project_inventory_repository = ProjectInventoryRepository()
+
+    def run(self, project_id=None, statuses=OPEN_STATUSES):
+        """
+        Run MRP over the processes in the given statuses.
+
+        Args:
+            project_id (uuid, optional): Restrict the run to one project's processes
+            statuses (iterable): Process statuses to plan for
+
+        Returns:
+            dict: 'summary' of the run and per-item 'items' requirements
+        """
+        statuses = tuple(statuses)
+        invalid = set(statuses) - set(OPEN_STATUSES)
+        if invalid:
+            raise ValueError(f"Invalid status for MRP: {', '.join(sorted(invalid))}")
+
+        start = time.perf_counter()
+        demand = self.process_repository.get_open_demand(statuses, project_id)
+        graph = BOMGraphRepository.get_graph()
+
+        # Item index: graph nodes first, so edge arrays index it directly
+        item_ids = [node.id for node in graph.nodes]
+        index = dict(graph.index)
+        project_index = {}
+        rows = []
+        for process_project, item_id, target, produced in demand:
+            remaining = target - produced
+            if remaining <= 0:
+                continue
+            position = index.get(item_id)
+            if position is None:
+                position = index[item_id] = len(item_ids)
+                item_ids.append(item_id)
+            rows.append((project_index.setdefault(process_project, len(project_index)), position, remaining))
+
+        if not rows:
+            return self._summarize(self._empty_result(), rows, project_index, statuses, start)
+
+        items = self.item_repository.get_planning_data(item_ids)
+        size = len(item_ids)
+        projects = len(project_index)
+
+        gross = np.zeros((size, projects))
+        project_positions, item_positions, quantities = (np.array(column) for column in zip(*rows))
+        np.add.at(gross, (item_positions, project_positions), quantities.astype(float))
+
+        allocated = np.zeros((size, projects))
+        for allocation_project, item_id, quantity in self.project_inventory_repository.get_allocations(project_index):
+            position = index.get(item_id)
+            if position is not None:
+                allocated[position, project_index[allocation_project]] = quantity
+
+        on_hand = np.array([max(items[item_id]['quantity'], 0) if item_id in items else 0 for item_id in item_ids],
+                           dtype=float)
+        sources, targets, per_unit = self._edges(graph)
+        levels = self._low_level_codes(size, sources, targets)
+
+        from_project = np.zeros(size)
+        from_stock = np.zeros(size)
+        net = np.zeros((size, projects))
+        edge_levels = levels[sources]
+        for level in range(int(levels.max()) + 1):
+            positions = np.flatnonzero(levels == level)
+            required = gross[positions]
+
+            covered = np.minimum(required, allocated[positions])
+            remaining = required - covered
+            total_remaining = remaining.sum(axis=1)
+            stock = np.minimum(total_remaining, on_hand[positions])
+            share = np.divide(stock, total_remaining, out=np.zeros_like(stock), where=total_remaining > 0)
+
+            net[positions] = remaining * (1 - share)[:, None]
+            from_project[positions] = covered.sum(axis=1)
+            from_stock[positions] = stock
+
+            edges = np.flatnonzero(edge_levels == level)
+            if edges.size:
+                np.add.at(gross, targets[edges], net[sources[edges]] * per_unit[edges, None])
+
+        result = self._build_result(
+            graph, item_ids, items, levels, gross.sum(axis=1), from_project, from_stock, net.sum(axis=1), on_hand,
+            has_recipe=np.bincount(sources, minlength=size) > 0
+        )
+        return self._summarize(result, rows, project_index, statuses, start)
+
+    def _summarize(self, result, rows, project_index, statuses, start):
+        result['summary'].update({
+            'processes': len(rows),
+            'projects': len(project_index),
+            'statuses': list(statuses),
+            'duration_ms': round((time.perf_counter() - start) * 1000, 1),
+        })
+        self.log_info(
+            "MRP run over %s processes: %s items required, %s to purchase",
+            len(rows), len(result['items']), result['summary']['items_to_purchase']
+        )
+        return result
+
+    @staticmethod
+    def _empty_result():
+        return {
+            'summary': {'items_required': 0, 'items_to_produce': 0, 'items_to_purchase': 0},
+            'items': [],
+        }
+
+    @staticmethod
+    def _edges(graph):
+        """
+        Recipe edges that are exploded: mandatory inputs of non-raw items.
+
+        Returns:
+            tuple: (source positions, target positions, quantity per unit of source) arrays
+        """
+        nodes = graph.nodes
+        counts = np.fromiter((node.edge_end - node.edge_start for node in nodes), dtype=np.intp, count=len(nodes))
+        sources = np.repeat(np.arange(len(nodes), dtype=np.intp), counts)
+        targets = np.array(graph.edge_targets, dtype=np.intp)
+        per_unit = np.array(graph.edge_quantities, dtype=float)
+
+        # Raw materials are bought even when a recipe exists for them, optional inputs are not planned
+        raw = np.fromiter((node.is_raw_material for node in nodes), dtype=bool, count=len(nodes))
+        keep = ~raw[sources] & (np.array(graph.edge_optional, dtype=np.int8) == 0)
+        return sources[keep], targets[keep], per_unit[keep]
+
+    @staticmethod
+    def _low_level_codes(size, sources, targets):
+        """Deepest level at which each item appears below a top-level item (0 for top level)"""
+        levels = np.zeros(size, dtype=np.intp)
+        while sources.size:
+            deeper = levels.copy()
+            np.maximum.at(deeper, targets, levels[sources] + 1)
+            if np.array_equal(deeper, levels):
+                break
+            if deeper.max() >= size:
+                raise ValueError("Recipe cycle detected")
+            levels = deeper
+        return levels
+
+    @staticmethod
+    def _build_result(graph, item_ids, items, levels, gross, from_project, from_stock, net, on_hand, has_recipe):
+        required = np.flatnonzero(gross > EPSILON)
+        result_items = []
+        to_purchase = 0
+        to_produce = 0
+        for position in required:
+            item_id = item_ids[position]
+            item = items.get(item_id)
+            if item is None:
+                node = graph.nodes[position]
+                item = {'name': node.name, 'sku': node.sku, 'item_type': node.item_type,
+                        'unit_of_measure': node.unit_of_measure}
+            shortfall = math.ceil(net[position] - EPSILON) if net[position] > EPSILON else 0
+            manufactured = bool(has_recipe[position])
+            to_produce += manufactured and shortfall > 0
+            to_purchase += not manufactured and shortfall > 0
+            result_items.append({
+                'item_id': item_id,
+                'name': item['name'],
+                'sku': item['sku'],
+                'item_type': item['item_type'],
+                'unit_of_measure': item['unit_of_measure'],
+                'low_level_code': int(levels[position]),
+                'on_hand': int(on_hand[position]),
+                'gross_requirement': round(float(gross[position]), 4),
+                'from_project_stock': round(float(from_project[position]), 4),
+                'from_on_hand': round(float(from_stock[position]), 4),
+                'net_requirement': round(float(net[position]), 4),
+                'suggested_production': shortfall if manufactured else 0,
+                'suggested_purchase': 0 if manufactured else shortfall,
+            })
+
+        result_items.sort(key=lambda entry: (entry['low_level_code'], entry['sku'] or ''))
+        return {
+            'summary': {
+                'items_required': len(result_items),
+                'items_to_produce': to_produce,
+                'items_to_purchase': to_purchase,
+            },
+            'items': result_items,
+        }
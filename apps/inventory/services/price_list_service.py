@@ -0,0 +1,55 @@
+from decimal import Decimal
+
+from apps.common.utils.exports import EXPORT_FORMATS
+from apps.inventory.repositories.price_list_repository import PRICE_LISTS, PriceListRepository
+
+# Column titles of downloaded price lists
+PRICE_LIST_HEADER = ('SKU', 'Ürün Adı', 'Kategori', 'Birim', 'Fiyat')
+
+
+class PriceListService:
+    """
+    Service class for the customer and dealer sales price lists.
+    Uses PriceListRepository for data access.
+    """
+    
+    def __init__(self, price_list_repository: PriceListRepository = None):
+        self.repository = price_list_repository or PriceListRepository()
+    
+    def _check_kind(self, kind):
+        if kind not in PRICE_LISTS:
+            raise ValueError(f"Invalid price list: {kind}. Must be one of {', '.join(PRICE_LISTS)}")
+    
+    def get_price_list(self, kind):
+        """
+        Get the current snapshot of a price list
+        
+        Args:
+            kind: 'customer' or 'dealer'
+            
+        Returns:
+            dict with list, version, built_at, columns and rows
+            
+        Raises:
+            ValueError: For an unknown price list
+        """
+        self._check_kind(kind)
+        return self.repository.get_snapshot(kind)
+    
+    def get_export_rows(self, kind, file_format):
+        """
+        Header and rows of a price list download
+        
+        Raises:
+            ValueError: For an unknown price list or file format
+        """
+        self._check_kind(kind)
+        if file_format not in EXPORT_FORMATS:
+            raise ValueError(f"Invalid file_type. Must be one of {', '.join(EXPORT_FORMATS)}")
+        snapshot = self.repository.get_snapshot(kind)
+        # Prices go out as numbers so spreadsheets can compute with them
+        rows = (
+            (sku, name, category, unit, Decimal(price))
+            for _, sku, name, category, unit, price in snapshot['rows']
+        )
+        return PRICE_LIST_HEADER, rows
@@ -3,18 +3,22 @@ from django.utils import timezone
 from apps.inventory.repositories.production_process_repository import ProductionProcessRepository
 from apps.inventory.repositories.item_repository import ItemRepository
 from apps.inventory.repositories.inventory_transaction_repository import InventoryTransactionRepository
+from apps.inventory.repositories.inventory_repository import InventoryRepository, StockMovement
+from apps.inventory.utils.logger import LoggerMixin
 
 
-class ProductionProcessService:
+class ProductionProcessService(LoggerMixin):
     """
     Service class to handle business logic for Production Process operations.
     Uses ProductionProcessRepository, ItemRepository and RecipeRepository for data access.
     """
+    trace_methods = True
     
     def __init__(self):
         self.repository = ProductionProcessRepository()
         self.item_repository = ItemRepository()
         self.transaction_repository = InventoryTransactionRepository()
+        self.inventory_repository = InventoryRepository()
     
     def get_all_processes(self):
         """Get all production processes"""
@@ -94,39 +98,28 @@ class ProductionProcessService:
         # Get all inputs that were consumed
         inputs = self.repository.get_process_inputs(process_id)
         
-        # For each input, reduce inventory and record a transaction
-        for input_record in inputs:
-            # Update item quantity in inventory
-            item = input_record.item
-            item.quantity -= input_record.quantity_consumed
-            self.item_repository.update(item.id, {'quantity': item.quantity})
-            
-            # Record inventory transaction for the consumed item
-            self.transaction_repository.create_transaction({
-                'item': item,
-                'transaction_type': 'PRODUCTION_IN',
-                'quantity': -input_record.quantity_consumed,  # Negative as it's being consumed
-                'reference_model': 'ProductionProcess',
-                'reference_id': process_id,
-                'notes': f"Consumed in production process: {process.name}"
-            })
-        
-        # For each output, increase inventory and record a transaction
-        for output_record in outputs:
-            # Update item quantity in inventory
-            item = output_record.item
-            item.quantity += output_record.quantity_produced
-            self.item_repository.update(item.id, {'quantity': item.quantity})
-            
-            # Record inventory transaction for the produced item
-            self.transaction_repository.create_transaction({
-                'item': item,
-                'transaction_type': 'PRODUCTION_OUT',
-                'quantity': output_record.quantity_produced,  # Positive as it's being produced
-                'reference_model': 'ProductionProcess',
-                'reference_id': process_id,
-                'notes': f"Produced in production process: {process.name}"
-            })
+        # Reduce inventory for every input and increase it for every output in one batch
+        movements = [
+            StockMovement(
+                input_record.item_id,
+                -input_record.quantity_consumed,  # Negative as it's being consumed
+                'PRODUCTION_IN',
+                f"Consumed in production process: {process.name}",
+                'ProductionProcess'
+            )
+            for input_record in inputs
+        ]
+        movements += [
+            StockMovement(
+                output_record.item_id,
+                output_record.quantity_produced,  # Positive as it's being produced
+                'PRODUCTION_OUT',
+                f"Produced in production process: {process.name}",
+                'ProductionProcess'
+            )
+            for output_record in outputs
+        ]
+        self.inventory_repository.apply_movements(movements, reference_id=process_id)
         
         # Update the process status to completed
         update_data = {
@@ -5,17 +5,23 @@ import traceback
 import logging
 import uuid
 
-from apps.common.responses import success_response, error_response
+from apps.common.responses import ApiResponse, success_response, error_response
 from apps.inventory.repositories.production_repository import ProductionRepository
 from apps.inventory.repositories.recipe_repository import RecipeRepository
 from apps.inventory.repositories.item_repository import ItemRepository
-from apps.inventory.repositories.inventory_repository import InventoryRepository
+from apps.inventory.repositories.inventory_repository import (
+    InventoryRepository, InsufficientStockError, StockMovement
+)
 from apps.inventory.utils.logger import LoggerMixin, log_exception
 from apps.inventory.models.recipe import Recipe
+from apps.inventory.models.production import Production
+from apps.inventory.models.production_item import ProductionItem
+from apps.inventory.models.production_history import ProductionHistory
 
 
 class ProductionService(LoggerMixin):
     """Service class for Production-related operations"""
+    trace_methods = True
     
     def __init__(self):
         self.production_repository = ProductionRepository()
@@ -27,24 +33,24 @@ class ProductionService(LoggerMixin):
     def get_all_productions(self, filters=None):
         """Get all production records with optional filtering"""
         try:
-            self.log_debug(f"Getting all productions with filters: {filters}")
+            self.log_debug("Getting all productions with filters: %s", filters)
             productions = self.production_repository.get_all_productions(filters)
             return success_response(data=productions)
         except Exception as e:
-            self.log_exception(f"Error getting productions: {str(e)}")
+            self.log_exception("Error getting productions: %s", e)
             return error_response(str(e), status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
     def get_production_by_id(self, production_id):
         """Get a specific production record by ID"""
         try:
-            self.log_debug(f"Getting production with ID: {production_id}")
+            self.log_debug("Getting production with ID: %s", production_id)
             production = self.production_repository.get_production_by_id(production_id)
             if not production:
-                self.log_warning(f"Production with ID {production_id} not found")
+                self.log_warning("Production with ID %s not found", production_id)
                 return error_response(_('Production record not found'), status_code=status.HTTP_404_NOT_FOUND)
             return success_response(data=production)
         except Exception as e:
-            self.log_exception(f"Error getting production {production_id}: {str(e)}")
+            self.log_exception("Error getting production %s: %s", production_id, e)
             return error_response(str(e), status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
     @transaction.atomic
@@ -52,8 +58,8 @@ class ProductionService(LoggerMixin):
         """Create a new production record and process inventory adjustments"""
         try:
             # Log the incoming request data
-            self.log_info(f"Creating production with data: {production_data}")
-            self.log_debug(f"User executing production: {user.username} (ID: {user.id})")
+            self.log_info("Creating production with data: %s", production_data)
+            self.log_debug("User executing production: %s (ID: %s)", user.username, user.id)
             
             # Check if user is authenticated
             if not user.is_authenticated:
@@ -63,17 +69,17 @@ class ProductionService(LoggerMixin):
             
             # Handle recipe which can be either a UUID or a Recipe object
             recipe = production_data.get('recipe')
-            self.log_debug(f"Recipe from request: {recipe}, type: {type(recipe)}")
+            self.log_debug("Recipe from request: %s, type: %s", recipe, type(recipe))
             
             # If recipe is already a Recipe object
             if isinstance(recipe, Recipe):
                 recipe_id = recipe.id
-                self.log_debug(f"Recipe is already a Recipe object with ID: {recipe_id}")
+                self.log_debug("Recipe is already a Recipe object with ID: %s", recipe_id)
             else:
                 # Try to convert to UUID if it's a string
                 try:
                     recipe_id = uuid.UUID(str(recipe))
-                    self.log_debug(f"Converted recipe ID to UUID: {recipe_id}")
+                    self.log_debug("Converted recipe ID to UUID: %s", recipe_id)
                 except (ValueError, TypeError, AttributeError) as e:
                     error_msg = f"Invalid recipe ID format: {str(e)}"
                     self.log_error(error_msg)
@@ -89,7 +95,7 @@ class ProductionService(LoggerMixin):
             # Ensure we're using the validated recipe
             production_data['recipe'] = recipe
             
-            self.log_debug(f"Recipe found: {recipe.name} (ID: {recipe.id})")
+            self.log_debug("Recipe found: %s (ID: %s)", recipe.name, recipe.id)
             
             # Add user to production data
             production_data['executed_by'] = user
@@ -104,19 +110,18 @@ class ProductionService(LoggerMixin):
                 
                 # For each recipe item, calculate required quantity
                 recipe_items = self.recipe_repository.get_recipe_items(recipe.id)
-                self.log_debug(f"Found {len(recipe_items)} items in recipe")
+                self.log_debug("Found %s items in recipe", len(recipe_items))
                 
                 for recipe_item in recipe_items:
                     # Skip optional items that might not be available
                     if recipe_item.is_optional:
-                        self.log_debug(f"Skipping optional item: {recipe_item.input_item.name}")
+                        self.log_debug("Skipping optional item: %s", recipe_item.input_item.name)
                         continue
                     
                     # Calculate required quantity proportional to output
-                    quantity_factor = output_quantity / recipe.output_quantity
-                    required_quantity = recipe_item.quantity_required * quantity_factor
+                    required_quantity = self.scale_recipe_quantity(recipe_item, output_quantity, recipe)
                     
-                    self.log_debug(f"Adding item {recipe_item.input_item.name} with quantity {required_quantity}")
+                    self.log_debug("Adding item %s with quantity %s", recipe_item.input_item.name, required_quantity)
                     
                     consumed_items_data.append({
                         'input_item': recipe_item.input_item,
@@ -124,71 +129,65 @@ class ProductionService(LoggerMixin):
                         'unit_of_measure': recipe_item.unit_of_measure
                     })
             
-            # Check if we have enough inventory for all consumed items
-            self.log_info("Checking inventory levels for consumed items")
-            for item_data in consumed_items_data:
-                item_id = item_data['input_item'].id if hasattr(item_data['input_item'], 'id') else item_data['input_item']
-                quantity = item_data['quantity_consumed']
-                
-                # Check inventory
-                inventory_response = self.inventory_repository.get_item_quantity(item_id)
-                available_quantity = inventory_response.get('available_quantity', 0)
-                self.log_debug(f"Item ID: {item_id}, Required: {quantity}, Available: {available_quantity}")
-                
-                if available_quantity < quantity:
-                    item = self.item_repository.get_item_by_id(item_id)
-                    item_name = item.name if item else f"Item ID: {item_id}"
-                    error_msg = f'Insufficient inventory for {item_name}. Required: {quantity}, Available: {available_quantity}'
-                    self.log_error(error_msg)
-                    return error_response(_(error_msg), status_code=status.HTTP_400_BAD_REQUEST)
+            # Resolve any raw item IDs to Item objects with a single query
+            missing_ids = [
+                item_data['input_item'] for item_data in consumed_items_data
+                if not hasattr(item_data['input_item'], 'id')
+            ]
+            if missing_ids:
+                items_by_id = self.item_repository.get_items_by_ids(missing_ids)
+                for item_data in consumed_items_data:
+                    if not hasattr(item_data['input_item'], 'id'):
+                        item_id = item_data['input_item']
+                        item = items_by_id.get(uuid.UUID(str(item_id)))
+                        if not item:
+                            error_msg = f"Item with ID {item_id} not found"
+                            self.log_error(error_msg)
+                            return error_response(_(error_msg), status_code=status.HTTP_400_BAD_REQUEST)
+                        item_data['input_item'] = item
             
             # Create production record
             self.log_info("Creating production record")
             production = self.production_repository.create_production(production_data)
-            self.log_debug(f"Production record created with ID: {production.id}")
+            self.log_debug("Production record created with ID: %s", production.id)
             
             # Add consumed items
             self.log_info("Adding consumed items")
+            movements = []
             for item_data in consumed_items_data:
-                # Ensure input_item is an Item object, not a UUID or ID
-                if not hasattr(item_data['input_item'], 'id'):
-                    # We have an ID or UUID, need to get the Item object
-                    item_id = item_data['input_item']
-                    self.log_debug(f"Converting input_item ID {item_id} to Item object")
-                    item = self.item_repository.get_item_by_id(item_id)
-                    if not item:
-                        error_msg = f"Item with ID {item_id} not found"
-                        self.log_error(error_msg)
-                        raise ValueError(error_msg)
-                    item_data['input_item'] = item
-
                 # Set production reference
                 item_data['production'] = production
-                self.log_debug(f"Adding consumed item: {item_data}")
+                self.log_debug("Adding consumed item: %s", item_data)
                 self.production_repository.add_production_item(item_data)
                 
-                # Get item ID for inventory adjustment
-                item_id = item_data['input_item'].id
-                
-                # Adjust inventory: decrease consumed items
-                self.log_debug(f"Adjusting inventory for item ID: {item_id}, quantity: -{item_data['quantity_consumed']}")
-                self.inventory_repository.adjust_inventory(
-                    item_id=item_id,
-                    quantity=-item_data['quantity_consumed'],  # Negative for decrement
-                    reason=f"Consumed in Production #{production.id}",
+                # Decrease consumed items
+                movements.append(StockMovement(
+                    item_data['input_item'].id,
+                    -item_data['quantity_consumed'],  # Negative for decrement
+                    'PRODUCTION_IN',
+                    f"Consumed in Production #{production.id}"
+                ))
+            
+            # Increase produced item
+            movements.append(StockMovement(
+                recipe.output_item.id,
+                production_data['output_quantity'],  # Positive for increment
+                'PRODUCTION_OUT',
+                f"Created in Production #{production.id}"
+            ))
+            
+            # Apply all inventory adjustments at once; stock levels are enforced by the database
+            self.log_info("Applying %s inventory movements for production %s", len(movements), production.id)
+            try:
+                self.inventory_repository.apply_movements(
+                    movements,
                     reference_id=str(production.id),
                     performed_by=user
                 )
-            
-            # Adjust inventory: increase produced item
-            self.log_info(f"Increasing inventory for produced item ID: {recipe.output_item.id}, quantity: {production_data['output_quantity']}")
-            self.inventory_repository.adjust_inventory(
-                item_id=recipe.output_item.id,
-                quantity=production_data['output_quantity'],  # Positive for increment
-                reason=f"Created in Production #{production.id}",
-                reference_id=str(production.id),
-                performed_by=user
-            )
+            except InsufficientStockError as e:
+                self.log_error(str(e))
+                transaction.set_rollback(True)
+                return error_response(_(str(e)), status_code=status.HTTP_400_BAD_REQUEST)
             
             # Add production history record
             self.log_info("Adding production history record")
@@ -206,17 +205,229 @@ class ProductionService(LoggerMixin):
             
             # Get fresh data with all relationships
             production = self.production_repository.get_production_by_id(production.id)
-            self.log_info(f"Production process completed successfully for ID: {production.id}")
+            self.log_info("Production process completed successfully for ID: %s", production.id)
             return success_response(data=production, status_code=status.HTTP_201_CREATED)
         except Exception as e:
             # Full exception logging with traceback
             tb = traceback.format_exc()
-            self.log_error(f"Exception during production creation: {str(e)}\nTraceback:\n{tb}")
+            self.log_error("Exception during production creation: %s\nTraceback:\n%s", e, tb)
             
             # Ensure transaction rollback
             transaction.set_rollback(True)
             return error_response(str(e), status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
+    @transaction.atomic
+    def create_productions_batch(self, productions_data, user, mode='all_or_nothing'):
+        """
+        Create many production records in one transaction.
+        
+        Recipes, items and stock levels are loaded with a constant number of queries,
+        the combined material demand is checked against locked stock, and the
+        Production, ProductionItem and ProductionHistory rows are written with bulk
+        inserts followed by a single batch of inventory movements.
+        
+        Args:
+            productions_data: List of dicts with recipe, output_quantity, notes and
+                optional consumed_items (input_item, quantity_consumed, unit_of_measure)
+            user: User executing the productions
+            mode: 'all_or_nothing' rejects the whole batch if any run fails,
+                'best_effort' creates every run that can be satisfied
+        
+        Returns:
+            ApiResponse with a per-run success/failure report
+        """
+        try:
+            if not user.is_authenticated:
+                return error_response(_("User is not authenticated"), status_code=status.HTTP_401_UNAUTHORIZED)
+            
+            if mode not in ('all_or_nothing', 'best_effort'):
+                return error_response(_(f"Invalid batch mode: {mode}"), status_code=status.HTTP_400_BAD_REQUEST)
+            
+            self.log_info("Creating batch of %s productions in %s mode", len(productions_data), mode)
+            
+            # Resolve recipes and explicitly consumed items in bulk
+            recipes = self.recipe_repository.get_recipes_by_ids(
+                {uuid.UUID(str(run['recipe'])) for run in productions_data}
+            )
+            items = self.item_repository.get_items_by_ids({
+                uuid.UUID(str(item_data['input_item']))
+                for run in productions_data
+                for item_data in run.get('consumed_items') or []
+            })
+            
+            results = []
+            runs = []
+            for index, run in enumerate(productions_data):
+                recipe = recipes.get(uuid.UUID(str(run['recipe'])))
+                if not recipe:
+                    results.append({'index': index, 'success': False,
+                                    'error': f"Recipe with ID {run['recipe']} not found"})
+                    continue
+                
+                try:
+                    consumed = self._get_batch_consumption(recipe, run, items)
+                except ValueError as e:
+                    results.append({'index': index, 'success': False, 'error': str(e)})
+                    continue
+                
+                results.append({'index': index, 'success': True, 'production_id': None, 'error': None})
+                runs.append({'index': index, 'recipe': recipe, 'data': run, 'consumed': consumed})
+            
+            # Check the combined demand against locked stock with a single query
+            stock_item_ids = {consumed[0].id for run in runs for consumed in run['consumed']}
+            stock_item_ids |= {run['recipe'].output_item_id for run in runs}
+            remaining = self.item_repository.get_item_quantities(stock_item_ids, for_update=True)
+            
+            accepted = []
+            for run in runs:
+                demand = {}
+                for item, quantity, unit_of_measure in run['consumed']:
+                    demand[item] = demand.get(item, 0) + quantity
+                
+                shortage = next(
+                    ((item, quantity) for item, quantity in demand.items() if remaining.get(item.id, 0) < quantity),
+                    None
+                )
+                if shortage:
+                    item, quantity = shortage
+                    results[run['index']].update({
+                        'success': False,
+                        'error': f"Insufficient inventory for {item.name}. "
+                                 f"Required: {quantity}, Available: {remaining.get(item.id, 0)}"
+                    })
+                    continue
+                
+                # Later runs in the batch may use what earlier runs produce
+                for item, quantity in demand.items():
+                    remaining[item.id] -= quantity
+                output_item_id = run['recipe'].output_item_id
+                remaining[output_item_id] = remaining.get(output_item_id, 0) + run['data']['output_quantity']
+                accepted.append(run)
+            
+            failed = [result for result in results if not result['success']]
+            if mode == 'all_or_nothing' and failed:
+                for result in results:
+                    if result['success']:
+                        result.update({'success': False,
+                                       'error': 'Not created because another run in the batch failed'})
+                self.log_warning("Production batch rejected: %s of %s runs failed", len(failed), len(results))
+                return self._batch_response(mode, results, status.HTTP_400_BAD_REQUEST)
+            
+            if not accepted:
+                return self._batch_response(mode, results, status.HTTP_400_BAD_REQUEST)
+            
+            # Build all rows in memory, then insert each table with one query
+            productions = []
+            production_items = []
+            history_records = []
+            movements = []
+            for run in accepted:
+                recipe = run['recipe']
+                production = Production(
+                    recipe=recipe,
+                    output_quantity=run['data']['output_quantity'],
+                    notes=run['data'].get('notes'),
+                    executed_by=user
+                )
+                productions.append(production)
+                results[run['index']]['production_id'] = str(production.id)
+                
+                for item, quantity, unit_of_measure in run['consumed']:
+                    production_items.append(ProductionItem(
+                        production=production,
+                        input_item=item,
+                        quantity_consumed=quantity,
+                        unit_of_measure=unit_of_measure
+                    ))
+                    movements.append(StockMovement(
+                        item.id, -quantity, 'PRODUCTION_IN', f"Consumed in Production #{production.id}"
+                    ))
+                
+                movements.append(StockMovement(
+                    recipe.output_item_id,
+                    production.output_quantity,
+                    'PRODUCTION_OUT',
+                    f"Created in Production #{production.id}"
+                ))
+                history_records.append(ProductionHistory(
+                    production=production,
+                    action='Created',
+                    performed_by=user,
+                    notes='Production record created in batch',
+                    new_data={
+                        'recipe_id': str(recipe.id),
+                        'output_quantity': str(production.output_quantity),
+                        'consumed_items': len(run['consumed'])
+                    }
+                ))
+            
+            self.production_repository.bulk_create_productions(productions)
+            self.production_repository.bulk_add_production_items(production_items)
+            self.production_repository.bulk_add_production_history(history_records)
+            
+            try:
+                self.inventory_repository.apply_movements(movements, performed_by=user)
+            except InsufficientStockError as e:
+                self.log_error(str(e))
+                transaction.set_rollback(True)
+                return error_response(_(str(e)), status_code=status.HTTP_400_BAD_REQUEST)
+            
+            self.log_info("Production batch completed: %s created, %s failed", len(accepted), len(failed))
+            return self._batch_response(mode, results, status.HTTP_201_CREATED)
+        except Exception as e:
+            tb = traceback.format_exc()
+            self.log_error("Exception during batch production creation: %s\nTraceback:\n%s", e, tb)
+            transaction.set_rollback(True)
+            return error_response(str(e), status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    
+    def _get_batch_consumption(self, recipe, run, items):
+        """
+        Get (item, quantity, unit_of_measure) tuples consumed by one batch run,
+        either as given explicitly or derived from the recipe.
+        """
+        consumed_items_data = run.get('consumed_items')
+        if consumed_items_data is not None:
+            consumed = []
+            for item_data in consumed_items_data:
+                item = items.get(uuid.UUID(str(item_data['input_item'])))
+                if not item:
+                    raise ValueError(f"Item with ID {item_data['input_item']} not found")
+                consumed.append((item, item_data['quantity_consumed'], item_data['unit_of_measure']))
+            return consumed
+        
+        # Calculate quantities proportional to output, skipping optional items
+        return [
+            (recipe_item.input_item, self.scale_recipe_quantity(recipe_item, run['output_quantity'], recipe),
+             recipe_item.unit_of_measure)
+            for recipe_item in recipe.items.all()
+            if not recipe_item.is_optional
+        ]
+    
+    @staticmethod
+    def scale_recipe_quantity(recipe_item, output_quantity, recipe):
+        """
+        Get the quantity of a recipe input consumed for an output quantity,
+        rounded up to whole units so a partial unit is never under-consumed
+        """
+        # Integer ceiling division; a float factor rounds e.g. 3 * (10 / 3) up to 11
+        return -(-recipe_item.quantity_required * int(output_quantity) // recipe.output_quantity)
+    
+    @staticmethod
+    def _batch_response(mode, results, status_code):
+        """Build the per-run report returned by create_productions_batch"""
+        succeeded = sum(1 for result in results if result['success'])
+        return ApiResponse(
+            data={
+                'mode': mode,
+                'total': len(results),
+                'succeeded': succeeded,
+                'failed': len(results) - succeeded,
+                'results': results
+            },
+            error=None if succeeded else _('No productions were created'),
+            status_code=status_code
+        )
+    
     @transaction.atomic
     def update_production(self, production_id, production_data, user):
         """Update an existing production record and adjust inventory if needed"""
@@ -241,84 +452,55 @@ class ProductionService(LoggerMixin):
             consumed_items_data = production_data.pop('consumed_items', None)
             consumed_items_changed = consumed_items_data is not None
             
-            # Verify we have enough inventory for any new consumption
-            if consumed_items_changed or output_quantity_changed:
-                # If new consumed items provided, check their inventory
-                if consumed_items_changed:
-                    for item_data in consumed_items_data:
-                        item_id = item_data['input_item']
-                        quantity = item_data['quantity_consumed']
-                        
-                        # For each originally consumed item, we'll return it to inventory,
-                        # so we only need to check the additional quantity
-                        original_item_quantity = 0
-                        for orig_item in original_consumed_items:
-                            if str(orig_item.input_item.id) == str(item_id):
-                                original_item_quantity = orig_item.quantity_consumed
-                                break
-                        
-                        additional_quantity = quantity - original_item_quantity
-                        if additional_quantity > 0:  # Only check if we're consuming more than before
-                            inventory_response = self.inventory_repository.get_item_quantity(item_id)
-                            if inventory_response.get('available_quantity', 0) < additional_quantity:
-                                item = self.item_repository.get_item_by_id(item_id)
-                                item_name = item.name if item else f"Item ID: {item_id}"
-                                return error_response(
-                                    _(f'Insufficient inventory for {item_name}. '
-                                      f'Required additional: {additional_quantity}, '
-                                      f'Available: {inventory_response.get("available_quantity", 0)}'),
-                                    status_code=status.HTTP_400_BAD_REQUEST
-                                )
+            # Consumed item stock is enforced by the database when movements are applied;
+            # only the recipe-based consumption needs an up-front availability check
+            if output_quantity_changed and not consumed_items_changed and output_quantity_diff > 0:
+                # For recipe-based consumption, calculate additional required quantities
+                recipe_items = self.recipe_repository.get_recipe_items(original_recipe.id)
                 
-                # If output quantity increased, check inventory for any additional consumption
-                elif output_quantity_changed and output_quantity_diff > 0:
-                    # For recipe-based consumption, calculate additional required quantities
-                    recipe_items = self.recipe_repository.get_recipe_items(original_recipe.id)
-                    
-                    for recipe_item in recipe_items:
-                        if recipe_item.is_optional:
-                            continue
-                            
-                        # Calculate additional consumption based on output quantity change
-                        quantity_factor = output_quantity_diff / original_recipe.output_quantity
-                        additional_quantity = recipe_item.quantity_required * quantity_factor
+                for recipe_item in recipe_items:
+                    if recipe_item.is_optional:
+                        continue
                         
-                        if additional_quantity > 0:
-                            inventory_response = self.inventory_repository.get_item_quantity(recipe_item.input_item.id)
-                            if inventory_response.get('available_quantity', 0) < additional_quantity:
-                                return error_response(
-                                    _(f'Insufficient inventory for {recipe_item.input_item.name}. '
-                                      f'Required additional: {additional_quantity}, '
-                                      f'Available: {inventory_response.get("available_quantity", 0)}'),
-                                    status_code=status.HTTP_400_BAD_REQUEST
-                                )
+                    # Calculate additional consumption based on output quantity change
+                    quantity_factor = output_quantity_diff / original_recipe.output_quantity
+                    additional_quantity = recipe_item.quantity_required * quantity_factor
+                    
+                    if additional_quantity > 0:
+                        inventory_response = self.inventory_repository.get_item_quantity(recipe_item.input_item.id)
+                        if inventory_response.get('available_quantity', 0) < additional_quantity:
+                            return error_response(
+                                _(f'Insufficient inventory for {recipe_item.input_item.name}. '
+                                  f'Required additional: {additional_quantity}, '
+                                  f'Available: {inventory_response.get("available_quantity", 0)}'),
+                                status_code=status.HTTP_400_BAD_REQUEST
+                            )
             
             # Update the production record
             updated_production = self.production_repository.update_production(production, production_data)
             
-            # Process inventory adjustments
+            # Collect inventory adjustments and apply them in one batch
+            movements = []
             
             # 1. If output quantity changed, adjust produced item inventory
             if output_quantity_changed:
-                self.inventory_repository.adjust_inventory(
-                    item_id=original_recipe.output_item.id,
-                    quantity=output_quantity_diff,  # Can be positive or negative
-                    reason=f"Production #{production.id} output quantity updated",
-                    reference_id=str(production.id),
-                    performed_by=user
-                )
+                movements.append(StockMovement(
+                    original_recipe.output_item.id,
+                    output_quantity_diff,  # Can be positive or negative
+                    'PRODUCTION_OUT' if output_quantity_diff > 0 else 'PRODUCTION_IN',
+                    f"Production #{production.id} output quantity updated"
+                ))
             
             # 2. If consumed items changed, process each change
             if consumed_items_changed:
                 # First, return all original consumed items to inventory
                 for orig_item in original_consumed_items:
-                    self.inventory_repository.adjust_inventory(
-                        item_id=orig_item.input_item.id,
-                        quantity=orig_item.quantity_consumed,  # Positive to add back
-                        reason=f"Production #{production.id} update - returning consumed item",
-                        reference_id=str(production.id),
-                        performed_by=user
-                    )
+                    movements.append(StockMovement(
+                        orig_item.input_item.id,
+                        orig_item.quantity_consumed,  # Positive to add back
+                        'PRODUCTION_OUT',
+                        f"Production #{production.id} update - returning consumed item"
+                    ))
                 
                 # Delete all existing consumed items
                 for orig_item in original_consumed_items:
@@ -330,13 +512,22 @@ class ProductionService(LoggerMixin):
                     self.production_repository.add_production_item(item_data)
                     
                     # Decrease inventory for new consumption
-                    self.inventory_repository.adjust_inventory(
-                        item_id=item_data['input_item'],
-                        quantity=-item_data['quantity_consumed'],  # Negative for decrement
-                        reason=f"Production #{production.id} update - new consumption",
-                        reference_id=str(production.id),
-                        performed_by=user
-                    )
+                    movements.append(StockMovement(
+                        getattr(item_data['input_item'], 'id', item_data['input_item']),
+                        -item_data['quantity_consumed'],  # Negative for decrement
+                        'PRODUCTION_IN',
+                        f"Production #{production.id} update - new consumption"
+                    ))
+            
+            try:
+                self.inventory_repository.apply_movements(
+                    movements,
+                    reference_id=str(production.id),
+                    performed_by=user
+                )
+            except InsufficientStockError as e:
+                transaction.set_rollback(True)
+                return error_response(_(str(e)), status_code=status.HTTP_400_BAD_REQUEST)
             
             # Add production history record
             self.production_repository.add_production_history({
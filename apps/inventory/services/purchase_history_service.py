@@ -1,12 +1,15 @@
 from datetime import date
 from apps.inventory.repositories.purchase_history_repository import PurchaseHistoryRepository
 from apps.inventory.repositories.item_repository import ItemRepository
+from apps.inventory.utils.logger import LoggerMixin
 
 
-class PurchaseHistoryService:
+class PurchaseHistoryService(LoggerMixin):
     """
     Service class for managing purchase history
     """
+    trace_methods = True
+
     @staticmethod
     def create_purchase_record(item_id, purchase_date, quantity, unit_price, supplier=None, invoice_reference=None, notes=None):
         """
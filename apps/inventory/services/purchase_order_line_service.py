@@ -1,12 +1,14 @@
 from apps.inventory.repositories.purchase_order_line_repository import PurchaseOrderLineRepository
 from apps.inventory.repositories.item_repository import ItemRepository
+from apps.inventory.utils.logger import LoggerMixin
 
 
-class PurchaseOrderLineService:
+class PurchaseOrderLineService(LoggerMixin):
     """
     Service class to handle business logic for Purchase Order Line operations.
     Uses PurchaseOrderLineRepository for data access.
     """
+    trace_methods = True
     
     def __init__(self):
         self.repository = PurchaseOrderLineRepository()
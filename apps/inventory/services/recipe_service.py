@@ -5,10 +5,12 @@ from rest_framework import status
 from apps.common.responses import success_response, error_response
 from apps.inventory.repositories.recipe_repository import RecipeRepository
 from apps.inventory.repositories.item_repository import ItemRepository
+from apps.inventory.utils.logger import LoggerMixin
 
 
-class RecipeService:
+class RecipeService(LoggerMixin):
     """Service class for Recipe-related operations"""
+    trace_methods = True
     
     def __init__(self):
         self.recipe_repository = RecipeRepository()
@@ -0,0 +1,54 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.inventory.models import Category, Item, Recipe, RecipeItem
+from apps.inventory.models.item import BOM_ITEM_FIELDS
+from apps.inventory.repositories.bom_graph_repository import BOMGraphRepository
+from apps.inventory.repositories.price_list_repository import PRICE_LIST_ITEM_FIELDS, PriceListRepository
+
+
+@receiver([post_save, post_delete], sender=Recipe)
+@receiver([post_save, post_delete], sender=RecipeItem)
+def invalidate_bom_graph(sender, **kwargs):
+    """Rebuild the BOM graph once any recipe or recipe item write commits"""
+    BOMGraphRepository.invalidate()
+
+
+@receiver(post_save, sender=Item)
+def invalidate_bom_graph_for_item(sender, instance, created, update_fields=None, **kwargs):
+    """Rebuild the BOM graph when an item that appears in it changes its node data"""
+    # New items only enter the graph through a recipe write
+    if created:
+        return
+    if update_fields is not None and not BOM_ITEM_FIELDS & set(update_fields):
+        return
+    if not instance.bom_fields_changed():
+        return
+    if BOMGraphRepository.is_loaded() and not BOMGraphRepository.contains(instance.id):
+        return
+    BOMGraphRepository.invalidate()
+
+
+@receiver(post_save, sender=Item)
+@receiver(post_delete, sender=Item)
+def update_price_lists(sender, instance, update_fields=None, **kwargs):
+    """Update the price list snapshots once a write to an item's listed data commits"""
+    if update_fields is not None and not PRICE_LIST_ITEM_FIELDS & set(update_fields):
+        return
+    PriceListRepository.mark_changed([instance.id])
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_price_lists(sender, **kwargs):
+    """Rebuild the price lists, which show category names, after any category write"""
+    PriceListRepository.invalidate()
+
+
+@receiver(post_delete, sender=Category)
+def rebase_orphaned_categories(sender, instance, **kwargs):
+    """Promote the descendants of a deleted category, whose parent was set to NULL"""
+    if instance.path:
+        Category.rebase_descendants(
+            {'path': instance.path, 'name_path': instance.name_path, 'depth': instance.depth}
+        )
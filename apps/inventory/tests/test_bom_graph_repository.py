@@ -0,0 +1,52 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from apps.inventory.models import Item, Recipe, RecipeItem
+from apps.inventory.repositories.bom_graph_repository import BOMGraphRepository
+
+
+class BOMGraphInvalidationTests(TestCase):
+    """Tests for when the BOM graph is re-read and invalidated"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.board = Item.objects.create(name='Board', sku='TST-BOARD', item_type='RAW', unit_of_measure='pcs')
+        cls.device = Item.objects.create(name='Device', sku='TST-DEVICE', item_type='FINAL', unit_of_measure='pcs')
+        recipe = Recipe.objects.create(
+            name='Device', output_item=cls.device, output_quantity=1, unit_of_measure='pcs'
+        )
+        RecipeItem.objects.create(recipe=recipe, input_item=cls.board, quantity_required=2, unit_of_measure='pcs')
+
+    def setUp(self):
+        BOMGraphRepository.expire()
+
+    def test_warm_graph_runs_no_query(self):
+        graph = BOMGraphRepository.get_graph()
+
+        with self.assertNumQueries(0):
+            self.assertIs(BOMGraphRepository.get_graph(), graph)
+
+    def test_commit_of_invalidating_write_expires_the_graph(self):
+        BOMGraphRepository.get_graph()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            BOMGraphRepository.invalidate()
+
+        self.assertIsNone(BOMGraphRepository._checked_at)
+
+    def test_full_save_without_node_changes_keeps_the_graph(self):
+        board = Item.objects.get(id=self.board.id)
+        board.quantity = 5
+
+        with mock.patch.object(BOMGraphRepository, 'invalidate') as invalidate:
+            board.save()
+            invalidate.assert_not_called()
+
+            board.name = 'Main board'
+            board.save()
+            invalidate.assert_called_once()
+
+            # The saved name is the new baseline
+            board.save()
+            invalidate.assert_called_once()
@@ -0,0 +1,71 @@
+from django.test import TestCase
+
+from apps.inventory.models import Item, Production, Recipe
+from apps.sales.models import Device
+from apps.sales.services.device_service import DeviceService
+from apps.users.models import User
+
+
+class DeviceRegistrationTests(TestCase):
+    """Tests for registering device batches with serial numbers allocated in blocks"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.alarm = Item.objects.create(name='Alarm', sku='ALARM', item_type='FINAL', unit_of_measure='pcs')
+        cls.sensor = Item.objects.create(name='Sensor', sku='SENSOR', item_type='FINAL', unit_of_measure='pcs')
+        cls.user = User.objects.create_user(username='uretim', password='secret-1')
+
+    def setUp(self):
+        self.service = DeviceService()
+
+    def serial_numbers(self, item):
+        return sorted(Device.objects.filter(item=item).values_list('serial_number', flat=True))
+
+    def test_batches_get_consecutive_disjoint_blocks(self):
+        first = self.service.register_devices(item_id=self.alarm.id, quantity=3)
+        second = self.service.register_devices(item_id=self.alarm.id, quantity=2)
+
+        self.assertEqual((first['first_serial_number'], first['last_serial_number']), ('ALARM-000001', 'ALARM-000003'))
+        self.assertEqual((second['first_serial_number'], second['last_serial_number']), ('ALARM-000004', 'ALARM-000005'))
+        self.assertEqual(self.serial_numbers(self.alarm), [f'ALARM-{number:06d}' for number in range(1, 6)])
+
+    def test_sequences_are_per_item(self):
+        self.service.register_devices(item_id=self.alarm.id, quantity=2)
+
+        result = self.service.register_devices(item_id=self.sensor.id, quantity=2)
+
+        self.assertEqual(result['first_serial_number'], 'SENSOR-000001')
+
+    def test_block_skips_manually_used_numbers(self):
+        Device.objects.create(item=self.alarm, serial_number='ALARM-000002')
+        Device.objects.create(item=self.alarm, serial_number='ALARM-000004')
+
+        result = self.service.register_devices(item_id=self.alarm.id, quantity=3)
+
+        # Colliding blocks (1-3, then 4-6) are abandoned whole, so the batch stays contiguous
+        self.assertEqual((result['first_serial_number'], result['last_serial_number']), ('ALARM-000007', 'ALARM-000009'))
+        self.assertEqual(Device.objects.filter(item=self.alarm).count(), 5)
+        self.assertEqual(self.service.register_devices(item_id=self.alarm.id, quantity=1)['first_serial_number'],
+                         'ALARM-000010')
+
+    def test_production_output_is_registered_once(self):
+        recipe = Recipe.objects.create(name='Alarm', output_item=self.alarm, output_quantity=1, unit_of_measure='pcs')
+        production = Production.objects.create(recipe=recipe, output_quantity=4, executed_by=self.user)
+        self.service.register_devices(item_id=self.alarm.id, quantity=1)
+        Device.objects.create(item=self.alarm, serial_number='MANUAL-1', production=production)
+
+        result = self.service.register_devices(production_id=production.id)
+
+        # One device of the production was already registered by hand
+        self.assertEqual(result['count'], 3)
+        self.assertEqual(result['first_serial_number'], 'ALARM-000002')
+        self.assertEqual(Device.objects.filter(production=production).count(), 4)
+        with self.assertRaisesMessage(ValueError, 'already registered'):
+            self.service.register_devices(production_id=production.id)
+
+    def test_invalid_requests(self):
+        with self.assertRaises(ValueError):
+            self.service.register_devices(item_id=self.alarm.id, quantity=0)
+        with self.assertRaises(ValueError):
+            self.service.register_devices()
+        self.assertFalse(Device.objects.exists())
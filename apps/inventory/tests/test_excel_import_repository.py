@@ -0,0 +1,100 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.inventory.management.commands.benchmark_excel_import import Command
+from apps.inventory.models import Item
+from apps.inventory.models.excel_import import ExcelImport
+from apps.inventory.repositories.excel_import_repository import ExcelImportRepository, ImportClaimLost
+from apps.inventory.services.excel_import_pipeline import PIPELINES
+
+
+class ExcelImportClaimTests(TestCase):
+    """Tests for claiming queued imports and taking over stale ones"""
+
+    def setUp(self):
+        self.excel_import = ExcelImport.objects.create(
+            import_type='RAW_MATERIALS', file='imports/inventory/test.xlsx', status='QUEUED'
+        )
+
+    def stale_before(self):
+        return timezone.now() - timedelta(minutes=5)
+
+    def make_stale(self):
+        ExcelImport.objects.filter(id=self.excel_import.id).update(
+            heartbeat_at=timezone.now() - timedelta(minutes=10)
+        )
+
+    def test_queued_import_is_claimed_once(self):
+        claimed = ExcelImportRepository.claim_next('worker-a', self.stale_before())
+
+        self.assertEqual(claimed.id, self.excel_import.id)
+        self.assertEqual(claimed.status, 'PROCESSING')
+        self.assertEqual(claimed.worker_id, 'worker-a')
+        self.assertIsNone(ExcelImportRepository.claim_next('worker-b', self.stale_before()))
+
+    def test_live_import_is_not_taken_over(self):
+        ExcelImportRepository.claim_next('worker-a', self.stale_before())
+        self.assertTrue(ExcelImportRepository.heartbeat(self.excel_import.id, 'worker-a'))
+
+        self.assertIsNone(ExcelImportRepository.claim_next('worker-b', self.stale_before()))
+
+    def test_stale_import_is_taken_over(self):
+        ExcelImportRepository.claim_next('worker-a', self.stale_before())
+        self.make_stale()
+
+        claimed = ExcelImportRepository.claim_next('worker-b', self.stale_before())
+
+        self.assertEqual(claimed.id, self.excel_import.id)
+        self.assertEqual(claimed.worker_id, 'worker-b')
+
+    def test_previous_worker_is_fenced_off(self):
+        ExcelImportRepository.claim_next('worker-a', self.stale_before())
+        self.make_stale()
+        ExcelImportRepository.claim_next('worker-b', self.stale_before())
+        import_id = self.excel_import.id
+
+        self.assertFalse(ExcelImportRepository.heartbeat(import_id, 'worker-a'))
+        with self.assertRaises(ImportClaimLost):
+            ExcelImportRepository.start(import_id, 'worker-a', 10, 1)
+        with self.assertRaises(ImportClaimLost):
+            ExcelImportRepository.save_checkpoint(import_id, 'worker-a', 1, 10, 0, None)
+        self.assertFalse(ExcelImportRepository.finish(import_id, 'worker-a', 'COMPLETED'))
+
+        # The new holder is unaffected
+        self.assertTrue(ExcelImportRepository.heartbeat(import_id, 'worker-b'))
+        ExcelImportRepository.save_checkpoint(import_id, 'worker-b', 1, 10, 0, None)
+        self.assertTrue(ExcelImportRepository.finish(import_id, 'worker-b', 'COMPLETED', processed_count=10))
+
+        excel_import = ExcelImport.objects.get(id=import_id)
+        self.assertEqual(excel_import.status, 'COMPLETED')
+        self.assertEqual(excel_import.processed_count, 10)
+        self.assertIsNone(excel_import.worker_id)
+
+    def test_lost_claim_rolls_back_the_chunk(self):
+        ExcelImportRepository.claim_next('worker-a', self.stale_before())
+        import_id = self.excel_import.id
+        pipeline = PIPELINES['RAW_MATERIALS'](self.excel_import)
+        pipeline.batch_size = 2
+        df = Command().build_raw_materials(4)
+
+        def checkpoint(chunks_completed, result):
+            ExcelImportRepository.save_checkpoint(
+                import_id, 'worker-a', chunks_completed,
+                result.processed_count, result.failed_count, result.error_details
+            )
+            if chunks_completed == 1:
+                # Worker A stalls after its first chunk and worker B takes over
+                self.make_stale()
+                ExcelImportRepository.claim_next('worker-b', self.stale_before())
+
+        with self.assertRaises(ImportClaimLost):
+            pipeline.run(df, checkpoint=checkpoint)
+
+        skus = set(Item.objects.filter(sku__startswith='BENCH-RM-').values_list('sku', flat=True))
+        self.assertEqual(skus, {'BENCH-RM-0', 'BENCH-RM-1'})
+        excel_import = ExcelImport.objects.get(id=import_id)
+        self.assertEqual(excel_import.worker_id, 'worker-b')
+        self.assertEqual(excel_import.chunks_completed, 1)
+        self.assertEqual(excel_import.processed_count, 2)
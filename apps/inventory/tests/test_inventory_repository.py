@@ -0,0 +1,136 @@
+import uuid
+from decimal import Decimal
+
+from django.test import TestCase
+
+from apps.inventory.models import InventoryTransaction, Item
+from apps.inventory.repositories.inventory_repository import (
+    InsufficientStockError, InventoryRepository, StockMovement, UnknownItemError
+)
+from apps.inventory.services.item_service import ItemService
+
+
+class ApplyMovementsTests(TestCase):
+    """Tests for InventoryRepository.apply_movements"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.screw = Item.objects.create(
+            name='Screw', sku='TST-SCREW', item_type='RAW', unit_of_measure='pcs', quantity=10
+        )
+        cls.board = Item.objects.create(
+            name='Board', sku='TST-BOARD', item_type='RAW', unit_of_measure='pcs', quantity=2,
+            minimum_stock_level=1
+        )
+
+    def assertQuantities(self, screw, board):
+        self.assertEqual(Item.objects.get(id=self.screw.id).quantity, screw)
+        self.assertEqual(Item.objects.get(id=self.board.id).quantity, board)
+
+    def test_applies_net_delta_per_item(self):
+        transactions = InventoryRepository.apply_movements([
+            StockMovement(self.screw.id, -4, 'ADJUSTMENT'),
+            StockMovement(self.screw.id, 7, 'PURCHASE'),
+            StockMovement(str(self.board.id), -1, 'ADJUSTMENT'),
+        ])
+
+        self.assertQuantities(13, 1)
+        self.assertEqual(len(transactions), 3)
+        self.assertEqual(InventoryTransaction.objects.filter(item=self.screw).count(), 2)
+        self.assertTrue(Item.objects.get(id=self.board.id).is_low_stock)
+
+    def test_movements_may_pass_through_zero_within_a_batch(self):
+        # Only the net change of an item is guarded, not the order of its movements
+        InventoryRepository.apply_movements([
+            StockMovement(self.board.id, -5, 'ADJUSTMENT'),
+            StockMovement(self.board.id, 3, 'PURCHASE'),
+        ])
+
+        self.assertQuantities(10, 0)
+
+    def test_rejects_movements_driving_stock_negative(self):
+        with self.assertRaises(InsufficientStockError) as raised:
+            InventoryRepository.apply_movements([
+                StockMovement(self.screw.id, -11, 'ADJUSTMENT'),
+                StockMovement(self.board.id, -1, 'ADJUSTMENT'),
+            ])
+
+        self.assertEqual(raised.exception.shortages, [{
+            'item_id': str(self.screw.id), 'item_name': 'Screw', 'required': 11, 'available': 10
+        }])
+
+    def test_shortage_rolls_back_the_whole_batch(self):
+        with self.assertRaises(InsufficientStockError):
+            InventoryRepository.apply_movements([
+                StockMovement(self.screw.id, -3, 'ADJUSTMENT'),
+                StockMovement(self.board.id, -3, 'ADJUSTMENT'),
+            ])
+
+        self.assertQuantities(10, 2)
+        self.assertFalse(InventoryTransaction.objects.exists())
+
+    def test_unknown_item_is_reported_as_not_found(self):
+        unknown = uuid.uuid4()
+        for quantity in (5, -5):
+            with self.subTest(quantity=quantity):
+                with self.assertRaises(UnknownItemError) as raised:
+                    InventoryRepository.apply_movements([
+                        StockMovement(self.screw.id, -1, 'ADJUSTMENT'),
+                        StockMovement(unknown, quantity, 'ADJUSTMENT'),
+                    ])
+
+                self.assertEqual(raised.exception.item_ids, [str(unknown)])
+                self.assertQuantities(10, 2)
+                self.assertFalse(InventoryTransaction.objects.exists())
+
+    def test_rejects_fractional_quantities(self):
+        for quantity in (-1.5, Decimal('0.25'), '2.5'):
+            with self.subTest(quantity=quantity):
+                with self.assertRaises(ValueError):
+                    InventoryRepository.apply_movements([StockMovement(self.screw.id, quantity, 'ADJUSTMENT')])
+
+                self.assertQuantities(10, 2)
+
+    def test_accepts_whole_quantities_of_any_type(self):
+        InventoryRepository.apply_movements([
+            StockMovement(self.screw.id, -2.0, 'ADJUSTMENT'),
+            StockMovement(self.screw.id, Decimal('3'), 'PURCHASE'),
+            StockMovement(self.board.id, '-1', 'ADJUSTMENT'),
+        ])
+
+        self.assertQuantities(11, 1)
+
+    def test_update_item_quantity_is_guarded_and_recorded(self):
+        item = InventoryRepository.update_item_quantity(self.screw.id, -4)
+
+        self.assertEqual(item.quantity, 6)
+        self.assertEqual(InventoryTransaction.objects.get(item=self.screw).quantity, -4)
+        with self.assertRaises(InsufficientStockError):
+            InventoryRepository.update_item_quantity(self.screw.id, -7)
+        self.assertQuantities(6, 2)
+
+
+class SetItemQuantityTests(TestCase):
+    """Tests for ItemService.update_item_quantity"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.screw = Item.objects.create(
+            name='Screw', sku='TST-SCREW', item_type='RAW', unit_of_measure='pcs', quantity=10
+        )
+
+    def test_books_the_difference_as_an_adjustment(self):
+        item = ItemService().update_item_quantity(str(self.screw.id), 4)
+
+        self.assertEqual(item.quantity, 4)
+        transaction = InventoryTransaction.objects.get(item=self.screw)
+        self.assertEqual((transaction.quantity, transaction.transaction_type), (-6, 'ADJUSTMENT'))
+
+    def test_rejects_negative_and_fractional_quantities(self):
+        for quantity in (-1, 2.5, 'many'):
+            with self.subTest(quantity=quantity):
+                with self.assertRaises(ValueError):
+                    ItemService().update_item_quantity(str(self.screw.id), quantity)
+
+        self.assertEqual(Item.objects.get(id=self.screw.id).quantity, 10)
+        self.assertFalse(InventoryTransaction.objects.exists())
@@ -0,0 +1,131 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from apps.inventory.models import Category, Item
+from apps.users.models import User
+
+
+class ItemListTestCase(APITestCase):
+    """Shared fixtures for the item list endpoint"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='depo', password='secret-1')
+        # Repeated names so that pages split inside a group of equal names
+        cls.items = Item.objects.bulk_create([
+            Item(name=f'Item {index // 3}', sku=f'SKU-{index:03}', item_type='RAW', unit_of_measure='pcs')
+            for index in range(23)
+        ])
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = reverse('item-list')
+
+
+class ItemKeysetPaginationTests(ItemListTestCase):
+    """Tests for cursor round-trips of the item list"""
+
+    def walk(self, url, direction):
+        pages = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            pages.append([row['id'] for row in response.data['data']])
+            url = response.data['pagination'][direction]
+        return pages
+
+    def test_round_trip(self):
+        for ordering, fields in (('name', ('name', 'id')), ('-name', ('-name', '-id')), ('sku', ('sku', 'id'))):
+            with self.subTest(ordering=ordering):
+                expected = [str(pk) for pk in Item.objects.order_by(*fields).values_list('id', flat=True)]
+
+                forward = self.walk(f'{self.url}?ordering={ordering}&page_size=5', 'next')
+                self.assertEqual([len(page) for page in forward], [5, 5, 5, 5, 3])
+                self.assertEqual(sum(forward, []), expected)
+
+                # From the last page back to the first one, the same pages in reverse
+                last_page = self.client.get(f'{self.url}?ordering={ordering}&page_size=5')
+                for _ in forward[1:]:
+                    last_page = self.client.get(last_page.data['pagination']['next'])
+                backward = self.walk(last_page.data['pagination']['previous'], 'previous')
+                self.assertEqual(backward, forward[-2::-1])
+
+    def test_first_page_has_no_previous(self):
+        response = self.client.get(f'{self.url}?page_size=5')
+
+        self.assertIsNone(response.data['pagination']['previous'])
+        self.assertIsNotNone(response.data['pagination']['next'])
+
+    def test_invalid_cursor(self):
+        for cursor in ('not-a-cursor', 'eyJvIjoibmFtZSJ9'):
+            with self.subTest(cursor=cursor):
+                response = self.client.get(f'{self.url}?cursor={cursor}')
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertEqual(response.data['error'], 'Invalid cursor')
+
+    def test_cursor_of_another_ordering_is_rejected(self):
+        cursor_url = self.client.get(f'{self.url}?ordering=sku&page_size=5').data['pagination']['next']
+        cursor = cursor_url.split('cursor=')[1].split('&')[0]
+
+        response = self.client.get(f'{self.url}?ordering=name&cursor={cursor}')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_invalid_ordering(self):
+        response = self.client.get(f'{self.url}?ordering=quantity')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ItemConditionalGetTests(ItemListTestCase):
+    """Tests for ETag revalidation of the item list"""
+
+    def test_unchanged_list_is_not_modified(self):
+        response = self.client.get(self.url)
+        etag = response['ETag']
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_item_change_changes_etag(self):
+        etag = self.client.get(self.url)['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            item = self.items[0]
+            item.name = 'Renamed'
+            item.save()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag']).status_code,
+                         status.HTTP_304_NOT_MODIFIED)
+
+    def test_category_change_changes_etag(self):
+        etag = self.client.get(self.url)['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Category.objects.create(name='Elektronik')
+
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_200_OK)
+
+    def test_etag_depends_on_query(self):
+        etag = self.client.get(self.url)['ETag']
+
+        response = self.client.get(f'{self.url}?ordering=sku', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_uncommitted_change_keeps_etag(self):
+        etag = self.client.get(self.url)['ETag']
+
+        with self.captureOnCommitCallbacks(execute=False):
+            self.items[0].save()
+            self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code,
+                             status.HTTP_304_NOT_MODIFIED)
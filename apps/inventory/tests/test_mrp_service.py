@@ -0,0 +1,236 @@
+import math
+import random
+from collections import defaultdict
+from unittest import mock
+
+from django.test import TestCase
+
+from apps.inventory.models import Item, ProcessItemOutput, ProductionProcess, Recipe, RecipeItem
+from apps.inventory.repositories.bom_graph_repository import BOMGraphRepository
+from apps.inventory.services.mrp_service import OPEN_STATUSES, MRPService
+from apps.projects.models import Project, ProjectInventory
+
+
+def reference_mrp(processes, recipes, allocations, on_hand, raw_items, statuses=OPEN_STATUSES):
+    """
+    Item-by-item MRP with plain dicts, the specification MRPService is checked against.
+
+    Args:
+        processes: (project, item, status, target, produced) tuples
+        recipes: item -> (output quantity, [(input item, quantity, optional)])
+        allocations: (project, item) -> stock held by the project
+        on_hand: item -> shared stock
+        raw_items: Items whose recipe is never exploded
+
+    Returns:
+        dict: item -> (gross, from project stock, from on hand, net)
+    """
+    gross = defaultdict(float)
+    for project, item, status, target, produced in processes:
+        if status in statuses and target > produced:
+            gross[item, project] += target - produced
+    projects = sorted({project for project, *_ in processes})
+
+    def inputs(item):
+        if item in raw_items or item not in recipes:
+            return []
+        output_quantity, lines = recipes[item]
+        return [(child, quantity / output_quantity) for child, quantity, optional in lines if not optional]
+
+    # Low-level code: deepest position below any demanded item
+    level = {}
+
+    def visit(item, depth):
+        if level.get(item, -1) >= depth:
+            return
+        level[item] = depth
+        for child, _ in inputs(item):
+            visit(child, depth + 1)
+
+    for item, _ in list(gross):
+        visit(item, 0)
+
+    result = {}
+    for depth in range(max(level.values(), default=-1) + 1):
+        for item in [item for item, item_level in level.items() if item_level == depth]:
+            remaining = {}
+            covered = 0.0
+            for project in projects:
+                required = gross[item, project]
+                from_project = min(required, allocations.get((project, item), 0))
+                covered += from_project
+                remaining[project] = required - from_project
+            total_remaining = sum(remaining.values())
+            stock = min(total_remaining, max(on_hand.get(item, 0), 0))
+            net = 0.0
+            for project in projects:
+                project_net = remaining[project] * (1 - stock / total_remaining) if total_remaining else 0.0
+                net += project_net
+                for child, per_unit in inputs(item):
+                    gross[child, project] += project_net * per_unit
+            total_gross = sum(gross[item, project] for project in projects)
+            if total_gross > 0:
+                result[item] = (total_gross, covered, stock, net)
+    return result
+
+
+class MRPServiceTests(TestCase):
+    """Tests for MRP netting of open production demand"""
+
+    def setUp(self):
+        # The graph held by this process may belong to another test's data
+        for attribute in ('_graph', '_version', '_checked_at'):
+            patcher = mock.patch.object(BOMGraphRepository, attribute, None)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.service = MRPService()
+
+    def create_item(self, sku, item_type, quantity=0):
+        return Item.objects.create(name=sku, sku=sku, item_type=item_type, unit_of_measure='pcs',
+                                   quantity=quantity)
+
+    def create_recipe(self, output_item, output_quantity, lines):
+        recipe = Recipe.objects.create(name=output_item.sku, output_item=output_item,
+                                       output_quantity=output_quantity, unit_of_measure='pcs')
+        for input_item, quantity, optional in lines:
+            RecipeItem.objects.create(recipe=recipe, input_item=input_item, quantity_required=quantity,
+                                      unit_of_measure='pcs', is_optional=optional)
+
+    def create_process(self, project, item, target, produced=0, status='PLANNED'):
+        process = ProductionProcess.objects.create(
+            project=project, name=f'{item.sku} x{target}', status=status,
+            target_output_item=item, target_output_quantity=target
+        )
+        if produced:
+            ProcessItemOutput.objects.create(process=process, item=item, quantity_produced=produced)
+        return process
+
+    def allocate(self, project, item, quantity):
+        ProjectInventory.objects.create(project=project, item=item, quantity=quantity)
+
+    def by_sku(self, result):
+        return {entry['sku']: entry for entry in result['items']}
+
+    def test_two_level_netting(self):
+        device = self.create_item('DEVICE', 'FINAL', quantity=3)
+        board = self.create_item('BOARD', 'INTERMEDIATE')
+        screw = self.create_item('SCREW', 'RAW', quantity=1)
+        chip = self.create_item('CHIP', 'RAW')
+        case = self.create_item('CASE', 'RAW')
+        self.create_recipe(device, 2, [(board, 3, False), (screw, 1, False)])
+        self.create_recipe(board, 1, [(chip, 4, False), (case, 1, True)])
+        first = Project.objects.create(name='Alpha')
+        second = Project.objects.create(name='Beta')
+        self.create_process(first, device, 10, produced=2)
+        self.create_process(second, device, 4, status='IN_PROGRESS')
+        self.create_process(second, device, 50, status='COMPLETED')
+        self.allocate(first, device, 2)
+        self.allocate(second, chip, 10)
+
+        result = self.service.run()
+        items = self.by_sku(result)
+
+        # 8 + 4 devices; Alpha holds 2 and the 3 on hand cover 30% of the remaining 10
+        self.assertEqual(items['DEVICE']['gross_requirement'], 12)
+        self.assertEqual(items['DEVICE']['from_project_stock'], 2)
+        self.assertEqual(items['DEVICE']['from_on_hand'], 3)
+        self.assertEqual(items['DEVICE']['suggested_production'], 7)
+        # 7 devices in batches of 2
+        self.assertAlmostEqual(items['BOARD']['gross_requirement'], 10.5)
+        self.assertEqual(items['BOARD']['suggested_production'], 11)
+        self.assertAlmostEqual(items['SCREW']['net_requirement'], 2.5)
+        self.assertEqual(items['SCREW']['suggested_purchase'], 3)
+        # Beta's share of the boards (40%) needs 16.8 chips, 10 of which it holds
+        self.assertAlmostEqual(items['CHIP']['gross_requirement'], 42)
+        self.assertAlmostEqual(items['CHIP']['from_project_stock'], 10)
+        self.assertEqual(items['CHIP']['suggested_purchase'], 32)
+        # Optional inputs are not planned
+        self.assertNotIn('CASE', items)
+        self.assertEqual(result['summary']['items_to_produce'], 2)
+        self.assertEqual(result['summary']['items_to_purchase'], 2)
+
+    def test_project_run_ignores_other_projects(self):
+        device = self.create_item('DEVICE', 'FINAL', quantity=4)
+        first = Project.objects.create(name='Alpha')
+        second = Project.objects.create(name='Beta')
+        self.create_process(first, device, 5)
+        self.create_process(second, device, 100)
+
+        items = self.by_sku(self.service.run(project_id=first.id))
+
+        # The whole on-hand stock goes to the only project planned for
+        self.assertEqual(items['DEVICE']['gross_requirement'], 5)
+        self.assertEqual(items['DEVICE']['from_on_hand'], 4)
+        self.assertEqual(items['DEVICE']['suggested_purchase'], 1)
+
+    def test_raw_material_recipe_is_not_exploded(self):
+        wire = self.create_item('WIRE', 'RAW')
+        copper = self.create_item('COPPER', 'RAW')
+        self.create_recipe(wire, 1, [(copper, 2, False)])
+        self.create_process(Project.objects.create(name='Alpha'), wire, 5)
+
+        items = self.by_sku(self.service.run())
+
+        self.assertEqual(items['WIRE']['suggested_purchase'], 5)
+        self.assertNotIn('COPPER', items)
+
+    def test_invalid_status(self):
+        with self.assertRaises(ValueError):
+            self.service.run(statuses=['COMPLETED'])
+
+    def test_matches_reference_on_random_bom(self):
+        rng = random.Random(6)
+        finals = [self.create_item(f'FIN-{index}', 'FINAL', rng.randint(0, 5)) for index in range(3)]
+        intermediates = [self.create_item(f'INT-{index}', 'INTERMEDIATE', rng.randint(0, 8)) for index in range(5)]
+        raws = [self.create_item(f'RAW-{index}', 'RAW', rng.randint(0, 40)) for index in range(8)]
+        # Inputs only come from later positions, so shared sub-assemblies sit at several depths without cycles
+        ordered = finals + intermediates + raws
+        recipes = {}
+        for position, item in enumerate(ordered[:len(finals) + len(intermediates)]):
+            candidates = ordered[max(position + 1, len(finals)):]
+            lines = [(input_item, rng.randint(1, 4), rng.random() < 0.15)
+                     for input_item in rng.sample(candidates, rng.randint(2, 4))]
+            output_quantity = rng.choice([1, 1, 2, 3])
+            self.create_recipe(item, output_quantity, lines)
+            recipes[item.id] = (output_quantity, [(input_item.id, quantity, optional)
+                                                  for input_item, quantity, optional in lines])
+        # A recipe for a raw material is ignored by planning
+        self.create_recipe(raws[0], 1, [(raws[1], 3, False)])
+        recipes[raws[0].id] = (1, [(raws[1].id, 3, False)])
+
+        projects = [Project.objects.create(name=f'Project {index}') for index in range(3)]
+        processes = []
+        for _ in range(12):
+            project = rng.choice(projects)
+            item = rng.choice(finals + intermediates[:2])
+            status = rng.choice(['PLANNED', 'IN_PROGRESS', 'COMPLETED'])
+            target = rng.randint(1, 30)
+            produced = rng.randint(0, target + 3)
+            self.create_process(project, item, target, produced, status)
+            processes.append((project.id, item.id, status, target, produced))
+        allocations = {}
+        for item in rng.sample(ordered, 7):
+            project = rng.choice(projects)
+            quantity = rng.randint(1, 20)
+            self.allocate(project, item, quantity)
+            allocations[project.id, item.id] = quantity
+
+        on_hand = dict(Item.objects.values_list('id', 'quantity'))
+        raw_items = {item.id for item in raws}
+        for statuses in (OPEN_STATUSES, ('IN_PROGRESS',)):
+            with self.subTest(statuses=statuses):
+                expected = reference_mrp(processes, recipes, allocations, on_hand, raw_items, statuses)
+                result = self.service.run(statuses=statuses)
+
+                self.assertGreater(len(expected), len(finals))
+                self.assertEqual({entry['item_id'] for entry in result['items']}, set(expected))
+                for entry in result['items']:
+                    gross, from_project, from_stock, net = expected[entry['item_id']]
+                    self.assertAlmostEqual(entry['gross_requirement'], gross, places=3)
+                    self.assertAlmostEqual(entry['from_project_stock'], from_project, places=3)
+                    self.assertAlmostEqual(entry['from_on_hand'], from_stock, places=3)
+                    self.assertAlmostEqual(entry['net_requirement'], net, places=3)
+                    shortfall = math.ceil(net - 1e-9) if net > 1e-9 else 0
+                    manufactured = entry['item_id'] in recipes and entry['item_id'] not in raw_items
+                    self.assertEqual(entry['suggested_production'], shortfall if manufactured else 0)
+                    self.assertEqual(entry['suggested_purchase'], 0 if manufactured else shortfall)
@@ -0,0 +1,24 @@
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase
+
+from apps.inventory.services.production_service import ProductionService
+
+
+class ScaleRecipeQuantityTests(SimpleTestCase):
+    """Tests for the consumption rule shared by single and batch productions"""
+
+    def scale(self, quantity_required, output_quantity, recipe_output_quantity):
+        return ProductionService.scale_recipe_quantity(
+            SimpleNamespace(quantity_required=quantity_required),
+            output_quantity,
+            SimpleNamespace(output_quantity=recipe_output_quantity)
+        )
+
+    def test_exact_multiples_are_not_rounded(self):
+        self.assertEqual(self.scale(3, 10, 3), 10)
+        self.assertEqual(self.scale(2, 8, 4), 4)
+
+    def test_partial_units_are_rounded_up(self):
+        self.assertEqual(self.scale(2, 5, 4), 3)
+        self.assertEqual(self.scale(1, 1, 3), 1)
@@ -4,12 +4,12 @@ from rest_framework.routers import DefaultRouter
 from apps.inventory.views import (
     CategoryViewSet, ItemViewSet,
     ProductionProcessViewSet, PurchaseOrderLineViewSet,
-    InventoryTransactionViewSet
+    InventoryTransactionViewSet, PriceListViewSet
 )
 from apps.inventory.views.recipe_views import RecipeViewSet, RecipeItemViewSet
 from apps.inventory.views.production_views import ProductionViewSet
 from apps.inventory.views.excel_import_views import (
-    ExcelImportListCreateView, ExcelImportDetailView,
+    ExcelImportListCreateView, ExcelImportDetailView, ExcelImportProgressView,
     ExcelTemplateView, ExcelTemplateInfoView
 )
 
@@ -27,6 +27,7 @@ router.register(r'productions', ProductionViewSet, basename='production')
 router.register(r'production-processes', ProductionProcessViewSet, basename='production-process')
 router.register(r'purchase-order-lines', PurchaseOrderLineViewSet, basename='purchase-order-line')
 router.register(r'inventory-transactions', InventoryTransactionViewSet, basename='inventory-transaction')
+router.register(r'price-lists', PriceListViewSet, basename='price-list')
 
 urlpatterns = [
     path('', include(router.urls)),
@@ -34,6 +35,7 @@ urlpatterns = [
     # Excel import endpoints
     path('excel-imports/', ExcelImportListCreateView.as_view(), name='excel-import-list-create'),
     path('excel-imports/<uuid:import_id>/', ExcelImportDetailView.as_view(), name='excel-import-detail'),
+    path('excel-imports/<uuid:import_id>/progress/', ExcelImportProgressView.as_view(), name='excel-import-progress'),
     path('excel-templates/<str:import_type>/', ExcelTemplateView.as_view(), name='excel-template'),
     path('excel-templates/', ExcelTemplateInfoView.as_view(), name='excel-template-info'),
 ]
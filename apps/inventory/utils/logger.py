@@ -1,7 +1,8 @@
 import logging
-import traceback
 from functools import wraps
 
+from apps.common.utils.metrics import traced
+
 # Create inventory logger
 logger = logging.getLogger('apps.inventory')
 
@@ -16,23 +17,13 @@ def log_exception(func):
             return func(*args, **kwargs)
         except Exception as e:
             # Get calling function details
-            try:
-                module_name = func.__module__
-                class_name = args[0].__class__.__name__ if args else ""
-                func_name = func.__name__
-                caller_info = f"{module_name}.{class_name}.{func_name}"
-            except:
-                caller_info = func.__name__
-            
-            # Get traceback info
-            tb = traceback.format_exc()
-            
-            # Log the error with detailed information
+            class_name = args[0].__class__.__name__ if args else ""
+
+            # Arguments are only formatted if the error is actually written
             logger.error(
-                f"Exception in {caller_info}: {str(e)}\n"
-                f"Args: {args[1:]}\n"
-                f"Kwargs: {kwargs}\n"
-                f"Traceback:\n{tb}"
+                "Exception in %s.%s.%s: %s\nArgs: %r\nKwargs: %r",
+                func.__module__, class_name, func.__name__, e, args[1:], kwargs,
+                exc_info=True
             )
             raise
     return wrapper
@@ -40,29 +31,54 @@ def log_exception(func):
 class LoggerMixin:
     """
     Mixin to add logging capabilities to a class.
+
+    Messages use logging's lazy %-style arguments, so a disabled level costs
+    a level check and nothing else:
+
+        self.log_debug("Getting production with ID: %s", production_id)
+
+    Classes that set ``trace_methods = True`` have every public method they
+    define wrapped with ``traced``, which records its latency, call, error and
+    query counts for the /metrics endpoint.
     """
-    
+    trace_methods = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.__dict__.get('trace_methods', False):
+            trace_class_methods(cls)
+
     @property
     def logger(self):
         # Use class name for logger to help identify source of logs
         if not hasattr(self, '_logger'):
             self._logger = logging.getLogger(f'apps.inventory.{self.__class__.__name__}')
         return self._logger
-    
-    def log_debug(self, message):
-        self.logger.debug(message)
-    
-    def log_info(self, message):
-        self.logger.info(message)
-    
-    def log_warning(self, message):
-        self.logger.warning(message)
-    
-    def log_error(self, message, exc_info=None):
-        if exc_info:
-            self.logger.error(message, exc_info=exc_info)
-        else:
-            self.logger.error(message)
-        
-    def log_exception(self, message):
-        self.logger.exception(message)
\ No newline at end of file
+
+    def log_debug(self, message, *args):
+        self.logger.debug(message, *args)
+
+    def log_info(self, message, *args):
+        self.logger.info(message, *args)
+
+    def log_warning(self, message, *args):
+        self.logger.warning(message, *args)
+
+    def log_error(self, message, *args, exc_info=None):
+        self.logger.error(message, *args, exc_info=exc_info)
+
+    def log_exception(self, message, *args):
+        self.logger.exception(message, *args)
+
+
+def trace_class_methods(cls):
+    """Wrap the public methods defined on a class with ``traced``"""
+    for attribute, value in list(cls.__dict__.items()):
+        if attribute.startswith('_'):
+            continue
+        if isinstance(value, (staticmethod, classmethod)):
+            if getattr(value.__func__, '__traced__', False):
+                continue
+            setattr(cls, attribute, type(value)(traced(value.__func__, service=cls.__name__)))
+        elif callable(value) and not isinstance(value, type) and not getattr(value, '__traced__', False):
+            setattr(cls, attribute, traced(value, service=cls.__name__))
@@ -6,6 +6,7 @@ from apps.inventory.views.production_views import ProductionViewSet
 from apps.inventory.views.production_process_views import ProductionProcessViewSet
 from apps.inventory.views.purchase_order_line_views import PurchaseOrderLineViewSet
 from .inventory_transaction_views import InventoryTransactionViewSet
+from .price_list_views import PriceListViewSet
 
 __all__ = [
     'CategoryViewSet',
@@ -16,4 +17,5 @@ __all__ = [
     'ProductionProcessViewSet',
     'PurchaseOrderLineViewSet',
     'InventoryTransactionViewSet',
+    'PriceListViewSet',
 ]
\ No newline at end of file
@@ -4,20 +4,33 @@ from rest_framework.permissions import IsAuthenticated
 
 from apps.inventory.serializers import (
     CategorySerializer, CategoryListSerializer, 
-    CategoryDetailSerializer, CategoryHierarchySerializer
+    CategoryDetailSerializer
 )
+from apps.inventory.serializers import ItemListSerializer
 from apps.inventory.services import CategoryService
+from apps.inventory.views.item_views import ItemViewSet
+from apps.common.conditional import ConditionalGetMixin
+from apps.common.pagination import KeysetListMixin
+from apps.common.repositories.resource_version_repository import ResourceVersionRepository
 from apps.common.responses import success_response, error_response
 
 
-class CategoryViewSet(viewsets.ViewSet):
+class CategoryViewSet(ConditionalGetMixin, KeysetListMixin, viewsets.ViewSet):
     """API endpoints for managing inventory categories."""
     permission_classes = [IsAuthenticated]
+    etag_resources = ('inventory.Category',)
+    etag_actions = ('list', 'retrieve', 'hierarchy', 'root', 'items')
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.service = CategoryService()
     
+    def get_etag_keys(self, request):
+        keys = super().get_etag_keys(request)
+        if self.action == 'items':
+            keys.append(ResourceVersionRepository.key('inventory.Item'))
+        return keys
+    
     def list(self, request):
         """Get all categories"""
         categories = self.service.get_all_categories()
@@ -130,13 +143,24 @@ class CategoryViewSet(viewsets.ViewSet):
     def hierarchy(self, request):
         """Get hierarchical structure of categories"""
         try:
-            # Get all root categories
-            root_categories = self.service.get_root_categories()
-            # Use the serializer directly on the ORM objects
-            serializer = CategoryHierarchySerializer(root_categories, many=True)
-            return success_response(data=serializer.data)
+            # The tree is built from a single query and cached until a category changes
+            return success_response(data=self.service.get_category_hierarchy())
+        except Exception as e:
+            return error_response(str(e))
+    
+    @action(detail=True, methods=['get'])
+    def items(self, request, pk=None):
+        """Get a page of items in this category and all of its subcategories"""
+        try:
+            items = self.service.get_category_items(pk)
         except Exception as e:
             return error_response(str(e))
+        return self.keyset_list_response(
+            request, items, ItemListSerializer,
+            orderings=ItemViewSet.list_orderings,
+            default_ordering=ItemViewSet.list_default_ordering,
+            filterset_fields=['item_type', 'is_low_stock']
+        )
     
     @action(detail=False, methods=['get'])
     def root(self, request):
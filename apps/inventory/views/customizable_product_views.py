@@ -86,9 +86,8 @@ class MaterialRequirementsView(APIView):
         Expected request body format:
         {
             "quantity": 1,  # Optional, default: 1
-            "component_selections": [  # Optional
+            "component_selections": [  # Optional, optional components to include
                 {
-                    "group": "group_name",
                     "component_id": component_id
                 },
                 ...
@@ -109,7 +108,8 @@ class MaterialRequirementsView(APIView):
         requirements, error = CustomizableProductService.calculate_material_requirements(
             item_id=item_id,
             quantity=quantity,
-            component_selections=component_selections
+            component_selections=component_selections,
+            include_stock=True
         )
         
         if error:
@@ -143,9 +143,8 @@ class ProductionView(APIView):
         Expected request body format:
         {
             "quantity": 1,  # Optional, default: 1
-            "component_selections": [  # Optional
+            "component_selections": [  # Optional, optional components to include
                 {
-                    "group": "group_name",
                     "component_id": component_id
                 },
                 ...
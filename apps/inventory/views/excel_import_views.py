@@ -9,6 +9,7 @@ from apps.inventory.repositories.excel_import_repository import ExcelImportRepos
 from apps.inventory.serializers.excel_import_serializer import (
     ExcelImportSerializer,
     ExcelImportCreateSerializer,
+    ExcelImportProgressSerializer,
     ExcelTemplateInfoSerializer
 )
 import logging
@@ -77,7 +78,9 @@ class ExcelImportDetailView(APIView):
     
     def post(self, request, import_id):
         """
-        Process an Excel import
+        Queue an Excel import for the background worker
+        
+        Returns 202 immediately; progress can be polled from the progress endpoint.
         """
         # Bu noktada project_id gelmiş mi diye kontrol ediyoruz (hem camelCase hem snake_case destekle)
         project_id = request.data.get('projectId') or request.data.get('project_id')
@@ -93,24 +96,29 @@ class ExcelImportDetailView(APIView):
         if error:
             return error_response(error, status.HTTP_404_NOT_FOUND)
         
-        if excel_import.import_type == 'RAW_MATERIALS':
-            result, error = ExcelImportService.process_raw_materials_import(import_id)
-        elif excel_import.import_type == 'BOM':
-            result, error = ExcelImportService.process_bom_import(import_id)
-        elif excel_import.import_type == 'ELECTRONIC_COMPONENTS':
-            result, error = ExcelImportService.process_electronic_components_import(import_id)
-        elif excel_import.import_type == 'PRODUCTS':
-            result, error = ExcelImportService.process_products_import(import_id)
-        else:
-            return error_response('Unsupported import type', status.HTTP_400_BAD_REQUEST)
-        
+        queued_import, error = ExcelImportService.queue_import(import_id)
         if error:
             return error_response(error, status.HTTP_400_BAD_REQUEST)
         
-        # Get updated import data
-        updated_import, _ = ExcelImportService.get_import_by_id(import_id)
-        serializer = ExcelImportSerializer(updated_import)
+        serializer = ExcelImportSerializer(queued_import)
+        return success_response(serializer.data, status.HTTP_202_ACCEPTED)
+
+
+class ExcelImportProgressView(APIView):
+    """
+    API endpoint for polling the progress of a queued Excel import
+    """
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request, import_id):
+        """
+        Get the status and progress counters of an Excel import
+        """
+        excel_import, error = ExcelImportService.get_import_by_id(import_id)
+        if error:
+            return error_response(error, status.HTTP_404_NOT_FOUND)
         
+        serializer = ExcelImportProgressSerializer(excel_import)
         return success_response(serializer.data)
 
 
@@ -1,8 +1,12 @@
-from rest_framework import viewsets, filters
+from rest_framework import viewsets, filters, status
+from rest_framework.decorators import action
 from django_filters.rest_framework import DjangoFilterBackend
+from apps.common.pagination import keyset_rows
 from apps.common.responses import success_response, error_response
+from apps.common.utils.exports import EXPORT_FORMATS, streaming_export_response
 from apps.inventory.serializers import InventoryTransactionSerializer
 from apps.inventory.models import InventoryTransaction
+from apps.inventory.repositories.inventory_repository import UnknownItemError
 from apps.inventory.services.inventory_transaction_service import InventoryTransactionService
 
 
@@ -17,6 +21,16 @@ class InventoryTransactionViewSet(viewsets.ModelViewSet):
     filterset_fields = ['item', 'transaction_type', 'reference_model', 'reference_id']
     search_fields = ['item__name', 'notes']
     ordering_fields = ['transaction_date', 'quantity']
+    export_columns = (
+        ('Tarih', 'transaction_date'),
+        ('SKU', 'item__sku'),
+        ('Ürün', 'item__name'),
+        ('İşlem Tipi', 'transaction_type'),
+        ('Miktar', 'quantity'),
+        ('Referans Model', 'reference_model'),
+        ('Referans ID', 'reference_id'),
+        ('Notlar', 'notes'),
+    )
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -33,6 +47,28 @@ class InventoryTransactionViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(queryset, many=True)
         return success_response(serializer.data)
     
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """
+        Download all transactions matching the list filters, search and ordering
+        as CSV or XLSX (file_type parameter, default xlsx).
+        """
+        file_format = request.query_params.get('file_type', 'xlsx')
+        if file_format not in EXPORT_FORMATS:
+            return error_response(
+                f"Invalid file_type. Must be one of {', '.join(EXPORT_FORMATS)}",
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+        queryset = self.filter_queryset(self.get_queryset())
+        # The primary key makes the list ordering total, as keyset batches need
+        ordering = [*queryset.query.order_by]
+        ordering.append('-id' if ordering and ordering[-1].startswith('-') else 'id')
+        rows = keyset_rows(queryset, ordering, [lookup for _, lookup in self.export_columns])
+        return streaming_export_response(
+            file_format, 'inventory_transactions', [title for title, _ in self.export_columns], rows,
+            sheet_name='Inventory Transactions'
+        )
+    
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
         serializer = self.get_serializer(instance)
@@ -42,7 +78,12 @@ class InventoryTransactionViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(data=request.data)
         if serializer.is_valid():
             # Use service layer to handle business logic, including updating item quantity
-            transaction = self.service.create_transaction(serializer.validated_data)
+            try:
+                transaction = self.service.create_transaction(serializer.validated_data)
+            except UnknownItemError as e:
+                return error_response(str(e), status_code=status.HTTP_404_NOT_FOUND)
+            except ValueError as e:
+                return error_response(str(e), status_code=status.HTTP_400_BAD_REQUEST)
             response_serializer = self.get_serializer(transaction)
             return success_response(response_serializer.data, status=201)
         return error_response(serializer.errors, status=400)
@@ -1,27 +1,41 @@
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated
 
 from apps.inventory.serializers import (
-    ItemSerializer, ItemListSerializer, ItemDetailSerializer, ItemCreateUpdateSerializer
+    ItemSerializer, ItemListSerializer, ItemDetailSerializer, ItemCreateUpdateSerializer,
+    LowStockItemSerializer
 )
+from apps.projects.serializers.project_inventory_serializer import ProjectInventoryDetailSerializer
 from apps.inventory.services import ItemService
+from apps.common.conditional import ConditionalGetMixin
+from apps.common.pagination import KeysetListMixin
 from apps.common.responses import success_response, error_response
 
 
-class ItemViewSet(viewsets.ViewSet):
+class ItemViewSet(ConditionalGetMixin, KeysetListMixin, viewsets.ViewSet):
     """API endpoints for managing inventory items."""
     permission_classes = [IsAuthenticated]
+    etag_resources = ('inventory.Item', 'inventory.Category')
+    list_orderings = {
+        'name': ('name', 'id'),
+        '-name': ('-name', '-id'),
+        'sku': ('sku', 'id'),
+        '-created_at': ('-created_at', '-id'),
+    }
+    list_default_ordering = 'name'
+    list_filterset_fields = ['item_type', 'category', 'is_low_stock']
+    query_budget = {'list': 3, 'retrieve': 3}
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.service = ItemService()
     
     def list(self, request):
-        """Get all items"""
+        """Get a page of items, filtered by item_type, category or is_low_stock"""
         items = self.service.get_all_items()
-        serializer = ItemListSerializer(items, many=True)
-        return success_response(data=serializer.data)
+        return self.keyset_list_response(request, items, ItemListSerializer)
     
     def retrieve(self, request, pk=None):
         """Get a specific item by ID"""
@@ -205,6 +219,26 @@ class ItemViewSet(viewsets.ViewSet):
         except Exception as e:
             return error_response(str(e))
     
+    @action(detail=False, methods=['get'])
+    def low_stock(self, request):
+        """Get a page of items at or below their minimum stock level, optionally for a project"""
+        try:
+            project_id = request.query_params.get('project_id')
+            items = self.service.get_low_stock_items(project_id)
+            
+            paginator = PageNumberPagination()
+            page = paginator.paginate_queryset(items, request, view=self)
+            serializer_class = ProjectInventoryDetailSerializer if project_id else LowStockItemSerializer
+            serializer = serializer_class(page, many=True)
+            return success_response(data={
+                'count': paginator.page.paginator.count,
+                'next': paginator.get_next_link(),
+                'previous': paginator.get_previous_link(),
+                'results': serializer.data
+            })
+        except Exception as e:
+            return error_response(str(e))
+    
     @action(detail=True, methods=['get'])
     def get_quantity(self, request, pk=None):
         """Get the current quantity of an item"""
@@ -222,12 +256,7 @@ class ItemViewSet(viewsets.ViewSet):
             if quantity is None:
                 return error_response('quantity parameter is required')
                 
-            try:
-                quantity = int(quantity)
-            except ValueError:
-                return error_response('quantity must be an integer')
-                
-            item = self.service.update_item_quantity(pk, quantity)
+            item = self.service.update_item_quantity(pk, quantity, performed_by=request.user)
             serializer = ItemDetailSerializer(item)
             return success_response(data=serializer.data)
         except Exception as e:
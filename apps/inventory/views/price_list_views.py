@@ -0,0 +1,60 @@
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+
+from apps.common.conditional import ConditionalGetMixin
+from apps.common.responses import success_response, error_response
+from apps.common.utils.exports import streaming_export_response
+from apps.inventory.repositories.price_list_repository import PRICE_LISTS, PriceListRepository
+from apps.inventory.services import PriceListService
+
+
+class PriceListViewSet(ConditionalGetMixin, viewsets.ViewSet):
+    """
+    API endpoints for the customer and dealer sales price lists.
+
+    /price-lists/customer/ and /price-lists/dealer/ return the current
+    snapshot of a list; /price-lists/<list>/download/?file_type=csv|xlsx
+    streams it as a file.
+    """
+    permission_classes = [IsAuthenticated]
+    etag_actions = ('retrieve', 'download')
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.service = PriceListService()
+    
+    def get_etag_keys(self, request):
+        return [PriceListRepository.version_key(self.kwargs.get('pk'))]
+    
+    def _not_found(self, pk):
+        return error_response(
+            f"Invalid price list: {pk}. Must be one of {', '.join(PRICE_LISTS)}",
+            status_code=status.HTTP_404_NOT_FOUND
+        )
+    
+    def list(self, request):
+        """Get the available price lists"""
+        return success_response(data=[
+            {'list': kind, 'version': PriceListRepository.get_version(kind)} for kind in PRICE_LISTS
+        ])
+    
+    def retrieve(self, request, pk=None):
+        """Get the snapshot of a price list"""
+        if pk not in PRICE_LISTS:
+            return self._not_found(pk)
+        return success_response(data=self.service.get_price_list(pk))
+    
+    @action(detail=True, methods=['get'])
+    def download(self, request, pk=None):
+        """Download a price list as CSV or XLSX (file_type parameter, default xlsx)"""
+        if pk not in PRICE_LISTS:
+            return self._not_found(pk)
+        file_format = request.query_params.get('file_type', 'xlsx')
+        try:
+            header, rows = self.service.get_export_rows(pk, file_format)
+        except ValueError as e:
+            return error_response(str(e))
+        return streaming_export_response(
+            file_format, f'{pk}_price_list', header, rows, sheet_name=f'{pk.title()} Price List'
+        )
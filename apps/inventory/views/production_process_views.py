@@ -8,13 +8,15 @@ from apps.inventory.serializers import (
     ProcessItemInputDetailSerializer, ProcessItemOutputSerializer,
     ProcessItemOutputDetailSerializer, ProductionProcessSummarySerializer
 )
-from apps.inventory.services import ProductionProcessService
+from apps.inventory.services import ProductionProcessService, MRPService
+from apps.inventory.services.mrp_service import OPEN_STATUSES
 from apps.common.responses import success_response, error_response
 
 
 class ProductionProcessViewSet(viewsets.ViewSet):
     """API endpoints for managing Production Processes."""
     permission_classes = [IsAuthenticated]
+    query_budget = {'list': 3}
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -83,6 +85,23 @@ class ProductionProcessViewSet(viewsets.ViewSet):
         except Exception as e:
             return error_response(str(e))
     
+    @action(detail=False, methods=['get'])
+    def mrp(self, request):
+        """
+        Net material requirements of the planned and in-progress processes.
+        
+        Query params:
+            project_id: Only plan for this project's processes
+            status: Comma separated subset of PLANNED,IN_PROGRESS (default both)
+        """
+        statuses = request.query_params.get('status')
+        statuses = [value.strip().upper() for value in statuses.split(',') if value.strip()] if statuses else OPEN_STATUSES
+        try:
+            result = MRPService().run(project_id=request.query_params.get('project_id'), statuses=statuses)
+            return success_response(data=result)
+        except Exception as e:
+            return error_response(str(e))
+    
     @action(detail=True, methods=['get'])
     def details(self, request, pk=None):
         """Get detailed information about a production process including inputs and outputs"""
@@ -9,7 +9,7 @@ from apps.inventory.models.production_item import ProductionItem
 from apps.inventory.models.production_history import ProductionHistory
 from apps.inventory.serializers.production_serializers import (
     ProductionSerializer, ProductionDetailSerializer, ProductionCreateSerializer, ProductionUpdateSerializer,
-    ProductionItemSerializer, ProductionHistorySerializer
+    ProductionItemSerializer, ProductionHistorySerializer, ProductionBatchCreateSerializer
 )
 from apps.inventory.services.production_service import ProductionService
 from apps.inventory.utils.logger import LoggerMixin
@@ -48,22 +48,22 @@ class ProductionViewSet(viewsets.ModelViewSet, LoggerMixin):
             filters = {}
             if 'recipe_id' in request.query_params:
                 filters['recipe_id'] = request.query_params.get('recipe_id')
-                self.log_debug(f"Filtering by recipe ID: {filters['recipe_id']}")
+                self.log_debug("Filtering by recipe ID: %s", filters['recipe_id'])
                 
             if 'executed_by_id' in request.query_params:
                 filters['executed_by_id'] = request.query_params.get('executed_by_id')
-                self.log_debug(f"Filtering by user ID: {filters['executed_by_id']}")
+                self.log_debug("Filtering by user ID: %s", filters['executed_by_id'])
                 
             if 'date_from' in request.query_params:
                 filters['date_from'] = request.query_params.get('date_from')
-                self.log_debug(f"Filtering by date from: {filters['date_from']}")
+                self.log_debug("Filtering by date from: %s", filters['date_from'])
                 
             if 'date_to' in request.query_params:
                 filters['date_to'] = request.query_params.get('date_to')
-                self.log_debug(f"Filtering by date to: {filters['date_to']}")
+                self.log_debug("Filtering by date to: %s", filters['date_to'])
             
             # Use service to get productions
-            self.log_debug(f"Calling service with filters: {filters}")
+            self.log_debug("Calling service with filters: %s", filters)
             service_response = self.get_service().get_all_productions(filters)
             
             # Extract data directly from ApiResponse
@@ -73,7 +73,7 @@ class ProductionViewSet(viewsets.ModelViewSet, LoggerMixin):
             # If successful, serialize and return data
             if response_data.get('data') is not None:
                 serializer = self.get_serializer(response_data.get('data'), many=True)
-                self.log_debug(f"Returning {len(serializer.data)} productions")
+                self.log_debug("Returning %s productions", len(serializer.data))
                 return Response({
                     'data': serializer.data,
                     'error': None,
@@ -81,12 +81,12 @@ class ProductionViewSet(viewsets.ModelViewSet, LoggerMixin):
                 }, status=status_code)
             
             # Otherwise return the error response directly
-            self.log_warning(f"Service returned error: {response_data.get('error')}")
+            self.log_warning("Service returned error: %s", response_data.get('error'))
             return service_response
         except Exception as e:
-            self.log_exception(f"Exception in list view: {str(e)}")
+            self.log_exception("Exception in list view: %s", e)
             tb = traceback.format_exc()
-            self.log_error(f"Traceback: {tb}")
+            self.log_error("Traceback: %s", tb)
             return Response({
                 'data': None,
                 'error': str(e),
@@ -96,7 +96,7 @@ class ProductionViewSet(viewsets.ModelViewSet, LoggerMixin):
     def retrieve(self, request, *args, **kwargs):
         try:
             production_id = kwargs.get('pk')
-            self.log_info(f"Retrieving production with ID: {production_id}")
+            self.log_info("Retrieving production with ID: %s", production_id)
             
             service_response = self.get_service().get_production_by_id(production_id)
             
@@ -107,7 +107,7 @@ class ProductionViewSet(viewsets.ModelViewSet, LoggerMixin):
             # If successful, serialize and return data
             if response_data.get('data') is not None:
                 serializer = self.get_serializer(response_data.get('data'))
-                self.log_debug(f"Successfully retrieved production: {production_id}")
+                self.log_debug("Successfully retrieved production: %s", production_id)
                 return Response({
                     'data': serializer.data,
                     'error': None,
@@ -115,12 +115,12 @@ class ProductionViewSet(viewsets.ModelViewSet, LoggerMixin):
                 }, status=status_code)
             
             # Otherwise return the error response directly
-            self.log_warning(f"Service returned error for production {production_id}: {response_data.get('error')}")
+            self.log_warning("Service returned error for production %s: %s", production_id, response_data.get('error'))
             return service_response
         except Exception as e:
-            self.log_exception(f"Exception in retrieve view for production {kwargs.get('pk')}: {str(e)}")
+            self.log_exception("Exception in retrieve view for production %s: %s", kwargs.get('pk'), e)
             tb = traceback.format_exc()
-            self.log_error(f"Traceback: {tb}")
+            self.log_error("Traceback: %s", tb)
             return Response({
                 'data': None,
                 'error': str(e),
@@ -129,7 +129,7 @@ class ProductionViewSet(viewsets.ModelViewSet, LoggerMixin):
     
     def create(self, request, *args, **kwargs):
         try:
-            self.log_info(f"Creating new production with data: {request.data}")
+            self.log_info("Creating new production with data: %s", request.data)
             
             # Authentication check
             if not request.user or not request.user.is_authenticated:
@@ -146,14 +146,14 @@ class ProductionViewSet(viewsets.ModelViewSet, LoggerMixin):
             
             # Log validation details if there are errors
             if not serializer.is_valid():
-                self.log_error(f"Validation errors: {serializer.errors}")
+                self.log_error("Validation errors: %s", serializer.errors)
                 return Response({
                     'data': None, 
                     'error': serializer.errors, 
                     'status': status.HTTP_400_BAD_REQUEST
                 }, status=status.HTTP_400_BAD_REQUEST)
             
-            self.log_debug(f"Data validation successful. Calling service with validated data: {serializer.validated_data}")
+            self.log_debug("Data validation successful. Calling service with validated data: %s", serializer.validated_data)
             
             # Call service with validated data
             service_response = self.get_service().create_production(serializer.validated_data, request.user)
@@ -165,7 +165,7 @@ class ProductionViewSet(viewsets.ModelViewSet, LoggerMixin):
             # If successful, serialize and return data
             if response_data.get('data') is not None:
                 result_serializer = ProductionDetailSerializer(response_data.get('data'))
-                self.log_info(f"Production created successfully with ID: {result_serializer.data.get('id')}")
+                self.log_info("Production created successfully with ID: %s", result_serializer.data.get('id'))
                 return Response({
                     'data': result_serializer.data,
                     'error': None,
@@ -173,12 +173,12 @@ class ProductionViewSet(viewsets.ModelViewSet, LoggerMixin):
                 }, status=status_code)
             
             # Otherwise return the error response directly
-            self.log_warning(f"Service returned error during creation: {response_data.get('error')}")
+            self.log_warning("Service returned error during creation: %s", response_data.get('error'))
             return service_response
         except Exception as e:
-            self.log_exception(f"Exception in create view: {str(e)}")
+            self.log_exception("Exception in create view: %s", e)
             tb = traceback.format_exc()
-            self.log_error(f"Traceback: {tb}")
+            self.log_error("Traceback: %s", tb)
             return Response({
                 'data': None,
                 'error': str(e),
@@ -218,6 +218,53 @@ class ProductionViewSet(viewsets.ModelViewSet, LoggerMixin):
                 'status': status.HTTP_500_INTERNAL_SERVER_ERROR
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
+    @action(detail=False, methods=['post'], url_path='batch')
+    def batch(self, request):
+        """
+        Create many productions in one request.
+        
+        Expected request body format:
+        {
+            "mode": "all_or_nothing" | "best_effort",  # Optional, default: all_or_nothing
+            "productions": [
+                {
+                    "recipe": recipe_id,
+                    "output_quantity": 10,
+                    "notes": "...",  # Optional
+                    "consumed_items": [  # Optional, defaults to the recipe items
+                        {"input_item": item_id, "quantity_consumed": 5, "unit_of_measure": "pcs"},
+                        ...
+                    ]
+                },
+                ...
+            ]
+        }
+        """
+        try:
+            self.log_info("Creating production batch")
+            
+            serializer = ProductionBatchCreateSerializer(data=request.data)
+            if not serializer.is_valid():
+                self.log_error("Validation errors: %s", serializer.errors)
+                return Response({
+                    'data': None,
+                    'error': serializer.errors,
+                    'status': status.HTTP_400_BAD_REQUEST
+                }, status=status.HTTP_400_BAD_REQUEST)
+            
+            return self.get_service().create_productions_batch(
+                serializer.validated_data['productions'],
+                request.user,
+                mode=serializer.validated_data['mode']
+            )
+        except Exception as e:
+            self.log_exception("Exception in batch view: %s", e)
+            return Response({
+                'data': None,
+                'error': str(e),
+                'status': status.HTTP_500_INTERNAL_SERVER_ERROR
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    
     @action(detail=True, methods=['get'], url_path='history')
     def production_history(self, request, pk=None):
         """Get history records for a production"""
@@ -9,10 +9,13 @@ from apps.inventory.serializers.recipe_serializers import (
     RecipeItemSerializer, RecipeItemCreateUpdateSerializer
 )
 from apps.inventory.services.recipe_service import RecipeService
+from apps.common.conditional import ConditionalGetMixin
 
 
-class RecipeViewSet(viewsets.ModelViewSet):
+class RecipeViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """ViewSet for Recipe operations"""
+    etag_resources = ('inventory.Recipe', 'inventory.RecipeItem', 'inventory.Item')
+    etag_actions = ('list', 'retrieve', 'recipe_items')
     queryset = Recipe.objects.all()
     serializer_class = RecipeSerializer
     filterset_fields = ['name', 'output_item_id', 'active']
@@ -205,13 +208,15 @@ class RecipeViewSet(viewsets.ModelViewSet):
             return Response({'success': False, 'message': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-class RecipeItemViewSet(viewsets.ModelViewSet):
+class RecipeItemViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """ViewSet for RecipeItem operations"""
-    queryset = RecipeItem.objects.all()
+    etag_resources = ('inventory.RecipeItem', 'inventory.Item')
+    queryset = RecipeItem.objects.select_related('input_item')
     serializer_class = RecipeItemSerializer
     filterset_fields = ['recipe_id', 'input_item_id']
     ordering_fields = ['sequence', 'created_at']
     ordering = ['sequence']
+    query_budget = {'list': 3}
     
     def get_serializer_class(self):
         if self.action in ['create', 'update', 'partial_update']:
@@ -1,6 +1,6 @@
 from apps.common.repositories.base_repository import BaseRepository
+from apps.inventory.models.item import LOW_STOCK_CONDITION
 from apps.projects.models import ProjectInventory
-from django.db import models
 
 
 class ProjectInventoryRepository(BaseRepository):
@@ -8,6 +8,7 @@ class ProjectInventoryRepository(BaseRepository):
     Repository for ProjectInventory model operations.
     Follows the repository pattern for data access abstraction.
     """
+    list_select_related = ('project', 'item')
     
     def __init__(self):
         super().__init__(ProjectInventory)
@@ -31,9 +32,48 @@ class ProjectInventoryRepository(BaseRepository):
         
         return self.filter(**filters)
     
+    def get_inventory_by_items(self, project_id, item_ids):
+        """
+        Get project inventory entries keyed by item ID for the given items.
+        
+        Args:
+            project_id (uuid): Project ID
+            item_ids (iterable): Item IDs to look up
+            
+        Returns:
+            dict: Item ID -> ProjectInventory
+        """
+        return {
+            entry.item_id: entry
+            for entry in self.filter(project=project_id, item_id__in=list(item_ids)).order_by()
+        }
+    
+    def get_allocations(self, project_ids):
+        """
+        Get the stock held by the given projects.
+        
+        Args:
+            project_ids (iterable): Project IDs
+            
+        Returns:
+            list: (project ID, item ID, quantity) tuples for positive quantities
+        """
+        return list(
+            self.filter(project_id__in=list(project_ids), quantity__gt=0)
+            .order_by()
+            .values_list('project_id', 'item_id', 'quantity')
+        )
+    
+    def bulk_save_inventory(self, entries, batch_size=None):
+        """Insert new project inventory entries and write quantities of existing ones in batches"""
+        return self.bulk_upsert(entries, ['quantity', 'updated_at'], batch_size=batch_size)
+    
     def get_low_stock_items(self, project_id):
         """
-        Get project inventory items with stock level below minimum.
+        Get project inventory items at or below their minimum stock level.
+        
+        Uses the same rule as the item variant (LOW_STOCK_CONDITION): only
+        rows with a minimum stock level above zero can be low.
         
         Args:
             project_id (uuid): Project ID
@@ -41,10 +81,7 @@ class ProjectInventoryRepository(BaseRepository):
         Returns:
             QuerySet: Low stock items for the project
         """
-        return self.filter(
-            project=project_id,
-            quantity__lt=models.F('minimum_stock_level')
-        )
+        return self.model.objects.filter(LOW_STOCK_CONDITION, project=project_id).select_related('project', 'item').order_by('item__name', 'id')
     
     def update_quantity(self, project_id, item_id, quantity_change):
         """
@@ -22,7 +22,7 @@ class ProjectInventoryService:
         Returns:
             QuerySet: All project inventory items
         """
-        return self.repository.list()
+        return self.repository.for_list()
         
     def get_project_inventory_by_id(self, inventory_id):
         """
@@ -47,11 +47,13 @@ class ProjectInventoryService:
         Returns:
             QuerySet or ProjectInventory: Project inventory items
         """
-        return self.repository.get_project_inventory(project_id, item_id)
+        if item_id:
+            return self.repository.get_project_inventory(project_id, item_id)
+        return self.repository.for_list(self.repository.get_project_inventory(project_id))
     
     def get_low_stock_items(self, project_id):
         """
-        Get project inventory items with stock below minimum level.
+        Get project inventory items at or below their minimum stock level.
         
         Args:
             project_id (int): Project ID
@@ -1,25 +1,42 @@
+import uuid
+
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
+from apps.common.conditional import ConditionalGetMixin
+from apps.common.repositories.resource_version_repository import ResourceVersionRepository
 from apps.common.responses import success_response, error_response
 from apps.projects.serializers.project_inventory_serializer import (
     ProjectInventorySerializer, ProjectInventoryDetailSerializer
 )
 from apps.projects.services.project_inventory_service import ProjectInventoryService
 
-class ProjectInventoryViewSet(viewsets.ViewSet):
+class ProjectInventoryViewSet(ConditionalGetMixin, viewsets.ViewSet):
     """
     Proje envanter işlemleri için katmanlı mimariye uygun ViewSet.
     Tüm iş mantığı servis katmanında, DB işlemleri repository katmanında.
     """
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['project', 'item']
+    query_budget = {'list': 3}
+    etag_resources = ('projects.ProjectInventory', 'projects.Project', 'inventory.Item')
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.service = ProjectInventoryService()
 
+    def get_etag_keys(self, request):
+        keys = super().get_etag_keys(request)
+        project_id = request.query_params.get('project')
+        if self.action == 'list' and project_id:
+            # A project's list only changes with that project's inventory
+            try:
+                keys[0] = ResourceVersionRepository.key('projects.ProjectInventory', project=uuid.UUID(project_id))
+            except ValueError:
+                pass
+        return keys
+
     def get_serializer_class(self):
         if self.action in ['retrieve', 'list']:
             return ProjectInventoryDetailSerializer
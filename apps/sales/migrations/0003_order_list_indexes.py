@@ -0,0 +1,24 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dealers", "0003_dealer_list_indexes"),
+        ("sales", "0002_alter_order_options_alter_device_table_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(fields=["created_at", "id"], name="order_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["status", "created_at", "id"], name="order_status_created_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:42
+
+import calendar
+
+from django.db import migrations, models
+
+
+def populate_warranty_end_date(apps, schema_editor):
+    """Purchase date plus the warranty period in calendar months (see apps.sales.models.device.add_months)"""
+    Device = apps.get_model("sales", "Device")
+    devices = []
+    for device in Device.objects.filter(purchase_date__isnull=False).only(
+        "id", "purchase_date", "warranty_period_months"
+    ).iterator(chunk_size=2000):
+        day = device.purchase_date
+        month_index = day.month - 1 + (device.warranty_period_months or 0)
+        year, month = day.year + month_index // 12, month_index % 12 + 1
+        device.warranty_end_date = day.replace(
+            year=year, month=month, day=min(day.day, calendar.monthrange(year, month)[1])
+        )
+        devices.append(device)
+    Device.objects.bulk_update(devices, ["warranty_end_date"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0013_category_materialized_path"),
+        ("sales", "0003_order_list_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="device",
+            name="warranty_end_date",
+            field=models.DateField(
+                blank=True, editable=False, null=True, verbose_name="Warranty End Date"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="device",
+            index=models.Index(
+                fields=["warranty_end_date", "id"], name="device_warranty_end_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="device",
+            index=models.Index(
+                fields=["item", "warranty_end_date"],
+                name="device_item_warranty_end_idx",
+            ),
+        ),
+        migrations.RunPython(populate_warranty_end_date, migrations.RunPython.noop),
+    ]
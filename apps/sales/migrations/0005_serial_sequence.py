@@ -0,0 +1,84 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:44
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0013_category_materialized_path"),
+        ("sales", "0004_device_warranty_end_date"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="device",
+            name="production",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="devices",
+                to="inventory.production",
+                verbose_name="Production",
+            ),
+        ),
+        migrations.CreateModel(
+            name="SerialSequence",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Created At"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="Updated At"),
+                ),
+                (
+                    "deleted_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="Deleted At"
+                    ),
+                ),
+                (
+                    "is_active",
+                    models.BooleanField(default=True, verbose_name="Is Active"),
+                ),
+                ("prefix", models.CharField(max_length=60, verbose_name="Prefix")),
+                (
+                    "width",
+                    models.PositiveSmallIntegerField(default=6, verbose_name="Width"),
+                ),
+                (
+                    "next_value",
+                    models.PositiveBigIntegerField(
+                        default=1, verbose_name="Next Value"
+                    ),
+                ),
+                (
+                    "item",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="serial_sequence",
+                        to="inventory.item",
+                        verbose_name="Item",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Serial Sequence",
+                "verbose_name_plural": "Serial Sequences",
+            },
+        ),
+    ]
@@ -1,11 +1,15 @@
 from apps.sales.models.device import Device
+from apps.sales.models.serial_sequence import SerialSequence
 from apps.sales.models.quotation import Quotation, QuotationItem, QuotationStatus
 from apps.sales.models.order import Order, OrderItem, OrderStatus, CurrencyType
 from apps.sales.models.commission import OrderCommission, CommissionType
+from apps.sales.models.totals import defer_totals, schedule_totals
 
 __all__ = [
     'Device',
+    'SerialSequence',
     'Quotation', 'QuotationItem', 'QuotationStatus',
     'Order', 'OrderItem', 'OrderStatus', 'CurrencyType',
-    'OrderCommission', 'CommissionType'
+    'OrderCommission', 'CommissionType',
+    'defer_totals', 'schedule_totals'
 ]
\ No newline at end of file
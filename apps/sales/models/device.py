@@ -1,7 +1,25 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from apps.common.models.base_model import BaseModel
-from datetime import date, timedelta
+import calendar
+from datetime import date
+
+# Fields the stored warranty end date is derived from
+WARRANTY_FIELDS = {'purchase_date', 'warranty_period_months'}
+
+
+def add_months(day, months):
+    """Same day ``months`` calendar months later, clamped to the last day of shorter months"""
+    month_index = day.month - 1 + months
+    year, month = day.year + month_index // 12, month_index % 12 + 1
+    return day.replace(year=year, month=month, day=min(day.day, calendar.monthrange(year, month)[1]))
+
+
+def warranty_end(purchase_date, warranty_period_months):
+    """Last day of the warranty, or None without a purchase date"""
+    if not purchase_date:
+        return None
+    return add_months(purchase_date, warranty_period_months or 0)
 
 
 class Device(BaseModel):
@@ -14,6 +32,8 @@ class Device(BaseModel):
         serial_number: Unique serial number of the device
         purchase_date: Date when the device was purchased
         warranty_period_months: Warranty period in months
+        warranty_end_date: Purchase date plus the warranty period, kept in sync on save
+        production: The production run the device was registered from, if any
         notes: Additional notes about the device
     """
     item = models.ForeignKey(
@@ -26,26 +46,40 @@ class Device(BaseModel):
     serial_number = models.CharField(_("Serial Number"), max_length=100, unique=True)
     purchase_date = models.DateField(_("Purchase Date"), blank=True, null=True)
     warranty_period_months = models.PositiveIntegerField(_("Warranty Period (Months)"), default=24)
+    warranty_end_date = models.DateField(_("Warranty End Date"), blank=True, null=True, editable=False)
+    production = models.ForeignKey(
+        'inventory.Production',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='devices',
+        verbose_name=_('Production')
+    )
     notes = models.TextField(_("Notes"), blank=True, null=True)
     
     class Meta:
         verbose_name = _("Device")
         verbose_name_plural = _("Devices")
+        indexes = [
+            # Expiry windows ("warranty ends in the next 30 days") and in/out of warranty filters
+            models.Index(fields=['warranty_end_date', 'id'], name='device_warranty_end_idx'),
+            models.Index(fields=['item', 'warranty_end_date'], name='device_item_warranty_end_idx'),
+        ]
     
     def __str__(self):
         return f"{self.item.name} - {self.serial_number}"
     
-    @property
-    def warranty_end_date(self):
-        """Calculate warranty end date"""
-        if not self.purchase_date:
-            return None
-        return self.purchase_date + timedelta(days=30 * self.warranty_period_months)
+    def save(self, *args, **kwargs):
+        self.warranty_end_date = warranty_end(self.purchase_date, self.warranty_period_months)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and WARRANTY_FIELDS & set(update_fields):
+            kwargs['update_fields'] = set(update_fields) | {'warranty_end_date'}
+        super().save(*args, **kwargs)
     
     @property
     def is_in_warranty(self):
         """Check if device is still in warranty"""
-        if not self.purchase_date:
+        if not self.warranty_end_date:
             return False
         return date.today() <= self.warranty_end_date
     
@@ -1,6 +1,10 @@
+from decimal import Decimal
+
 from django.db import models
+from django.db.models import Sum
 from django.utils.translation import gettext_lazy as _
 from apps.common.models.base_model import BaseModel
+from apps.sales.models.totals import schedule_totals
 
 
 class OrderStatus(models.TextChoices):
@@ -74,24 +78,27 @@ class Order(BaseModel):
         verbose_name = _("Order")
         verbose_name_plural = _("Orders")
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='order_created_idx'),
+            models.Index(fields=['status', 'created_at', 'id'], name='order_status_created_idx'),
+        ]
     
     def __str__(self):
         return f"Order #{self.order_number} - {self.dealer.name}"
     
     def calculate_total_price(self):
-        """Calculate total price from order items"""
-        total = sum(item.total_price for item in self.items.all())
-        self.total_price = total
-        
-        # Calculate VAT and grand total
-        self.calculate_vat()
+        """Calculate total price, VAT and grand total from order items in a single aggregate"""
+        totals = self.items.aggregate(total=Sum('total_price'), vat=Sum('vat_amount'))
+        self.total_price = (totals['total'] or Decimal('0')).quantize(Decimal('0.01'))
+        self.vat_amount = (totals['vat'] or Decimal('0')).quantize(Decimal('0.01'))
+        self.grand_total = self.total_price + self.vat_amount
         super().save(update_fields=['total_price', 'vat_amount', 'grand_total'])
-        return total
+        return self.total_price
     
     def calculate_vat(self):
         """Calculate VAT amount and grand total"""
         # Calculate VAT amount from items
-        self.vat_amount = sum(item.vat_amount for item in self.items.all())
+        self.vat_amount = (self.items.aggregate(vat=Sum('vat_amount'))['vat'] or Decimal('0')).quantize(Decimal('0.01'))
         # Grand total is the sum of total price and VAT amount
         self.grand_total = self.total_price + self.vat_amount
         return self.vat_amount
@@ -144,14 +151,14 @@ class OrderItem(BaseModel):
     def calculate_discounted_price(self):
         """Calculate discounted price after applying both discounts"""
         # First apply the regular discount
-        price_after_discount = self.unit_price * (1 - (self.discount_percentage / 100))
+        price_after_discount = self.unit_price * (1 - (self.discount_percentage / Decimal(100)))
         # Then apply the dealer discount
-        self.discounted_price = price_after_discount * (1 - (self.dealer_discount_percentage / 100))
+        self.discounted_price = price_after_discount * (1 - (self.dealer_discount_percentage / Decimal(100)))
         return self.discounted_price
     
     def calculate_vat_amount(self):
         """Calculate VAT amount for this item"""
-        self.vat_amount = (self.discounted_price * self.quantity) * (self.vat_percentage / 100)
+        self.vat_amount = (self.discounted_price * self.quantity) * (self.vat_percentage / Decimal(100))
         return self.vat_amount
     
     def calculate_total_price(self):
@@ -159,12 +166,17 @@ class OrderItem(BaseModel):
         self.total_price = self.discounted_price * self.quantity
         return self.total_price
     
-    def save(self, *args, **kwargs):
-        # Calculate all prices and amounts before saving
+    def calculate_prices(self):
+        """Calculate discounted price, line total and VAT in memory"""
         self.calculate_discounted_price()
         self.calculate_total_price()
         self.calculate_vat_amount()
+    
+    def save(self, *args, **kwargs):
+        # Calculate all prices and amounts before saving
+        self.calculate_prices()
         super().save(*args, **kwargs)
         
-        # Update order total
-        self.order.calculate_total_price()
\ No newline at end of file
+        # Update order total, unless it is deferred to the end of a bulk write
+        if not schedule_totals(self.order):
+            self.order.calculate_total_price()
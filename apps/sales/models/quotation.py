@@ -1,6 +1,10 @@
+from decimal import Decimal
+
 from django.db import models
+from django.db.models import Sum
 from django.utils.translation import gettext_lazy as _
 from apps.common.models.base_model import BaseModel
+from apps.sales.models.totals import schedule_totals
 
 
 class QuotationStatus(models.TextChoices):
@@ -54,8 +58,8 @@ class Quotation(BaseModel):
         return f"Quotation #{self.quotation_number} - {self.dealer.name}"
     
     def calculate_total_price(self):
-        """Calculate total price from quotation items"""
-        total = sum(item.total_price for item in self.items.all())
+        """Calculate total price from quotation items in a single aggregate"""
+        total = (self.items.aggregate(total=Sum('total_price'))['total'] or Decimal('0')).quantize(Decimal('0.01'))
         self.total_price = total
         self.save(update_fields=['total_price'])
         return total
@@ -103,11 +107,17 @@ class QuotationItem(BaseModel):
     def __str__(self):
         return f"{self.item.name} ({self.quantity}) - {self.quotation.quotation_number}"
     
+    def calculate_total_price(self):
+        """Calculate the line total with discount in memory"""
+        discounted_unit_price = self.unit_price * (1 - (self.discount_percent / Decimal(100)))
+        self.total_price = self.quantity * discounted_unit_price
+        return self.total_price
+    
     def save(self, *args, **kwargs):
         # Calculate total price with discount before saving
-        discounted_unit_price = self.unit_price * (1 - (self.discount_percent / 100))
-        self.total_price = self.quantity * discounted_unit_price
+        self.calculate_total_price()
         super().save(*args, **kwargs)
         
-        # Update quotation total
-        self.quotation.calculate_total_price()
\ No newline at end of file
+        # Update quotation total, unless it is deferred to the end of a bulk write
+        if not schedule_totals(self.quotation):
+            self.quotation.calculate_total_price()
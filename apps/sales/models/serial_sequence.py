@@ -0,0 +1,38 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+from apps.common.models.base_model import BaseModel
+
+
+class SerialSequence(BaseModel):
+    """
+    Per-product counter that hands out device serial numbers in blocks.
+    
+    Serial numbers have the form ``<prefix>-<number>`` with the number zero
+    padded to ``width`` digits, e.g. ``SEQ-ALARM-000042``.
+    
+    Fields:
+        item: The product whose devices are numbered
+        prefix: Serial number prefix (the item SKU by default)
+        width: Minimum number of digits of the numeric part
+        next_value: First number of the next allocated block
+    """
+    item = models.OneToOneField(
+        'inventory.Item',
+        on_delete=models.CASCADE,
+        related_name='serial_sequence',
+        verbose_name=_('Item')
+    )
+    prefix = models.CharField(_("Prefix"), max_length=60)
+    width = models.PositiveSmallIntegerField(_("Width"), default=6)
+    next_value = models.PositiveBigIntegerField(_("Next Value"), default=1)
+    
+    class Meta:
+        verbose_name = _("Serial Sequence")
+        verbose_name_plural = _("Serial Sequences")
+    
+    def __str__(self):
+        return f"{self.prefix} ({self.next_value})"
+    
+    def format(self, value):
+        """Serial number for a number of this sequence"""
+        return f"{self.prefix}-{value:0{self.width}d}"
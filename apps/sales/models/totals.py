@@ -0,0 +1,46 @@
+import threading
+from contextlib import contextmanager
+
+_state = threading.local()
+
+
+@contextmanager
+def defer_totals():
+    """
+    Defer document total recalculation while lines are being written.
+
+    Inside the block, saving an OrderItem or QuotationItem only schedules its
+    order/quotation; each scheduled document recalculates its totals once when
+    the block exits without an error. Nested blocks join the outermost one.
+
+    Usage:
+        with defer_totals():
+            for data in lines:
+                OrderItem.objects.create(order=order, **data)
+    """
+    if getattr(_state, 'pending', None) is not None:
+        yield
+        return
+
+    _state.pending = pending = {}
+    try:
+        yield
+    finally:
+        _state.pending = None
+
+    for document in pending.values():
+        document.calculate_total_price()
+
+
+def schedule_totals(document):
+    """
+    Schedule a document for recalculation in the active defer_totals block.
+
+    Returns:
+        bool: False if no block is active and the caller should recalculate now
+    """
+    pending = getattr(_state, 'pending', None)
+    if pending is None:
+        return False
+    pending[(document._meta.label, document.pk)] = document
+    return True
@@ -1,5 +1,4 @@
-from django.db import models
-from datetime import date
+from datetime import date, timedelta
 from apps.sales.models import Device
 from apps.common.repositories.base_repository import BaseRepository
 
@@ -9,6 +8,11 @@ class DeviceRepository(BaseRepository):
     Repository for Device model operations.
     Follows the repository pattern for data access abstraction.
     """
+    # Columns read by warranty checks
+    warranty_fields = (
+        'id', 'serial_number', 'item_id', 'item__name', 'item__sku',
+        'purchase_date', 'warranty_period_months', 'warranty_end_date'
+    )
     
     def __init__(self):
         super().__init__(Device)
@@ -40,6 +44,61 @@ class DeviceRepository(BaseRepository):
         """
         return self.model.objects.filter(item_id=item_id)
     
+    def get_by_serial_numbers(self, serial_numbers):
+        """
+        Get the warranty fields of the devices with the given serial numbers in one query
+        
+        Args:
+            serial_numbers: Iterable of serial numbers
+            
+        Returns:
+            Dictionary of serial number -> row dict with the warranty_fields
+        """
+        rows = self.model.objects.filter(serial_number__in=list(serial_numbers)).order_by().values(
+            *self.warranty_fields
+        )
+        return {row['serial_number']: row for row in rows}
+    
+    def get_existing_serial_numbers(self, serial_numbers):
+        """
+        Get which of the given serial numbers are already taken, in one query
+        
+        Args:
+            serial_numbers: Iterable of serial numbers
+            
+        Returns:
+            Set of serial numbers that belong to existing devices
+        """
+        return set(
+            self.model.objects.filter(serial_number__in=list(serial_numbers))
+            .values_list('serial_number', flat=True)
+        )
+    
+    def count_by_production(self, production_id):
+        """
+        Count the devices registered from a production run
+        
+        Args:
+            production_id: Production ID
+            
+        Returns:
+            Number of devices
+        """
+        return self.model.objects.filter(production_id=production_id).count()
+    
+    def bulk_create_devices(self, devices, batch_size=1000):
+        """
+        Insert many devices with one statement per batch (Device.save is not called)
+        
+        Args:
+            devices: List of unsaved Device instances with warranty_end_date set
+            batch_size: Rows per INSERT statement
+            
+        Returns:
+            List of created Device instances
+        """
+        return self.model.objects.bulk_create(devices, batch_size=batch_size)
+    
     def get_in_warranty(self):
         """
         Get all devices that are currently in warranty
@@ -47,11 +106,7 @@ class DeviceRepository(BaseRepository):
         Returns:
             QuerySet of devices in warranty
         """
-        today = date.today()
-        return self.model.objects.filter(
-            models.Q(purchase_date__isnull=False) & 
-            models.Q(purchase_date__add=models.F('warranty_period_months') * 30, gt=today)
-        )
+        return self.model.objects.filter(warranty_end_date__gte=date.today())
     
     def get_out_of_warranty(self):
         """
@@ -60,8 +115,23 @@ class DeviceRepository(BaseRepository):
         Returns:
             QuerySet of devices out of warranty
         """
+        return self.model.objects.filter(warranty_end_date__lt=date.today())
+    
+    def get_warranty_expiring(self, days, item_id=None):
+        """
+        Get devices whose warranty ends within the next ``days`` days (today included)
+        
+        Args:
+            days: Length of the window in days
+            item_id: Optional item to restrict to
+            
+        Returns:
+            QuerySet of row dicts with the warranty_fields, ordered by warranty end date
+        """
         today = date.today()
-        return self.model.objects.filter(
-            models.Q(purchase_date__isnull=False) & 
-            models.Q(purchase_date__add=models.F('warranty_period_months') * 30, lte=today)
-        )
\ No newline at end of file
+        queryset = self.model.objects.filter(
+            warranty_end_date__range=(today, today + timedelta(days=days))
+        )
+        if item_id:
+            queryset = queryset.filter(item_id=item_id)
+        return queryset.order_by('warranty_end_date', 'id').values(*self.warranty_fields)
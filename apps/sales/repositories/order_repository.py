@@ -1,7 +1,7 @@
 from django.db import models
 from django.db import transaction
 from apps.sales.models import Order, OrderItem, OrderStatus
-from apps.common.repositories.base_repository import BaseRepository
+from apps.common.repositories.base_repository import BaseRepository, related_count
 
 
 class OrderRepository(BaseRepository):
@@ -9,10 +9,14 @@ class OrderRepository(BaseRepository):
     Repository for Order model operations.
     Follows the repository pattern for data access abstraction.
     """
+    list_select_related = ('dealer',)
     
     def __init__(self):
         super().__init__(Order)
     
+    def get_list_annotations(self):
+        return {'item_count': related_count(OrderItem, 'order')}
+    
     def get_by_number(self, order_number):
         """
         Get an order by its number
@@ -85,15 +89,35 @@ class OrderRepository(BaseRepository):
         # Create the order
         order = self.model.objects.create(**order_data)
         
-        # Create order items
-        for item_data in items_data:
-            item_data['order'] = order
-            OrderItem.objects.create(**item_data)
+        # Create order items and calculate total price once
+        self.add_items(order, items_data)
+        
+        return order
+    
+    @transaction.atomic
+    def add_items(self, order, items_data, batch_size=500):
+        """
+        Add items to an order in bulk
+        
+        Lines are priced in memory, inserted with bulk_create and the order
+        totals are recalculated once with a single aggregate.
         
-        # Calculate total price
+        Args:
+            order: Order instance
+            items_data: List of order items data
+            batch_size: Number of rows per INSERT statement
+            
+        Returns:
+            List of created OrderItem instances
+        """
+        order_items = [OrderItem(order=order, **item_data) for item_data in items_data]
+        for order_item in order_items:
+            order_item.calculate_prices()
+        
+        OrderItem.objects.bulk_create(order_items, batch_size=batch_size)
         order.calculate_total_price()
         
-        return order
+        return order_items
     
     @transaction.atomic
     def update_order_status(self, order_id, status):
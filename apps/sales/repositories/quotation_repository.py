@@ -1,7 +1,7 @@
 from django.db import models
 from django.db import transaction
 from apps.sales.models import Quotation, QuotationItem, QuotationStatus
-from apps.common.repositories.base_repository import BaseRepository
+from apps.common.repositories.base_repository import BaseRepository, related_count
 from django.utils import timezone
 
 
@@ -10,10 +10,14 @@ class QuotationRepository(BaseRepository):
     Repository for Quotation model operations.
     Follows the repository pattern for data access abstraction.
     """
+    list_select_related = ('dealer',)
     
     def __init__(self):
         super().__init__(Quotation)
     
+    def get_list_annotations(self):
+        return {'item_count': related_count(QuotationItem, 'quotation')}
+    
     def get_by_number(self, quotation_number):
         """
         Get a quotation by its number
@@ -88,15 +92,35 @@ class QuotationRepository(BaseRepository):
         # Create the quotation
         quotation = self.model.objects.create(**quotation_data)
         
-        # Create quotation items
-        for item_data in items_data:
-            item_data['quotation'] = quotation
-            QuotationItem.objects.create(**item_data)
+        # Create quotation items and calculate total price once
+        self.add_items(quotation, items_data)
+        
+        return quotation
+    
+    @transaction.atomic
+    def add_items(self, quotation, items_data, batch_size=500):
+        """
+        Add items to a quotation in bulk
+        
+        Lines are priced in memory, inserted with bulk_create and the quotation
+        total is recalculated once with a single aggregate.
         
-        # Calculate total price
+        Args:
+            quotation: Quotation instance
+            items_data: List of quotation items data
+            batch_size: Number of rows per INSERT statement
+            
+        Returns:
+            List of created QuotationItem instances
+        """
+        quotation_items = [QuotationItem(quotation=quotation, **item_data) for item_data in items_data]
+        for quotation_item in quotation_items:
+            quotation_item.calculate_total_price()
+        
+        QuotationItem.objects.bulk_create(quotation_items, batch_size=batch_size)
         quotation.calculate_total_price()
         
-        return quotation
+        return quotation_items
     
     @transaction.atomic
     def update_quotation_status(self, quotation_id, status):
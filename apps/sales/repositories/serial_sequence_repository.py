@@ -0,0 +1,37 @@
+from django.db import transaction
+from apps.sales.models import SerialSequence
+from apps.common.repositories.base_repository import BaseRepository
+
+
+class SerialSequenceRepository(BaseRepository):
+    """
+    Repository for SerialSequence model operations.
+    Allocates blocks of device serial numbers per product.
+    """
+    
+    def __init__(self):
+        super().__init__(SerialSequence)
+    
+    @transaction.atomic
+    def allocate(self, item, count, minimum=1):
+        """
+        Reserve ``count`` consecutive numbers of an item's sequence
+        
+        The sequence row is created on first use (prefixed with the item SKU)
+        and locked until the surrounding transaction ends, so concurrent
+        allocations for the same item get disjoint blocks.
+        
+        Args:
+            item: Item instance
+            count: Number of serial numbers to reserve
+            minimum: Lowest number the block may start at
+            
+        Returns:
+            Tuple of (SerialSequence, first number of the block)
+        """
+        self.model.objects.get_or_create(item=item, defaults={'prefix': item.sku})
+        sequence = self.model.objects.select_for_update().get(item=item)
+        first = max(sequence.next_value, minimum)
+        sequence.next_value = first + count
+        sequence.save(update_fields=['next_value', 'updated_at'])
+        return sequence, first
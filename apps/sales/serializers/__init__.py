@@ -1,6 +1,12 @@
 from apps.sales.serializers.device_serializer import DeviceSerializer, DeviceListSerializer
-from apps.sales.serializers.order_serializer import OrderSerializer, OrderItemSerializer, OrderItemListSerializer, OrderListSerializer
-from apps.sales.serializers.quotation_serializer import QuotationSerializer, QuotationItemSerializer, QuotationListSerializer
+from apps.sales.serializers.order_serializer import (
+    OrderSerializer, OrderItemSerializer, OrderItemListSerializer, OrderListSerializer,
+    OrderItemBulkCreateSerializer, OrderTotalsSerializer
+)
+from apps.sales.serializers.quotation_serializer import (
+    QuotationSerializer, QuotationItemSerializer, QuotationListSerializer,
+    QuotationItemBulkCreateSerializer, QuotationTotalsSerializer
+)
 from apps.sales.serializers.commission_serializer import OrderCommissionSerializer, OrderCommissionListSerializer
 
 __all__ = [
@@ -10,9 +16,13 @@ __all__ = [
     'OrderItemSerializer',
     'OrderItemListSerializer',
     'OrderListSerializer',
+    'OrderItemBulkCreateSerializer',
+    'OrderTotalsSerializer',
     'QuotationSerializer',
     'QuotationItemSerializer',
     'QuotationListSerializer',
+    'QuotationItemBulkCreateSerializer',
+    'QuotationTotalsSerializer',
     'OrderCommissionSerializer',
     'OrderCommissionListSerializer'
 ]
\ No newline at end of file
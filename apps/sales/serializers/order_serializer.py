@@ -1,5 +1,8 @@
+from decimal import Decimal
+
 from rest_framework import serializers
 from apps.sales.models.order import Order, OrderItem, OrderStatus
+from apps.sales.models.totals import defer_totals, schedule_totals
 from apps.dealers.serializers.dealer_serializer import DealerSerializer
 from apps.customers.serializers.customer_serializer import CustomerSerializer
 from apps.inventory.serializers.item_serializer import ItemSerializer
@@ -92,8 +95,9 @@ class OrderSerializer(serializers.ModelSerializer):
         order_items_data = validated_data.pop('order_items', [])
         order = Order.objects.create(**validated_data)
         
-        for item_data in order_items_data:
-            OrderItem.objects.create(order=order, **item_data)
+        with defer_totals():
+            for item_data in order_items_data:
+                OrderItem.objects.create(order=order, **item_data)
         
         return order
     
@@ -110,30 +114,68 @@ class OrderSerializer(serializers.ModelSerializer):
         
         # Update order items if provided
         if order_items_data is not None:
-            # Remove existing items
-            instance.items.all().delete()
-            
-            # Create new items
-            for item_data in order_items_data:
-                OrderItem.objects.create(order=instance, **item_data)
+            with defer_totals():
+                # Remove existing items
+                instance.items.all().delete()
+                
+                # Create new items
+                for item_data in order_items_data:
+                    OrderItem.objects.create(order=instance, **item_data)
+                
+                # Totals are recalculated once, even if no items remain
+                schedule_totals(instance)
         
         return instance
 
 
+class OrderItemLineSerializer(serializers.Serializer):
+    """
+    Serializer for a single line of a bulk order item request.
+    """
+    item_id = serializers.UUIDField()
+    quantity = serializers.IntegerField(min_value=1)
+    unit_price = serializers.DecimalField(max_digits=10, decimal_places=2, min_value=Decimal('0'), required=False)
+    discount_percentage = serializers.DecimalField(
+        max_digits=5, decimal_places=2, min_value=Decimal('0'), max_value=Decimal('100'), required=False
+    )
+    dealer_discount_percentage = serializers.DecimalField(
+        max_digits=5, decimal_places=2, min_value=Decimal('0'), max_value=Decimal('100'), required=False
+    )
+    vat_percentage = serializers.DecimalField(
+        max_digits=5, decimal_places=2, min_value=Decimal('0'), max_value=Decimal('100'), required=False
+    )
+
+
+class OrderItemBulkCreateSerializer(serializers.Serializer):
+    """
+    Serializer for adding several items to an order in one request.
+    """
+    items = OrderItemLineSerializer(many=True, allow_empty=False)
+
+
+class OrderTotalsSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the totals of an Order.
+    """
+    class Meta:
+        model = Order
+        fields = ['id', 'order_number', 'total_price', 'vat_amount', 'grand_total', 'currency']
+        read_only_fields = fields
+
+
 class OrderListSerializer(serializers.ModelSerializer):
     """
     Serializer for listing Order instances with limited fields.
     """
     dealer_name = serializers.StringRelatedField(source='dealer.name', read_only=True)
-    customer_name = serializers.StringRelatedField(source='customer.name', read_only=True)
     status_display = serializers.CharField(source='get_status_display', read_only=True)
-    item_count = serializers.IntegerField(source='items.count', read_only=True)
+    item_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = Order
         fields = [
-            'id', 'order_number', 'dealer_name', 'customer_name',
-            'order_date', 'status', 'status_display', 'net_amount', 
+            'id', 'order_number', 'dealer_name',
+            'order_date', 'status', 'status_display', 'grand_total', 
             'is_paid', 'item_count'
         ]
         read_only_fields = fields
\ No newline at end of file
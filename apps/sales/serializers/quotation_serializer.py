@@ -1,5 +1,8 @@
+from decimal import Decimal
+
 from rest_framework import serializers
 from apps.sales.models.quotation import Quotation, QuotationItem, QuotationStatus
+from apps.sales.models.totals import defer_totals, schedule_totals
 from apps.dealers.serializers.dealer_serializer import DealerSerializer
 from apps.customers.serializers.customer_serializer import CustomerSerializer
 from apps.inventory.serializers.item_serializer import ItemSerializer
@@ -84,8 +87,9 @@ class QuotationSerializer(serializers.ModelSerializer):
         quotation_items_data = validated_data.pop('quotation_items', [])
         quotation = Quotation.objects.create(**validated_data)
         
-        for item_data in quotation_items_data:
-            QuotationItem.objects.create(quotation=quotation, **item_data)
+        with defer_totals():
+            for item_data in quotation_items_data:
+                QuotationItem.objects.create(quotation=quotation, **item_data)
         
         return quotation
     
@@ -102,32 +106,64 @@ class QuotationSerializer(serializers.ModelSerializer):
         
         # Update quotation items if provided
         if quotation_items_data is not None:
-            # Remove existing items
-            instance.items.all().delete()
-            
-            # Create new items
-            for item_data in quotation_items_data:
-                QuotationItem.objects.create(quotation=instance, **item_data)
+            with defer_totals():
+                # Remove existing items
+                instance.items.all().delete()
+                
+                # Create new items
+                for item_data in quotation_items_data:
+                    QuotationItem.objects.create(quotation=instance, **item_data)
+                
+                # Totals are recalculated once, even if no items remain
+                schedule_totals(instance)
         
         return instance
 
 
+class QuotationItemLineSerializer(serializers.Serializer):
+    """
+    Serializer for a single line of a bulk quotation item request.
+    """
+    item_id = serializers.UUIDField()
+    quantity = serializers.IntegerField(min_value=1)
+    unit_price = serializers.DecimalField(max_digits=10, decimal_places=2, min_value=Decimal('0'), required=False)
+    discount_percent = serializers.DecimalField(
+        max_digits=5, decimal_places=2, min_value=Decimal('0'), max_value=Decimal('100'), required=False
+    )
+
+
+class QuotationItemBulkCreateSerializer(serializers.Serializer):
+    """
+    Serializer for adding several items to a quotation in one request.
+    """
+    items = QuotationItemLineSerializer(many=True, allow_empty=False)
+
+
+class QuotationTotalsSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the totals of a Quotation.
+    """
+    class Meta:
+        model = Quotation
+        fields = ['id', 'quotation_number', 'total_price']
+        read_only_fields = fields
+
+
 class QuotationListSerializer(serializers.ModelSerializer):
     """
     Serializer for listing Quotation instances with limited fields.
     """
     dealer_name = serializers.StringRelatedField(source='dealer.name', read_only=True)
-    customer_name = serializers.StringRelatedField(source='customer.name', read_only=True)
     status_display = serializers.CharField(source='get_status_display', read_only=True)
     is_valid = serializers.SerializerMethodField()
-    item_count = serializers.IntegerField(source='items.count', read_only=True)
+    item_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = Quotation
         fields = [
-            'id', 'quotation_number', 'dealer_name', 'customer_name',
-            'quotation_date', 'valid_until', 'status', 'status_display', 
-            'net_amount', 'is_valid', 'item_count'
+            'id', 'quotation_number', 'dealer_name',
+            'issue_date', 'valid_until', 'status', 'status_display', 
+            'total_price', 'is_valid', 'item_count'
         ]
         read_only_fields = fields
     
@@ -1,7 +1,21 @@
-from datetime import date, timedelta
+from datetime import date
 from django.db import transaction
+from apps.sales.models import Device
+from apps.sales.models.device import warranty_end
 from apps.sales.repositories.device_repository import DeviceRepository
+from apps.sales.repositories.serial_sequence_repository import SerialSequenceRepository
 from apps.inventory.repositories.item_repository import ItemRepository
+from apps.inventory.repositories.production_repository import ProductionRepository
+from apps.common.repositories.search_repository import SearchIndexRepository
+
+# Largest number of serial numbers accepted by one bulk warranty check
+MAX_WARRANTY_CHECK_SERIALS = 1000
+
+# Largest number of devices registered by one bulk registration
+MAX_BULK_DEVICES = 10000
+
+# Fresh blocks tried when an allocated block collides with existing serial numbers
+SERIAL_ALLOCATION_ATTEMPTS = 5
 
 
 class DeviceService:
@@ -13,10 +27,12 @@ class DeviceService:
     def __init__(
         self,
         device_repository: DeviceRepository = None,
-        item_repository: ItemRepository = None
+        item_repository: ItemRepository = None,
+        serial_sequence_repository: SerialSequenceRepository = None
     ):
         self.repository = device_repository or DeviceRepository()
         self.item_repository = item_repository or ItemRepository()
+        self.serial_sequence_repository = serial_sequence_repository or SerialSequenceRepository()
     
     def get_all_devices(self):
         """
@@ -86,43 +102,97 @@ class DeviceService:
         """
         return self.repository.get_out_of_warranty()
     
-    def check_warranty_status(self, device_id):
+    def get_devices_with_expiring_warranty(self, days=30, item_id=None):
         """
-        Check the warranty status of a device
+        Get devices whose warranty ends within the next ``days`` days
         
         Args:
-            device_id: Device ID
+            days: Length of the window in days
+            item_id: Optional item to restrict to
             
         Returns:
-            Dictionary with warranty status information
+            List of warranty status dictionaries ordered by warranty end date
         """
-        device = self.repository.get(id=device_id)
-        if not device:
-            return None
-            
+        if days < 0:
+            raise ValueError("days must not be negative")
         today = date.today()
-        
-        if not device.purchase_date or not device.warranty_period_months:
+        return [self._warranty_row(row, today) for row in self.repository.get_warranty_expiring(days, item_id)]
+    
+    @staticmethod
+    def _warranty_info(warranty_end_date, today):
+        """Warranty status fields for a stored warranty end date"""
+        if not warranty_end_date:
             return {
-                'device': device,
                 'in_warranty': False,
                 'warranty_status': 'No warranty information available'
             }
-            
-        # Calculate warranty end date
-        days_in_month = 30  # Average days in a month for warranty purposes
-        warranty_days = device.warranty_period_months * days_in_month
-        warranty_end_date = device.purchase_date + timedelta(days=warranty_days)
-        days_left = (warranty_end_date - today).days
         
+        days_left = (warranty_end_date - today).days
         return {
-            'device': device,
             'in_warranty': today <= warranty_end_date,
             'warranty_end_date': warranty_end_date,
             'days_left': max(0, days_left),
             'warranty_status': 'Active' if today <= warranty_end_date else 'Expired'
         }
     
+    def _warranty_row(self, device, today):
+        """Warranty status of a device row read with DeviceRepository.warranty_fields"""
+        return {
+            'serial_number': device['serial_number'],
+            'device_id': device['id'],
+            'item_id': device['item_id'],
+            'item_name': device['item__name'],
+            'item_sku': device['item__sku'],
+            'purchase_date': device['purchase_date'],
+            'warranty_period_months': device['warranty_period_months'],
+            **self._warranty_info(device['warranty_end_date'], today)
+        }
+    
+    def check_warranty_status(self, device_id):
+        """
+        Check the warranty status of a device
+        
+        Args:
+            device_id: Device ID
+            
+        Returns:
+            Dictionary with warranty status information
+        """
+        device = self.repository.get(id=device_id)
+        if not device:
+            return None
+        
+        return {
+            'device_id': device.id,
+            'serial_number': device.serial_number,
+            **self._warranty_info(device.warranty_end_date, date.today())
+        }
+    
+    def check_warranty_bulk(self, serial_numbers):
+        """
+        Check the warranty status of many devices by serial number with one query
+        
+        Args:
+            serial_numbers: List of serial numbers
+            
+        Returns:
+            List of warranty status dictionaries in the order of the given serial
+            numbers; unknown serial numbers are returned with found=False
+        """
+        if len(serial_numbers) > MAX_WARRANTY_CHECK_SERIALS:
+            raise ValueError(f"At most {MAX_WARRANTY_CHECK_SERIALS} serial numbers can be checked at once")
+        
+        devices = self.repository.get_by_serial_numbers(serial_numbers)
+        today = date.today()
+        results = []
+        for serial_number in serial_numbers:
+            device = devices.get(serial_number)
+            if device is None:
+                results.append({'serial_number': serial_number, 'found': False})
+            else:
+                results.append({'found': True, **self._warranty_row(device, today)})
+        return results
+    
     @transaction.atomic
     def create_device(self, device_data):
         """
@@ -151,6 +221,95 @@ class DeviceService:
                 
         return self.repository.create(**device_data)
     
+    @transaction.atomic
+    def register_devices(self, item_id=None, quantity=None, production_id=None,
+                         purchase_date=None, warranty_period_months=24, notes=None):
+        """
+        Register a batch of devices with consecutive serial numbers
+        
+        Either a production run is given, whose recipe output item and not yet
+        registered output quantity are used, or an item and a quantity. The
+        serial numbers are taken as one block from the item's sequence,
+        checked against existing devices with one query and all devices are
+        inserted with bulk_create, warranty end dates included.
+        
+        Args:
+            item_id: Item ID (when no production is given)
+            quantity: Number of devices (when no production is given)
+            production_id: Production ID to register the output of
+            purchase_date: Optional purchase date of the devices
+            warranty_period_months: Warranty period of the devices
+            notes: Optional notes for the devices
+            
+        Returns:
+            Dictionary with item_id, production_id, count, first_serial_number
+            and last_serial_number
+            
+        Raises:
+            ValueError: When validation fails
+        """
+        if production_id:
+            # Concurrent registrations of the same production wait here, so each
+            # one counts the devices the previous ones registered
+            production = ProductionRepository.lock_production(production_id)
+            if not production:
+                raise ValueError(f"Production with ID {production_id} not found")
+            item = production.recipe.output_item
+            quantity = production.output_quantity - self.repository.count_by_production(production.id)
+            if quantity <= 0:
+                raise ValueError("All devices of this production are already registered")
+        else:
+            production = None
+            if not item_id:
+                raise ValueError("Either production_id or item_id is required")
+            try:
+                item = self.item_repository.get(id=item_id)
+            except self.item_repository.model.DoesNotExist:
+                raise ValueError(f"Item with ID {item_id} not found")
+            if not quantity or quantity <= 0:
+                raise ValueError("quantity must be a positive number")
+        
+        if quantity > MAX_BULK_DEVICES:
+            raise ValueError(f"At most {MAX_BULK_DEVICES} devices can be registered at once")
+        
+        # Manually created devices may already use numbers of the sequence; skip past them
+        minimum = 1
+        for _ in range(SERIAL_ALLOCATION_ATTEMPTS):
+            sequence, first = self.serial_sequence_repository.allocate(item, quantity, minimum)
+            serial_numbers = [sequence.format(value) for value in range(first, first + quantity)]
+            taken = self.repository.get_existing_serial_numbers(serial_numbers)
+            if not taken:
+                break
+            positions = {serial_number: position for position, serial_number in enumerate(serial_numbers)}
+            minimum = first + max(positions[serial_number] for serial_number in taken) + 1
+        else:
+            raise ValueError(f"Could not allocate {quantity} free serial numbers for {item.sku}")
+        
+        warranty_end_date = warranty_end(purchase_date, warranty_period_months)
+        devices = [
+            Device(
+                item=item,
+                serial_number=serial_number,
+                production=production,
+                purchase_date=purchase_date,
+                warranty_period_months=warranty_period_months,
+                warranty_end_date=warranty_end_date,
+                notes=notes
+            )
+            for serial_number in serial_numbers
+        ]
+        self.repository.bulk_create_devices(devices)
+        # Bulk inserts send no signals
+        SearchIndexRepository().add('device', devices)
+        
+        return {
+            'item_id': item.id,
+            'production_id': production.id if production else None,
+            'count': quantity,
+            'first_serial_number': serial_numbers[0],
+            'last_serial_number': serial_numbers[-1],
+        }
+    
     @transaction.atomic
     def update_device(self, device_id, device_data):
         """
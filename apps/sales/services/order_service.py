@@ -4,7 +4,7 @@ from django.utils import timezone
 from apps.sales.repositories.order_repository import OrderRepository
 from apps.dealers.repositories.dealer_repository import DealerRepository
 from apps.inventory.repositories.item_repository import ItemRepository
-from apps.sales.models import OrderStatus
+from apps.sales.models import Order, OrderStatus
 
 
 class OrderService:
@@ -30,7 +30,7 @@ class OrderService:
         Returns:
             QuerySet of all orders
         """
-        return self.repository.list()
+        return self.repository.for_list()
     
     def get_order(self, order_id):
         """
@@ -70,7 +70,7 @@ class OrderService:
         if not dealer:
             return None
             
-        return self.repository.get_by_dealer(dealer_id)
+        return self.repository.for_list(self.repository.get_by_dealer(dealer_id))
     
     def get_orders_by_status(self, status):
         """
@@ -82,7 +82,7 @@ class OrderService:
         Returns:
             QuerySet of orders
         """
-        return self.repository.get_by_status(status)
+        return self.repository.for_list(self.repository.get_by_status(status))
     
     def get_paid_orders(self):
         """
@@ -130,13 +130,64 @@ class OrderService:
             order_data['order_number'] = f"{prefix}-{today.strftime('%Y%m%d')}-{today.timestamp():.0f}"
         
         # Validate order items
-        for item in order_items:
-            if 'item_id' not in item or not self.item_repository.get(id=item['item_id']):
-                raise ValueError(f"Invalid item_id: {item.get('item_id')}")
+        order_items = self._prepare_items(order_items)
         
         # Create order with items
         return self.repository.create_order_with_items(order_data, order_items)
     
+    @transaction.atomic
+    def add_order_items(self, order_id, order_items):
+        """
+        Add several items to an existing order in one write
+        
+        Args:
+            order_id: Order ID
+            order_items: List of dictionaries with order item data
+            
+        Returns:
+            Tuple of (updated Order instance, list of created OrderItem instances)
+            
+        Raises:
+            Order.DoesNotExist: When the order is not found
+            ValidationError: When the order ID is malformed
+            ValueError: When validation of the items fails
+        """
+        try:
+            order = self.repository.get(id=order_id)
+        except Order.DoesNotExist:
+            raise Order.DoesNotExist(f"Order with ID {order_id} not found")
+        
+        order_items = self._prepare_items(order_items)
+        created_items = self.repository.add_items(order, order_items)
+        return order, created_items
+    
+    def _prepare_items(self, order_items):
+        """
+        Validate order item data against inventory in a single query
+        
+        Items without a unit price are priced at the item's dealer price.
+        
+        Raises:
+            ValueError: When an item ID is missing or unknown
+        """
+        item_ids = [item.get('item_id') for item in order_items]
+        if None in item_ids:
+            raise ValueError("Invalid item_id: None")
+        
+        items = {
+            str(item_id): item
+            for item_id, item in self.item_repository.get_items_by_ids(set(item_ids)).items()
+        }
+        prepared = []
+        for item_data in order_items:
+            item = items.get(str(item_data['item_id']))
+            if not item:
+                raise ValueError(f"Invalid item_id: {item_data['item_id']}")
+            item_data = dict(item_data)
+            item_data.setdefault('unit_price', item.dealer_price)
+            prepared.append(item_data)
+        return prepared
+    
     @transaction.atomic
     def update_order_status(self, order_id, status):
         """
@@ -4,7 +4,7 @@ from django.utils import timezone
 from apps.sales.repositories.quotation_repository import QuotationRepository
 from apps.dealers.repositories.dealer_repository import DealerRepository
 from apps.inventory.repositories.item_repository import ItemRepository
-from apps.sales.models import QuotationStatus
+from apps.sales.models import Quotation, QuotationStatus
 
 
 class QuotationService:
@@ -30,7 +30,7 @@ class QuotationService:
         Returns:
             QuerySet of all quotations
         """
-        return self.repository.list()
+        return self.repository.for_list()
     
     def get_quotation(self, quotation_id):
         """
@@ -70,7 +70,7 @@ class QuotationService:
         if not dealer:
             return None
             
-        return self.repository.get_by_dealer(dealer_id)
+        return self.repository.for_list(self.repository.get_by_dealer(dealer_id))
     
     def get_quotations_by_status(self, status):
         """
@@ -82,7 +82,7 @@ class QuotationService:
         Returns:
             QuerySet of quotations
         """
-        return self.repository.get_by_status(status)
+        return self.repository.for_list(self.repository.get_by_status(status))
     
     def get_valid_quotations(self):
         """
@@ -138,13 +138,64 @@ class QuotationService:
             quotation_data['status'] = QuotationStatus.PENDING
         
         # Validate quotation items
-        for item in quotation_items:
-            if 'item_id' not in item or not self.item_repository.get(id=item['item_id']):
-                raise ValueError(f"Invalid item_id: {item.get('item_id')}")
+        quotation_items = self._prepare_items(quotation_items)
         
         # Create quotation with items
         return self.repository.create_quotation_with_items(quotation_data, quotation_items)
     
+    @transaction.atomic
+    def add_quotation_items(self, quotation_id, quotation_items):
+        """
+        Add several items to an existing quotation in one write
+        
+        Args:
+            quotation_id: Quotation ID
+            quotation_items: List of dictionaries with quotation item data
+            
+        Returns:
+            Tuple of (updated Quotation instance, list of created QuotationItem instances)
+            
+        Raises:
+            Quotation.DoesNotExist: When the quotation is not found
+            ValidationError: When the quotation ID is malformed
+            ValueError: When validation of the items fails
+        """
+        try:
+            quotation = self.repository.get(id=quotation_id)
+        except Quotation.DoesNotExist:
+            raise Quotation.DoesNotExist(f"Quotation with ID {quotation_id} not found")
+        
+        quotation_items = self._prepare_items(quotation_items)
+        created_items = self.repository.add_items(quotation, quotation_items)
+        return quotation, created_items
+    
+    def _prepare_items(self, quotation_items):
+        """
+        Validate quotation item data against inventory in a single query
+        
+        Items without a unit price are priced at the item's dealer price.
+        
+        Raises:
+            ValueError: When an item ID is missing or unknown
+        """
+        item_ids = [item.get('item_id') for item in quotation_items]
+        if None in item_ids:
+            raise ValueError("Invalid item_id: None")
+        
+        items = {
+            str(item_id): item
+            for item_id, item in self.item_repository.get_items_by_ids(set(item_ids)).items()
+        }
+        prepared = []
+        for item_data in quotation_items:
+            item = items.get(str(item_data['item_id']))
+            if not item:
+                raise ValueError(f"Invalid item_id: {item_data['item_id']}")
+            item_data = dict(item_data)
+            item_data.setdefault('unit_price', item.dealer_price)
+            prepared.append(item_data)
+        return prepared
+    
     @transaction.atomic
     def update_quotation_status(self, quotation_id, status):
         """
@@ -4,12 +4,14 @@ from rest_framework.routers import DefaultRouter
 from apps.sales.views.order_view import OrderViewSet
 from apps.sales.views.order_item_view import OrderItemViewSet
 from apps.sales.views.device_view import DeviceViewSet
+from apps.sales.views.quotation_view import QuotationViewSet
 
 # DRF router for viewsets 
 router = DefaultRouter()
 router.register(r'orders', OrderViewSet, basename='order')
 router.register(r'order-items', OrderItemViewSet, basename='order-item')
 router.register(r'devices', DeviceViewSet, basename='device')
+router.register(r'quotations', QuotationViewSet, basename='quotation')
 
 # URL patterns 
 urlpatterns = [
@@ -1,7 +1,9 @@
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
+from django.core.exceptions import ValidationError
 from django.db import transaction
+from django.utils.dateparse import parse_date
 
 from apps.sales.models.device import Device
 from apps.sales.serializers import DeviceSerializer, DeviceListSerializer
@@ -183,7 +185,7 @@ class DeviceViewSet(viewsets.ViewSet):
                 status_code=status.HTTP_404_NOT_FOUND
             )
             
-        warranty_info = self.service.get_warranty_status(pk)
+        warranty_info = self.service.check_warranty_status(pk)
         return success_response(
             data=warranty_info,
             status_code=status.HTTP_200_OK
@@ -208,4 +210,84 @@ class DeviceViewSet(viewsets.ViewSet):
         return success_response(
             data=serializer.data,
             status_code=status.HTTP_200_OK
-        )
\ No newline at end of file
+        )
+    
+    @action(detail=False, methods=['post'])
+    def warranty_check(self, request):
+        """
+        Get the warranty status of many devices by serial number.
+        
+        Body: {"serial_numbers": ["SN-1", "SN-2", ...]}
+        """
+        serial_numbers = request.data.get('serial_numbers')
+        if not isinstance(serial_numbers, list) or not all(isinstance(value, str) for value in serial_numbers):
+            return error_response(
+                error_message="serial_numbers must be a list of serial numbers",
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+            
+        try:
+            results = self.service.check_warranty_bulk([value.strip() for value in serial_numbers])
+        except ValueError as e:
+            return error_response(
+                error_message=str(e),
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+            
+        return success_response(
+            data=results,
+            status_code=status.HTTP_200_OK
+        )
+    
+    @action(detail=False, methods=['get'])
+    def warranty_expiring(self, request):
+        """
+        Get devices whose warranty ends within the next `days` days (default 30).
+        """
+        try:
+            days = int(request.query_params.get('days', 30))
+            devices = self.service.get_devices_with_expiring_warranty(
+                days, item_id=request.query_params.get('item_id')
+            )
+        except (ValueError, ValidationError) as e:
+            return error_response(
+                error_message=str(e),
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+            
+        return success_response(
+            data=devices,
+            status_code=status.HTTP_200_OK
+        )
+    
+    @action(detail=False, methods=['post'])
+    def bulk_register(self, request):
+        """
+        Register a batch of devices with consecutive serial numbers.
+        
+        Body: {"production_id": "..."} or {"item_id": "...", "quantity": 2000},
+        optionally with purchase_date (YYYY-MM-DD), warranty_period_months and notes.
+        """
+        data = request.data
+        try:
+            purchase_date = parse_date(data['purchase_date']) if data.get('purchase_date') else None
+            if data.get('purchase_date') and purchase_date is None:
+                raise ValueError("purchase_date must be a date in YYYY-MM-DD format")
+            result = self.service.register_devices(
+                item_id=data.get('item_id'),
+                quantity=int(data['quantity']) if data.get('quantity') is not None else None,
+                production_id=data.get('production_id'),
+                purchase_date=purchase_date,
+                warranty_period_months=int(data.get('warranty_period_months', 24)),
+                notes=data.get('notes')
+            )
+        except (ValueError, TypeError, ValidationError) as e:
+            return error_response(
+                error_message=str(e),
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+            
+        return success_response(
+            data=result,
+            status_code=status.HTTP_201_CREATED
+        )
@@ -1,19 +1,47 @@
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
+from django.core.exceptions import ValidationError
 from django.db import transaction
 
 from apps.sales.models.order import Order, OrderStatus
-from apps.sales.serializers import OrderSerializer, OrderListSerializer
+from apps.sales.serializers import (
+    OrderSerializer, OrderListSerializer, OrderItemBulkCreateSerializer, OrderTotalsSerializer
+)
 from apps.sales.services import OrderService
+from apps.common.pagination import KeysetListMixin
 from apps.common.responses import success_response, error_response
 
 
-class OrderViewSet(viewsets.ViewSet):
+class OrderViewSet(KeysetListMixin, viewsets.ViewSet):
     """
     ViewSet for order operations.
     """
     permission_classes = [IsAuthenticated]
+    list_orderings = {
+        '-created_at': ('-created_at', '-id'),
+        'created_at': ('created_at', 'id'),
+        'order_number': ('order_number', 'id'),
+    }
+    list_default_ordering = '-created_at'
+    list_filterset_fields = ['dealer', 'status', 'is_paid']
+    query_budget = {'list': 3}
+    export_columns = (
+        ('Sipariş No', 'order_number'),
+        ('Sipariş Tarihi', 'order_date'),
+        ('Bayi Kodu', 'dealer__code'),
+        ('Bayi', 'dealer__name'),
+        ('Durum', 'status'),
+        ('Ödendi', 'is_paid'),
+        ('Para Birimi', 'currency'),
+        ('Tutar', 'total_price'),
+        ('KDV', 'vat_amount'),
+        ('Genel Toplam', 'grand_total'),
+        ('Cihaz Seti', 'device_set_count'),
+        ('Sevk Tarihi', 'shipping_date'),
+        ('Teslim Tarihi', 'delivery_date'),
+        ('Tamamlanma Tarihi', 'completion_date'),
+    )
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -21,14 +49,10 @@ class OrderViewSet(viewsets.ViewSet):
     
     def list(self, request):
         """
-        Get all orders.
+        Get a page of orders, filtered by dealer, status or is_paid.
         """
         orders = self.service.get_all_orders()
-        serializer = OrderListSerializer(orders, many=True)
-        return success_response(
-            data=serializer.data,
-            status_code=status.HTTP_200_OK
-        )
+        return self.keyset_list_response(request, orders, OrderListSerializer)
     
     def retrieve(self, request, pk=None):
         """
@@ -127,6 +151,14 @@ class OrderViewSet(viewsets.ViewSet):
                 status_code=status.HTTP_400_BAD_REQUEST
             )
     
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """
+        Download all orders matching the list filters as CSV or XLSX (file_type parameter).
+        """
+        orders = self.service.get_all_orders()
+        return self.keyset_export_response(request, orders, self.export_columns, 'orders', sheet_name='Orders')
+    
     @action(detail=False, methods=['get'])
     def by_customer(self, request):
         """
@@ -213,6 +245,43 @@ class OrderViewSet(viewsets.ViewSet):
                 status_code=status.HTTP_400_BAD_REQUEST
             )
     
+    @action(detail=True, methods=['post'])
+    def add_items(self, request, pk=None):
+        """
+        Add several items to an order in one request.
+        """
+        serializer = OrderItemBulkCreateSerializer(data=request.data)
+        if not serializer.is_valid():
+            return error_response(
+                error_message="Invalid order item data",
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+            
+        try:
+            order, order_items = self.service.add_order_items(pk, serializer.validated_data['items'])
+        except Order.DoesNotExist as e:
+            return error_response(
+                error_message=str(e),
+                status_code=status.HTTP_404_NOT_FOUND
+            )
+        except ValidationError as e:
+            return error_response(
+                error_message=' '.join(e.messages),
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+        except ValueError as e:
+            return error_response(
+                error_message=str(e),
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+            
+        data = OrderTotalsSerializer(order).data
+        data['item_ids'] = [str(order_item.id) for order_item in order_items]
+        return success_response(
+            data=data,
+            status_code=status.HTTP_201_CREATED
+        )
+    
     @action(detail=True, methods=['get'])
     def generate_invoice(self, request, pk=None):
         """
@@ -0,0 +1,59 @@
+from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from django.core.exceptions import ValidationError
+
+from apps.sales.models import Quotation
+from apps.sales.serializers import QuotationItemBulkCreateSerializer, QuotationTotalsSerializer
+from apps.sales.services import QuotationService
+from apps.common.responses import success_response, error_response
+
+
+class QuotationViewSet(viewsets.ViewSet):
+    """
+    ViewSet for quotation operations.
+    """
+    permission_classes = [IsAuthenticated]
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.service = QuotationService()
+    
+    @action(detail=True, methods=['post'])
+    def add_items(self, request, pk=None):
+        """
+        Add several items to a quotation in one request.
+        """
+        serializer = QuotationItemBulkCreateSerializer(data=request.data)
+        if not serializer.is_valid():
+            return error_response(
+                error_message="Invalid quotation item data",
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+            
+        try:
+            quotation, quotation_items = self.service.add_quotation_items(
+                pk, serializer.validated_data['items']
+            )
+        except Quotation.DoesNotExist as e:
+            return error_response(
+                error_message=str(e),
+                status_code=status.HTTP_404_NOT_FOUND
+            )
+        except ValidationError as e:
+            return error_response(
+                error_message=' '.join(e.messages),
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+        except ValueError as e:
+            return error_response(
+                error_message=str(e),
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+            
+        data = QuotationTotalsSerializer(quotation).data
+        data['item_ids'] = [str(quotation_item.id) for quotation_item in quotation_items]
+        return success_response(
+            data=data,
+            status_code=status.HTTP_201_CREATED
+        )
@@ -4,4 +4,7 @@ from django.apps import AppConfig
 class ServiceConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.service'
-    verbose_name = 'Service'
\ No newline at end of file
+    verbose_name = 'Service'
+    
+    def ready(self):
+        import apps.service.signals  # noqa F401
@@ -0,0 +1,26 @@
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand
+
+from apps.service.repositories.repair_daily_stat_repository import RepairDailyStatRepository
+
+
+class Command(BaseCommand):
+    help = (
+        'Rebuilds the daily repair statistics rollup from the repair requests '
+        '(needed after bulk writes, which send no signals)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start-date', type=date.fromisoformat,
+                            help='First request date to rebuild (YYYY-MM-DD, default: all)')
+        parser.add_argument('--end-date', type=date.fromisoformat,
+                            help='Last request date to rebuild (YYYY-MM-DD, default: all)')
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        rows = RepairDailyStatRepository().rebuild(options['start_date'], options['end_date'])
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt {rows} daily repair statistic rows in {time.perf_counter() - start:.1f} s'
+        ))
@@ -0,0 +1,28 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("customers", "0003_customer_list_indexes"),
+        ("dealers", "0003_dealer_list_indexes"),
+        ("sales", "0003_order_list_indexes"),
+        ("service", "0002_alter_repairpart_table_alter_repairrequest_table"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="repairrequest",
+            index=models.Index(
+                fields=["request_date", "id"], name="repair_request_date_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="repairrequest",
+            index=models.Index(
+                fields=["status", "request_date", "id"], name="repair_status_date_idx"
+            ),
+        ),
+    ]
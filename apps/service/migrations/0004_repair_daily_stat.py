@@ -0,0 +1,139 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:40
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+def build_rollup(apps, schema_editor):
+    """Fill the rollup from the existing repair requests"""
+    RepairRequest = apps.get_model("service", "RepairRequest")
+    RepairDailyStat = apps.get_model("service", "RepairDailyStat")
+    rows = (
+        RepairRequest.objects.order_by()
+        .values("request_date", "dealer_id", "status", "is_warranty")
+        .annotate(
+            repair_count=models.Count("id"),
+            costed_count=models.Count(
+                "id", filter=~models.Q(repair_cost=0) & models.Q(repair_cost__isnull=False)
+            ),
+            total_cost=models.Sum("repair_cost"),
+        )
+    )
+    RepairDailyStat.objects.bulk_create(
+        [
+            RepairDailyStat(
+                date=row["request_date"],
+                dealer_id=row["dealer_id"],
+                status=row["status"],
+                is_warranty=row["is_warranty"],
+                repair_count=row["repair_count"],
+                costed_count=row["costed_count"],
+                total_cost=row["total_cost"] or 0,
+            )
+            for row in rows
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dealers", "0003_dealer_list_indexes"),
+        ("service", "0003_repair_request_list_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RepairDailyStat",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Created At"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="Updated At"),
+                ),
+                (
+                    "deleted_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="Deleted At"
+                    ),
+                ),
+                (
+                    "is_active",
+                    models.BooleanField(default=True, verbose_name="Is Active"),
+                ),
+                ("date", models.DateField(verbose_name="Date")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("created", "Created"),
+                            ("received", "Received"),
+                            ("fee_notified", "Fee Notified"),
+                            ("dealer_approved", "Dealer Approved"),
+                            ("payment_pending", "Payment Pending"),
+                            ("repairing", "Repairing"),
+                            ("ready_for_delivery", "Ready For Delivery"),
+                            ("delivered_to_dealer", "Delivered To Dealer"),
+                        ],
+                        max_length=20,
+                        verbose_name="Status",
+                    ),
+                ),
+                ("is_warranty", models.BooleanField(verbose_name="Is Warranty")),
+                (
+                    "repair_count",
+                    models.PositiveIntegerField(default=0, verbose_name="Repair Count"),
+                ),
+                (
+                    "costed_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Costed Repair Count"
+                    ),
+                ),
+                (
+                    "total_cost",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=14,
+                        verbose_name="Total Cost",
+                    ),
+                ),
+                (
+                    "dealer",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="repair_daily_stats",
+                        to="dealers.dealer",
+                        verbose_name="Dealer",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Repair Daily Statistic",
+                "verbose_name_plural": "Repair Daily Statistics",
+                "ordering": ["date"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("date", "dealer", "status", "is_warranty"),
+                        name="repair_daily_stat_unique",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(build_rollup, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,5 @@
 from apps.service.models.repair_request import RepairRequest, RepairStatus
 from apps.service.models.repair_part import RepairPart
+from apps.service.models.repair_daily_stat import RepairDailyStat
 
-__all__ = ['RepairRequest', 'RepairStatus', 'RepairPart']
\ No newline at end of file
+__all__ = ['RepairRequest', 'RepairStatus', 'RepairPart', 'RepairDailyStat']
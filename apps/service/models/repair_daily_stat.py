@@ -0,0 +1,50 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+from apps.common.models.base_model import BaseModel
+from apps.service.models.repair_request import RepairStatus
+
+
+class RepairDailyStat(BaseModel):
+    """
+    Daily rollup of repair requests for dashboards.
+    
+    One row per request day, dealer, status and warranty flag. Rows are
+    derived data: they are rebuilt for a day whenever a repair request of
+    that day is written (see apps.service.signals) and can be rebuilt for any
+    range with the rebuild_repair_statistics command.
+    
+    Fields:
+        date: Request date of the counted repairs
+        dealer: Dealer of the counted repairs
+        status: Current status of the counted repairs
+        is_warranty: Warranty flag of the counted repairs
+        repair_count: Number of repairs
+        costed_count: Number of repairs with a non-zero repair cost
+        total_cost: Sum of the repair costs
+    """
+    date = models.DateField(_("Date"))
+    dealer = models.ForeignKey(
+        'dealers.Dealer',
+        on_delete=models.CASCADE,
+        related_name='repair_daily_stats',
+        verbose_name=_('Dealer')
+    )
+    status = models.CharField(_("Status"), max_length=20, choices=RepairStatus.choices)
+    is_warranty = models.BooleanField(_("Is Warranty"))
+    repair_count = models.PositiveIntegerField(_("Repair Count"), default=0)
+    costed_count = models.PositiveIntegerField(_("Costed Repair Count"), default=0)
+    total_cost = models.DecimalField(_("Total Cost"), max_digits=14, decimal_places=2, default=0)
+    
+    class Meta:
+        verbose_name = _("Repair Daily Statistic")
+        verbose_name_plural = _("Repair Daily Statistics")
+        ordering = ['date']
+        constraints = [
+            # Leading date column also serves the date range scans of the dashboards
+            models.UniqueConstraint(
+                fields=['date', 'dealer', 'status', 'is_warranty'], name='repair_daily_stat_unique'
+            ),
+        ]
+    
+    def __str__(self):
+        return f"{self.date} {self.status} ({self.repair_count})"
@@ -75,6 +75,10 @@ class RepairRequest(BaseModel):
         verbose_name = _("Repair Request")
         verbose_name_plural = _("Repair Requests")
         ordering = ['-request_date']
+        indexes = [
+            models.Index(fields=['request_date', 'id'], name='repair_request_date_idx'),
+            models.Index(fields=['status', 'request_date', 'id'], name='repair_status_date_idx'),
+        ]
     
     def __str__(self):
         return f"Repair #{self.id} - {self.device.serial_number}"
@@ -0,0 +1,141 @@
+from decimal import Decimal
+
+from django.db import connections, transaction
+from django.db.models import Count, DecimalField, Q, Sum, Value
+from django.db.models.functions import Coalesce, Trunc
+from apps.service.models import RepairDailyStat, RepairRequest
+from apps.common.repositories.base_repository import BaseRepository
+
+# Periods the rollup can be grouped by
+PERIODS = ('day', 'week', 'month', 'quarter', 'year')
+
+
+class RepairDailyStatRepository(BaseRepository):
+    """
+    Repository for the RepairDailyStat rollup.
+    Rebuilds rollup rows from repair requests and reads them grouped by period.
+
+    Rows are upserted on their (date, dealer, status, is_warranty) key and
+    only the keys that no longer have repairs are deleted, so two refreshes
+    of the same day overwrite each other instead of colliding on the key.
+    """
+    # Columns rewritten when a rollup key already exists
+    STAT_FIELDS = ['repair_count', 'costed_count', 'total_cost', 'updated_at']
+    KEY_FIELDS = ['date', 'dealer', 'status', 'is_warranty']
+
+    def __init__(self):
+        super().__init__(RepairDailyStat)
+
+    def refresh_days(self, days):
+        """
+        Rebuild the rollup rows of the given request days.
+
+        Args:
+            days: Iterable of dates
+
+        Returns:
+            Number of rollup rows written
+        """
+        days = sorted(set(days))
+        if not days:
+            return 0
+        return self._replace(Q(request_date__in=days), Q(date__in=days))
+
+    def rebuild(self, start_date=None, end_date=None):
+        """
+        Rebuild the rollup rows of a request date range (all days by default).
+
+        Returns:
+            Number of rollup rows written
+        """
+        source, target = Q(), Q()
+        if start_date:
+            source &= Q(request_date__gte=start_date)
+            target &= Q(date__gte=start_date)
+        if end_date:
+            source &= Q(request_date__lte=end_date)
+            target &= Q(date__lte=end_date)
+        return self._replace(source, target)
+
+    @transaction.atomic
+    def _replace(self, source, target):
+        rows = (
+            RepairRequest.objects.filter(source)
+            .order_by()
+            .values('request_date', 'dealer_id', 'status', 'is_warranty')
+            .annotate(
+                repair_count=Count('id'),
+                costed_count=Count('id', filter=~Q(repair_cost=0) & Q(repair_cost__isnull=False)),
+                total_cost=Coalesce(
+                    Sum('repair_cost'), Value(Decimal('0')), output_field=DecimalField(max_digits=14, decimal_places=2)
+                ),
+            )
+        )
+        stats = [
+            self.model(
+                date=row['request_date'],
+                dealer_id=row['dealer_id'],
+                status=row['status'],
+                is_warranty=row['is_warranty'],
+                repair_count=row['repair_count'],
+                costed_count=row['costed_count'],
+                total_cost=row['total_cost'],
+            )
+            for row in rows
+        ]
+        # A fixed key order keeps concurrent refreshes from locking rows in opposite orders
+        stats.sort(key=lambda stat: (stat.date, str(stat.dealer_id), stat.status, stat.is_warranty))
+        keys = {(stat.date, stat.dealer_id, stat.status, stat.is_warranty) for stat in stats}
+        stale = [
+            stat_id
+            for stat_id, *key in self.model.objects.filter(target).values_list(
+                'id', 'date', 'dealer_id', 'status', 'is_warranty'
+            )
+            if tuple(key) not in keys
+        ]
+        if stale:
+            self.model.objects.filter(id__in=stale).delete()
+
+        unique_fields = None
+        if connections[self.model.objects.db].features.supports_update_conflicts_with_target:
+            unique_fields = self.KEY_FIELDS
+        self.model.objects.bulk_create(
+            stats,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=unique_fields,
+            update_fields=self.STAT_FIELDS
+        )
+        return len(stats)
+
+    def summarize(self, start_date, end_date, period='month', dealer_id=None):
+        """
+        Sum the rollup rows of a date range per period and status.
+
+        Args:
+            start_date: First day (inclusive)
+            end_date: Last day (inclusive)
+            period: One of PERIODS
+            dealer_id: Optional dealer to restrict to
+
+        Returns:
+            List of dicts with period, status, repairs, warranty_repairs,
+            costed_repairs and cost, ordered by period
+        """
+        if period not in PERIODS:
+            raise ValueError(f"Invalid period. Must be one of {', '.join(PERIODS)}")
+        queryset = self.model.objects.filter(date__range=(start_date, end_date))
+        if dealer_id:
+            queryset = queryset.filter(dealer_id=dealer_id)
+        return list(
+            queryset.order_by()
+            .annotate(period=Trunc('date', period))
+            .values('period', 'status')
+            .annotate(
+                repairs=Sum('repair_count'),
+                warranty_repairs=Coalesce(Sum('repair_count', filter=Q(is_warranty=True)), 0),
+                costed_repairs=Sum('costed_count'),
+                cost=Sum('total_cost'),
+            )
+            .order_by('period', 'status')
+        )
@@ -9,6 +9,7 @@ class RepairRequestRepository(BaseRepository):
     Repository for RepairRequest model operations.
     Follows the repository pattern for data access abstraction.
     """
+    list_select_related = ('device__item',)
     
     def __init__(self):
         super().__init__(RepairRequest)
@@ -61,6 +62,30 @@ class RepairRequestRepository(BaseRepository):
         """
         return self.model.objects.filter(status=status)
     
+    def get_statistics(self, start_date, end_date):
+        """
+        Count and cost figures of the repair requests of a date range in one query
+        
+        Args:
+            start_date: First request date (inclusive)
+            end_date: Last request date (inclusive)
+            
+        Returns:
+            Dictionary with total, warranty, avg_repair_cost, total_repair_cost
+            and one count per RepairStatus value
+        """
+        by_status = {
+            status: models.Count('id', filter=models.Q(status=status))
+            for status in RepairStatus.values
+        }
+        return self.model.objects.filter(request_date__range=(start_date, end_date)).aggregate(
+            total=models.Count('id'),
+            warranty=models.Count('id', filter=models.Q(is_warranty=True)),
+            avg_repair_cost=models.Avg('repair_cost', filter=~models.Q(repair_cost=0)),
+            total_repair_cost=models.Sum('repair_cost'),
+            **by_status
+        )
+    
     def get_warranty_repairs(self):
         """
         Get all warranty repair requests
@@ -131,8 +131,8 @@ class RepairRequestListSerializer(serializers.ModelSerializer):
     class Meta:
         model = RepairRequest
         fields = [
-            'id', 'repair_number', 'device_serial', 'device_item_name',
+            'id', 'device_serial', 'device_item_name', 'request_date',
             'status', 'status_display', 'is_warranty', 'repair_cost',
-            'started_at', 'completed_at'
+            'completion_date'
         ]
         read_only_fields = fields
\ No newline at end of file
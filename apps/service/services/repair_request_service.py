@@ -1,8 +1,9 @@
 from datetime import datetime
+from decimal import Decimal
 from django.db import transaction
 from django.utils import timezone
-from django.db.models import Avg
 from apps.service.repositories.repair_request_repository import RepairRequestRepository
+from apps.service.repositories.repair_daily_stat_repository import RepairDailyStatRepository
 from apps.sales.repositories.device_repository import DeviceRepository
 from apps.sales.services.device_service import DeviceService
 from apps.service.models import RepairStatus
@@ -18,9 +19,11 @@ class RepairRequestService:
         self,
         repair_request_repository: RepairRequestRepository = None,
         device_repository: DeviceRepository = None,
-        device_service: DeviceService = None
+        device_service: DeviceService = None,
+        daily_stat_repository: RepairDailyStatRepository = None
     ):
         self.repository = repair_request_repository or RepairRequestRepository()
+        self.daily_stat_repository = daily_stat_repository or RepairDailyStatRepository()
         self.device_repository = device_repository or DeviceRepository()
         self.device_service = device_service or DeviceService()
     
@@ -31,7 +34,7 @@ class RepairRequestService:
         Returns:
             QuerySet of all repair requests
         """
-        return self.repository.list()
+        return self.repository.for_list()
     
     def get_repair_request(self, repair_id):
         """
@@ -72,7 +75,7 @@ class RepairRequestService:
         if not device:
             return None
             
-        return self.repository.get_by_device(device_id)
+        return self.repository.for_list(self.repository.get_by_device(device_id))
     
     def get_repair_requests_by_status(self, status):
         """
@@ -84,7 +87,7 @@ class RepairRequestService:
         Returns:
             QuerySet of repair requests
         """
-        return self.repository.get_by_status(status)
+        return self.repository.for_list(self.repository.get_by_status(status))
     
     def get_warranty_repairs(self):
         """
@@ -93,7 +96,7 @@ class RepairRequestService:
         Returns:
             QuerySet of warranty repair requests
         """
-        return self.repository.get_warranty_repairs()
+        return self.repository.for_list(self.repository.get_warranty_repairs())
     
     def get_non_warranty_repairs(self):
         """
@@ -102,38 +105,82 @@ class RepairRequestService:
         Returns:
             QuerySet of non-warranty repair requests
         """
-        return self.repository.get_non_warranty_repairs()
+        return self.repository.for_list(self.repository.get_non_warranty_repairs())
     
     def get_repair_statistics(self, start_date=None, end_date=None):
         """
-        Get repair request statistics
+        Get repair request statistics with a single aggregate query
         
         Args:
-            start_date: Start date for filtering
-            end_date: End date for filtering
+            start_date: First request date (default: first day of this month)
+            end_date: Last request date (default: today)
             
         Returns:
             Dictionary with repair statistics
         """
-        if not start_date:
-            start_date = timezone.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
         if not end_date:
-            end_date = timezone.now()
-            
-        repairs = self.repository.get_by_date_range(start_date, end_date)
-        
-        statistics = {
-            'total': repairs.count(),
-            'warranty': repairs.filter(is_warranty=True).count(),
-            'non_warranty': repairs.filter(is_warranty=False).count(),
-            'pending': repairs.filter(status=RepairStatus.PENDING).count(),
-            'in_progress': repairs.filter(status=RepairStatus.IN_PROGRESS).count(),
-            'completed': repairs.filter(status=RepairStatus.COMPLETED).count(),
-            'cancelled': repairs.filter(status=RepairStatus.CANCELLED).count(),
-            'avg_repair_cost': repairs.exclude(repair_cost=0).aggregate(Avg('repair_cost'))['repair_cost__avg'] or 0,
+            end_date = timezone.localdate()
+        if not start_date:
+            start_date = end_date.replace(day=1)
+        
+        figures = self.repository.get_statistics(start_date, end_date)
+        
+        return {
+            'start_date': start_date,
+            'end_date': end_date,
+            'total': figures['total'],
+            'warranty': figures['warranty'],
+            'non_warranty': figures['total'] - figures['warranty'],
+            'by_status': {status: figures[status] for status in RepairStatus.values},
+            'avg_repair_cost': figures['avg_repair_cost'] or 0,
+            'total_repair_cost': figures['total_repair_cost'] or 0,
         }
+    
+    def get_repair_trends(self, start_date=None, end_date=None, period='month', dealer_id=None):
+        """
+        Get repair figures per period from the daily rollup
+        
+        Reads the pre-aggregated RepairDailyStat rows, so a year of data costs
+        a few hundred rows instead of a scan over every repair request.
+        
+        Args:
+            start_date: First request date (default: 1 January of this year)
+            end_date: Last request date (default: today)
+            period: day, week, month, quarter or year
+            dealer_id: Optional dealer to restrict to
+            
+        Returns:
+            List of per-period dictionaries, oldest first
+        """
+        if not end_date:
+            end_date = timezone.localdate()
+        if not start_date:
+            start_date = end_date.replace(month=1, day=1)
+        
+        periods = {}
+        for row in self.daily_stat_repository.summarize(start_date, end_date, period, dealer_id):
+            entry = periods.get(row['period'])
+            if entry is None:
+                entry = periods[row['period']] = {
+                    'period': row['period'],
+                    'total': 0,
+                    'warranty': 0,
+                    'non_warranty': 0,
+                    'by_status': dict.fromkeys(RepairStatus.values, 0),
+                    'costed': 0,
+                    'total_repair_cost': Decimal('0'),
+                }
+            entry['total'] += row['repairs']
+            entry['warranty'] += row['warranty_repairs']
+            entry['non_warranty'] += row['repairs'] - row['warranty_repairs']
+            entry['by_status'][row['status']] += row['repairs']
+            entry['costed'] += row['costed_repairs']
+            entry['total_repair_cost'] += row['cost'] or 0
         
-        return statistics
+        for entry in periods.values():
+            costed = entry.pop('costed')
+            entry['avg_repair_cost'] = entry['total_repair_cost'] / costed if costed else 0
+        return list(periods.values())
     
     @transaction.atomic
     def create_repair_request(self, repair_data, parts_data=None):
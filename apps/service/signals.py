@@ -0,0 +1,32 @@
+import threading
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.service.models import RepairRequest
+from apps.service.repositories.repair_daily_stat_repository import RepairDailyStatRepository
+
+# Request days waiting for a rollup refresh when the current transaction commits
+_pending = threading.local()
+
+
+def _refresh_pending_days():
+    days = getattr(_pending, 'days', None)
+    if days:
+        _pending.days = set()
+        RepairDailyStatRepository().refresh_days(days)
+
+
+@receiver([post_save, post_delete], sender=RepairRequest)
+def refresh_repair_daily_stats(sender, instance, raw=False, **kwargs):
+    """Rebuild the rollup of a repair's request day once the write commits"""
+    if raw or not instance.request_date:
+        return
+    if not hasattr(_pending, 'days'):
+        _pending.days = set()
+    _pending.days.add(instance.request_date)
+    # Every write registers a callback; the first one to run refreshes all pending days.
+    # The repair has committed by then, so a failed refresh is logged instead of
+    # failing the request; `manage.py rebuild_repair_statistics` repairs the rollup.
+    transaction.on_commit(_refresh_pending_days, robust=True)
@@ -1,19 +1,43 @@
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
+from django.core.exceptions import ValidationError
 from django.db import transaction
+from django.utils.dateparse import parse_date
 
 from apps.service.models.repair_request import RepairRequest, RepairStatus
 from apps.service.serializers.repair_serializer import RepairRequestSerializer, RepairRequestListSerializer
 from apps.service.services.repair_request_service import RepairRequestService
+from apps.common.pagination import KeysetListMixin
 from apps.common.responses import success_response, error_response
 
 
-class RepairRequestViewSet(viewsets.ViewSet):
+class RepairRequestViewSet(KeysetListMixin, viewsets.ViewSet):
     """
     ViewSet for repair request operations.
     """
     permission_classes = [IsAuthenticated]
+    list_orderings = {
+        '-request_date': ('-request_date', '-id'),
+        'request_date': ('request_date', 'id'),
+        '-created_at': ('-created_at', '-id'),
+    }
+    list_default_ordering = '-request_date'
+    list_filterset_fields = ['status', 'dealer', 'customer', 'device', 'is_warranty']
+    query_budget = {'list': 3}
+    export_columns = (
+        ('Talep Tarihi', 'request_date'),
+        ('Durum', 'status'),
+        ('Seri No', 'device__serial_number'),
+        ('Ürün', 'device__item__name'),
+        ('Bayi', 'dealer__name'),
+        ('Müşteri', 'customer__name'),
+        ('Garanti', 'is_warranty'),
+        ('Tamir Ücreti', 'repair_cost'),
+        ('Tamamlanma Tarihi', 'completion_date'),
+        ('Arıza', 'issue_description'),
+        ('Teknisyen Notları', 'technician_notes'),
+    )
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -21,14 +45,10 @@ class RepairRequestViewSet(viewsets.ViewSet):
     
     def list(self, request):
         """
-        Get all repair requests.
+        Get a page of repair requests, filtered by status, dealer, customer, device or is_warranty.
         """
         repair_requests = self.service.get_all_repair_requests()
-        serializer = RepairRequestListSerializer(repair_requests, many=True)
-        return success_response(
-            data=serializer.data,
-            status_code=status.HTTP_200_OK
-        )
+        return self.keyset_list_response(request, repair_requests, RepairRequestListSerializer)
     
     def retrieve(self, request, pk=None):
         """
@@ -127,6 +147,16 @@ class RepairRequestViewSet(viewsets.ViewSet):
                 status_code=status.HTTP_400_BAD_REQUEST
             )
     
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """
+        Download all repair requests matching the list filters as CSV or XLSX (file_type parameter).
+        """
+        repair_requests = self.service.get_all_repair_requests()
+        return self.keyset_export_response(
+            request, repair_requests, self.export_columns, 'repair_requests', sheet_name='Repair Requests'
+        )
+    
     @action(detail=False, methods=['get'])
     def by_device(self, request):
         """
@@ -270,4 +300,61 @@ class RepairRequestViewSet(viewsets.ViewSet):
         return success_response(
             data=serializer.data,
             status_code=status.HTTP_200_OK
-        )
\ No newline at end of file
+        )
+    
+    def _date_range(self, request):
+        """Parse the optional start_date/end_date query parameters (YYYY-MM-DD)"""
+        dates = []
+        for name in ('start_date', 'end_date'):
+            value = request.query_params.get(name)
+            try:
+                parsed = parse_date(value) if value else None
+            except ValueError:
+                parsed = None
+            if value and parsed is None:
+                raise ValueError(f"{name} must be a date in YYYY-MM-DD format")
+            dates.append(parsed)
+        return dates
+    
+    @action(detail=False, methods=['get'])
+    def statistics(self, request):
+        """
+        Get repair statistics of a request date range (default: this month).
+        """
+        try:
+            start_date, end_date = self._date_range(request)
+        except ValueError as e:
+            return error_response(
+                error_message=str(e),
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+            
+        statistics = self.service.get_repair_statistics(start_date, end_date)
+        return success_response(
+            data=statistics,
+            status_code=status.HTTP_200_OK
+        )
+    
+    @action(detail=False, methods=['get'])
+    def trends(self, request):
+        """
+        Get repair figures per day, week, month, quarter or year from the daily rollup.
+        """
+        try:
+            start_date, end_date = self._date_range(request)
+            trends = self.service.get_repair_trends(
+                start_date,
+                end_date,
+                period=request.query_params.get('period', 'month'),
+                dealer_id=request.query_params.get('dealer_id')
+            )
+        except (ValueError, ValidationError) as e:
+            return error_response(
+                error_message=str(e),
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+            
+        return success_response(
+            data=trends,
+            status_code=status.HTTP_200_OK
+        )
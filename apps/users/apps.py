@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class UsersConfig(AppConfig):
@@ -6,7 +7,7 @@ class UsersConfig(AppConfig):
     name = 'apps.users'
     
     def ready(self):
-        try:
-            import apps.users.signals  # noqa F401
-        except ImportError:
-            pass
\ No newline at end of file
+        if getattr(settings, 'JWT_STATELESS_AUTH', False):
+            from apps.common.utils.cache import require_redis_cache
+            require_redis_cache('JWT_STATELESS_AUTH')
+        import apps.users.signals  # noqa F401
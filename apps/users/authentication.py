@@ -0,0 +1,109 @@
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.db import router
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from apps.users.models import ClaimsUser
+from apps.users.repositories.token_version_repository import TokenVersionRepository
+
+# Relations loaded together with the authenticated user
+USER_RELATED_FIELDS = ('role', 'department')
+
+# Token claim holding the user's token version
+TOKEN_VERSION_CLAIM = 'token_version'
+
+# User fields embedded in access tokens, each under a claim of the same name
+USER_CLAIM_FIELDS = ('username', 'role_id', 'department_id', 'is_superuser', 'is_staff')
+
+
+def get_user_claims(user):
+    """Get the claims that let a token stand in for the user row"""
+    claims = {}
+    for field in USER_CLAIM_FIELDS:
+        value = getattr(user, field)
+        claims[field] = str(value) if isinstance(value, uuid.UUID) else value
+    claims['role'] = user.role.name if user.role_id else None
+    claims[TOKEN_VERSION_CLAIM] = TokenVersionRepository.issue_version(user.pk)
+    return claims
+
+
+class RoleJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that loads the user's role and department in the same
+    query as the user, so views and serializers reading ``request.user.role``
+    do not issue another query.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        try:
+            user = self.user_model.objects.select_related(*USER_RELATED_FIELDS).get(
+                **{api_settings.USER_ID_FIELD: user_id}
+            )
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+
+        return user
+
+
+class RoleModelBackend(ModelBackend):
+    """Session backend that loads the user's role and department with the user"""
+
+    def get_user(self, user_id):
+        UserModel = get_user_model()
+        try:
+            user = UserModel._default_manager.select_related(*USER_RELATED_FIELDS).get(pk=user_id)
+        except UserModel.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
+
+
+class StatelessJWTAuthentication(RoleJWTAuthentication):
+    """
+    JWT authentication that trusts the signed user claims of the token.
+
+    The user is built from the claims without a query as long as the token
+    version matches the user's current one. After a bump (password, role or
+    state change), or when the user's version is no longer in the cache, the
+    token falls back to the regular database lookup, which also rejects
+    deleted and inactive users. Versions live in the default cache, which
+    must be Redis (enforced at startup).
+    """
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        version = validated_token.get(TOKEN_VERSION_CLAIM)
+        if user_id is None or version is None or version != TokenVersionRepository.get_version(user_id):
+            return super().get_user(validated_token)
+
+        return self.build_user(validated_token)
+
+    @staticmethod
+    def build_user(validated_token):
+        claims = {api_settings.USER_ID_FIELD: validated_token[api_settings.USER_ID_CLAIM], 'is_active': True}
+        for field in USER_CLAIM_FIELDS:
+            claims[field] = validated_token.get(field)
+
+        field_names, values = [], []
+        for field in ClaimsUser._meta.concrete_fields:
+            if field.attname in claims:
+                field_names.append(field.attname)
+                values.append(field.to_python(claims[field.attname]))
+        return ClaimsUser.from_db(router.db_for_read(ClaimsUser), field_names, values)
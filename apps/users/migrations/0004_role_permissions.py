@@ -0,0 +1,24 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0001_initial"),
+        ("users", "0003_user_list_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="role",
+            name="permissions",
+            field=models.ManyToManyField(
+                blank=True,
+                related_name="roles",
+                to="common.permission",
+                verbose_name="Permissions",
+            ),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from apps.users.models.department import Department
 from apps.users.models.role import Role
 from apps.users.models.user import User
+from apps.users.models.claims_user import ClaimsUser
 
-__all__ = ["Department", "Role", "User"]
\ No newline at end of file
+__all__ = ["Department", "Role", "User", "ClaimsUser"]
\ No newline at end of file
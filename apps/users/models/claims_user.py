@@ -0,0 +1,20 @@
+from apps.users.models.user import User
+
+
+class ClaimsUser(User):
+    """
+    A user built from signed token claims instead of a database row.
+
+    Only the fields carried in the token are loaded; the rest are deferred.
+    The first deferred field that is read loads all of them in one query, so
+    code that needs the full user (profile, password change) still works.
+    """
+
+    class Meta:
+        proxy = True
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        deferred = self.get_deferred_fields()
+        if fields is not None and deferred and set(fields) <= deferred:
+            fields = list(deferred)
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
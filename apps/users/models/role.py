@@ -12,6 +12,12 @@ class Role(BaseModel):
         on_delete=models.CASCADE,
         verbose_name=_("Department")
     )
+    permissions = models.ManyToManyField(
+        'common.Permission',
+        related_name="roles",
+        blank=True,
+        verbose_name=_("Permissions")
+    )
     
     class Meta(BaseModel.Meta):
         verbose_name = _("Role")
@@ -28,6 +28,9 @@ class User(AbstractUser):
     class Meta:
         verbose_name = _("User")
         verbose_name_plural = _("Users")
+        indexes = [
+            models.Index(fields=['date_joined', 'id'], name='user_date_joined_idx'),
+        ]
     
     def __str__(self):
         return self.username
@@ -1,5 +1,6 @@
 from apps.users.repositories.department_repository import DepartmentRepository
 from apps.users.repositories.role_repository import RoleRepository
 from apps.users.repositories.user_repository import UserRepository
+from apps.users.repositories.token_version_repository import TokenVersionRepository
 
-__all__ = ["DepartmentRepository", "RoleRepository", "UserRepository"]
\ No newline at end of file
+__all__ = ["DepartmentRepository", "RoleRepository", "UserRepository", "TokenVersionRepository"]
\ No newline at end of file
@@ -0,0 +1,76 @@
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+# Users whose tokens the current transaction invalidates
+_pending = threading.local()
+
+
+class TokenVersionRepository:
+    """
+    Per-user token versions kept in the Django cache.
+
+    Access tokens carry the version that was current when they were issued.
+    Bumping a user's version (password, role or state change) makes every
+    token issued before it fall back to a database check. A user without a
+    cache entry (never logged in, evicted or expired) has no version, and
+    every token of that user falls back as well; a lost entry costs a query,
+    never a stale claim.
+
+    The cache must be shared by all worker processes, or a bump is only seen
+    by the worker that made it; JWT_STATELESS_AUTH refuses to start otherwise.
+
+    A version is the time it was stamped, so it never repeats even after its
+    cache entry expires.
+    """
+    CACHE_KEY = 'users:token_version:{user_id}'
+
+    @classmethod
+    def get_version(cls, user_id):
+        """Get the current token version of a user, or None when it is not known"""
+        return cache.get(cls.CACHE_KEY.format(user_id=user_id))
+
+    @classmethod
+    def issue_version(cls, user_id):
+        """
+        Get the version to embed in a new token, stamping one if the user has none
+
+        The entry is kept for a full refresh lifetime from now, so that the
+        version outlives the tokens it is issued with.
+        """
+        key = cls.CACHE_KEY.format(user_id=user_id)
+        timeout = cls.get_timeout()
+        if not cache.add(key, time.time_ns(), timeout=timeout):
+            cache.touch(key, timeout=timeout)
+        # Re-read so concurrent logins agree on the stamp that won
+        return cache.get(key)
+
+    @classmethod
+    def bump(cls, user_id):
+        """Invalidate the claims of every token issued to a user so far"""
+        cache.set(cls.CACHE_KEY.format(user_id=user_id), time.time_ns(), timeout=cls.get_timeout())
+
+    @classmethod
+    def bump_on_commit(cls, user_id):
+        """Bump a user's version once the current transaction commits"""
+        user_ids = getattr(_pending, 'user_ids', None)
+        if user_ids is None:
+            user_ids = _pending.user_ids = set()
+        user_ids.add(user_id)
+        # Every write registers a callback; the first one to run bumps them all
+        transaction.on_commit(cls._bump_pending)
+
+    @classmethod
+    def _bump_pending(cls):
+        user_ids = getattr(_pending, 'user_ids', None)
+        _pending.user_ids = None
+        for user_id in user_ids or ():
+            cls.bump(user_id)
+
+    @staticmethod
+    def get_timeout():
+        lifetime = settings.SIMPLE_JWT.get('REFRESH_TOKEN_LIFETIME')
+        return int(lifetime.total_seconds()) if lifetime else None
@@ -1,7 +1,8 @@
 from typing import List, Optional, Dict, Any
 from django.contrib.auth import get_user_model
-from django.db.models import Q
+from django.db.models import QuerySet
 from apps.users.repositories.base_repository import BaseRepository
+from apps.common.repositories.search_repository import SearchIndexRepository
 
 User = get_user_model()
 
@@ -50,9 +51,11 @@ class UserRepository(BaseRepository):
     
     def search(self, query: str) -> List[User]:
         """Search users by username, first_name, last_name, or email."""
-        return list(self.get_queryset().filter(
-            Q(username__icontains=query) |
-            Q(first_name__icontains=query) |
-            Q(last_name__icontains=query) |
-            Q(email__icontains=query)
-        ))
\ No newline at end of file
+        return list(self.search_queryset(query))
+    
+    def search_queryset(self, query: str) -> QuerySet:
+        """Get a lazy queryset of users matching username, first_name, last_name, or email (search index)."""
+        matching = SearchIndexRepository().matching('user', query)
+        if matching is None:
+            return self.get_queryset().none()
+        return self.get_queryset().filter(pk__in=matching)
\ No newline at end of file
@@ -3,11 +3,20 @@ from django.contrib.auth import get_user_model, authenticate
 from django.utils.translation import gettext_lazy as _
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from apps.users.serializers.user_serializers import UserSerializer
+from apps.users.authentication import get_user_claims
 
 User = get_user_model()
 
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     """Custom JWT token serializer that includes user information in response."""
+
+    @classmethod
+    def get_token(cls, user):
+        # Embed the user claims used by StatelessJWTAuthentication
+        token = super().get_token(user)
+        for claim, value in get_user_claims(user).items():
+            token[claim] = value
+        return token
     
     def validate(self, attrs):
         data = super().validate(attrs)
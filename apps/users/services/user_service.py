@@ -1,5 +1,6 @@
 from typing import List, Optional, Dict, Any
 from django.contrib.auth import get_user_model
+from django.db.models import QuerySet
 from apps.users.repositories.user_repository import UserRepository
 from apps.users.repositories.department_repository import DepartmentRepository
 from apps.users.repositories.role_repository import RoleRepository
@@ -29,6 +30,12 @@ class UserService:
     def list_users(self) -> List[User]:
         return self.user_repository.list()
     
+    def get_users_queryset(self, search: str = None) -> QuerySet:
+        """Get a lazy queryset of active users, optionally narrowed by a search query."""
+        if search:
+            return self.user_repository.search_queryset(search)
+        return self.user_repository.get_queryset()
+    
     def list_users_by_department(self, department_id: int) -> List[User]:
         return self.user_repository.list_by_department(department_id)
     
@@ -0,0 +1,58 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from apps.common.models import Permission
+from apps.common.permissions.permission_matrix import PermissionMatrixRepository
+from apps.users.models import ClaimsUser, Role, User
+from apps.users.repositories.token_version_repository import TokenVersionRepository
+
+# User fields whose change invalidates the claims of issued tokens
+TOKEN_CLAIM_USER_FIELDS = {
+    'username', 'password', 'role', 'department', 'is_superuser', 'is_staff', 'is_active', 'deleted_at'
+}
+
+# Role fields that are compiled into the permission matrix
+MATRIX_ROLE_FIELDS = {'name', 'is_active', 'deleted_at'}
+
+
+@receiver([post_save, post_delete], sender=Permission)
+def invalidate_permission_matrix(sender, **kwargs):
+    """Recompile the permission matrix after any permission write"""
+    PermissionMatrixRepository.invalidate()
+
+
+@receiver(post_save, sender=Role)
+def invalidate_permission_matrix_for_role(sender, update_fields=None, **kwargs):
+    """Recompile the permission matrix when a role's name or state changes"""
+    if update_fields is not None and not MATRIX_ROLE_FIELDS & set(update_fields):
+        return
+    PermissionMatrixRepository.invalidate()
+
+
+@receiver(post_delete, sender=Role)
+def invalidate_permission_matrix_for_deleted_role(sender, **kwargs):
+    PermissionMatrixRepository.invalidate()
+
+
+@receiver(m2m_changed, sender=Role.permissions.through)
+def invalidate_permission_matrix_for_links(sender, action, **kwargs):
+    """Recompile the permission matrix after permissions are granted to or revoked from a role"""
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        PermissionMatrixRepository.invalidate()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_save, sender=ClaimsUser)
+def bump_token_version(sender, instance, created, update_fields=None, **kwargs):
+    """Send tokens issued before a password, role or state change back to the database once it commits"""
+    if created:
+        return
+    if update_fields is not None and not TOKEN_CLAIM_USER_FIELDS & set(update_fields):
+        return
+    TokenVersionRepository.bump_on_commit(instance.pk)
+
+
+@receiver(post_delete, sender=User)
+@receiver(post_delete, sender=ClaimsUser)
+def bump_token_version_for_deleted_user(sender, instance, **kwargs):
+    TokenVersionRepository.bump_on_commit(instance.pk)
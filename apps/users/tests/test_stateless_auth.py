@@ -0,0 +1,147 @@
+from django.apps import apps
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase, override_settings
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+
+from apps.users.authentication import StatelessJWTAuthentication
+from apps.users.models import ClaimsUser, Department, Role, User
+from apps.users.serializers.auth_serializers import CustomTokenObtainPairSerializer
+
+LOCAL_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(CACHES=LOCAL_CACHE)
+class StatelessJWTAuthenticationTests(TestCase):
+    """Tests for StatelessJWTAuthentication and token version revocation"""
+
+    @classmethod
+    def setUpTestData(cls):
+        department = Department.objects.create(name='Production')
+        cls.operator = Role.objects.create(name='Operator', department=department)
+        cls.manager = Role.objects.create(name='Manager', department=department)
+        cls.user = User.objects.create_user(username='ayse', password='secret-1', role=cls.operator)
+
+    def setUp(self):
+        cache.clear()
+        self.auth = StatelessJWTAuthentication()
+
+    def authenticate(self, token):
+        return self.auth.get_user(self.auth.get_validated_token(str(token)))
+
+    def issue_token(self):
+        return CustomTokenObtainPairSerializer.get_token(self.user).access_token
+
+    def test_matching_version_is_trusted_without_query(self):
+        token = self.issue_token()
+
+        with self.assertNumQueries(0):
+            user = self.authenticate(token)
+
+        self.assertIsInstance(user, ClaimsUser)
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertEqual(user.role_id, self.operator.id)
+
+    def test_issued_version_is_stamped(self):
+        token = self.issue_token()
+
+        self.assertIsNotNone(token['token_version'])
+        self.assertNotEqual(token['token_version'], 0)
+        # Logins after the first one share its version
+        self.assertEqual(self.issue_token()['token_version'], token['token_version'])
+
+    def test_cache_miss_falls_back_to_database(self):
+        token = self.issue_token()
+        cache.clear()
+
+        with self.assertNumQueries(1):
+            user = self.authenticate(token)
+
+        self.assertIsInstance(user, User)
+        self.assertNotIsInstance(user, ClaimsUser)
+
+    def test_role_change_revokes_claims(self):
+        token = self.issue_token()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.role = self.manager
+            self.user.save()
+
+        with self.assertNumQueries(1):
+            user = self.authenticate(token)
+        self.assertEqual(user.role_id, self.manager.id)
+        # A token issued after the change is trusted again
+        with self.assertNumQueries(0):
+            self.assertEqual(self.authenticate(self.issue_token()).role_id, self.manager.id)
+
+    def test_password_change_revokes_claims(self):
+        token = self.issue_token()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.set_password('secret-2')
+            self.user.save(update_fields=['password'])
+
+        with self.assertNumQueries(1):
+            self.authenticate(token)
+
+    def test_deactivation_rejects_token(self):
+        token = self.issue_token()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save(update_fields=['is_active'])
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(token)
+
+    def test_unrelated_change_keeps_claims(self):
+        token = self.issue_token()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.first_name = 'Ayşe'
+            self.user.save(update_fields=['first_name'])
+
+        with self.assertNumQueries(0):
+            self.authenticate(token)
+
+    def test_bump_waits_for_commit(self):
+        token = self.issue_token()
+
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            self.user.role = self.manager
+            self.user.save()
+            # Until the change commits the token still matches the database
+            with self.assertNumQueries(0):
+                self.authenticate(token)
+
+        for callback in callbacks:
+            callback()
+        with self.assertNumQueries(1):
+            self.authenticate(token)
+
+
+class StatelessAuthStartupTests(TestCase):
+    """Tests for the cache check of JWT_STATELESS_AUTH at startup"""
+
+    def test_refuses_non_redis_cache(self):
+        backends = (
+            'django.core.cache.backends.locmem.LocMemCache',
+            'django.core.cache.backends.db.DatabaseCache',
+        )
+        for backend in backends:
+            with self.subTest(backend=backend):
+                caches = {'default': {'BACKEND': backend, 'LOCATION': 'smarteq_cache'}}
+                with override_settings(JWT_STATELESS_AUTH=True, CACHES=caches):
+                    with self.assertRaises(ImproperlyConfigured):
+                        apps.get_app_config('users').ready()
+
+    def test_starts_with_redis_cache(self):
+        caches = {'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': 'redis://localhost:6379'
+        }}
+        with override_settings(JWT_STATELESS_AUTH=True, CACHES=caches):
+            apps.get_app_config('users').ready()
+
+    def test_not_checked_when_disabled(self):
+        with override_settings(JWT_STATELESS_AUTH=False, CACHES=LOCAL_CACHE):
+            apps.get_app_config('users').ready()
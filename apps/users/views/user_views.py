@@ -5,6 +5,7 @@ from rest_framework.permissions import IsAuthenticated
 from django.contrib.auth import get_user_model
 
 from apps.common.permissions import IsSuperUser, IsSystemAdmin
+from apps.common.pagination import KeysetListMixin
 from apps.common.responses import success_response, error_response
 from apps.users.serializers.user_serializers import (
     UserSerializer, UserDetailSerializer, UserCreateSerializer,
@@ -14,13 +15,19 @@ from apps.users.services import UserService
 
 User = get_user_model()
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(KeysetListMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing users.
     """
     queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated]
+    list_orderings = {
+        'username': ('username', 'id'),
+        '-date_joined': ('-date_joined', '-id'),
+    }
+    list_default_ordering = 'username'
+    list_filterset_fields = ['department', 'role', 'is_active']
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -38,24 +45,9 @@ class UserViewSet(viewsets.ModelViewSet):
         return UserSerializer
     
     def list(self, request, *args, **kwargs):
-        # Check for filters
-        department_id = request.query_params.get('department')
-        role_id = request.query_params.get('role')
-        search_query = request.query_params.get('search')
-        
-        if department_id and role_id:
-            users = self.user_service.list_users_by_department_and_role(department_id, role_id)
-        elif department_id:
-            users = self.user_service.list_users_by_department(department_id)
-        elif role_id:
-            users = self.user_service.list_users_by_role(role_id)
-        elif search_query:
-            users = self.user_service.search_users(search_query)
-        else:
-            users = self.user_service.list_users()
-            
-        serializer = self.get_serializer(users, many=True)
-        return success_response(data=serializer.data)
+        # department, role and is_active are applied as filters, search narrows the queryset first
+        users = self.user_service.get_users_queryset(search=request.query_params.get('search'))
+        return self.keyset_list_response(request, users, self.get_serializer_class())
     
     def retrieve(self, request, *args, **kwargs):
         user = self.user_service.get_user(kwargs['pk'])
@@ -41,6 +41,8 @@ LOCAL_APPS = [
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 
 MIDDLEWARE = [
+    'core.middleware.request_logging.RequestLoggingMiddleware',
+    'core.middleware.query_inspector.QueryInspectorMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
@@ -53,6 +55,21 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = 'config.urls'
 
+# Structured request logging (core.middleware.request_logging); records are
+# written by the handlers of the 'core.request' logger on a background thread
+REQUEST_LOGGING = {
+    'SAMPLE_RATE': float(os.getenv('REQUEST_LOG_SAMPLE_RATE', '1.0')),
+    'SLOW_REQUEST_MS': int(os.getenv('REQUEST_LOG_SLOW_MS', '1000')),
+    'LOG_BODIES': os.getenv('REQUEST_LOG_BODIES', 'False') == 'True',
+    'MAX_BODY_BYTES': 2048,
+}
+
+# Per-request query budgets and N+1 detection (core.middleware.query_inspector);
+# off unless a settings module enables it
+QUERY_INSPECTOR = {
+    'ENABLED': False,
+}
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
@@ -74,6 +91,11 @@ WSGI_APPLICATION = 'config.wsgi.application'
 # Custom User model
 AUTH_USER_MODEL = 'users.User'
 
+# Load the user's role and department with the session user
+AUTHENTICATION_BACKENDS = [
+    'apps.users.authentication.RoleModelBackend',
+]
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -112,10 +134,35 @@ MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Access to the internal /metrics endpoint, which is disabled unless one of
+# these is set:
+# - METRICS_TOKEN: scrapers send "Authorization: Bearer <token>". Use this
+#   whenever the app runs behind a reverse proxy, where REMOTE_ADDR is the
+#   proxy's address for every request.
+# - METRICS_ALLOWED_IPS: comma-separated client addresses, only for scrapers
+#   reaching gunicorn directly. Requests carrying proxy headers
+#   (X-Forwarded-For, Forwarded, X-Real-IP) are never let in by address.
+METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')
+METRICS_ALLOWED_IPS = [ip.strip() for ip in os.getenv('METRICS_ALLOWED_IPS', '').split(',') if ip.strip()]
+
+# Permission matrix versions and token revocations reach the other worker
+# processes through the default cache. With REQUIRE_SHARED_CACHE the app
+# refuses to start on a process-local cache (LocMemCache, DummyCache); every
+# deployment running more than one process must enable it.
+REQUIRE_SHARED_CACHE = os.getenv('REQUIRE_SHARED_CACHE', 'False') == 'True'
+
+# Trust the user claims signed into access tokens instead of loading the user
+# on every request; tokens fall back to a database lookup after a user change.
+# A user change is signalled through the default cache, which is read on every
+# request, so this mode requires a Redis cache (REDIS_URL in production
+# settings) and refuses to start on any other backend.
+JWT_STATELESS_AUTH = os.getenv('JWT_STATELESS_AUTH', 'False') == 'True'
+
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apps.users.authentication.StatelessJWTAuthentication' if JWT_STATELESS_AUTH
+        else 'apps.users.authentication.RoleJWTAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
@@ -130,6 +177,12 @@ REST_FRAMEWORK = {
     ],
 }
 
+# Cursor-paginated list endpoints wrap their pages in the ApiResponse envelope
+# ({data, error, status, pagination}). Set to False to return the plain
+# {next, previous, results} body instead; clients can override per request
+# with ?envelope=true|false.
+API_LIST_ENVELOPE = os.getenv('API_LIST_ENVELOPE', 'True') == 'True'
+
 # JWT Settings
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(hours=1),
@@ -0,0 +1,42 @@
+"""
+Benchmark settings for smarteq project.
+
+Runs against a local SQLite database so that benchmark results are
+repeatable on any machine:
+
+    DJANGO_SETTINGS_MODULE=config.settings.benchmark python manage.py migrate
+    DJANGO_SETTINGS_MODULE=config.settings.benchmark python manage.py run_benchmarks --scale medium
+"""
+
+import os
+from .base import *  # noqa
+
+SECRET_KEY = os.getenv('SECRET_KEY', 'django-insecure-benchmark-key')
+
+DEBUG = False
+
+ALLOWED_HOSTS = ['testserver', 'localhost', '127.0.0.1']
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.getenv('BENCHMARK_DB', os.path.join(BASE_DIR, 'benchmark.sqlite3')),  # noqa F405
+    }
+}
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+# Keep request logging out of the measurements
+MIDDLEWARE = [m for m in MIDDLEWARE if m != 'core.middleware.request_logging.RequestLoggingMiddleware']  # noqa F405
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'root': {'level': 'ERROR'},
+}
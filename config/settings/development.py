@@ -3,6 +3,7 @@ Development settings for smarteq project.
 """
 
 import os
+import sys
 from dotenv import load_dotenv
 from .base import *  # noqa
 
@@ -40,6 +41,14 @@ CORS_ALLOW_ALL_ORIGINS = True
 # Email backend for development
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 
+# Query budgets and N+1 detection (core.middleware.query_inspector);
+# under `manage.py test` a violation fails the request instead of logging
+TESTING = len(sys.argv) > 1 and sys.argv[1] == 'test'
+QUERY_INSPECTOR = {
+    'ENABLED': os.getenv('QUERY_INSPECTOR_ENABLED', 'True') == 'True',
+    'RAISE': TESTING or os.getenv('QUERY_INSPECTOR_RAISE', 'False') == 'True',
+}
+
 # Debug Toolbar
 if DEBUG:
     try:
@@ -127,6 +136,16 @@ LOGGING = {
             'level': 'DEBUG',
             'propagate': False,
         },
+        'core.request': {
+            'handlers': ['console', 'file'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+        'core.query_inspector': {
+            'handlers': ['console', 'file'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
         'apps': {
             'handlers': ['console', 'file', 'error_file'],
             'level': 'DEBUG',
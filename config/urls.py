@@ -12,6 +12,8 @@ from rest_framework.permissions import IsAuthenticated
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 
+from apps.common.views import SearchView, metrics_view
+
 schema_view = get_schema_view(
    openapi.Info(
       title="Smarteq API",
@@ -30,6 +32,7 @@ API_VERSION = 'v1'
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api-auth/', include('rest_framework.urls')),
+    path('metrics', metrics_view, name='metrics'),
     path(f'api/{API_VERSION}/', include([
         # Include app URLs here
         path('users/', include('apps.users.urls.v1')),
@@ -39,6 +42,7 @@ urlpatterns = [
         path('dealers/', include('apps.dealers.urls.v1')),
         path('sales/', include('apps.sales.urls.v1')),
         path('service/', include('apps.service.urls.v1')),
+        path('search/', SearchView.as_view(), name='search'),
     ])),
     path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
     path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
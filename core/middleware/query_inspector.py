@@ -0,0 +1,71 @@
+"""
+Query inspection middleware for smarteq project.
+
+Development-only: records the queries of each request, reports likely N+1
+patterns with the serializer field or project frame that issued them and
+checks the query budget declared on the view.
+"""
+
+import logging
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from apps.common.utils.query_inspector import (
+    N_PLUS_ONE_THRESHOLD, QueryBudgetExceeded, QueryInspector, get_query_budget
+)
+
+logger = logging.getLogger('core.query_inspector')
+
+DEFAULTS = {
+    'ENABLED': False,
+    # Repeats of one statement in a request that are reported as N+1
+    'N_PLUS_ONE_THRESHOLD': N_PLUS_ONE_THRESHOLD,
+    # Raise QueryBudgetExceeded instead of logging a warning (tests)
+    'RAISE': False,
+    # Add X-Query-Count / X-Query-Budget headers to responses
+    'HEADERS': True,
+    # Walk the stack of every query to find where it came from
+    'CAPTURE_ORIGIN': True,
+}
+
+
+class QueryInspectorMiddleware:
+    """
+    Middleware to check the queries of every request.
+
+    Configured with the QUERY_INSPECTOR setting (see DEFAULTS) and removed
+    from the stack unless ENABLED. A request fails its check when it runs
+    more queries than the ``query_budget`` of its view or repeats a statement
+    N_PLUS_ONE_THRESHOLD times.
+    """
+
+    def __init__(self, get_response):
+        options = {**DEFAULTS, **getattr(settings, 'QUERY_INSPECTOR', {})}
+        if not options['ENABLED']:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.threshold = options['N_PLUS_ONE_THRESHOLD']
+        self.raise_errors = options['RAISE']
+        self.headers = options['HEADERS']
+        self.capture_origin = options['CAPTURE_ORIGIN']
+
+    def __call__(self, request):
+        with QueryInspector(capture_origin=self.capture_origin) as inspector:
+            response = self.get_response(request)
+
+        # DRF keeps the view that rendered the response, with its action
+        view = (getattr(response, 'renderer_context', None) or {}).get('view')
+        budget = get_query_budget(view) if view is not None else None
+        if self.headers:
+            response['X-Query-Count'] = str(inspector.count)
+            if budget is not None:
+                response['X-Query-Budget'] = str(budget)
+
+        over_budget = budget is not None and inspector.count > budget
+        if over_budget or inspector.n_plus_one(self.threshold):
+            message = f'{request.method} {request.path}: {inspector.describe(budget, self.threshold)}'
+            if self.raise_errors:
+                raise QueryBudgetExceeded(message)
+            logger.warning(message, extra={'query_report': inspector.report(budget, self.threshold)})
+        return response
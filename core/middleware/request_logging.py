@@ -1,77 +1,312 @@
 """
 Request logging middleware for smarteq project.
+
+Each request is described by a small RequestRecord that is filled in on the
+request thread and put on a queue as is; building the log record, JSON
+encoding, redaction and writing happen on a background thread, in the
+handlers configured for the ``core.request`` logger.
 """
 
+import atexit
+import json
 import logging
+import queue
+import random
+import threading
 import time
-import json
-from django.utils.deprecation import MiddlewareMixin
+from logging.handlers import QueueHandler, QueueListener
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.utils.functional import empty
+
+logger = logging.getLogger('core.request')
 
-logger = logging.getLogger(__name__)
+DEFAULTS = {
+    # Share of successful requests that are logged; errors and slow requests always are
+    'SAMPLE_RATE': 1.0,
+    # Requests slower than this are always logged
+    'SLOW_REQUEST_MS': 1000,
+    # Capture request bodies (never multipart uploads) up to MAX_BODY_BYTES
+    'LOG_BODIES': False,
+    'MAX_BODY_BYTES': 2048,
+    'MAX_QUERY_STRING_BYTES': 512,
+    'EXCLUDE_PATHS': ('/media/', '/static/'),
+}
 
+# Body keys whose values are never written to the log
+REDACTED_KEYS = ('password', 'token', 'secret', 'access', 'refresh')
 
-class RequestLoggingMiddleware(MiddlewareMixin):
+BODY_CONTENT_TYPES = ('application/json', 'application/x-www-form-urlencoded', 'text/')
+
+
+class RequestRecord:
     """
-    Middleware to log all requests and responses.
+    Fixed-layout description of one request.
+
+    Only raw values are stored on the request thread; the JSON message is
+    built when a handler formats the log record.
     """
+    __slots__ = (
+        'created', 'level', 'method', 'path', 'route', 'query_string', 'status_code', 'duration_ms',
+        'db_queries', 'db_time_ms', 'user_id', 'remote_addr', 'response_bytes',
+        'body', 'body_bytes', 'content_type',
+    )
 
-    def process_request(self, request):
-        """
-        Process request and set start time.
-        """
-        request.start_time = time.time()
-        
-        # Don't log media or static requests
-        if request.path.startswith('/media/') or request.path.startswith('/static/'):
-            return None
-            
-        # Log request details
-        request_data = {
-            'method': request.method,
-            'path': request.path,
-            'user': str(request.user) if hasattr(request, 'user') else 'AnonymousUser',
-            'remote_addr': self._get_client_ip(request),
+    def __init__(self):
+        self.route = None
+        self.query_string = None
+        self.user_id = None
+        self.response_bytes = None
+        self.body = None
+        self.body_bytes = None
+        self.content_type = None
+
+    def as_dict(self):
+        data = {
+            'method': self.method,
+            'path': self.path,
+            'route': self.route,
+            'status_code': self.status_code,
+            'duration_ms': round(self.duration_ms, 3),
+            'db_queries': self.db_queries,
+            'db_time_ms': round(self.db_time_ms, 3),
+            'user_id': self.user_id,
+            'remote_addr': self.remote_addr,
         }
-        
-        if request.GET:
-            request_data['query_params'] = dict(request.GET)
-        
-        # Only log request body for non-GET methods and if not a file upload
-        if request.method not in ('GET', 'HEAD') and not request.content_type.startswith('multipart/form-data'):
-            try:
-                request_data['body'] = json.loads(request.body) if request.body else None
-            except json.JSONDecodeError:
-                request_data['body'] = 'Invalid JSON'
-        
-        logger.info(f"REQUEST: {json.dumps(request_data)}")
-        return None
-
-    def process_response(self, request, response):
-        """
-        Process response and log response time.
-        """
-        # Skip logging for media and static files
-        if request.path.startswith('/media/') or request.path.startswith('/static/'):
+        if self.query_string:
+            data['query_string'] = self.query_string
+        if self.response_bytes is not None:
+            data['response_bytes'] = self.response_bytes
+        if self.body_bytes is not None:
+            data['body_bytes'] = self.body_bytes
+        if self.body is not None:
+            data['body'] = redact_body(self.body, self.content_type)
+        return data
+
+    def __str__(self):
+        return json.dumps(self.as_dict(), default=str, ensure_ascii=False)
+
+
+def redact_body(body, content_type):
+    """Decode a captured body and mask the values of sensitive keys"""
+    text = body.decode('utf-8', errors='replace')
+    if not content_type.startswith('application/json'):
+        return text
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return text
+    return _redact(data)
+
+
+def _redact(value):
+    if isinstance(value, dict):
+        return {
+            key: '***' if any(word in str(key).lower() for word in REDACTED_KEYS) else _redact(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_redact(item) for item in value]
+    return value
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener's handlers.
+
+    The stock QueueHandler formats the message before enqueueing it, which
+    would put the JSON encoding back on the request thread.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+class RequestLogListener(QueueListener):
+    """QueueListener that turns queued RequestRecords into log records"""
+
+    def prepare(self, record):
+        if not isinstance(record, RequestRecord):
+            return record
+        log_record = logger.makeRecord(logger.name, record.level, __file__, 0, '%s', (record,), None)
+        log_record.created = record.created
+        log_record.msecs = (record.created - int(record.created)) * 1000
+        return log_record
+
+
+class RequestLogPipeline:
+    """
+    Moves the handlers of the ``core.request`` logger behind a queue.
+
+    The handlers configured in LOGGING (or inherited from parent loggers) are
+    served by a listener thread. The middleware puts its records on the
+    queue directly, skipping LogRecord creation on the request thread; other
+    messages sent to the logger reach the same queue through a QueueHandler.
+    """
+    queue = None
+    _listener = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def put(cls, record):
+        cls.queue.put_nowait(record)
+
+    @classmethod
+    def install(cls):
+        with cls._lock:
+            if cls._listener is not None:
+                return
+            handlers = cls._collect_handlers(logger)
+            cls.queue = queue.SimpleQueue()
+            cls._listener = RequestLogListener(cls.queue, *handlers, respect_handler_level=True)
+            for handler in logger.handlers[:]:
+                logger.removeHandler(handler)
+            logger.addHandler(DeferredQueueHandler(cls.queue))
+            logger.propagate = False
+            cls._listener.start()
+            atexit.register(cls.stop)
+
+    @classmethod
+    def stop(cls):
+        """Write out the queued records and stop the writer thread"""
+        with cls._lock:
+            if cls._listener is not None:
+                cls._listener.stop()
+                cls._listener = None
+
+    @staticmethod
+    def _collect_handlers(target):
+        handlers = []
+        current = target
+        while current:
+            handlers.extend(current.handlers)
+            if not current.propagate:
+                break
+            current = current.parent
+        return handlers
+
+
+class QueryStats:
+    """Counts and times the database queries of one request"""
+    __slots__ = ('count', 'time_ns')
+
+    def __init__(self):
+        self.count = 0
+        self.time_ns = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter_ns()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.time_ns += time.perf_counter_ns() - start
+            self.count += 1
+
+
+class RequestLoggingMiddleware:
+    """
+    Middleware to log all requests and responses.
+
+    Configured with the REQUEST_LOGGING setting (see DEFAULTS). Successful
+    requests are sampled at SAMPLE_RATE; error responses and requests slower
+    than SLOW_REQUEST_MS are always logged.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        options = {**DEFAULTS, **getattr(settings, 'REQUEST_LOGGING', {})}
+        self.sample_rate = options['SAMPLE_RATE']
+        self.slow_request_ns = options['SLOW_REQUEST_MS'] * 1_000_000
+        self.log_bodies = options['LOG_BODIES']
+        self.max_body_bytes = options['MAX_BODY_BYTES']
+        self.max_query_string_bytes = options['MAX_QUERY_STRING_BYTES']
+        self.exclude_paths = tuple(options['EXCLUDE_PATHS'])
+        RequestLogPipeline.install()
+
+    def __call__(self, request):
+        if not logger.isEnabledFor(logging.INFO) or request.path.startswith(self.exclude_paths):
+            return self.get_response(request)
+
+        stats = QueryStats()
+        body = self._capture_body(request) if self.log_bodies else None
+        # Same as connection.execute_wrapper(), without the context manager overhead
+        wrappers = connections[DEFAULT_DB_ALIAS].execute_wrappers
+        wrappers.append(stats)
+        start = time.perf_counter_ns()
+        try:
+            response = self.get_response(request)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            wrappers.remove(stats)
+
+        if (
+            response.status_code < 400
+            and elapsed < self.slow_request_ns
+            and self.sample_rate < 1.0
+            and random.random() >= self.sample_rate
+        ):
             return response
-            
-        # Calculate request processing time
-        if hasattr(request, 'start_time'):
-            duration = time.time() - request.start_time
-            response_data = {
-                'method': request.method,
-                'path': request.path,
-                'status_code': response.status_code,
-                'duration': f"{duration:.2f}s",
-            }
-            
-            # Log response headers if there's an issue
-            if response.status_code >= 400:
-                response_data['headers'] = dict(response.headers)
-                
-            logger.info(f"RESPONSE: {json.dumps(response_data)}")
-            
+
+        record = RequestRecord()
+        record.created = time.time()
+        record.method = request.method
+        record.path = request.path
+        record.status_code = response.status_code
+        record.duration_ms = elapsed / 1_000_000
+        record.db_queries = stats.count
+        record.db_time_ms = stats.time_ns / 1_000_000
+        record.user_id = self._get_user_id(request)
+        record.remote_addr = self._get_client_ip(request)
+
+        match = request.resolver_match
+        if match is not None:
+            record.route = match.route
+        query_string = request.META.get('QUERY_STRING')
+        if query_string:
+            record.query_string = query_string[:self.max_query_string_bytes]
+        if not response.streaming:
+            record.response_bytes = len(response.content)
+        if body is not None:
+            record.body_bytes, record.body, record.content_type = body
+
+        record.level = logging.ERROR if response.status_code >= 500 else (
+            logging.WARNING if response.status_code >= 400 or elapsed >= self.slow_request_ns else logging.INFO
+        )
+        RequestLogPipeline.put(record)
         return response
-        
+
+    def _capture_body(self, request):
+        """Get (size, capped body, content type) for a non-GET, non-upload request"""
+        if request.method in ('GET', 'HEAD', 'OPTIONS'):
+            return None
+        content_type = request.content_type or ''
+        if not content_type.startswith(BODY_CONTENT_TYPES):
+            return None
+        try:
+            size = int(request.META.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            return None
+        if not size:
+            return None
+        if size > self.max_body_bytes:
+            # Reading the body would pull the whole upload into memory here
+            return size, None, content_type
+        return size, request.body[:self.max_body_bytes], content_type
+
+    @staticmethod
+    def _get_user_id(request):
+        """Get the id of the authenticated user without triggering a lazy user lookup"""
+        user = request.__dict__.get('user')
+        if user is None:
+            return None
+        wrapped = getattr(user, '_wrapped', None)
+        if wrapped is empty:
+            return None
+        if not user.is_authenticated:
+            return None
+        return str(user.pk)
+
     def _get_client_ip(self, request):
         """
         Get client IP address from request.
@@ -81,4 +316,4 @@ class RequestLoggingMiddleware(MiddlewareMixin):
             ip = x_forwarded_for.split(',')[0]
         else:
             ip = request.META.get('REMOTE_ADDR')
-        return ip
\ No newline at end of file
+        return ip